@@ -0,0 +1,982 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module defines TransvalentArray, a container for large numbers of
+transvalent values. Rather than a list of tuples (each of which, with
+its float and string, occupies over 100 bytes), an array holds two NumPy
+arrays: the real parts (float64) and the symbol codes (int8, as defined
+in config.symbol_codes), for 9 bytes per value. This is the same form
+in which writers.NpyResultWriter saves results, so a pair of .npy files
+written by the batch mode can be opened as an array (memory-mapped, if
+desired) and vice versa.
+
+Each value is stored in its (real, symbol) form, as produced by
+cli.decompose_result_for_output(); when values are converted back into
+results (or passed to the CLI's operations), they take the form of
+tuples, using the CLI's canonical tuples where possible.
+
+Arrays can be added, subtracted, multiplied, divided, and raised to
+powers elementwise, with one another or with single values, and the
+results follow the CLI's operations exactly. Operations on ordinary real
+numbers (see codegen.py) are performed by NumPy; operations involving
+other values are performed by the CLI's operator functions, once for
+each distinct combination of operands (or, where an ordinary real number
+is combined with some other value, once for each sign of the real
+number, if the result depends on the number only through its sign or as
+the number itself).
+
+NumPy is required by this module (but not by the rest of Liniarote).
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import sys
+import math
+import time
+import random
+import argparse
+import contextlib
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import third-party modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import tree
+    from . import ordering
+    from . import realization
+except:
+    import config as cfg
+    import cli
+    import tree
+    import ordering
+    import realization
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the conversion of individual values.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for arrays of transvalent values.")
+
+
+# The code stored for anything that isn't a number.
+unimplemented_code = cfg.symbol_codes[cfg.unimplemented_sym]
+
+# The codes of the values whose real parts aren't stored (i.e., are NaN).
+indeterminate_codes = frozenset(
+    cfg.symbol_codes[symbol] for symbol in realization.indeterminate_symbols
+    )
+
+# The values whose real parts are irrelevant, by their codes. (Other
+# symbols are converted into their canonical tuples when their real parts
+# are zero.)
+values_by_code = {
+    code: cli.tuples_by_lone_element[cfg.symbols_by_code[code]]
+    for code in indeterminate_codes
+    }
+values_by_code[unimplemented_code] = cfg.unimplemented_sym
+
+
+def decompose_value(
+    value,
+    ):
+    """
+    Returns the (real, code) pair by which a calculated result is stored
+    (or, for None, the code of an input that couldn't be evaluated).
+    """
+
+    if value is None:
+        return (math.nan, cfg.evaluation_error_code)
+    real_value, symbol = cli.decompose_result_for_output(value)
+    return (real_value, cfg.symbol_codes[symbol])
+
+
+def compose_value(
+    real_value,
+    code,
+    ):
+    """
+    Returns the result (as a tuple, or "U") represented by a real part and
+    a symbol code (or None, for an input that couldn't be evaluated).
+    """
+
+    if code == cfg.evaluation_error_code:
+        return None
+    value = values_by_code.get(code)
+    if value is not None:
+        return value
+    symbol = cfg.symbols_by_code[code]
+    if real_value == 0.0 and math.copysign(1.0, real_value) == 1.0:
+        return cli.tuples_by_lone_element[symbol]
+    return (real_value, symbol)
+
+
+def apply_operation_quietly(
+    operator,
+    u,
+    v,
+    ):
+    """
+    Applies one of the CLI's operations to two values, returning the
+    (real, code) pair of the result. (A result that couldn't be
+    calculated, including one whose calculation raised an exception, is
+    "U"; any messages printed along the way are suppressed.)
+    """
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            result = tree.binary_operations[operator](u, v)
+        except Exception:
+            return (math.nan, unimplemented_code)
+    if result is None:
+        # (Unlike an input that couldn't be evaluated at all.)
+        return (math.nan, unimplemented_code)
+    return decompose_value(result)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the elementwise operations.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+
+# The behaviors of the operations that combine an ordinary real number
+# (of a given sign) with some other value, once they have been found.
+mixed_behaviors = {}
+
+
+def find_mixed_behavior(
+    operator,
+    real_side,
+    other_value,
+    sign,
+    ):
+    """
+    Determines how an operation combines ordinary real numbers of a given
+    sign (as the left operand, if real_side is 0, or the right operand)
+    with another value, by applying it to representative numbers. Returns
+    a (factor, offset, code, constant) tuple: the result's code is always
+    the given code, and its real part is either the given offset (if
+    constant is True) or the number multiplied by the factor (1 or -1)
+    plus the offset. If the result depends on the number in some other
+    way, None is returned.
+    """
+
+    numbers = realization.sign_representatives[sign]
+    results = []
+    for number in numbers:
+        operand = (number, cfg.null_sym)
+        if real_side == 0:
+            results.append(apply_operation_quietly(operator, operand, other_value))
+        else:
+            results.append(apply_operation_quietly(operator, other_value, operand))
+
+    (first_real, first_code), (second_real, second_code) = results
+    if first_code != second_code:
+        return None
+    if first_code in values_by_code or first_real == second_real:
+        return (0.0, first_real, first_code, True)
+    for factor in (1.0, -1.0):
+        offset = first_real - factor * numbers[0]
+        if second_real - factor * numbers[1] == offset:
+            return (factor, offset, first_code, False)
+    return None
+
+
+def get_mixed_behavior(
+    operator,
+    real_side,
+    other_real,
+    other_code,
+    sign,
+    ):
+    if other_code in values_by_code:
+        other_real = None
+    key = (operator, real_side, other_real, other_code, sign)
+    try:
+        return mixed_behaviors[key]
+    except KeyError:
+        behavior = mixed_behaviors[key] = find_mixed_behavior(
+            operator, real_side, compose_value(other_real, other_code), sign,
+            )
+        return behavior
+
+
+def find_distinct_rows(
+    *columns
+    ):
+    """
+    Returns the positions of the first occurrence of each distinct row of
+    the given columns (of floats or small integers), and the index of the
+    distinct row to which each row belongs. (Floats are compared by their
+    bits, so that NaNs can be grouped together.) The columns are combined
+    into a single integer key, so that only one array need be sorted;
+    a column whose values are all the same (e.g., a single value that
+    has been broadcast) is skipped.
+    """
+
+    keys = np.zeros(len(columns[0]), dtype=np.int64)
+    key_count = 1
+    for column in columns:
+        if column.dtype == np.float64:
+            column = column.view(np.int64)
+        if (column == column[0]).all():
+            continue
+        if column.dtype == np.int64:
+            unique_values, column_keys = np.unique(column, return_inverse=True)
+            column_key_count = len(unique_values)
+        else:
+            smallest_value = int(column.min())
+            column_keys = column.astype(np.int64) - smallest_value
+            column_key_count = int(column.max()) - smallest_value + 1
+        if key_count * column_key_count >= 2 ** 62:
+            unique_keys, keys = np.unique(keys, return_inverse=True)
+            key_count = len(unique_keys)
+        keys = keys * column_key_count + column_keys.reshape(-1)
+        key_count *= column_key_count
+
+    if key_count == 1:
+        return (np.zeros(1, dtype=np.intp), np.zeros(len(keys), dtype=np.intp))
+    unique_keys, first_positions, inverse = np.unique(
+        keys, return_index=True, return_inverse=True
+        )
+    return (first_positions, inverse.reshape(-1))
+
+
+def combine_mixed_values(
+    operator,
+    real_side,
+    numbers,
+    other_reals,
+    other_codes,
+    ):
+    """
+    Combines ordinary real numbers with other values, once for each
+    distinct pair of another value and the sign of a number. Returns the
+    real parts and codes of the results, along with a Boolean array
+    indicating which of them were found (the rest being left to be
+    combined separately).
+    """
+
+    signs = np.sign(numbers).astype(np.int8)
+    first_positions, inverse = find_distinct_rows(other_reals, other_codes, signs)
+    factors = np.zeros(len(first_positions))
+    offsets = np.zeros(len(first_positions))
+    codes = np.zeros(len(first_positions), dtype=np.int8)
+    constant = np.zeros(len(first_positions), dtype=bool)
+    found = np.zeros(len(first_positions), dtype=bool)
+    for row, position in enumerate(first_positions.tolist()):
+        behavior = get_mixed_behavior(
+            operator, real_side, float(other_reals[position]),
+            int(other_codes[position]), int(signs[position]),
+            )
+        if behavior is not None:
+            factors[row], offsets[row], codes[row], constant[row] = behavior
+            found[row] = True
+
+    constant = constant[inverse]
+    results = np.where(constant, offsets[inverse], factors[inverse] * numbers + offsets[inverse])
+    found = found[inverse] & (constant | realization.is_ordinary_real(results))
+    return (results, codes[inverse], found)
+
+
+def combine_distinct_values(
+    operator,
+    u_reals,
+    u_codes,
+    v_reals,
+    v_codes,
+    ):
+    """
+    Combines pairs of values by means of the CLI's operation, once for
+    each distinct pair. Returns the real parts and codes of the results.
+    """
+
+    first_positions, inverse = find_distinct_rows(u_reals, u_codes, v_reals, v_codes)
+    reals = np.empty(len(first_positions))
+    codes = np.empty(len(first_positions), dtype=np.int8)
+    for row, position in enumerate(first_positions.tolist()):
+        reals[row], codes[row] = apply_operation_quietly(
+            operator,
+            compose_value(float(u_reals[position]), int(u_codes[position])),
+            compose_value(float(v_reals[position]), int(v_codes[position])),
+            )
+    return (reals[inverse], codes[inverse])
+
+
+def prepare_output(
+    shape,
+    out,
+    operands,
+    ):
+    """
+    Returns flat arrays into which the real parts and codes of the results
+    are to be written: those of out itself, if it is given and can be
+    written directly, and otherwise new arrays.
+    """
+
+    if out is None:
+        return (np.empty(shape).reshape(-1), np.empty(shape, dtype=np.int8).reshape(-1))
+    if out.shape != shape:
+        raise ValueError(
+            f"The output array has the shape {out.shape}, rather than {shape}."
+            )
+    if out.reals.flags.c_contiguous and out.codes.flags.c_contiguous and not any(
+            np.may_share_memory(out.reals, operand.reals)
+            or np.may_share_memory(out.codes, operand.codes)
+            for operand in operands
+            ):
+        return (out.reals.reshape(-1), out.codes.reshape(-1))
+    return (np.empty(shape).reshape(-1), np.empty(shape, dtype=np.int8).reshape(-1))
+
+
+def apply_operation(
+    operator,
+    u,
+    v,
+    out=None,
+    ):
+    """
+    Applies one of the CLI's operations ("+", "-", "*", "/", or "^")
+    elementwise to two TransvalentArrays (or to an array and a single
+    value), broadcasting them as NumPy does. The results are written to
+    out, if it is given, and otherwise to a new TransvalentArray.
+    """
+
+    require_numpy()
+    u = as_array(u)
+    v = as_array(v)
+    shape = np.broadcast_shapes(u.shape, v.shape)
+    u_reals, u_codes, v_reals, v_codes = (
+        np.broadcast_to(array, shape).reshape(-1)
+        for array in (u.reals, u.codes, v.reals, v.codes)
+        )
+    reals, codes = prepare_output(shape, out, (u, v))
+
+    u_ordinary = (u_codes == 0) & realization.is_ordinary_real(u_reals)
+    v_ordinary = (v_codes == 0) & realization.is_ordinary_real(v_reals)
+    both_ordinary = u_ordinary & v_ordinary
+
+    with np.errstate(all="ignore"):
+
+        # Combine ordinary real numbers by means of NumPy.
+        if both_ordinary.all():
+            reals[:] = realization.real_operations[operator](u_reals, v_reals)
+            codes[:] = 0
+            unresolved = ~realization.is_ordinary_real(reals)
+        else:
+            unresolved = ~both_ordinary
+            indexes = np.flatnonzero(both_ordinary)
+            if len(indexes):
+                results = realization.real_operations[operator](
+                    u_reals[indexes], v_reals[indexes]
+                    )
+                reals[indexes] = results
+                codes[indexes] = 0
+                unresolved[indexes[~realization.is_ordinary_real(results)]] = True
+
+            # Combine ordinary real numbers with other values (apart from
+            # real numbers that aren't ordinary, other than zero) once for
+            # each sign. (A power depends on more than the sign of its
+            # exponent, e.g., on whether it is an integer, so powers are
+            # instead combined once for each distinct pair, below.)
+            for real_side, real_mask, other_reals, other_codes, numbers in (
+                    (0, u_ordinary & ~v_ordinary, v_reals, v_codes, u_reals),
+                    (1, v_ordinary & ~u_ordinary, u_reals, u_codes, v_reals),
+                    ) if operator != "^" else ():
+                indexes = np.flatnonzero(
+                    real_mask & ((other_codes != 0) | (other_reals == 0.0))
+                    )
+                if not len(indexes):
+                    continue
+                results, result_codes, found = combine_mixed_values(
+                    operator, real_side, numbers[indexes],
+                    other_reals[indexes], other_codes[indexes],
+                    )
+                reals[indexes[found]] = results[found]
+                codes[indexes[found]] = result_codes[found]
+                unresolved[indexes[found]] = False
+
+        # Combine any remaining values once for each distinct pair.
+        indexes = np.flatnonzero(unresolved)
+        if len(indexes):
+            reals[indexes], codes[indexes] = combine_distinct_values(
+                operator, u_reals[indexes], u_codes[indexes],
+                v_reals[indexes], v_codes[indexes],
+                )
+
+    if out is None:
+        return TransvalentArray(reals.reshape(shape), codes.reshape(shape))
+    if not np.may_share_memory(out.reals, reals):
+        out.reals[...] = reals.reshape(shape)
+        out.codes[...] = codes.reshape(shape)
+    return out
+
+
+def add(
+    u,
+    v,
+    out=None,
+    ):
+    return apply_operation("+", u, v, out)
+
+
+def subtract(
+    u,
+    v,
+    out=None,
+    ):
+    return apply_operation("-", u, v, out)
+
+
+def multiply(
+    u,
+    v,
+    out=None,
+    ):
+    return apply_operation("*", u, v, out)
+
+
+def divide(
+    u,
+    v,
+    out=None,
+    ):
+    return apply_operation("/", u, v, out)
+
+
+def power(
+    u,
+    v,
+    out=None,
+    ):
+    return apply_operation("^", u, v, out)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the array of transvalent values.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def as_array(
+    value,
+    ):
+    """
+    Returns the given value as a TransvalentArray (with no dimensions, if
+    it is a single value rather than an array).
+    """
+
+    if isinstance(value, TransvalentArray):
+        return value
+    if isinstance(value, (int, np.integer, np.floating)) and not isinstance(value, bool):
+        value = float(value)
+    real_value, code = decompose_value(value)
+    return TransvalentArray(np.array(real_value), np.array(code, dtype=np.int8))
+
+
+def format_value(
+    real_value,
+    code,
+    ):
+    """
+    Formats a stored value as the CLI displays the equivalent result.
+    """
+
+    if code == 0:
+        return str(real_value)
+    if code == cfg.evaluation_error_code:
+        return cfg.evaluation_error_marker
+    symbol = cfg.symbols_by_code[code]
+    if code in values_by_code or real_value == 0.0:
+        return symbol
+    return f"({real_value}, {symbol})"
+
+
+class TransvalentArray:
+    """
+    An array of transvalent values, stored as an array of real parts
+    (float64) and an array of symbol codes (int8). The two arrays may be
+    views of other arrays or memory-mapped files, which are then read and
+    written in place.
+    """
+
+    # (NumPy's scalars and arrays defer to this class's operators, rather
+    # than treating an array as a single object.)
+    __array_ufunc__ = None
+
+
+    def __init__(self, reals, codes):
+        require_numpy()
+        self.reals = np.asanyarray(reals, dtype=np.float64)
+        self.codes = np.asanyarray(codes, dtype=np.int8)
+        if self.reals.shape != self.codes.shape:
+            raise ValueError(
+                f"The real parts have the shape {self.reals.shape}, but the "
+                + f"codes have the shape {self.codes.shape}."
+                )
+
+
+    @classmethod
+    def empty(cls, shape):
+        """
+        Creates an array of the given shape whose values are undefined
+        (as with numpy.empty()), to be filled in later.
+        """
+
+        require_numpy()
+        return cls(np.empty(shape), np.empty(shape, dtype=np.int8))
+
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Creates an array from calculated results (e.g., floats, symbols,
+        and tuples). Each distinct result is decomposed only once.
+        """
+
+        require_numpy()
+        pairs_by_value = {}
+        reals = []
+        codes = []
+        append_real = reals.append
+        append_code = codes.append
+        for value in values:
+            if type(value) is float:
+                append_real(value)
+                append_code(0)
+                continue
+            pair = pairs_by_value.get(value)
+            if pair is None:
+                pair = pairs_by_value[value] = decompose_value(value)
+            append_real(pair[0])
+            append_code(pair[1])
+        return cls(np.array(reals, dtype=np.float64), np.array(codes, dtype=np.int8))
+
+
+    @classmethod
+    def load(cls, prefix, mode="r"):
+        """
+        Opens the pair of .npy files with the given prefix (as written by
+        save() or by writers.NpyResultWriter) as memory-mapped arrays.
+        The mode is that of numpy.load() (e.g., "r+" to modify the values
+        in place).
+        """
+
+        require_numpy()
+        return cls(
+            np.load(prefix + ".real.npy", mmap_mode=mode),
+            np.load(prefix + ".symbol.npy", mmap_mode=mode),
+            )
+
+
+    @classmethod
+    def create(cls, prefix, shape):
+        """
+        Creates a pair of .npy files with the given prefix, for an array
+        of the given shape, and returns them as a memory-mapped array
+        (e.g., for use as the output of an operation too large to be held
+        in memory).
+        """
+
+        require_numpy()
+        return cls(
+            np.lib.format.open_memmap(
+                prefix + ".real.npy", mode="w+", dtype=np.float64, shape=shape
+                ),
+            np.lib.format.open_memmap(
+                prefix + ".symbol.npy", mode="w+", dtype=np.int8, shape=shape
+                ),
+            )
+
+
+    def save(self, prefix):
+        """
+        Saves the array as a pair of .npy files with the given prefix.
+        """
+
+        np.save(prefix + ".real.npy", self.reals)
+        np.save(prefix + ".symbol.npy", self.codes)
+
+
+    def flush(self):
+        """
+        Writes any changes to a memory-mapped array to its files.
+        """
+
+        for array in (self.reals, self.codes):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+
+    def to_values(self):
+        """
+        Returns a list of the results represented by the array (in the
+        order of its flattened elements).
+        """
+
+        return [
+            compose_value(real_value, code)
+            for real_value, code in zip(
+                self.reals.reshape(-1).tolist(), self.codes.reshape(-1).tolist()
+                )
+            ]
+
+
+    def argsort(self):
+        """
+        Returns the indexes that would sort a one-dimensional array (see
+        ordering.py).
+        """
+
+        return ordering.argsort_results(self.reals, self.codes)
+
+
+    def copy(self):
+        """
+        Returns a new array holding copies of this array's real parts and
+        symbol codes (e.g., of an array loaded from memory-mapped files).
+        """
+
+        return TransvalentArray(self.reals.copy(), self.codes.copy())
+
+
+    @property
+    def shape(self):
+        """
+        The shape of the array (as for a NumPy array).
+        """
+
+        return self.reals.shape
+
+
+    @property
+    def size(self):
+        """
+        The number of values in the array.
+        """
+
+        return self.reals.size
+
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes taken by the real parts and symbol codes (9
+        per value).
+        """
+
+        return self.reals.nbytes + self.codes.nbytes
+
+
+    def __len__(self):
+        """
+        Returns the length of the array's first dimension.
+        """
+
+        return len(self.reals)
+
+
+    def __getitem__(self, key):
+        """
+        Returns a single result (for an integer index), or a
+        TransvalentArray of the selected values (for a slice, a Boolean
+        mask, or an array of indexes, as with NumPy's arrays).
+        """
+
+        if isinstance(key, TransvalentArray):
+            raise TypeError("A TransvalentArray can't be used as an index.")
+        reals = self.reals[key]
+        codes = self.codes[key]
+        if np.ndim(reals) == 0 and not isinstance(reals, np.ndarray):
+            return compose_value(float(reals), int(codes))
+        return TransvalentArray(reals, codes)
+
+
+    def __setitem__(self, key, value):
+        """
+        Stores a result (or the values of an array) at the selected
+        positions.
+        """
+
+        value = as_array(value)
+        self.reals[key] = value.reals
+        self.codes[key] = value.codes
+
+
+    def __repr__(self):
+        """
+        Returns a description of the array that shows its first 10
+        values as the CLI displays them.
+        """
+
+        values = [
+            format_value(real_value, code)
+            for real_value, code in zip(
+                self.reals.reshape(-1)[:10].tolist(), self.codes.reshape(-1)[:10].tolist()
+                )
+            ]
+        if self.size > 10:
+            values.append("...")
+        return f"TransvalentArray([{', '.join(values)}], shape={self.shape})"
+
+
+    def __add__(self, other):
+        """
+        Returns a new array of this array's values added to the other
+        operand's (an array or a single result), elementwise.
+        """
+
+        return apply_operation("+", self, other)
+
+
+    def __radd__(self, other):
+        """
+        Returns a new array of the other operand's values added to this
+        array's, elementwise.
+        """
+
+        return apply_operation("+", other, self)
+
+
+    def __iadd__(self, other):
+        """
+        Stores this array's values added to the other operand's in place
+        of this array's values.
+        """
+
+        return apply_operation("+", self, other, out=self)
+
+
+    def __sub__(self, other):
+        """
+        Returns a new array of this array's values minus the other
+        operand's (an array or a single result), elementwise.
+        """
+
+        return apply_operation("-", self, other)
+
+
+    def __rsub__(self, other):
+        """
+        Returns a new array of the other operand's values minus this
+        array's, elementwise.
+        """
+
+        return apply_operation("-", other, self)
+
+
+    def __isub__(self, other):
+        """
+        Stores this array's values minus the other operand's in place
+        of this array's values.
+        """
+
+        return apply_operation("-", self, other, out=self)
+
+
+    def __mul__(self, other):
+        """
+        Returns a new array of this array's values multiplied by the other
+        operand's (an array or a single result), elementwise.
+        """
+
+        return apply_operation("*", self, other)
+
+
+    def __rmul__(self, other):
+        """
+        Returns a new array of the other operand's values multiplied by this
+        array's, elementwise.
+        """
+
+        return apply_operation("*", other, self)
+
+
+    def __imul__(self, other):
+        """
+        Stores this array's values multiplied by the other operand's in place
+        of this array's values.
+        """
+
+        return apply_operation("*", self, other, out=self)
+
+
+    def __truediv__(self, other):
+        """
+        Returns a new array of this array's values divided by the other
+        operand's (an array or a single result), elementwise.
+        """
+
+        return apply_operation("/", self, other)
+
+
+    def __rtruediv__(self, other):
+        """
+        Returns a new array of the other operand's values divided by this
+        array's, elementwise.
+        """
+
+        return apply_operation("/", other, self)
+
+
+    def __itruediv__(self, other):
+        """
+        Stores this array's values divided by the other operand's in place
+        of this array's values.
+        """
+
+        return apply_operation("/", self, other, out=self)
+
+
+    def __pow__(self, other):
+        """
+        Returns a new array of this array's values raised to the power of the other
+        operand's (an array or a single result), elementwise.
+        """
+
+        return apply_operation("^", self, other)
+
+
+    def __rpow__(self, other):
+        """
+        Returns a new array of the other operand's values raised to the power of this
+        array's, elementwise.
+        """
+
+        return apply_operation("^", other, self)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def generate_values(
+    count,
+    real_fraction=0.9,
+    seed=None,
+    ):
+    """
+    Returns a list of randomly chosen results, most of which are real
+    numbers (including some zeros) and the rest symbols or tuples.
+    """
+
+    generator = random.Random(seed)
+    symbols = list(cli.tuples_by_lone_element) + [cfg.unimplemented_sym]
+    values = []
+    for index in range(count):
+        if generator.random() < real_fraction:
+            if generator.random() < 0.01:
+                values.append((0.0, cfg.null_sym))
+            else:
+                values.append((round(generator.gauss(0.0, 10.0), 2), cfg.null_sym))
+        elif generator.random() < 0.1:
+            values.append((float(generator.randrange(1, 5)), generator.choice(symbols[:12])))
+        else:
+            symbol = generator.choice(symbols)
+            values.append(cli.tuples_by_lone_element.get(symbol, symbol))
+    return values
+
+
+def results_agree(
+    first_pair,
+    second_pair,
+    ):
+    """
+    Returns True if two (real, code) pairs represent the same result
+    (treating NaN real parts as equal).
+    """
+
+    (first_real, first_code), (second_real, second_code) = first_pair, second_pair
+    return first_code == second_code and (
+        first_real == second_real or (first_real != first_real and second_real != second_real)
+        )
+
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(
+        description="Apply operations to arrays of random transvalent values, "
+            + "comparing the results and speed with those of the CLI's "
+            + "operations on individual values."
+        )
+    argument_parser.add_argument("--count", type=int, default=1000000)
+    argument_parser.add_argument(
+        "--check-count", type=int, default=10000,
+        help="the number of values checked against the CLI's operations",
+        )
+    argument_parser.add_argument("--real-fraction", type=float, default=0.9)
+    argument_parser.add_argument("--seed", type=int, default=None)
+    arguments = argument_parser.parse_args()
+
+    left_values = generate_values(arguments.count, arguments.real_fraction, arguments.seed)
+    right_values = generate_values(
+        arguments.count, arguments.real_fraction,
+        None if arguments.seed is None else arguments.seed + 1,
+        )
+
+    start_time = time.perf_counter()
+    left = TransvalentArray.from_values(left_values)
+    right = TransvalentArray.from_values(right_values)
+    conversion_time = time.perf_counter() - start_time
+    list_bytes = sys.getsizeof(left_values) + sum(
+        sys.getsizeof(value) + (
+            sys.getsizeof(value[0]) if type(value) is tuple else 0
+            )
+        for value in left_values
+        )
+    print(f"values: {len(left):,}   converted in {conversion_time / 2:.4f} s per array")
+    print(f"bytes per value: {left.nbytes / len(left):.1f} "
+        + f"(list of results: about {list_bytes / len(left):.1f})")
+
+    check_count = min(arguments.check_count, len(left))
+    for operator, function in (("+", add), ("-", subtract), ("*", multiply), ("/", divide)):
+        start_time = time.perf_counter()
+        result = function(left, right)
+        array_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        expected = [
+            apply_operation_quietly(operator, u, v)
+            for u, v in zip(left.to_values()[:check_count], right.to_values()[:check_count])
+            ]
+        cli_time = (time.perf_counter() - start_time) * len(left) / max(check_count, 1)
+
+        disagreements = sum(
+            not results_agree(pair, (real_value, code))
+            for pair, real_value, code in zip(
+                expected, result.reals[:check_count].tolist(), result.codes[:check_count].tolist()
+                )
+            )
+        print(f"{operator}  array: {array_time:8.4f} s   CLI (estimated): {cli_time:8.2f} s   "
+            + f"({cli_time / max(array_time, 1e-9):.0f}×)   disagreements: {disagreements:,}")
@@ -0,0 +1,612 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module allows files of Liniarote expressions (with one expression
+per line) to be evaluated in batch mode, without use of the interactive
+command prompt. Input files are memory-mapped rather than read into
+memory, so that even multi-gigabyte files can be processed while peak
+memory use remains flat.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import os
+import sys
+import json
+import time
+import mmap
+import argparse
+import builtins
+import tempfile
+import contextlib
+import collections
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import writers
+    from . import diagnostics
+    from . import metrics
+    from . import evaluation_context as ctx
+except:
+    import config as cfg
+    import cli
+    import writers
+    import diagnostics
+    import metrics
+    import evaluation_context as ctx
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the memory-mapped reader.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The number of bytes examined at a time when newlines must be counted
+# (e.g., to determine the line number at which a resumed run begins).
+line_count_chunk_size = 1 << 20
+
+
+def open_mapped_file(
+    file_path,
+    ):
+    """
+    Returns a read-only memory map of the given file, or None if the
+    file is empty (as zero-length files cannot be memory-mapped).
+    """
+
+    with open(file_path, "rb") as file_handle:
+        if os.fstat(file_handle.fileno()).st_size == 0:
+            return None
+        mapped_file = mmap.mmap(
+            file_handle.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+    # Tell the operating system that the file will be read from start
+    # to finish, so that pages that have already been processed can be
+    # dropped eagerly (where this is supported).
+    if hasattr(mapped_file, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped_file.madvise(mmap.MADV_SEQUENTIAL)
+
+    return mapped_file
+
+
+def count_lines_before_offset(
+    mapped_file,
+    offset,
+    ):
+    """
+    Counts the newlines that appear before the given byte offset,
+    examining the mapped buffer in fixed-size chunks so that no large
+    copy of the file is made.
+    """
+
+    line_count = 0
+    position = 0
+    while position < offset:
+        chunk_end = min(position + line_count_chunk_size, offset)
+        line_count += mapped_file[position:chunk_end].count(b"\n")
+        position = chunk_end
+    return line_count
+
+
+def align_offset_to_line_start(
+    mapped_file,
+    offset,
+    ):
+    """
+    Moves the given byte offset forward (if necessary) to the start of
+    the next line, so that it can safely be used as a split point.
+    """
+
+    if offset <= 0:
+        return 0
+    if offset >= len(mapped_file):
+        return len(mapped_file)
+    if mapped_file[offset - 1] == ord("\n"):
+        return offset
+
+    newline_position = mapped_file.find(b"\n", offset)
+    if newline_position == -1:
+        return len(mapped_file)
+    return newline_position + 1
+
+
+def find_split_offsets(
+    file_path,
+    number_of_parts,
+    ):
+    """
+    Divides the given file into (at most) the requested number of parts
+    of roughly equal size, each of which begins at the start of a line.
+    Returns a list of (start_offset, end_offset) pairs that can be
+    passed to iterate_mapped_lines() (e.g., by separate workers).
+    """
+
+    mapped_file = open_mapped_file(file_path)
+    if mapped_file is None:
+        return []
+
+    try:
+        file_size = len(mapped_file)
+        boundaries = [0]
+        for part_number in range(1, number_of_parts):
+            boundary = align_offset_to_line_start(
+                mapped_file, (file_size * part_number) // number_of_parts
+                )
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+        if boundaries[-1] < file_size:
+            boundaries.append(file_size)
+    finally:
+        mapped_file.close()
+
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+class UndecodableText(str):
+    """
+    The text of a line that isn't valid UTF-8, as yielded by
+    iterate_mapped_lines() (with each invalid byte replaced by "\ufffd"),
+    so that it can be reported rather than evaluated.
+    """
+
+
+def iterate_mapped_lines(
+    file_path,
+    start_offset=0,
+    end_offset=None,
+    ):
+    """
+    Yields a (line_number, offset, next_offset, text) tuple for each
+    line of the given file whose first byte lies in the range
+    [start_offset, end_offset). Line boundaries are located directly
+    within the memory-mapped buffer, and only the bytes of each
+    individual line are copied and decoded.
+
+    The value of next_offset is the byte offset at which the following
+    line begins; a run that has been interrupted can thus be resumed by
+    passing the last next_offset that was processed as start_offset. The
+    text of a line that isn't valid UTF-8 is yielded as UndecodableText,
+    so that a single such line doesn't end the iteration.
+    """
+
+    mapped_file = open_mapped_file(file_path)
+    if mapped_file is None:
+        return
+
+    try:
+        file_size = len(mapped_file)
+        if end_offset is None or end_offset > file_size:
+            end_offset = file_size
+
+        offset = align_offset_to_line_start(mapped_file, start_offset)
+        line_number = count_lines_before_offset(mapped_file, offset) + 1
+
+        find_newline = mapped_file.find
+        while offset < end_offset:
+            newline_position = find_newline(b"\n", offset)
+            if newline_position == -1:
+                newline_position = file_size
+            next_offset = newline_position + 1
+
+            # Strip a Windows-style carriage return, if present.
+            line_end = newline_position
+            if line_end > offset and mapped_file[line_end - 1] == ord("\r"):
+                line_end -= 1
+
+            line_bytes = mapped_file[offset:line_end]
+            try:
+                text = line_bytes.decode("utf-8")
+            except UnicodeDecodeError:
+                text = UndecodableText(line_bytes.decode("utf-8", errors="replace"))
+            yield (line_number, offset, min(next_offset, file_size), text)
+
+            line_number += 1
+            offset = next_offset
+    finally:
+        mapped_file.close()
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the batch evaluator.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def evaluate_file(
+    file_path,
+    start_offset=0,
+    end_offset=None,
+    context=None,
+    ):
+    """
+    Evaluates each non-blank line of the given file as a Liniarote
+    expression. Yields a (line_number, offset, next_offset, text, result,
+    line_diagnostics) tuple for each line, in which result is the
+    unformatted result generated by the parser and line_diagnostics is
+    the list of problems detected (see diagnostics.py), which are
+    recorded rather than displayed. The evaluation of each line is
+    recorded in the run-time metrics (see metrics.py).
+
+    The lines are evaluated within the given context (by default, a new
+    one with the constants currently recognized). As there's no one to
+    ask for the value of an unknown constant, a line that uses one gives
+    the result None and an "unknown_constant" diagnostic. A line that isn't
+    valid UTF-8 isn't evaluated; it gives the result None and an
+    "invalid_encoding" diagnostic.
+    """
+
+    if context is None:
+        context = ctx.EvaluationContext(prompt_for_constants=False)
+    lexer = cli.create_lexer()
+    runtime_metrics = metrics.runtime_metrics
+
+    for line_number, offset, next_offset, text in iterate_mapped_lines(
+            file_path, start_offset, end_offset
+            ):
+
+        # Blank lines are skipped (but still counted).
+        if not text.strip():
+            continue
+
+        if type(text) is UndecodableText:
+            result = None
+            line_diagnostics = [diagnostics.Diagnostic(
+                line_number, None, None, "invalid_encoding",
+                diagnostics.diagnostic_messages["invalid_encoding"],
+                )]
+            runtime_metrics.record_diagnosed_expression(0.0, result, 0, line_diagnostics)
+            yield (line_number, offset, next_offset, text, result, line_diagnostics)
+            continue
+
+        parsers_before = metrics.count_parsers_created()
+        start_time = time.perf_counter()
+        result, line_diagnostics = diagnostics.parse_with_diagnostics(
+            text, line_number, lexer, context
+            )
+        runtime_metrics.record_diagnosed_expression(
+            time.perf_counter() - start_time, result,
+            metrics.count_parsers_created() - parsers_before - 1, line_diagnostics,
+            )
+
+        yield (line_number, offset, next_offset, text, result, line_diagnostics)
+
+
+def write_rejected_line(
+    reject_file,
+    line_number,
+    text,
+    line_diagnostics,
+    ):
+    """
+    Writes a line whose input contains errors to the reject file (as a
+    line of JSON that includes its diagnostics).
+    """
+
+    reject_file.write(json.dumps({
+        "line": line_number,
+        "text": text,
+        "diagnostics": [
+            diagnostic._asdict() for diagnostic in line_diagnostics
+            ],
+        }, ensure_ascii=False) + "\n")
+
+
+def describe_input_errors(
+    line_diagnostics,
+    ):
+    """
+    Returns a description of the errors that prevented a line from
+    giving a result, for display in place of the result.
+    """
+
+    return " ".join(
+        diagnostic.message
+            + (f" ({diagnostic.token})" if diagnostic.token else "")
+        for diagnostic in line_diagnostics
+        if diagnostic.category in diagnostics.input_categories
+        )
+
+
+def parse_constant_assignment(
+    assignment_text,
+    ):
+    """
+    Converts text of the form "name=value" (e.g., "m=5.7") into a
+    (name, value) pair, for use with the --constant option.
+    """
+
+    name, separator, value = assignment_text.partition("=")
+    if not separator or not name.strip():
+        raise argparse.ArgumentTypeError(
+            f"Constants must be given in the form name=value: {assignment_text}"
+            )
+    return (name.strip(), float(value))
+
+
+def refuse_input(
+    prompt="",
+    ):
+    """
+    Takes the place of input() while batch mode is checked, so that any
+    attempt to ask for input (which batch mode must never make) fails.
+    """
+
+    raise AssertionError(f"Batch mode asked for input: {prompt!r}")
+
+
+def check_batch_mode():
+    """
+    Runs batch mode on a small file of expressions, one of which isn't
+    valid UTF-8 (while refusing any request for input), and checks the
+    results. Returns a list of
+    descriptions of the checks that failed.
+    """
+
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "expressions.txt")
+        with open(input_path, "wb") as input_file:
+            input_file.write(b"2+3\n2 * undefined_constant\n4*2\n3 + \xff\n5-1\n")
+
+        original_input = builtins.input
+        builtins.input = refuse_input
+        try:
+            evaluated_lines = {
+                line_number: (result, line_diagnostics)
+                for line_number, _, _, _, result, line_diagnostics
+                in evaluate_file(input_path)
+                }
+
+            # Run batch mode with a reject file, too, to check where each
+            # line is written.
+            output_path = os.path.join(directory, "results.jsonl")
+            reject_path = os.path.join(directory, "rejected.jsonl")
+            with contextlib.redirect_stderr(io.StringIO()):
+                main([
+                    input_path, "--format", "jsonl", "--output", output_path,
+                    "--reject-file", reject_path,
+                    ])
+        finally:
+            builtins.input = original_input
+
+        with open(output_path, encoding="utf-8") as output_file:
+            written_lines = [
+                json.loads(output_line)["line"] for output_line in output_file
+                ]
+        with open(reject_path, encoding="utf-8") as reject_file:
+            rejected_lines = [
+                json.loads(reject_line) for reject_line in reject_file
+                ]
+
+    # A line that uses an unknown constant gives an error of its own,
+    # without affecting the lines around it.
+    result, line_diagnostics = evaluated_lines[2]
+    if result is not None or [
+            (diagnostic.category, diagnostic.token, diagnostic.column)
+            for diagnostic in line_diagnostics
+            ] != [("unknown_constant", "undefined_constant", 5)]:
+        failures.append(
+            "An unknown constant wasn't reported as an error of its line: "
+            + f"{result!r}, {line_diagnostics!r}"
+            )
+    # A line that isn't valid UTF-8 is reported in the same way, and the
+    # lines that follow it are still evaluated.
+    result, line_diagnostics = evaluated_lines[4]
+    if result is not None or [
+            diagnostic.category for diagnostic in line_diagnostics
+            ] != ["invalid_encoding"]:
+        failures.append(
+            "A line that isn't valid UTF-8 wasn't reported as an error of its "
+            + f"line: {result!r}, {line_diagnostics!r}"
+            )
+    for line_number, expected_result in ((1, "5.0"), (3, "8.0"), (5, "4.0")):
+        result, line_diagnostics = evaluated_lines[line_number]
+        if cli.format_result_for_display(result) != expected_result \
+                or line_diagnostics:
+            failures.append(
+                f"Line {line_number} gave {result!r} ({line_diagnostics!r}) "
+                + f"rather than {expected_result!r}"
+                )
+
+    # A line whose input contains errors is written only to the reject
+    # file (with its diagnostics), and every other line only to the output.
+    if written_lines != [1, 3, 5]:
+        failures.append(
+            f"The output contained lines {written_lines!r} rather than [1, 3, 5]"
+            )
+    if [
+            (rejected_line["line"], rejected_line["text"], [
+                diagnostic["category"]
+                for diagnostic in rejected_line["diagnostics"]
+                ])
+            for rejected_line in rejected_lines
+            ] != [
+                (2, "2 * undefined_constant", ["unknown_constant"]),
+                (4, "3 + \ufffd", ["invalid_encoding"]),
+                ]:
+        failures.append(
+            f"The reject file contained {rejected_lines!r} rather than lines 2 and 4"
+            )
+
+    return failures
+
+
+def build_argument_parser():
+    """
+    Defines the command-line options accepted in batch mode.
+    """
+
+    argument_parser = argparse.ArgumentParser(
+        description="Evaluate a file of Liniarote expressions "
+            "(one expression per line)."
+        )
+    argument_parser.add_argument(
+        "input_file", nargs="?",
+        help="the file of expressions to be evaluated",
+        )
+    argument_parser.add_argument(
+        "--start-offset", type=int, default=0,
+        help="the byte offset at which evaluation should begin "
+            "(e.g., to resume an interrupted run)",
+        )
+    argument_parser.add_argument(
+        "--end-offset", type=int, default=None,
+        help="the byte offset at which evaluation should stop",
+        )
+    argument_parser.add_argument(
+        "--split", type=int, default=None, metavar="N",
+        help="display the byte offsets that divide the input file into "
+            "N parts (at line boundaries) and exit",
+        )
+    argument_parser.add_argument(
+        "--constant", type=parse_constant_assignment, action="append",
+        default=[], metavar="NAME=VALUE",
+        help="assign a value to a user-created constant",
+        )
+    argument_parser.add_argument(
+        "--format", choices=["text", "jsonl", "csv", "npy", "bin"], default="text",
+        help="the format in which results should be written",
+        )
+    argument_parser.add_argument(
+        "--output", default=None,
+        help="the file to which results should be written (for the npy "
+            "format, the prefix of the two files to be created); results "
+            "are written to standard output if this isn't given",
+        )
+    argument_parser.add_argument(
+        "--reject-file", default=None,
+        help="the file to which lines whose input contains errors should "
+            "be written (as JSON lines, with their diagnostics) instead of "
+            "to the output; such lines are still evaluated, as their errors "
+            "are only detected during evaluation",
+        )
+    argument_parser.add_argument(
+        "--metrics-file", default=None,
+        help="a file to which the run-time metrics should be written "
+            "periodically (and at the end of the run), in the Prometheus "
+            "text format",
+        )
+    argument_parser.add_argument(
+        "--metrics-interval", type=float, default=cfg.metrics_write_interval,
+        metavar="SECONDS",
+        help="the number of seconds between writes of the metrics file",
+        )
+    argument_parser.add_argument(
+        "--check", action="store_true",
+        help="check batch mode's handling of a small built-in file of "
+            "expressions (instead of evaluating an input file)",
+        )
+    return argument_parser
+
+
+def main(argv=None):
+    """
+    Runs batch mode using the given command-line arguments.
+    """
+
+    argument_parser = build_argument_parser()
+    arguments = argument_parser.parse_args(argv)
+
+    if arguments.check:
+        failures = check_batch_mode()
+        print(f"checks failed: {len(failures)}")
+        for failure in failures:
+            print(f"    {failure}")
+        return 1 if failures else 0
+    if arguments.input_file is None:
+        argument_parser.error("an input file is required (unless --check is used)")
+
+    if arguments.split is not None:
+        for start_offset, end_offset in find_split_offsets(
+                arguments.input_file, arguments.split
+                ):
+            print(start_offset, end_offset)
+        return
+
+    for name, value in arguments.constant:
+        cfg.recognized_constants[name] = value
+    if arguments.metrics_file is not None:
+        cfg.metrics_file_path = arguments.metrics_file
+        cfg.metrics_write_interval = arguments.metrics_interval
+
+    evaluated_lines = evaluate_file(
+        arguments.input_file, arguments.start_offset, arguments.end_offset
+        )
+    next_offset = arguments.start_offset
+    lines_evaluated = 0
+    lines_rejected = 0
+    diagnostic_counts = collections.Counter()
+
+    reject_file = None
+    if arguments.reject_file is not None:
+        reject_file = open(arguments.reject_file, "w", encoding="utf-8")
+
+    result_writer = None
+    if arguments.format != "text":
+        result_writer = writers.open_result_writer(
+            arguments.format, arguments.output
+            )
+
+    try:
+        for line_number, offset, next_offset, text, result, line_diagnostics \
+                in evaluated_lines:
+
+            for diagnostic in line_diagnostics:
+                diagnostic_counts[diagnostic.category] += 1
+
+            if (reject_file is not None) \
+                    and diagnostics.has_input_errors(line_diagnostics):
+                write_rejected_line(reject_file, line_number, text, line_diagnostics)
+                lines_rejected += 1
+                continue
+
+            lines_evaluated += 1
+            if result_writer is None:
+                print(f"{line_number}: {text}")
+                if result is None:
+                    print("    error =  " + describe_input_errors(line_diagnostics))
+                else:
+                    print("    output =  " + str(cli.format_result_for_display(result)))
+            else:
+                result_writer.write(line_number, result)
+
+    finally:
+        if result_writer is not None:
+            result_writer.close()
+        if reject_file is not None:
+            reject_file.close()
+        if cfg.metrics_file_path is not None:
+            metrics.runtime_metrics.write_text_file(cfg.metrics_file_path)
+
+    # Report the run's statistics and where a subsequent run should begin,
+    # so that processing can be resumed from this point.
+    print(f"lines evaluated: {lines_evaluated}", file=sys.stderr)
+    print(f"lines rejected: {lines_rejected}", file=sys.stderr)
+    for category, count in sorted(diagnostic_counts.items()):
+        print(f"diagnostics ({category}): {count}", file=sys.stderr)
+    print(f"next offset: {next_offset}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
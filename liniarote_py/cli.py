@@ -34,6 +34,7 @@ import signal
 
 import readchar
 from sly import Lexer, Parser
+from sly.lex import LexError
 
 
 # ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
@@ -42,8 +43,94 @@ from sly import Lexer, Parser
 
 try:
     from . import config as cfg
+    from . import evaluation_context as ctx
+    from . import scanner
 except:
     import config as cfg
+    import evaluation_context as ctx
+    import scanner
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the canonical symbolic values.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The tuples for the purely symbolic values (e.g., "(0.0, Ƿ)" or
+# "(Æ, ∅)"). Every operation returns these instances rather than
+# creating new tuples, so that large numbers of results share the same
+# few objects, and a result can be recognized by its identity alone.
+tuple_tv_sym_pos = (0.0, cfg.tv_sym_pos)
+tuple_tv_sym_neg = (0.0, cfg.tv_sym_neg)
+tuple_tv_sym_pwr_p2_pos = (0.0, cfg.tv_sym_pwr_p2_pos)
+tuple_tv_sym_pwr_p2_neg = (0.0, cfg.tv_sym_pwr_p2_neg)
+tuple_tv_sym_pwr_p3_pos = (0.0, cfg.tv_sym_pwr_p3_pos)
+tuple_tv_sym_pwr_p3_neg = (0.0, cfg.tv_sym_pwr_p3_neg)
+tuple_tv_sym_pwr_p4_pos = (0.0, cfg.tv_sym_pwr_p4_pos)
+tuple_tv_sym_pwr_p4_neg = (0.0, cfg.tv_sym_pwr_p4_neg)
+tuple_tv_sym_pwr_m2_pos = (0.0, cfg.tv_sym_pwr_m2_pos)
+tuple_tv_sym_pwr_m2_neg = (0.0, cfg.tv_sym_pwr_m2_neg)
+tuple_tv_sym_pwr_m3_pos = (0.0, cfg.tv_sym_pwr_m3_pos)
+tuple_tv_sym_pwr_m3_neg = (0.0, cfg.tv_sym_pwr_m3_neg)
+tuple_null_sym = (0.0, cfg.null_sym)
+tuple_real_num_sym_pos = (cfg.real_num_sym_pos, cfg.null_sym)
+tuple_real_num_sym_neg = (cfg.real_num_sym_neg, cfg.null_sym)
+tuple_real_num_sym = (cfg.real_num_sym, cfg.null_sym)
+
+# The canonical tuples, by the lone elements (i.e., symbols) that they
+# represent.
+tuples_by_lone_element = {
+    cfg.tv_sym_pos: tuple_tv_sym_pos,
+    cfg.tv_sym_neg: tuple_tv_sym_neg,
+    cfg.tv_sym_pwr_p2_pos: tuple_tv_sym_pwr_p2_pos,
+    cfg.tv_sym_pwr_p2_neg: tuple_tv_sym_pwr_p2_neg,
+    cfg.tv_sym_pwr_p3_pos: tuple_tv_sym_pwr_p3_pos,
+    cfg.tv_sym_pwr_p3_neg: tuple_tv_sym_pwr_p3_neg,
+    cfg.tv_sym_pwr_p4_pos: tuple_tv_sym_pwr_p4_pos,
+    cfg.tv_sym_pwr_p4_neg: tuple_tv_sym_pwr_p4_neg,
+    cfg.tv_sym_pwr_m2_pos: tuple_tv_sym_pwr_m2_pos,
+    cfg.tv_sym_pwr_m2_neg: tuple_tv_sym_pwr_m2_neg,
+    cfg.tv_sym_pwr_m3_pos: tuple_tv_sym_pwr_m3_pos,
+    cfg.tv_sym_pwr_m3_neg: tuple_tv_sym_pwr_m3_neg,
+    cfg.real_num_sym_pos: tuple_real_num_sym_pos,
+    cfg.real_num_sym_neg: tuple_real_num_sym_neg,
+    cfg.real_num_sym: tuple_real_num_sym,
+    cfg.null_sym: tuple_null_sym,
+    }
+
+# The displayed forms of the canonical tuples, by the identities of the
+# tuples. (As the canonical tuples are never freed, no other object can
+# share one of these identities.)
+displayed_forms_by_identity = {
+    id(tuple_value): symbol
+    for symbol, tuple_value in tuples_by_lone_element.items()
+    }
+displayed_forms_by_identity[id(tuple_null_sym)] = str(0.0)
+
+
+def intern_value(
+    value,
+    ):
+    """
+    Returns the canonical instance of a purely symbolic tuple that is
+    equal to the given value (e.g., a tuple that was created by
+    unpickling a result), or the value itself if there is none.
+    """
+
+    if type(value) is tuple and len(value) == 2 and value[1] in cfg.symbol_codes:
+        if value[1] == cfg.null_sym:
+            if value[0] == 0.0 and type(value[0]) is float \
+                    and math.copysign(1.0, value[0]) == 1.0:
+                return tuple_null_sym
+            if type(value[0]) is str:
+                return tuples_by_lone_element.get(value[0], value)
+        elif value[0] == 0.0 and type(value[0]) is float:
+            # (The canonical tuples of the indeterminate symbols take the
+            # form "(Æ, ∅)", so a tuple such as "(0.0, Æ)" is left as it
+            # is.)
+            canonical_value = tuples_by_lone_element.get(value[1])
+            if canonical_value == value:
+                return canonical_value
+    return value
 
 
 # ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
@@ -61,6 +148,7 @@ class LiniaroteLexer(Lexer):
         MINUS,
         TIMES,
         DIVIDE,
+        POWER,
         LPAREN,
         RPAREN,
         NUM,
@@ -88,6 +176,7 @@ class LiniaroteLexer(Lexer):
     MINUS = r'-'
     TIMES = r'\*'
     DIVIDE = r'/'
+    POWER = r'\^'
     LPAREN = r'\('
     RPAREN = r'\)'
     NUM = r"-?[0-9]+(\.[0-9]*)?"
@@ -109,6 +198,33 @@ class LiniaroteLexer(Lexer):
     ID['pi'] = PI_CONSTANT
     ID['e'] = E_CONSTANT
 
+    # When a list is assigned to this attribute, illegal characters are
+    # recorded in it (and skipped) rather than raising an exception; see
+    # diagnostics.py.
+    diagnostics = None
+
+
+    def error(self, t):
+        """
+        Handles a character that can't be recognized as part of a token.
+        """
+
+        if self.diagnostics is None:
+            return Lexer.error(self, t)
+        self.diagnostics.append((self.index, t.value[0], "illegal_character"))
+        self.index += 1
+
+
+def create_lexer():
+    """
+    Returns a new lexer of the kind selected by config.lexer_backend
+    (the sly-based LiniaroteLexer or the hand-written Scanner).
+    """
+
+    if cfg.lexer_backend == "scanner":
+        return scanner.Scanner()
+    return LiniaroteLexer()
+
 
 class LiniaroteParser(Parser):
     """
@@ -129,16 +245,38 @@ class LiniaroteParser(Parser):
         ('left', PLUS, MINUS),
         ('left', TIMES, DIVIDE),
         ('right', UMINUS),
+        ('right', POWER),
         )
 
 
+    # When a list is assigned to this attribute, parse errors are
+    # recorded in it rather than displayed; see diagnostics.py.
+    diagnostics = None
+
+
+    # The number of parsers that have been created (including those that
+    # the operations create to interpret the values that they generate),
+    # for the run-time metrics; see metrics.py. (The count is approximate
+    # when parsers are created by several threads.)
+    parsers_created = 0
+
+    # The number of errors detected by a parser in its own input.
+    errors_detected = 0
+
+
     # ------------------------------------------------------------------
     # Define internal methods and functions.
     # ------------------------------------------------------------------
-    def __init__(self):
+    def __init__(self, context=None):
         """
-        The constructor method for the class object.
+        The constructor method for the class object. The parser is bound
+        to the given evaluation context (by default, the one current in
+        the running thread), from which it takes the values of constants.
         """
+        LiniaroteParser.parsers_created += 1
+        if context is None:
+            context = ctx.get_current_context()
+        self.context = context
 
 
     @_('HELP')
@@ -170,6 +308,21 @@ class LiniaroteParser(Parser):
         Displays an error message if poorly formulated input is detected
         (e.g., "3++w" or "5//w").
         """
+
+        self.errors_detected += 1
+
+        # Parsers created by the operations record their errors in the
+        # context's list (if it has one).
+        diagnostics = self.diagnostics
+        if diagnostics is None:
+            diagnostics = self.context.subordinate_diagnostics
+        if diagnostics is not None:
+            if p is None:
+                diagnostics.append((None, None, "unexpected_end_of_input"))
+            else:
+                diagnostics.append((p.index, p.value, "unexpected_token"))
+            return
+
         print(cfg.output_spacer \
             + "A poorly formulated input statement has been detected.")
         print(cfg.output_spacer \
@@ -183,2207 +336,2569 @@ class LiniaroteParser(Parser):
         (over the subtraction operation) and returns the correct
         value after the unary minus operation has been applied.
         """
+        return negate_value(p.expr)
 
-        if p.expr == cfg.tv_sym_pos:
-            return cfg.tv_sym_neg
-        elif p.expr == cfg.tv_sym_neg:
-            return cfg.tv_sym_pos
 
-        elif p.expr == cfg.tv_sym_pwr_p2_pos:
-            return cfg.tv_sym_pwr_p2_neg
-        elif p.expr == cfg.tv_sym_pwr_p2_neg:
-            return cfg.tv_sym_pwr_p2_pos
-
-        elif p.expr == cfg.tv_sym_pwr_p3_pos:
-            return cfg.tv_sym_pwr_p3_neg
-        elif p.expr == cfg.tv_sym_pwr_p3_neg:
-            return cfg.tv_sym_pwr_p3_pos
+    @_('expr MINUS expr')
+    def expr(self, p):
+        """
+        Specifies how the subtraction operation is evaluated
+        within the context of transvalent mathematics.
+        """
+        return subtract_values(p.expr0, p.expr1)
 
-        elif p.expr == cfg.tv_sym_pwr_p4_pos:
-            return cfg.tv_sym_pwr_p4_neg
-        elif p.expr == cfg.tv_sym_pwr_p4_neg:
-            return cfg.tv_sym_pwr_p4_pos
 
-        elif p.expr == cfg.tv_sym_pwr_m2_pos:
-            return cfg.tv_sym_pwr_m2_neg
-        elif p.expr == cfg.tv_sym_pwr_m2_neg:
-            return cfg.tv_sym_pwr_m2_pos
+    @_('expr PLUS expr')
+    def expr(self, p):
+        """
+        Specifies how the addition operation is evaluated
+        within the context of transvalent mathematics.
+        """
+        return add_values(p.expr0, p.expr1)
 
-        elif p.expr == cfg.tv_sym_pwr_m3_pos:
-            return cfg.tv_sym_pwr_m3_neg
-        elif p.expr == cfg.tv_sym_pwr_m3_neg:
-            return cfg.tv_sym_pwr_m3_pos
 
-        elif p.expr == cfg.real_num_sym_pos:
-            return cfg.real_num_sym_neg
-        elif p.expr == cfg.real_num_sym_neg:
-            return cfg.real_num_sym_pos
+    @_('term')
+    def expr(self, p):
+        """
+        Defines the processing of a single term.
+        """
+        return p.term
 
-        elif p.expr == cfg.real_num_sym:
-            return cfg.real_num_sym
 
-        elif p.expr == cfg.null_sym:
-            return cfg.null_sym
+    @_('expr TIMES expr')
+    def expr(self, p):
+        """
+        Specifies how the multiplication operation is evaluated
+        within the context of transvalent mathematics.
+        """
+        return multiply_values(p.expr0, p.expr1)
 
-        elif p.expr == cfg.unimplemented_sym:
-            return cfg.unimplemented_sym
 
-        # If nothing above applies...
-        return -p.expr
+    @_('expr DIVIDE expr')
+    def expr(self, p):
+        """
+        Specifies how the division operation is evaluated
+        within the context of transvalent mathematics.
+        """
+        return divide_values(p.expr0, p.expr1)
 
 
-    @_('expr MINUS expr')
+    @_('expr POWER expr')
     def expr(self, p):
         """
-        Specifies how the subtraction operation is evaluated
-        within the context of transvalent mathematics.
+        Specifies how exponentiation is evaluated within the context of
+        transvalent mathematics.
         """
+        return power_values(p.expr0, p.expr1)
 
-        if cfg.debugging_mode is True:
-            print("Beginning subtraction of: ", str(p.expr0), "and", str(p.expr1))
-            print("   ... of types: ", str(type(p.expr0)), "and", str(type(p.expr1)))
-
-        # Assign the argument expressions to variables, to simplify
-        # operations involving them.
-        u = p.expr0
-        v = p.expr1
-
-        # If both u *and* v are lone elements, then they can be processed
-        # directly as specified further below. Similarly, if both u *and* v 
-        # are already well-formed tuples, they can be processed as specified
-        # further below. However, if one of u or v is a lone element and the
-        # other is a tuple, the lone element should be converted to a tuple
-        # here, so that they can be processed below as two tuples.
-        #
-        # Note that technically, this only checks whether they are tuples;
-        # to be more rigorous and eliminate errors, it should check whether
-        # they are *well-formed* transvalent tuples.
-        if isinstance(u, tuple) and (not isinstance(v, tuple)):
-            v = convert_lone_element_to_tuple(v)
-        elif (not isinstance(u, tuple)) and isinstance(v, tuple):
-            u = convert_lone_element_to_tuple(u)
-
-        if cfg.debugging_mode is True:
-            print("Continuing with subtraction of: ", str(u), "and", str(v))
-
-
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-        # ● Process the subtraction of lone elements (e.g., a transvalent 
-        # ● symbol *or* float with another such variable), generating a
-        # ● well-formed transvalent tuple as output.
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-
-        # If either of the terms is the Unimplemented symbol, return
-        # a result indicating that the operation cannot be processed.
-        if (u == cfg.unimplemented_sym) | (v == cfg.unimplemented_sym):
-            return cfg.unimplemented_sym
 
+    @_('factor')
+    def term(self, p):
+        """
+        Defines the processing of a single factor.
+        """
+        return p.factor
 
-        # ------------------------------------------------------------------
-        # Process "float - (something)".
-        # ------------------------------------------------------------------
 
-        # Process "float - float".
-        if isinstance(u, float) and isinstance(v, float):
-            return (u - v, cfg.null_sym)
+    @_('LPAREN expr RPAREN')
+    def factor(self, p):
+        """
+        Defines the processing of an expression enclosed in parentheses.
+        """
+        return p.expr
 
-        # Process "float - Ƿ".
-        elif isinstance(u, float) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_neg)
 
-        # Process "float - -Ƿ".
-        elif isinstance(u, float) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pos)
+    @_('NUM')
+    def factor(self, p):
+        """
+        Defines the processing of a recognized numerical token.
+        """
+        return float(p.NUM)
 
-        # Process "float - Ƿ²".
-        elif isinstance(u, float) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
 
-        # Process "float - -Ƿ²".
-        elif isinstance(u, float) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # ------------------------------------------------------------------
+    # Define the recognition of transvalent symbols and other special
+    # symbols.
+    # ------------------------------------------------------------------
 
-        # Process "float - ∅".
-        elif isinstance(u, float)  and (v == cfg.null_sym):
-            return (u, cfg.null_sym)
+    @_('TRANSVALENT_SYMBOL_POSITIVE_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “Ƿ” string.
+        """
+        return cfg.tv_sym_pos
 
-        # Process "float - Æ".
-        elif isinstance(u, float) and (v == cfg.real_num_sym_pos):
-            if u == 0:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
 
-        # Process "float - -Æ".
-        elif isinstance(u, float) and (v == cfg.real_num_sym_neg):
-            if u == 0:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
+    @_('TRANSVALENT_SYMBOL_POWER_PLUS_TWO_POSITIVE_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “Ƿ²” string.
+        """
+        return cfg.tv_sym_pwr_p2_pos
 
-        # Process "float - ℝ".
-        elif isinstance(u, float) and (v == cfg.real_num_sym):
-            return (cfg.real_num_sym, cfg.null_sym)
 
+    @_('TRANSVALENT_SYMBOL_POWER_PLUS_THREE_POSITIVE_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “Ƿ³” string.
+        """
+        return cfg.tv_sym_pwr_p3_pos
 
-        # ------------------------------------------------------------------
-        # Process "Ƿ - (something)".
-        # ------------------------------------------------------------------
 
-        # Process "Ƿ - float".
-        elif (u == cfg.tv_sym_pos) and isinstance(v, float):
-            return (0.0, cfg.tv_sym_pos)
+    @_('TRANSVALENT_SYMBOL_POWER_PLUS_FOUR_POSITIVE_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “Ƿ⁴” string.
+        """
+        return cfg.tv_sym_pwr_p4_pos
 
-        # Process "Ƿ - Ƿ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.null_sym)
 
-        # Process "Ƿ - -Ƿ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pos)
+    @_('TRANSVALENT_SYMBOL_POWER_MINUS_TWO_POSITIVE_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “Ƿ⁻²” string.
+        """
+        return cfg.tv_sym_pwr_m2_pos
 
-        # Process "Ƿ - Ƿ²".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
 
-        # Process "Ƿ - -Ƿ²".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    @_('TRANSVALENT_SYMBOL_POWER_MINUS_THREE_POSITIVE_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “Ƿ⁻³” string.
+        """
+        return cfg.tv_sym_pwr_m3_pos
 
-        # Process "Ƿ - ∅".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.null_sym):
-            return (0.0, cfg.tv_sym_pos)
 
-        # Process "Ƿ - Æ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym_pos):
-            return (0.0, cfg.tv_sym_pos)
+    @_('REAL_NUMBER_POSITIVE_SYMBOL_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “Æ” string.
+        """
+        return cfg.real_num_sym_pos
 
-        # Process "Ƿ - -Æ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym_neg):
-            return (0.0, cfg.tv_sym_pos)
 
-        # Process "Ƿ - ℝ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym):
-            return (0.0, cfg.tv_sym_pos)
+    @_('REAL_NUMBER_SYMBOL_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “ℝ” string.
+        """
+        return cfg.real_num_sym
 
 
-        # ------------------------------------------------------------------
-        # Process "-Ƿ - (something)".
-        # ------------------------------------------------------------------
+    @_('NULL_SYMBOL_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “∅” string.
+        """
+        return cfg.null_sym
 
-        # Process "-Ƿ - float".
-        elif (u == cfg.tv_sym_neg) and isinstance(v, float):
-            return (0.0, cfg.tv_sym_neg)
 
-        # Process "-Ƿ - Ƿ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_neg)
+    @_('UNIMPLEMENTED_SYMBOL_INPUT')
+    def factor(self, p):
+        """
+        Defines the processing of the “U” string.
+        """
+        return cfg.unimplemented_sym
 
-        # Process "-Ƿ - -Ƿ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.null_sym)
 
-        # Process "-Ƿ - Ƿ²".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # ------------------------------------------------------------------
+    # Handle the input of user-defined constants.
+    # ------------------------------------------------------------------
 
-        # Process "-Ƿ - -Ƿ²".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    @_('ID')
+    def factor(self, p):
+        """
+        Checks whether inputted text is an established variable.
+        """
+        return self.get_value_of_constant(p.ID)
 
-        # Process "-Ƿ - ∅".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.null_sym):
-            return (0.0, cfg.tv_sym_neg)
 
-        # Process "-Ƿ - Æ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym_pos):
-            return (0.0, cfg.tv_sym_neg)
+    def get_value_of_constant(self, name):
+        """
+        Assigns the value to a new variable from via user input.
+        """
+        return self.context.get_value_of_constant(name)
 
-        # Process "-Ƿ - -Æ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym_neg):
-            return (0.0, cfg.tv_sym_neg)
 
-        # Process "-Ƿ - ℝ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym):
-            return (0.0, cfg.tv_sym_neg)
+def evaluate_text(
+    text,
+    context=None,
+    ):
+    """
+    Lexes and parses the given text within an evaluation context (by
+    default, the one current in the running thread), returning the
+    parser's unformatted result.
+    """
 
+    if context is None:
+        context = ctx.get_current_context()
+    with ctx.use_context(context):
+        return LiniaroteParser(context).parse(tokenize_with_cache(text))
 
-        # ------------------------------------------------------------------
-        # Process "Ƿ² - (something)".
-        # ------------------------------------------------------------------
 
-        # Process "Ƿ² - float".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and isinstance(v, float):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the token-stream cache.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 
-        # Process "Ƿ² - Ƿ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+# An immutable token, which the parsers treat as they do the lexer's own
+# tokens. (The hand-written scanner produces tokens of this kind itself.)
+CachedToken = scanner.ScannedToken
 
-        # Process "Ƿ² - -Ƿ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+# The token types of the operators that appear in the texts created for
+# the subordinate parsers (e.g., "(2.0 + Ƿ)").
+operator_token_types = {
+    "+": "PLUS",
+    "-": "MINUS",
+    "*": "TIMES",
+    "/": "DIVIDE",
+    }
 
-        # Process "Ƿ² - Ƿ²".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.null_sym)
 
-        # Process "Ƿ² - -Ƿ²".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+class TokenStreamCache:
+    """
+    A bounded cache of the tokens into which texts have been lexed (as
+    tuples of CachedTokens). When a text of the form "(a + b)" isn't in
+    the cache, its tokens are assembled from the cached tokens of its
+    operands (e.g., literals and symbols that have been seen before),
+    rather than by lexing the whole text. The statistics it keeps are
+    approximate when the cache is shared by several threads.
+    """
 
-       # Process "Ƿ² - ∅".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.null_sym):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    def __init__(self, maximum_size=None):
+        if maximum_size is None:
+            maximum_size = cfg.token_cache_size
+        self.maximum_size = maximum_size
+        self.token_streams = {}
+        self.lexeme_tokens = {}
+        self.hits = 0
+        self.assembled = 0
+        self.misses = 0
 
-        # Process "Ƿ² - Æ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
 
-        # Process "Ƿ² - -Æ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    def lex(self, text):
+        """
+        Lexes a text, returning a tuple of CachedTokens.
+        """
 
-        # Process "Ƿ² - ℝ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+        return tuple(
+            token if type(token) is CachedToken
+            else CachedToken(token.type, token.value, token.lineno, token.index, token.end)
+            for token in create_lexer().tokenize(text)
+            )
 
 
-        # ------------------------------------------------------------------
-        # Process "-Ƿ² - (something)".
-        # ------------------------------------------------------------------
+    def store(self, cache, key, value):
+        """
+        Stores a value in one of the caches, first discarding its oldest
+        entry if the cache is full.
+        """
 
-        # Process "-Ƿ² - float".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and isinstance(v, float):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+        if len(cache) >= self.maximum_size:
+            try:
+                del cache[next(iter(cache))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass
+        cache[key] = value
 
-        # Process "-Ƿ² - Ƿ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
 
-        # Process "-Ƿ² - -Ƿ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    def get_lexeme_tokens(self, lexeme):
+        """
+        Returns the tokens that a lexeme (e.g., "2.5", "-Ƿ²", or "Æ") is
+        lexed as, or None if it contains illegal characters.
+        """
 
-        # Process "-Ƿ² - Ƿ²".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+        if lexeme in self.lexeme_tokens:
+            return self.lexeme_tokens[lexeme]
+        try:
+            lexeme_tokens = self.lex(lexeme)
+        except LexError:
+            lexeme_tokens = None
+        self.store(self.lexeme_tokens, lexeme, lexeme_tokens)
+        return lexeme_tokens
 
-        # Process "-Ƿ² - -Ƿ²".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.null_sym)
 
-        # Process "-Ƿ² - ∅".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.null_sym):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    def assemble_operation_tokens(self, text):
+        """
+        Returns the tokens of a text of the form "(a + b)", assembled from
+        the tokens of a and b (which are cached separately), or None if
+        the text doesn't have that form. As no token can extend past the
+        spaces and parentheses that separate a and b from the rest of the
+        text, a and b are lexed as they would be on their own.
+        """
 
-        # Process "-Ƿ² - Æ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+        if text[:1] != "(" or text[-1:] != ")":
+            return None
+        parts = text[1:-1].split(" ")
+        if len(parts) != 3 or parts[1] not in operator_token_types:
+            return None
+        left, operator, right = parts
+        left_tokens = self.get_lexeme_tokens(left)
+        if not left_tokens:
+            return None
+        right_tokens = self.get_lexeme_tokens(right)
+        if not right_tokens:
+            return None
+
+        operator_index = len(left) + 2
+        right_index = operator_index + 2
+        right_end = right_index + len(right)
+        return (CachedToken("LPAREN", "(", 1, 0, 1),) \
+            + tuple(
+                token._replace(index=token.index + 1, end=token.end + 1)
+                for token in left_tokens
+                ) \
+            + (CachedToken(
+                operator_token_types[operator], operator, 1,
+                operator_index, operator_index + 1,
+                ),) \
+            + tuple(
+                token._replace(index=token.index + right_index, end=token.end + right_index)
+                for token in right_tokens
+                ) \
+            + (CachedToken("RPAREN", ")", 1, right_end, right_end + 1),)
+
+
+    def get_tokens(self, text):
+        """
+        Returns the tokens of a text as a tuple of CachedTokens. (A
+        LexError is raised if the text contains illegal characters.)
+        """
 
-        # Process "-Ƿ² - -Æ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+        tokens = self.token_streams.get(text)
+        if tokens is not None:
+            self.hits += 1
+            return tokens
 
-        # Process "-Ƿ² - ℝ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+        tokens = self.assemble_operation_tokens(text)
+        if tokens is not None:
+            self.assembled += 1
+        else:
+            self.misses += 1
+            tokens = self.lex(text)
+        self.store(self.token_streams, text, tokens)
+        return tokens
 
 
-        # ------------------------------------------------------------------
-        # Process "∅ - (something)".
-        # ------------------------------------------------------------------
+    def get_statistics(self):
+        """
+        Returns a dictionary giving the numbers of hits, assembled token
+        streams, and misses, the share of lookups that were hits, and the
+        number of texts cached.
+        """
 
-        # Process "∅ - float".
-        elif (u == cfg.null_sym) and isinstance(v, float):
-            return (-v, cfg.null_sym)
+        lookups = self.hits + self.assembled + self.misses
+        return {
+            "hits": self.hits,
+            "assembled": self.assembled,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.token_streams),
+            }
 
-        # Process "∅ - Ƿ".
-        elif (u == cfg.null_sym) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_neg)
 
-        # Process "∅ - -Ƿ".
-        elif (u == cfg.null_sym) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pos)
+    def clear(self):
+        self.token_streams.clear()
+        self.lexeme_tokens.clear()
+        self.hits = self.assembled = self.misses = 0
 
-        # Process "∅ - Ƿ²".
-        elif (u == cfg.null_sym) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
 
-        # Process "∅ - -Ƿ²".
-        elif (u == cfg.null_sym) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+token_stream_cache = TokenStreamCache()
 
-        # Process "∅ - ∅".
-        elif (u == cfg.null_sym) and (v == cfg.null_sym):
-            return (0.0, cfg.null_sym)
 
-        # Process "∅ - Æ".
-        elif (u == cfg.null_sym) and (v == cfg.real_num_sym_pos):
-            return (cfg.real_num_sym_neg, cfg.null_sym)
+def tokenize_with_cache(
+    text,
+    lexer=None,
+    ):
+    """
+    Returns an iterator over the tokens of a text (for use by a parser),
+    taking them from the token-stream cache where possible. If the text
+    contains illegal characters, it is tokenized by the given lexer (by
+    default, a new one), so that they're handled as before.
+    """
 
-        # Process "∅ - -Æ".
-        elif (u == cfg.null_sym) and (v == cfg.real_num_sym_neg):
-            return (cfg.real_num_sym_pos, cfg.null_sym)
+    try:
+        return iter(token_stream_cache.get_tokens(text))
+    except LexError:
+        if lexer is None:
+            lexer = create_lexer()
+        return lexer.tokenize(text)
 
-        # Process "∅ - ℝ".
-        elif (u == cfg.null_sym) and (v == cfg.real_num_sym):
-            return (cfg.real_num_sym, cfg.null_sym)
 
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the transvalent operations (which the parser applies to the
+# █ values of parsed expressions).
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 
-        # ------------------------------------------------------------------
-        # Process "Æ - (something)".
-        # ------------------------------------------------------------------
+def negate_value(
+    u,
+    ):
+    """
+    Returns the value of the given element after a unary minus sign has been
+    applied to it.
+    """
 
-        # Process "Æ - float".
-        elif (u == cfg.real_num_sym_pos) and isinstance(v, float):
-            if v == 0:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
+    if u == cfg.tv_sym_pos:
+        return cfg.tv_sym_neg
+    elif u == cfg.tv_sym_neg:
+        return cfg.tv_sym_pos
 
-        # Process "Æ - Ƿ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_neg)
+    elif u == cfg.tv_sym_pwr_p2_pos:
+        return cfg.tv_sym_pwr_p2_neg
+    elif u == cfg.tv_sym_pwr_p2_neg:
+        return cfg.tv_sym_pwr_p2_pos
 
-        # Process "Æ - -Ƿ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pos)
+    elif u == cfg.tv_sym_pwr_p3_pos:
+        return cfg.tv_sym_pwr_p3_neg
+    elif u == cfg.tv_sym_pwr_p3_neg:
+        return cfg.tv_sym_pwr_p3_pos
 
-        # Process "Æ - Ƿ²".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    elif u == cfg.tv_sym_pwr_p4_pos:
+        return cfg.tv_sym_pwr_p4_neg
+    elif u == cfg.tv_sym_pwr_p4_neg:
+        return cfg.tv_sym_pwr_p4_pos
 
-        # Process "Æ - -Ƿ²".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    elif u == cfg.tv_sym_pwr_m2_pos:
+        return cfg.tv_sym_pwr_m2_neg
+    elif u == cfg.tv_sym_pwr_m2_neg:
+        return cfg.tv_sym_pwr_m2_pos
 
-        # Process "Æ - ∅".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.null_sym):
-            return (cfg.real_num_sym_pos, cfg.null_sym)
+    elif u == cfg.tv_sym_pwr_m3_pos:
+        return cfg.tv_sym_pwr_m3_neg
+    elif u == cfg.tv_sym_pwr_m3_neg:
+        return cfg.tv_sym_pwr_m3_pos
 
-        # Process "Æ - Æ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym_pos):
-            return cfg.unimplemented_sym
+    elif u == cfg.real_num_sym_pos:
+        return cfg.real_num_sym_neg
+    elif u == cfg.real_num_sym_neg:
+        return cfg.real_num_sym_pos
 
-        # Process "Æ - -Æ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym_neg):
-            return (cfg.real_num_sym_pos, cfg.null_sym)
+    elif u == cfg.real_num_sym:
+        return cfg.real_num_sym
 
-        # Process "Æ - ℝ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym):
-            return cfg.unimplemented_sym
+    elif u == cfg.null_sym:
+        return cfg.null_sym
 
+    elif u == cfg.unimplemented_sym:
+        return cfg.unimplemented_sym
 
-        # ------------------------------------------------------------------
-        # Process "-Æ - (something)".
-        # ------------------------------------------------------------------
+    # If nothing above applies...
+    return -u
 
-        # Process "-Æ - float".
-        elif (u == cfg.real_num_sym_neg) and isinstance(v, float):
-            if v == 0:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
 
-        # Process "-Æ - Ƿ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_neg)
+def subtract_values(
+    u,
+    v,
+    ):
+    """
+    Specifies how the subtraction operation is evaluated
+    within the context of transvalent mathematics.
+    """
 
-        # Process "-Æ - -Ƿ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pos)
+    if ctx.get_current_context().debugging_mode is True:
+        print("Beginning subtraction of: ", str(u), "and", str(v))
+        print("   ... of types: ", str(type(u)), "and", str(type(v)))
+
+    # If both u *and* v are lone elements, then they can be processed
+    # directly as specified further below. Similarly, if both u *and* v 
+    # are already well-formed tuples, they can be processed as specified
+    # further below. However, if one of u or v is a lone element and the
+    # other is a tuple, the lone element should be converted to a tuple
+    # here, so that they can be processed below as two tuples.
+    #
+    # Note that technically, this only checks whether they are tuples;
+    # to be more rigorous and eliminate errors, it should check whether
+    # they are *well-formed* transvalent tuples.
+    if isinstance(u, tuple) and (not isinstance(v, tuple)):
+        v = convert_lone_element_to_tuple(v)
+    elif (not isinstance(u, tuple)) and isinstance(v, tuple):
+        u = convert_lone_element_to_tuple(u)
+
+    if ctx.get_current_context().debugging_mode is True:
+        print("Continuing with subtraction of: ", str(u), "and", str(v))
+
+
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ● Process the subtraction of lone elements (e.g., a transvalent 
+    # ● symbol *or* float with another such variable), generating a
+    # ● well-formed transvalent tuple as output.
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+
+    # If either of the terms is the Unimplemented symbol, return
+    # a result indicating that the operation cannot be processed.
+    if (u == cfg.unimplemented_sym) | (v == cfg.unimplemented_sym):
+        return cfg.unimplemented_sym
+
+
+    # ------------------------------------------------------------------
+    # Process "float - (something)".
+    # ------------------------------------------------------------------
+
+    # Process "float - float".
+    if isinstance(u, float) and isinstance(v, float):
+        return (u - v, cfg.null_sym)
 
-        # Process "-Æ - Ƿ²".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float - Ƿ".
+    elif isinstance(u, float) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_neg
 
-        # Process "-Æ - -Ƿ²".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # Process "float - -Ƿ".
+    elif isinstance(u, float) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pos
 
-        # Process "-Æ - ∅".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.null_sym):
-            return (cfg.real_num_sym_neg, cfg.null_sym)
+    # Process "float - Ƿ²".
+    elif isinstance(u, float) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "-Æ - Æ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym_pos):
-            return (cfg.real_num_sym_neg, cfg.null_sym)
+    # Process "float - -Ƿ²".
+    elif isinstance(u, float) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Æ - -Æ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym_neg):
+    # Process "float - ∅".
+    elif isinstance(u, float)  and (v == cfg.null_sym):
+        return (u, cfg.null_sym)
+
+    # Process "float - Æ".
+    elif isinstance(u, float) and (v == cfg.real_num_sym_pos):
+        if u == 0:
+            return tuple_real_num_sym_neg
+        else:
             return cfg.unimplemented_sym
 
-        # Process "-Æ - ℝ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym):
+    # Process "float - -Æ".
+    elif isinstance(u, float) and (v == cfg.real_num_sym_neg):
+        if u == 0:
+            return tuple_real_num_sym_pos
+        else:
             return cfg.unimplemented_sym
 
+    # Process "float - ℝ".
+    elif isinstance(u, float) and (v == cfg.real_num_sym):
+        return tuple_real_num_sym
 
-        # ------------------------------------------------------------------
-        # Process "ℝ - (something)".
-        # ------------------------------------------------------------------
 
-        # Process "ℝ - float".
-        elif (u == cfg.real_num_sym) and isinstance(v, float):
-            return (cfg.real_num_sym, cfg.null_sym)
+    # ------------------------------------------------------------------
+    # Process "Ƿ - (something)".
+    # ------------------------------------------------------------------
 
-        # Process "ℝ - Ƿ".
-        elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_neg)
+    # Process "Ƿ - float".
+    elif (u == cfg.tv_sym_pos) and isinstance(v, float):
+        return tuple_tv_sym_pos
 
-        # Process "ℝ - -Ƿ".
-        elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "Ƿ - Ƿ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pos):
+        return tuple_null_sym
 
-        # Process "ℝ - Ƿ²".
-        elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "Ƿ - -Ƿ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pos
 
-        # Process "ℝ - -Ƿ²".
-        elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # Process "Ƿ - Ƿ²".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "ℝ - ∅".
-        elif (u == cfg.real_num_sym) and (v == cfg.null_sym):
-            return (cfg.real_num_sym, cfg.null_sym)
+    # Process "Ƿ - -Ƿ²".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "ℝ - Æ".
-        elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym_pos):
-            return cfg.unimplemented_sym
+    # Process "Ƿ - ∅".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.null_sym):
+        return tuple_tv_sym_pos
 
-        # Process "ℝ - -Æ".
-        elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym_neg):
-            return cfg.unimplemented_sym
+    # Process "Ƿ - Æ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym_pos):
+        return tuple_tv_sym_pos
 
-        # Process "ℝ - ℝ".
-        elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym):
-            return cfg.unimplemented_sym
+    # Process "Ƿ - -Æ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym_neg):
+        return tuple_tv_sym_pos
 
+    # Process "Ƿ - ℝ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym):
+        return tuple_tv_sym_pos
 
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-        # ● Process the subtraction of two well-formed tuples.
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
 
-        # This subtracts two well-formed tuples by separately subtracting 
-        # their real elements and their transvalent elements, using the rules 
-        # defined above for the subtraction of lone elements.
+    # ------------------------------------------------------------------
+    # Process "-Ƿ - (something)".
+    # ------------------------------------------------------------------
 
-        elif isinstance(u, tuple) and isinstance(v, tuple):
+    # Process "-Ƿ - float".
+    elif (u == cfg.tv_sym_neg) and isinstance(v, float):
+        return tuple_tv_sym_neg
 
-            if cfg.debugging_mode is True:
-                print("Beginning subtraction of two tuples.")
+    # Process "-Ƿ - Ƿ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_neg
 
-            # This subtracts one transvalent tuple from another; i.e., 
-            # it calculates the value of: (a, b) - (c, d), where:
-            a = u[0]
-            b = u[1]
-            c = v[0]
-            d = v[1]
+    # Process "-Ƿ - -Ƿ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_neg):
+        return tuple_null_sym
 
-            # If any of the tuples' elements is the "Unimplemented" symbol, 
-            # return a result indicating that the operation cannot be 
-            # processed.
-            if (a == cfg.unimplemented_sym) \
-                    | (b == cfg.unimplemented_sym) \
-                    | (c == cfg.unimplemented_sym) \
-                    | (d == cfg.unimplemented_sym):
-                return cfg.unimplemented_sym
+    # Process "-Ƿ - Ƿ²".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_neg
 
+    # Process "-Ƿ - -Ƿ²".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-            # ------------------------------------------------------------------
-            # Determine the difference of a and c as the difference of 
-            # two lone elements.
-            # ------------------------------------------------------------------
+    # Process "-Ƿ - ∅".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.null_sym):
+        return tuple_tv_sym_neg
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(
-                "(" + str(a) + " - " + str(c) + ")"
-                )
+    # Process "-Ƿ - Æ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym_pos):
+        return tuple_tv_sym_neg
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+    # Process "-Ƿ - -Æ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym_neg):
+        return tuple_tv_sym_neg
 
-            diff_of_a_and_c = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("difference of real elements: ", diff_of_a_and_c)
+    # Process "-Ƿ - ℝ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym):
+        return tuple_tv_sym_neg
 
-            # ------------------------------------------------------------------
-            # Determine the difference of b and d as the difference of 
-            # two lone elements.
-            # ------------------------------------------------------------------
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(
-                "(" + str(b) + " - " + str(d) + ")"
-                )
+    # ------------------------------------------------------------------
+    # Process "Ƿ² - (something)".
+    # ------------------------------------------------------------------
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+    # Process "Ƿ² - float".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and isinstance(v, float):
+        return tuple_tv_sym_pwr_p2_pos
 
-            diff_of_b_and_d = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("difference of transvalent elements: ", diff_of_b_and_d)
+    # Process "Ƿ² - Ƿ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-            # ------------------------------------------------------------------
-            # Determine the sum of (a-c) and (b-d) as the sum of 
-            # two lone elements.
-            # ------------------------------------------------------------------
+    # Process "Ƿ² - -Ƿ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(
-                "(" + str(diff_of_a_and_c[0]) + " + " + str(diff_of_b_and_d[1]) + ")"
-                )
+    # Process "Ƿ² - Ƿ²".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_null_sym
+
+    # Process "Ƿ² - -Ƿ²".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_pos
+
+   # Process "Ƿ² - ∅".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.null_sym):
+        return tuple_tv_sym_pwr_p2_pos
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+    # Process "Ƿ² - Æ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-            sum_of_a_minus_c_and_b_minus_d = \
-                parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("difference of tuples: ", sum_of_a_minus_c_and_b_minus_d)
+    # Process "Ƿ² - -Æ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-            return sum_of_a_minus_c_and_b_minus_d
+    # Process "Ƿ² - ℝ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym):
+        return tuple_tv_sym_pwr_p2_pos
 
 
-        # If none of the steps above have been able to successfully
-        # handle the subtraction operation, return the Unimplemented symbol.
+    # ------------------------------------------------------------------
+    # Process "-Ƿ² - (something)".
+    # ------------------------------------------------------------------
+
+    # Process "-Ƿ² - float".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and isinstance(v, float):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "-Ƿ² - Ƿ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "-Ƿ² - -Ƿ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "-Ƿ² - Ƿ²".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "-Ƿ² - -Ƿ²".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_null_sym
+
+    # Process "-Ƿ² - ∅".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.null_sym):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "-Ƿ² - Æ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym_pos):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "-Ƿ² - -Æ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym_neg):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "-Ƿ² - ℝ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym):
+        return tuple_tv_sym_pwr_p2_neg
+
+
+    # ------------------------------------------------------------------
+    # Process "∅ - (something)".
+    # ------------------------------------------------------------------
+
+    # Process "∅ - float".
+    elif (u == cfg.null_sym) and isinstance(v, float):
+        return (-v, cfg.null_sym)
+
+    # Process "∅ - Ƿ".
+    elif (u == cfg.null_sym) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_neg
+
+    # Process "∅ - -Ƿ".
+    elif (u == cfg.null_sym) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pos
+
+    # Process "∅ - Ƿ²".
+    elif (u == cfg.null_sym) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "∅ - -Ƿ²".
+    elif (u == cfg.null_sym) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_pos
+
+    # Process "∅ - ∅".
+    elif (u == cfg.null_sym) and (v == cfg.null_sym):
+        return tuple_null_sym
+
+    # Process "∅ - Æ".
+    elif (u == cfg.null_sym) and (v == cfg.real_num_sym_pos):
+        return tuple_real_num_sym_neg
+
+    # Process "∅ - -Æ".
+    elif (u == cfg.null_sym) and (v == cfg.real_num_sym_neg):
+        return tuple_real_num_sym_pos
+
+    # Process "∅ - ℝ".
+    elif (u == cfg.null_sym) and (v == cfg.real_num_sym):
+        return tuple_real_num_sym
+
+
+    # ------------------------------------------------------------------
+    # Process "Æ - (something)".
+    # ------------------------------------------------------------------
+
+    # Process "Æ - float".
+    elif (u == cfg.real_num_sym_pos) and isinstance(v, float):
+        if v == 0:
+            return tuple_real_num_sym_pos
         else:
             return cfg.unimplemented_sym
 
+    # Process "Æ - Ƿ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_neg
 
-    @_('expr PLUS expr')
-    def expr(self, p):
-        """
-        Specifies how the addition operation is evaluated
-        within the context of transvalent mathematics.
-        """
+    # Process "Æ - -Ƿ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pos
 
-        if cfg.debugging_mode is True:
-            print("Beginning addition of: ", str(p.expr0), "and", str(p.expr1))
-            print("   ... of types: ", str(type(p.expr0)), "and", str(type(p.expr1)))
-
-        # Assign the argument expressions to variables, to simplify
-        # operations involving them.
-        u = p.expr0
-        v = p.expr1
-
-        # If both u *and* v are lone elements, then they can be processed
-        # directly as specified further below. Similarly, if both u *and* v 
-        # are already well-formed tuples, they can be processed as specified
-        # further below. However, if one of u or v is a lone element and the
-        # other is a tuple, the lone element should be converted to a tuple
-        # here, so that they can be processed below as two tuples.
-        #
-        # Note that technically, this only checks whether they are tuples;
-        # to be more rigorous and eliminate errors, it should check whether
-        # they are *well-formed* transvalent tuples.
-        if isinstance(u, tuple) and (not isinstance(v, tuple)):
-            v = convert_lone_element_to_tuple(v)
-        elif (not isinstance(u, tuple)) and isinstance(v, tuple):
-            u = convert_lone_element_to_tuple(u)
-
-        if cfg.debugging_mode is True:
-            print("Continuing with addition of: ", str(u), "and", str(v))
-
-
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-        # ● Process the addition of lone elements (e.g., a transvalent 
-        # ● symbol *or* float with another such variable), generating a
-        # ● well-formed transvalent tuple as output.
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-
-        # If either u or v is the Unimplemented symbol, return the
-        # Unimplemented symbol as the operation's result.
-        if (u == cfg.unimplemented_sym) | (u == cfg.unimplemented_sym):
+    # Process "Æ - Ƿ²".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "Æ - -Ƿ²".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_pos
+
+    # Process "Æ - ∅".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.null_sym):
+        return tuple_real_num_sym_pos
+
+    # Process "Æ - Æ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym_pos):
+        return cfg.unimplemented_sym
+
+    # Process "Æ - -Æ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym_neg):
+        return tuple_real_num_sym_pos
+
+    # Process "Æ - ℝ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym):
+        return cfg.unimplemented_sym
+
+
+    # ------------------------------------------------------------------
+    # Process "-Æ - (something)".
+    # ------------------------------------------------------------------
+
+    # Process "-Æ - float".
+    elif (u == cfg.real_num_sym_neg) and isinstance(v, float):
+        if v == 0:
+            return tuple_real_num_sym_neg
+        else:
             return cfg.unimplemented_sym
 
+    # Process "-Æ - Ƿ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_neg
 
-        # ------------------------------------------------------------------
-        # Process "float + (something)".
-        # ------------------------------------------------------------------
+    # Process "-Æ - -Ƿ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pos
 
-        # Process "float + float".
-        if isinstance(u, float) and isinstance(v, float):
-            return (u + v, cfg.null_sym)
+    # Process "-Æ - Ƿ²".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "float + Ƿ".
-        elif isinstance(u, float) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "-Æ - -Ƿ²".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "float + -Ƿ".
-        elif isinstance(u, float) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_neg)
+    # Process "-Æ - ∅".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.null_sym):
+        return tuple_real_num_sym_neg
 
-        # Process "float + Ƿ²".
-        elif isinstance(u, float) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # Process "-Æ - Æ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym_pos):
+        return tuple_real_num_sym_neg
 
-        # Process "float + -Ƿ²".
-        elif isinstance(u, float) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "-Æ - -Æ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym_neg):
+        return cfg.unimplemented_sym
 
-        # Process "float + ∅".
-        elif isinstance(u, float)  and (v == cfg.null_sym):
-            return (u, cfg.null_sym)
+    # Process "-Æ - ℝ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym):
+        return cfg.unimplemented_sym
 
-        # Process "float + Æ".
-        elif isinstance(u, float) and (v == cfg.real_num_sym_pos):
-            if u == 0:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
 
-        # Process "float + -Æ".
-        elif isinstance(u, float) and (v == cfg.real_num_sym_neg):
-            if u == 0:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
+    # ------------------------------------------------------------------
+    # Process "ℝ - (something)".
+    # ------------------------------------------------------------------
 
-        # Process "float + ℝ".
-        elif isinstance(u, float) and (v == cfg.real_num_sym):
-            if u == 0:
-                return (cfg.real_num_sym, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
+    # Process "ℝ - float".
+    elif (u == cfg.real_num_sym) and isinstance(v, float):
+        return tuple_real_num_sym
 
+    # Process "ℝ - Ƿ".
+    elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_neg
 
-        # ------------------------------------------------------------------
-        # Process "Ƿ + (something)".
-        # ------------------------------------------------------------------
+    # Process "ℝ - -Ƿ".
+    elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pos
 
-        # Process "Ƿ + float".
-        elif (u == cfg.tv_sym_pos) and isinstance(v, float):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "ℝ - Ƿ²".
+    elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "Ƿ + Ƿ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "ℝ - -Ƿ²".
+    elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "Ƿ + -Ƿ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.null_sym)
+    # Process "ℝ - ∅".
+    elif (u == cfg.real_num_sym) and (v == cfg.null_sym):
+        return tuple_real_num_sym
 
-        # Process "Ƿ + Ƿ²".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # Process "ℝ - Æ".
+    elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym_pos):
+        return cfg.unimplemented_sym
 
-        # Process "Ƿ + -Ƿ²".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "ℝ - -Æ".
+    elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym_neg):
+        return cfg.unimplemented_sym
 
-        # Process "Ƿ + ∅".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.null_sym):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "ℝ - ℝ".
+    elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym):
+        return cfg.unimplemented_sym
 
-        # Process "Ƿ + Æ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym_pos):
-            return (0.0, cfg.tv_sym_pos)
 
-        # Process "Ƿ + -Æ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym_neg):
-            return (0.0, cfg.tv_sym_pos)
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ● Process the subtraction of two well-formed tuples.
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
 
-        # Process "Ƿ + ℝ".
-        elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym):
-            return (0.0, cfg.tv_sym_pos)
+    # This subtracts two well-formed tuples by separately subtracting 
+    # their real elements and their transvalent elements, using the rules 
+    # defined above for the subtraction of lone elements.
 
+    elif isinstance(u, tuple) and isinstance(v, tuple):
 
-        # ------------------------------------------------------------------
-        # Process "-Ƿ + (something)".
-        # ------------------------------------------------------------------
+        if ctx.get_current_context().debugging_mode is True:
+            print("Beginning subtraction of two tuples.")
 
-        # Process "-Ƿ + float".
-        elif (u == cfg.tv_sym_neg) and isinstance(v, float):
-            return (0.0, cfg.tv_sym_neg)
+        # This subtracts one transvalent tuple from another; i.e., 
+        # it calculates the value of: (a, b) - (c, d), where:
+        a = u[0]
+        b = u[1]
+        c = v[0]
+        d = v[1]
 
-        # Process "-Ƿ + Ƿ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.null_sym)
+        # If any of the tuples' elements is the "Unimplemented" symbol, 
+        # return a result indicating that the operation cannot be 
+        # processed.
+        if (a == cfg.unimplemented_sym) \
+                | (b == cfg.unimplemented_sym) \
+                | (c == cfg.unimplemented_sym) \
+                | (d == cfg.unimplemented_sym):
+            return cfg.unimplemented_sym
 
-        # Process "-Ƿ + -Ƿ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_neg)
 
-        # Process "-Ƿ + Ƿ²".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # ------------------------------------------------------------------
+        # Determine the difference of a and c as the difference of 
+        # two lone elements.
+        # ------------------------------------------------------------------
 
-        # Process "-Ƿ + -Ƿ²".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+        tokens_subordinate = tokenize_with_cache(
+            "(" + str(a) + " - " + str(c) + ")"
+            )
 
-        # Process "-Ƿ + ∅".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.null_sym):
-            return (0.0, cfg.tv_sym_neg)
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-        # Process "-Ƿ + Æ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym_pos):
-            return (0.0, cfg.tv_sym_neg)
+        diff_of_a_and_c = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("difference of real elements: ", diff_of_a_and_c)
 
-        # Process "-Ƿ + -Æ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym_neg):
-            return (0.0, cfg.tv_sym_neg)
+        # ------------------------------------------------------------------
+        # Determine the difference of b and d as the difference of 
+        # two lone elements.
+        # ------------------------------------------------------------------
+
+        tokens_subordinate = tokenize_with_cache(
+            "(" + str(b) + " - " + str(d) + ")"
+            )
 
-        # Process "-Ƿ + ℝ".
-        elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym):
-            return (0.0, cfg.tv_sym_neg)
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
+        diff_of_b_and_d = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("difference of transvalent elements: ", diff_of_b_and_d)
 
         # ------------------------------------------------------------------
-        # Process "Ƿ² + (something)".
+        # Determine the sum of (a-c) and (b-d) as the sum of 
+        # two lone elements.
         # ------------------------------------------------------------------
 
-        # Process "Ƿ² + float".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and isinstance(v, float):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+        tokens_subordinate = tokenize_with_cache(
+            "(" + str(diff_of_a_and_c[0]) + " + " + str(diff_of_b_and_d[1]) + ")"
+            )
 
-        # Process "Ƿ² + Ƿ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-        # Process "Ƿ² + -Ƿ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+        sum_of_a_minus_c_and_b_minus_d = \
+            parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("difference of tuples: ", sum_of_a_minus_c_and_b_minus_d)
 
-        # Process "Ƿ² + Ƿ²".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+        return sum_of_a_minus_c_and_b_minus_d
 
-        # Process "Ƿ² + -Ƿ²".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.null_sym)
 
-        # Process "Ƿ² + ∅".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.null_sym):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # If none of the steps above have been able to successfully
+    # handle the subtraction operation, return the Unimplemented symbol.
+    else:
+        return cfg.unimplemented_sym
 
-        # Process "Ƿ² + Æ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
 
-        # Process "Ƿ² + -Æ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+def add_values(
+    u,
+    v,
+    ):
+    """
+    Specifies how the addition operation is evaluated
+    within the context of transvalent mathematics.
+    """
 
-        # Process "Ƿ² + ℝ".
-        elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    if ctx.get_current_context().debugging_mode is True:
+        print("Beginning addition of: ", str(u), "and", str(v))
+        print("   ... of types: ", str(type(u)), "and", str(type(v)))
+
+    # If both u *and* v are lone elements, then they can be processed
+    # directly as specified further below. Similarly, if both u *and* v 
+    # are already well-formed tuples, they can be processed as specified
+    # further below. However, if one of u or v is a lone element and the
+    # other is a tuple, the lone element should be converted to a tuple
+    # here, so that they can be processed below as two tuples.
+    #
+    # Note that technically, this only checks whether they are tuples;
+    # to be more rigorous and eliminate errors, it should check whether
+    # they are *well-formed* transvalent tuples.
+    if isinstance(u, tuple) and (not isinstance(v, tuple)):
+        v = convert_lone_element_to_tuple(v)
+    elif (not isinstance(u, tuple)) and isinstance(v, tuple):
+        u = convert_lone_element_to_tuple(u)
+
+    if ctx.get_current_context().debugging_mode is True:
+        print("Continuing with addition of: ", str(u), "and", str(v))
+
+
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ● Process the addition of lone elements (e.g., a transvalent 
+    # ● symbol *or* float with another such variable), generating a
+    # ● well-formed transvalent tuple as output.
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+
+    # If either u or v is the Unimplemented symbol, return the
+    # Unimplemented symbol as the operation's result.
+    if (u == cfg.unimplemented_sym) | (u == cfg.unimplemented_sym):
+        return cfg.unimplemented_sym
 
 
-        # ------------------------------------------------------------------
-        # Process "-Ƿ² + (something)".
-        # ------------------------------------------------------------------
+    # ------------------------------------------------------------------
+    # Process "float + (something)".
+    # ------------------------------------------------------------------
 
-        # Process "-Ƿ² + float".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and isinstance(v, float):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float + float".
+    if isinstance(u, float) and isinstance(v, float):
+        return (u + v, cfg.null_sym)
 
-        # Process "-Ƿ² + Ƿ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float + Ƿ".
+    elif isinstance(u, float) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pos
 
-        # Process "-Ƿ² + -Ƿ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float + -Ƿ".
+    elif isinstance(u, float) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_neg
 
-        # Process "-Ƿ² + Ƿ²".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.null_sym)
+    # Process "float + Ƿ²".
+    elif isinstance(u, float) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Ƿ² + -Ƿ²".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float + -Ƿ²".
+    elif isinstance(u, float) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "-Ƿ² + ∅".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.null_sym):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float + ∅".
+    elif isinstance(u, float)  and (v == cfg.null_sym):
+        return (u, cfg.null_sym)
 
-        # Process "-Ƿ² + Æ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float + Æ".
+    elif isinstance(u, float) and (v == cfg.real_num_sym_pos):
+        if u == 0:
+            return tuple_real_num_sym_pos
+        else:
+            return cfg.unimplemented_sym
 
-        # Process "-Ƿ² + -Æ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float + -Æ".
+    elif isinstance(u, float) and (v == cfg.real_num_sym_neg):
+        if u == 0:
+            return tuple_real_num_sym_neg
+        else:
+            return cfg.unimplemented_sym
 
-        # Process "-Ƿ² + ℝ".
-        elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "float + ℝ".
+    elif isinstance(u, float) and (v == cfg.real_num_sym):
+        if u == 0:
+            return tuple_real_num_sym
+        else:
+            return cfg.unimplemented_sym
 
 
-        # ------------------------------------------------------------------
-        # Process "∅ + (something)".
-        # ------------------------------------------------------------------
+    # ------------------------------------------------------------------
+    # Process "Ƿ + (something)".
+    # ------------------------------------------------------------------
 
-        # Process "∅ + float".
-        elif (u == cfg.null_sym) and isinstance(v, float):
-            return (v, cfg.null_sym)
+    # Process "Ƿ + float".
+    elif (u == cfg.tv_sym_pos) and isinstance(v, float):
+        return tuple_tv_sym_pos
 
-        # Process "∅ + Ƿ".
-        elif (u == cfg.null_sym) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "Ƿ + Ƿ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pos
 
-        # Process "∅ + -Ƿ".
-        elif (u == cfg.null_sym) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_neg)
+    # Process "Ƿ + -Ƿ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_neg):
+        return tuple_null_sym
 
-        # Process "∅ + Ƿ²".
-        elif (u == cfg.null_sym) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # Process "Ƿ + Ƿ²".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "∅ + -Ƿ²".
-        elif (u == cfg.null_sym) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "Ƿ + -Ƿ²".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "∅ + ∅".
-        elif (u == cfg.null_sym) and (v == cfg.null_sym):
-            return (0.0, cfg.null_sym)
+    # Process "Ƿ + ∅".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.null_sym):
+        return tuple_tv_sym_pos
 
-        # Process "∅ + Æ".
-        elif (u == cfg.null_sym) and (v == cfg.real_num_sym_pos):
-            return (cfg.real_num_sym_pos, cfg.null_sym)
+    # Process "Ƿ + Æ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym_pos):
+        return tuple_tv_sym_pos
 
-        # Process "∅ + -Æ".
-        elif (u == cfg.null_sym) and (v == cfg.real_num_sym_neg):
-            return (cfg.real_num_sym_neg, cfg.null_sym)
+    # Process "Ƿ + -Æ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym_neg):
+        return tuple_tv_sym_pos
 
-        # Process "∅ + ℝ".
-        elif (u == cfg.null_sym) and (v == cfg.real_num_sym):
-            return (cfg.real_num_sym, cfg.null_sym)
+    # Process "Ƿ + ℝ".
+    elif (u == cfg.tv_sym_pos) and (v == cfg.real_num_sym):
+        return tuple_tv_sym_pos
 
 
-        # ------------------------------------------------------------------
-        # Process "Æ + (something)".
-        # ------------------------------------------------------------------
+    # ------------------------------------------------------------------
+    # Process "-Ƿ + (something)".
+    # ------------------------------------------------------------------
 
-        # Process "Æ + float".
-        elif (u == cfg.real_num_sym_pos) and isinstance(v, float):
-            if v == 0:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
+    # Process "-Ƿ + float".
+    elif (u == cfg.tv_sym_neg) and isinstance(v, float):
+        return tuple_tv_sym_neg
 
-        # Process "Æ + Ƿ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "-Ƿ + Ƿ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pos):
+        return tuple_null_sym
 
-        # Process "Æ + -Ƿ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_neg)
+    # Process "-Ƿ + -Ƿ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_neg
 
-        # Process "Æ + Ƿ²".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # Process "-Ƿ + Ƿ²".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "Æ + -Ƿ²".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "-Ƿ + -Ƿ²".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "Æ + ∅".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.null_sym):
-            return (cfg.real_num_sym_pos, cfg.null_sym)
+    # Process "-Ƿ + ∅".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.null_sym):
+        return tuple_tv_sym_neg
 
-        # Process "Æ + Æ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym_pos):
-            return (cfg.real_num_sym_pos, cfg.null_sym)
+    # Process "-Ƿ + Æ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym_pos):
+        return tuple_tv_sym_neg
 
-        # Process "Æ + -Æ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym_neg):
-            return cfg.unimplemented_sym
+    # Process "-Ƿ + -Æ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym_neg):
+        return tuple_tv_sym_neg
 
-        # Process "Æ + ℝ".
-        elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym):
-            return cfg.unimplemented_sym
+    # Process "-Ƿ + ℝ".
+    elif (u == cfg.tv_sym_neg) and (v == cfg.real_num_sym):
+        return tuple_tv_sym_neg
 
 
-        # ------------------------------------------------------------------
-        # Process "-Æ + (something)".
-        # ------------------------------------------------------------------
+    # ------------------------------------------------------------------
+    # Process "Ƿ² + (something)".
+    # ------------------------------------------------------------------
 
-        # Process "-Æ + float".
-        elif (u == cfg.real_num_sym_neg) and isinstance(v, float):
-            if v == 0:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
-            else:
-                return cfg.unimplemented_sym
+    # Process "Ƿ² + float".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and isinstance(v, float):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Æ + Ƿ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "Ƿ² + Ƿ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Æ + -Ƿ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_neg)
+    # Process "Ƿ² + -Ƿ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Æ + Ƿ²".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # Process "Ƿ² + Ƿ²".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Æ + -Ƿ²".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "Ƿ² + -Ƿ²".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_null_sym
 
-        # Process "-Æ + ∅".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.null_sym):
-            return (cfg.real_num_sym_neg, cfg.null_sym)
+    # Process "Ƿ² + ∅".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.null_sym):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Æ + Æ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym_pos):
-            return cfg.unimplemented_sym
+    # Process "Ƿ² + Æ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Æ + -Æ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym_neg):
-            return (cfg.real_num_sym_neg, cfg.null_sym)
+    # Process "Ƿ² + -Æ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym_neg):
+        return tuple_tv_sym_pwr_p2_pos
 
-        # Process "-Æ + ℝ".
-        elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym):
-            return cfg.unimplemented_sym
+    # Process "Ƿ² + ℝ".
+    elif (u == cfg.tv_sym_pwr_p2_pos) and (v == cfg.real_num_sym):
+        return tuple_tv_sym_pwr_p2_pos
 
 
-        # ------------------------------------------------------------------
-        # Process "ℝ + (something)".
-        # ------------------------------------------------------------------
+    # ------------------------------------------------------------------
+    # Process "-Ƿ² + (something)".
+    # ------------------------------------------------------------------
 
-        # Process "ℝ + float".
-        elif (u == cfg.real_num_sym) and isinstance(v, float):
-            if v == 0:
-                return (0.0, cfg.real_num_sym)
-            else:
-                return cfg.unimplemented_sym
+    # Process "-Ƿ² + float".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and isinstance(v, float):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "ℝ + Ƿ".
-        elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pos):
-            return (0.0, cfg.tv_sym_pos)
+    # Process "-Ƿ² + Ƿ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "ℝ + -Ƿ".
-        elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_neg):
-            return (0.0, cfg.tv_sym_neg)
+    # Process "-Ƿ² + -Ƿ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "ℝ + Ƿ²".
-        elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pwr_p2_pos):
-            return (0.0, cfg.tv_sym_pwr_p2_pos)
+    # Process "-Ƿ² + Ƿ²".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_null_sym
 
-        # Process "ℝ + -Ƿ²".
-        elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pwr_p2_neg):
-            return (0.0, cfg.tv_sym_pwr_p2_neg)
+    # Process "-Ƿ² + -Ƿ²".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "ℝ + ∅".
-        elif (u == cfg.real_num_sym) and (v == cfg.null_sym):
-            return (cfg.real_num_sym, cfg.null_sym)
+    # Process "-Ƿ² + ∅".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.null_sym):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "ℝ + Æ".
-        elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym_pos):
-            return cfg.unimplemented_sym
+    # Process "-Ƿ² + Æ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym_pos):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "ℝ + -Æ".
-        elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym_neg):
-            return cfg.unimplemented_sym
+    # Process "-Ƿ² + -Æ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
-        # Process "ℝ + ℝ".
-        elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym):
-            return cfg.unimplemented_sym
+    # Process "-Ƿ² + ℝ".
+    elif (u == cfg.tv_sym_pwr_p2_neg) and (v == cfg.real_num_sym):
+        return tuple_tv_sym_pwr_p2_neg
 
 
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-        # ● Process the addition of two well-formed tuples.
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ------------------------------------------------------------------
+    # Process "∅ + (something)".
+    # ------------------------------------------------------------------
 
-        # This adds two well-formed tuples by separately adding their real
-        # elements and their transvalent elements, using the rules defined
-        # above for the addition of lone elements.
+    # Process "∅ + float".
+    elif (u == cfg.null_sym) and isinstance(v, float):
+        return (v, cfg.null_sym)
 
-        elif isinstance(u, tuple) and isinstance(v, tuple):
+    # Process "∅ + Ƿ".
+    elif (u == cfg.null_sym) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pos
 
-            if cfg.debugging_mode is True:
-                print("Beginning addition of two tuples.")
+    # Process "∅ + -Ƿ".
+    elif (u == cfg.null_sym) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_neg
 
-            # The steps below will add one transvalent tuple to another; 
-            # i.e., it calculates the value of: (a, b) + (c, d), where:
-            a = u[0]
-            b = u[1]
-            c = v[0]
-            d = v[1]
+    # Process "∅ + Ƿ²".
+    elif (u == cfg.null_sym) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-            # If any of the tuples' elements is the Unimplemented symbol, 
-            # return a result indicating that the operation cannot be 
-            # processed.
-            if (a == cfg.unimplemented_sym) \
-                    | (b == cfg.unimplemented_sym) \
-                    | (c == cfg.unimplemented_sym) \
-                    | (d == cfg.unimplemented_sym):
-                return cfg.unimplemented_sym
+    # Process "∅ + -Ƿ²".
+    elif (u == cfg.null_sym) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
+    # Process "∅ + ∅".
+    elif (u == cfg.null_sym) and (v == cfg.null_sym):
+        return tuple_null_sym
 
-            # ------------------------------------------------------------------
-            # Determine the sum of a and c as the sum of two lone elements.
-            # ------------------------------------------------------------------
+    # Process "∅ + Æ".
+    elif (u == cfg.null_sym) and (v == cfg.real_num_sym_pos):
+        return tuple_real_num_sym_pos
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(
-                "(" + str(a) + " + " + str(c) + ")"
-                )
+    # Process "∅ + -Æ".
+    elif (u == cfg.null_sym) and (v == cfg.real_num_sym_neg):
+        return tuple_real_num_sym_neg
+
+    # Process "∅ + ℝ".
+    elif (u == cfg.null_sym) and (v == cfg.real_num_sym):
+        return tuple_real_num_sym
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
 
-            sum_of_a_and_c = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("sum of real elements: ", sum_of_a_and_c)
+    # ------------------------------------------------------------------
+    # Process "Æ + (something)".
+    # ------------------------------------------------------------------
 
-            # ------------------------------------------------------------------
-            # Determine the sum of b and d as the sum of two lone elements.
-            # ------------------------------------------------------------------
+    # Process "Æ + float".
+    elif (u == cfg.real_num_sym_pos) and isinstance(v, float):
+        if v == 0:
+            return tuple_real_num_sym_pos
+        else:
+            return cfg.unimplemented_sym
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(
-                "(" + str(b) + " + " + str(d) + ")"
-                )
+    # Process "Æ + Ƿ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pos
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+    # Process "Æ + -Ƿ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_neg
 
-            sum_of_b_and_d = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("sum of transvalent elements: ", sum_of_b_and_d)
+    # Process "Æ + Ƿ²".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-            if sum_of_b_and_d == cfg.unimplemented_sym:
-                return cfg.unimplemented_sym
+    # Process "Æ + -Ƿ²".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
-            # ------------------------------------------------------------------
-            # Determine the sum of (a+c) and (b+d) as the sum of 
-            # two lone elements.
-            # ------------------------------------------------------------------
+    # Process "Æ + ∅".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.null_sym):
+        return tuple_real_num_sym_pos
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(
-                "(" + str(sum_of_a_and_c[0]) + " + " + str(sum_of_b_and_d[1]) + ")"
-                )
+    # Process "Æ + Æ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym_pos):
+        return tuple_real_num_sym_pos
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+    # Process "Æ + -Æ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym_neg):
+        return cfg.unimplemented_sym
 
-            sum_of_a_and_c_and_b_and_d = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("sum of tuples: ", sum_of_a_and_c_and_b_and_d)
+    # Process "Æ + ℝ".
+    elif (u == cfg.real_num_sym_pos) and (v == cfg.real_num_sym):
+        return cfg.unimplemented_sym
 
-            return sum_of_a_and_c_and_b_and_d
 
+    # ------------------------------------------------------------------
+    # Process "-Æ + (something)".
+    # ------------------------------------------------------------------
 
-        # If none of the steps above have been able to successfully
-        # handle the addition operation, return the Unimplemented symbol.
+    # Process "-Æ + float".
+    elif (u == cfg.real_num_sym_neg) and isinstance(v, float):
+        if v == 0:
+            return tuple_real_num_sym_neg
         else:
             return cfg.unimplemented_sym
 
+    # Process "-Æ + Ƿ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pos
 
-    @_('term')
-    def expr(self, p):
-        """
-        Defines the processing of a single term.
-        """
-        return p.term
+    # Process "-Æ + -Ƿ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_neg
 
+    # Process "-Æ + Ƿ²".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_pos
 
-    @_('expr TIMES expr')
-    def expr(self, p):
-        """
-        Specifies how the multiplication operation is evaluated
-        within the context of transvalent mathematics.
-        """
+    # Process "-Æ + -Ƿ²".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_neg
 
-        if cfg.debugging_mode is True:
-            print("Beginning multiplication of: ",
-                str(p.expr0), "and", str(p.expr1)
-                )
-            print("   ... of types: ",
-                str(type(p.expr0)), "and", str(type(p.expr1))
-                )
+    # Process "-Æ + ∅".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.null_sym):
+        return tuple_real_num_sym_neg
 
-        # Assign the argument expressions to variables, to simplify
-        # operations involving them.
-        u = p.expr0
-        v = p.expr1
-
-        # If both u *and* v are lone elements, then they can be processed
-        # directly as specified further below. Similarly, if both u *and* v 
-        # are already well-formed tuples, they can be processed as specified
-        # further below. However, if one of u or v is a lone element and the
-        # other is a tuple, the lone element should be converted to a tuple
-        # here, so that they can be processed below as two tuples.
-        #
-        # Note that technically, this only checks whether they are tuples;
-        # to be more rigorous and eliminate errors, it should check whether
-        # they are *well-formed* transvalent tuples.
-        if isinstance(u, tuple) and (not isinstance(v, tuple)):
-            v = convert_lone_element_to_tuple(v)
-        elif (not isinstance(u, tuple)) and isinstance(v, tuple):
-            u = convert_lone_element_to_tuple(u)
-
-        if cfg.debugging_mode is True:
-            print("Continuing with multiplication of: ",
-                str(u), "and", str(v)
-                )
+    # Process "-Æ + Æ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym_pos):
+        return cfg.unimplemented_sym
+
+    # Process "-Æ + -Æ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym_neg):
+        return tuple_real_num_sym_neg
+
+    # Process "-Æ + ℝ".
+    elif (u == cfg.real_num_sym_neg) and (v == cfg.real_num_sym):
+        return cfg.unimplemented_sym
+
+
+    # ------------------------------------------------------------------
+    # Process "ℝ + (something)".
+    # ------------------------------------------------------------------
+
+    # Process "ℝ + float".
+    elif (u == cfg.real_num_sym) and isinstance(v, float):
+        if v == 0:
+            return (0.0, cfg.real_num_sym)
+        else:
+            return cfg.unimplemented_sym
+
+    # Process "ℝ + Ƿ".
+    elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pos):
+        return tuple_tv_sym_pos
+
+    # Process "ℝ + -Ƿ".
+    elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_neg):
+        return tuple_tv_sym_neg
+
+    # Process "ℝ + Ƿ²".
+    elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pwr_p2_pos):
+        return tuple_tv_sym_pwr_p2_pos
+
+    # Process "ℝ + -Ƿ²".
+    elif (u == cfg.real_num_sym) and (v == cfg.tv_sym_pwr_p2_neg):
+        return tuple_tv_sym_pwr_p2_neg
+
+    # Process "ℝ + ∅".
+    elif (u == cfg.real_num_sym) and (v == cfg.null_sym):
+        return tuple_real_num_sym
+
+    # Process "ℝ + Æ".
+    elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym_pos):
+        return cfg.unimplemented_sym
+
+    # Process "ℝ + -Æ".
+    elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym_neg):
+        return cfg.unimplemented_sym
+
+    # Process "ℝ + ℝ".
+    elif (u == cfg.real_num_sym) and (v == cfg.real_num_sym):
+        return cfg.unimplemented_sym
+
+
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ● Process the addition of two well-formed tuples.
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
 
+    # This adds two well-formed tuples by separately adding their real
+    # elements and their transvalent elements, using the rules defined
+    # above for the addition of lone elements.
 
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-        # ● Process the multiplication of lone elements (e.g., a transvalent
-        # ● symbol *or* float with another such variable), generating a
-        # ● well-formed transvalent tuple as output.
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    elif isinstance(u, tuple) and isinstance(v, tuple):
 
-        # If either of the terms is the "Unimplemented" symbol, return
-        # a result indicating that the operation cannot be processed.
-        if (u == cfg.unimplemented_sym) | (v == cfg.unimplemented_sym):
+        if ctx.get_current_context().debugging_mode is True:
+            print("Beginning addition of two tuples.")
+
+        # The steps below will add one transvalent tuple to another; 
+        # i.e., it calculates the value of: (a, b) + (c, d), where:
+        a = u[0]
+        b = u[1]
+        c = v[0]
+        d = v[1]
+
+        # If any of the tuples' elements is the Unimplemented symbol, 
+        # return a result indicating that the operation cannot be 
+        # processed.
+        if (a == cfg.unimplemented_sym) \
+                | (b == cfg.unimplemented_sym) \
+                | (c == cfg.unimplemented_sym) \
+                | (d == cfg.unimplemented_sym):
             return cfg.unimplemented_sym
 
 
         # ------------------------------------------------------------------
-        # Process "positive float × (something)".
+        # Determine the sum of a and c as the sum of two lone elements.
+        # ------------------------------------------------------------------
+
+        tokens_subordinate = tokenize_with_cache(
+            "(" + str(a) + " + " + str(c) + ")"
+            )
+
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
+
+        sum_of_a_and_c = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("sum of real elements: ", sum_of_a_and_c)
+
+        # ------------------------------------------------------------------
+        # Determine the sum of b and d as the sum of two lone elements.
+        # ------------------------------------------------------------------
+
+        tokens_subordinate = tokenize_with_cache(
+            "(" + str(b) + " + " + str(d) + ")"
+            )
+
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
+
+        sum_of_b_and_d = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("sum of transvalent elements: ", sum_of_b_and_d)
+
+        if sum_of_b_and_d == cfg.unimplemented_sym:
+            return cfg.unimplemented_sym
+
+        # ------------------------------------------------------------------
+        # Determine the sum of (a+c) and (b+d) as the sum of 
+        # two lone elements.
         # ------------------------------------------------------------------
-        if isinstance(u, float) and (u > 0):
 
-            # Process "positive float × positive float".
-            # Process "positive float × negative float".
-            # Process "positive float × 0".
-            if isinstance(v, float):
-                return (u*v, cfg.null_sym)
+        tokens_subordinate = tokenize_with_cache(
+            "(" + str(sum_of_a_and_c[0]) + " + " + str(sum_of_b_and_d[1]) + ")"
+            )
+
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
+
+        sum_of_a_and_c_and_b_and_d = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("sum of tuples: ", sum_of_a_and_c_and_b_and_d)
 
-            # Process "positive float × Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_pos)
+        return sum_of_a_and_c_and_b_and_d
+
+
+    # If none of the steps above have been able to successfully
+    # handle the addition operation, return the Unimplemented symbol.
+    else:
+        return cfg.unimplemented_sym
 
-            # Process "positive float × -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_neg)
 
-            # Process "positive float × Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+def multiply_values(
+    u,
+    v,
+    ):
+    """
+    Specifies how the multiplication operation is evaluated
+    within the context of transvalent mathematics.
+    """
 
-            # Process "positive float × -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+    if ctx.get_current_context().debugging_mode is True:
+        print("Beginning multiplication of: ",
+            str(u), "and", str(v)
+            )
+        print("   ... of types: ",
+            str(type(u)), "and", str(type(v))
+            )
+
+    # If both u *and* v are lone elements, then they can be processed
+    # directly as specified further below. Similarly, if both u *and* v 
+    # are already well-formed tuples, they can be processed as specified
+    # further below. However, if one of u or v is a lone element and the
+    # other is a tuple, the lone element should be converted to a tuple
+    # here, so that they can be processed below as two tuples.
+    #
+    # Note that technically, this only checks whether they are tuples;
+    # to be more rigorous and eliminate errors, it should check whether
+    # they are *well-formed* transvalent tuples.
+    if isinstance(u, tuple) and (not isinstance(v, tuple)):
+        v = convert_lone_element_to_tuple(v)
+    elif (not isinstance(u, tuple)) and isinstance(v, tuple):
+        u = convert_lone_element_to_tuple(u)
+
+    if ctx.get_current_context().debugging_mode is True:
+        print("Continuing with multiplication of: ",
+            str(u), "and", str(v)
+            )
+
+
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ● Process the multiplication of lone elements (e.g., a transvalent
+    # ● symbol *or* float with another such variable), generating a
+    # ● well-formed transvalent tuple as output.
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+
+    # If either of the terms is the "Unimplemented" symbol, return
+    # a result indicating that the operation cannot be processed.
+    if (u == cfg.unimplemented_sym) | (v == cfg.unimplemented_sym):
+        return cfg.unimplemented_sym
 
-            # Process "positive float × ∅".
-            elif v == cfg.null_sym:
-                return (0.0, cfg.null_sym)
 
+    # ------------------------------------------------------------------
+    # Process "positive float × (something)".
+    # ------------------------------------------------------------------
+    if isinstance(u, float) and (u > 0):
 
-        # ------------------------------------------------------------------
-        # Process "negative float × (something)".
-        # ------------------------------------------------------------------
-        elif isinstance(u, float) and (u < 0):
+        # Process "positive float × positive float".
+        # Process "positive float × negative float".
+        # Process "positive float × 0".
+        if isinstance(v, float):
+            return (u*v, cfg.null_sym)
 
-            # Process "negative float × positive float".
-            # Process "negative float × negative float".
-            # Process "negative float × 0".
-            if isinstance(v, float):
-                return (u*v, cfg.null_sym)
+        # Process "positive float × Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_pos
 
-            # Process "negative float × Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_neg)
+        # Process "positive float × -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_neg
 
-            # Process "negative float × -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_pos)
+        # Process "positive float × Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_p2_pos
 
-            # Process "negative float × Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+        # Process "positive float × -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_p2_neg
 
-            # Process "negative float × -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # Process "positive float × ∅".
+        elif v == cfg.null_sym:
+            return tuple_null_sym
 
-            # Process "negative float × ∅".
-            elif v == cfg.null_sym:
-                return (0.0, cfg.null_sym)
 
+    # ------------------------------------------------------------------
+    # Process "negative float × (something)".
+    # ------------------------------------------------------------------
+    elif isinstance(u, float) and (u < 0):
 
-        # ------------------------------------------------------------------
-        # Process "0 × (something)".
-        # ------------------------------------------------------------------
-        elif u == 0:
+        # Process "negative float × positive float".
+        # Process "negative float × negative float".
+        # Process "negative float × 0".
+        if isinstance(v, float):
+            return (u*v, cfg.null_sym)
 
-            # Process "0 × positive float".
-            # Process "0 × negative float".
-            # Process "0 × 0".
-            if isinstance(v, float):
-                return (0.0, cfg.null_sym)
+        # Process "negative float × Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_neg
 
-            # Process "0 × Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
+        # Process "negative float × -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_pos
 
-            # Process "0 × -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
+        # Process "negative float × Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_p2_neg
 
-            # Process "0 × Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pos)
+        # Process "negative float × -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_p2_pos
 
-            # Process "0 × -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_neg)
+        # Process "negative float × ∅".
+        elif v == cfg.null_sym:
+            return tuple_null_sym
 
-            # Process "0 × ∅".
-            elif v == cfg.null_sym:
-                return (0.0, cfg.null_sym)
 
+    # ------------------------------------------------------------------
+    # Process "0 × (something)".
+    # ------------------------------------------------------------------
+    elif u == 0:
 
-        # ------------------------------------------------------------------
-        # Process "Ƿ × (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.tv_sym_pos:
+        # Process "0 × positive float".
+        # Process "0 × negative float".
+        # Process "0 × 0".
+        if isinstance(v, float):
+            return tuple_null_sym
 
-            # Process "Ƿ × positive float".
-            if isinstance(v, float) and (v > 0):
-                return (0.0, cfg.tv_sym_pos)
+        # Process "0 × Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_real_num_sym_pos
 
-            # Process "Ƿ × negative float".
-            elif isinstance(v, float) and (v < 0):
-                return (0.0, cfg.tv_sym_neg)
+        # Process "0 × -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_real_num_sym_neg
 
-            # Process "Ƿ × 0".
-            elif v == 0:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
+        # Process "0 × Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pos
 
-            # Process "Ƿ × Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # Process "0 × -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_neg
 
-            # Process "Ƿ × -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+        # Process "0 × ∅".
+        elif v == cfg.null_sym:
+            return tuple_null_sym
 
-            # Process "Ƿ × Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_p3_pos)
 
-            # Process "Ƿ × -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_p3_neg)
+    # ------------------------------------------------------------------
+    # Process "Ƿ × (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.tv_sym_pos:
 
-            # Process "Ƿ × ∅".
-            elif v == cfg.null_sym:
-                return (0.0, cfg.null_sym)
+        # Process "Ƿ × positive float".
+        if isinstance(v, float) and (v > 0):
+            return tuple_tv_sym_pos
 
+        # Process "Ƿ × negative float".
+        elif isinstance(v, float) and (v < 0):
+            return tuple_tv_sym_neg
 
-        # ------------------------------------------------------------------
-        # Process "-Ƿ × (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.tv_sym_neg:
+        # Process "Ƿ × 0".
+        elif v == 0:
+            return tuple_real_num_sym_pos
 
-            # Process "-Ƿ × positive float".
-            if isinstance(v, float) and (v > 0):
-                return (0.0, cfg.tv_sym_neg)
+        # Process "Ƿ × Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_pwr_p2_pos
 
-            # Process "-Ƿ × negative float".
-            elif isinstance(v, float) and (v < 0):
-                return (0.0, cfg.tv_sym_pos)
+        # Process "Ƿ × -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_pwr_p2_neg
 
-            # Process "-Ƿ × 0".
-            elif v == 0:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
+        # Process "Ƿ × Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_p3_pos
 
-            # Process "-Ƿ × Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+        # Process "Ƿ × -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_p3_neg
 
-            # Process "-Ƿ × -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # Process "Ƿ × ∅".
+        elif v == cfg.null_sym:
+            return tuple_null_sym
 
-            # Process "-Ƿ × Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_p3_neg)
 
-            # Process "-Ƿ × -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_p3_pos)
+    # ------------------------------------------------------------------
+    # Process "-Ƿ × (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.tv_sym_neg:
 
-            # Process "-Ƿ × ∅".
-            elif v == cfg.null_sym:
-                return (0.0, cfg.null_sym)
+        # Process "-Ƿ × positive float".
+        if isinstance(v, float) and (v > 0):
+            return tuple_tv_sym_neg
 
+        # Process "-Ƿ × negative float".
+        elif isinstance(v, float) and (v < 0):
+            return tuple_tv_sym_pos
 
-        # ------------------------------------------------------------------
-        # Process "Ƿ² × (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.tv_sym_pwr_p2_pos:
+        # Process "-Ƿ × 0".
+        elif v == 0:
+            return tuple_real_num_sym_neg
 
-            # Process "Ƿ² × positive float".
-            if isinstance(v, float) and (v > 0):
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # Process "-Ƿ × Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_pwr_p2_neg
 
-            # Process "Ƿ² × negative float".
-            elif isinstance(v, float) and (v < 0):
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+        # Process "-Ƿ × -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_pwr_p2_pos
 
-            # Process "Ƿ² × 0".
-            elif v == 0:
-                return (0.0, cfg.tv_sym_pos)
+        # Process "-Ƿ × Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_p3_neg
 
-            # Process "Ƿ² × Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_pwr_p3_pos)
+        # Process "-Ƿ × -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_p3_pos
 
-            # Process "Ƿ² × -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_pwr_p3_neg)
+        # Process "-Ƿ × ∅".
+        elif v == cfg.null_sym:
+            return tuple_null_sym
 
-            # Process "Ƿ² × Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_p4_pos)
 
-            # Process "Ƿ² × -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_p4_neg)
+    # ------------------------------------------------------------------
+    # Process "Ƿ² × (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.tv_sym_pwr_p2_pos:
 
-            # Process "Ƿ² × ∅".
-            elif v == cfg.null_sym:
-                return (0.0, cfg.null_sym)
+        # Process "Ƿ² × positive float".
+        if isinstance(v, float) and (v > 0):
+            return tuple_tv_sym_pwr_p2_pos
 
+        # Process "Ƿ² × negative float".
+        elif isinstance(v, float) and (v < 0):
+            return tuple_tv_sym_pwr_p2_neg
 
-        # ------------------------------------------------------------------
-        # Process "-Ƿ² × (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.tv_sym_pwr_p2_neg:
+        # Process "Ƿ² × 0".
+        elif v == 0:
+            return tuple_tv_sym_pos
 
-            # Process "-Ƿ² × positive float".
-            if isinstance(v, float) and (v > 0):
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+        # Process "Ƿ² × Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_pwr_p3_pos
 
-            # Process "-Ƿ² × negative float".
-            elif isinstance(v, float) and (v < 0):
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # Process "Ƿ² × -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_pwr_p3_neg
 
-            # Process "-Ƿ² × 0".
-            elif v == 0:
-                return (0.0, cfg.tv_sym_neg)
+        # Process "Ƿ² × Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_p4_pos
 
-            # Process "-Ƿ² × Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_pwr_p3_neg)
+        # Process "Ƿ² × -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_p4_neg
 
-            # Process "-Ƿ² × -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_pwr_p3_pos)
+        # Process "Ƿ² × ∅".
+        elif v == cfg.null_sym:
+            return tuple_null_sym
 
-            # Process "-Ƿ² × Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_p4_neg)
 
-            # Process "-Ƿ² × -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_p4_pos)
+    # ------------------------------------------------------------------
+    # Process "-Ƿ² × (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.tv_sym_pwr_p2_neg:
 
-            # Process "-Ƿ² × ∅".
-            elif v == cfg.null_sym:
-                return (0.0, cfg.null_sym)
+        # Process "-Ƿ² × positive float".
+        if isinstance(v, float) and (v > 0):
+            return tuple_tv_sym_pwr_p2_neg
 
+        # Process "-Ƿ² × negative float".
+        elif isinstance(v, float) and (v < 0):
+            return tuple_tv_sym_pwr_p2_pos
 
-        # ------------------------------------------------------------------
-        # Process "∅ × (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.null_sym:
-            # Process "∅ × positive float".
-            # Process "∅ × negative float".
-            # Process "∅ × 0".
-            # Process "∅ × Ƿ".
-            # Process "∅ × -Ƿ".
-            # Process "∅ × Ƿ²".
-            # Process "∅ × -Ƿ²".
-            # Process "∅ × ∅".
-            return (0.0, cfg.null_sym)
-
-
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-        # ● Process the multiplication of two well-formed tuples.
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-
-        # This multiplies two well-formed tuples by using the rules
-        # defined above for the multiplication of lone elements (and the
-        # rules for addition of tuples and lone elements).
-
-        # Multiplication of two tuples is calculated in the following manner:
-        # (a, b) × (c, d) = (a × c) + (a × d) + (b × c) + (b × d)
-
-        elif isinstance(u, tuple) and isinstance(v, tuple):
-
-            # This multiplies one well-formed tuple by another; i.e., it 
-            # calculates the value of: (a, b) × (c, d), where:
-            a = u[0]
-            b = u[1]
-            c = v[0]
-            d = v[1]
-
-            # If any of the tuples' elements is the "Unimplemented" symbol, 
-            # return a result indicating that the operation cannot be 
-            # processed.
-            if (a == cfg.unimplemented_sym) \
-                    | (b == cfg.unimplemented_sym) \
-                    | (c == cfg.unimplemented_sym) \
-                    | (d == cfg.unimplemented_sym):
-                return cfg.unimplemented_sym
+        # Process "-Ƿ² × 0".
+        elif v == 0:
+            return tuple_tv_sym_neg
 
+        # Process "-Ƿ² × Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_pwr_p3_neg
 
-            # ------------------------------------------------------------------
-            # Determine the product of "(a × c)".
-            # ------------------------------------------------------------------
+        # Process "-Ƿ² × -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_pwr_p3_pos
 
-            # Create a new "input" string to be lexed and parsed
-            # that requests the product of a × c.
-            input_string = "(" + str(a) + " * " + str(c) + ")"
-            if cfg.debugging_mode is True:
-                print("input_string: ", input_string)
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(input_string)
+        # Process "-Ƿ² × Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_p4_neg
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+        # Process "-Ƿ² × -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_p4_pos
 
-            result_subordinate = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("parsed result: ", result_subordinate)
+        # Process "-Ƿ² × ∅".
+        elif v == cfg.null_sym:
+            return tuple_null_sym
 
-            a_times_c = result_subordinate
-            if cfg.debugging_mode is True:
-                print("a_times_c: ", a_times_c)
 
-            if a_times_c == cfg.unimplemented_sym:
-                return cfg.unimplemented_sym
+    # ------------------------------------------------------------------
+    # Process "∅ × (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.null_sym:
+        # Process "∅ × positive float".
+        # Process "∅ × negative float".
+        # Process "∅ × 0".
+        # Process "∅ × Ƿ".
+        # Process "∅ × -Ƿ".
+        # Process "∅ × Ƿ²".
+        # Process "∅ × -Ƿ²".
+        # Process "∅ × ∅".
+        return tuple_null_sym
+
+
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ● Process the multiplication of two well-formed tuples.
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+
+    # This multiplies two well-formed tuples by using the rules
+    # defined above for the multiplication of lone elements (and the
+    # rules for addition of tuples and lone elements).
+
+    # Multiplication of two tuples is calculated in the following manner:
+    # (a, b) × (c, d) = (a × c) + (a × d) + (b × c) + (b × d)
+
+    elif isinstance(u, tuple) and isinstance(v, tuple):
+
+        # This multiplies one well-formed tuple by another; i.e., it 
+        # calculates the value of: (a, b) × (c, d), where:
+        a = u[0]
+        b = u[1]
+        c = v[0]
+        d = v[1]
+
+        # If any of the tuples' elements is the "Unimplemented" symbol, 
+        # return a result indicating that the operation cannot be 
+        # processed.
+        if (a == cfg.unimplemented_sym) \
+                | (b == cfg.unimplemented_sym) \
+                | (c == cfg.unimplemented_sym) \
+                | (d == cfg.unimplemented_sym):
+            return cfg.unimplemented_sym
 
 
-            # ------------------------------------------------------------------
-            # Determine the product of "(a × d)".
-            # ------------------------------------------------------------------
+        # ------------------------------------------------------------------
+        # Determine the product of "(a × c)".
+        # ------------------------------------------------------------------
 
-            # Create a new "input" string to be lexed and parsed
-            # that requests the product of a × d.
-            input_string = "(" + str(a) + " * " + str(d) + ")"
-            if cfg.debugging_mode is True:
-                print("input_string: ", input_string)
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(input_string)
+        # Create a new "input" string to be lexed and parsed
+        # that requests the product of a × c.
+        input_string = "(" + str(a) + " * " + str(c) + ")"
+        if ctx.get_current_context().debugging_mode is True:
+            print("input_string: ", input_string)
+        tokens_subordinate = tokenize_with_cache(input_string)
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-            result_subordinate = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("parsed result: ", result_subordinate)
+        result_subordinate = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("parsed result: ", result_subordinate)
 
-            a_times_d = result_subordinate
-            if cfg.debugging_mode is True:
-                print("a_times_d: ", a_times_d)
+        a_times_c = result_subordinate
+        if ctx.get_current_context().debugging_mode is True:
+            print("a_times_c: ", a_times_c)
 
-            if a_times_d == cfg.unimplemented_sym:
-                return cfg.unimplemented_sym
+        if a_times_c == cfg.unimplemented_sym:
+            return cfg.unimplemented_sym
 
 
-            # ------------------------------------------------------------------
-            # Determine the product of "(b × c)".
-            # ------------------------------------------------------------------
+        # ------------------------------------------------------------------
+        # Determine the product of "(a × d)".
+        # ------------------------------------------------------------------
 
-            input_string = "(" + str(b) + " * " + str(c) + ")"
-            if cfg.debugging_mode is True:
-                print("input_string: ", input_string)
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(input_string)
+        # Create a new "input" string to be lexed and parsed
+        # that requests the product of a × d.
+        input_string = "(" + str(a) + " * " + str(d) + ")"
+        if ctx.get_current_context().debugging_mode is True:
+            print("input_string: ", input_string)
+        tokens_subordinate = tokenize_with_cache(input_string)
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-            result_subordinate = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("parsed result: ", result_subordinate)
+        result_subordinate = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("parsed result: ", result_subordinate)
 
-            b_times_c = result_subordinate
-            if cfg.debugging_mode is True:
-                print("b_times_c: ", b_times_c)
+        a_times_d = result_subordinate
+        if ctx.get_current_context().debugging_mode is True:
+            print("a_times_d: ", a_times_d)
 
-            if b_times_c == cfg.unimplemented_sym:
-                return cfg.unimplemented_sym
+        if a_times_d == cfg.unimplemented_sym:
+            return cfg.unimplemented_sym
 
 
-            # ------------------------------------------------------------------
-            # Determine the product of "(b × d)".
-            # ------------------------------------------------------------------
+        # ------------------------------------------------------------------
+        # Determine the product of "(b × c)".
+        # ------------------------------------------------------------------
 
-            input_string = "(" + str(b) + " * " + str(d) + ")"
-            if cfg.debugging_mode is True:
-                print("input_string: ", input_string)
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(input_string)
+        input_string = "(" + str(b) + " * " + str(c) + ")"
+        if ctx.get_current_context().debugging_mode is True:
+            print("input_string: ", input_string)
+        tokens_subordinate = tokenize_with_cache(input_string)
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-            result_subordinate = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("parsed result: ", result_subordinate)
+        result_subordinate = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("parsed result: ", result_subordinate)
 
-            b_times_d = result_subordinate
-            if cfg.debugging_mode is True:
-                print("b_times_d: ", b_times_d)
+        b_times_c = result_subordinate
+        if ctx.get_current_context().debugging_mode is True:
+            print("b_times_c: ", b_times_c)
 
-            if b_times_d == cfg.unimplemented_sym:
-                return cfg.unimplemented_sym
+        if b_times_c == cfg.unimplemented_sym:
+            return cfg.unimplemented_sym
 
 
-            # ------------------------------------------------------------------
-            # Determine the sum of "a_times_c + a_times_d".
-            # ------------------------------------------------------------------
+        # ------------------------------------------------------------------
+        # Determine the product of "(b × d)".
+        # ------------------------------------------------------------------
 
-            input_string = "(" \
-                + str(a_times_c[0]) + " + " \
-                + str(a_times_c[1]) + " + " \
-                + str(a_times_d[0]) + " + " \
-                + str(a_times_d[1]) \
-                + ")"
-            if cfg.debugging_mode is True:
-                print("a_times_c + a_times_d input_string: ", input_string)
+        input_string = "(" + str(b) + " * " + str(d) + ")"
+        if ctx.get_current_context().debugging_mode is True:
+            print("input_string: ", input_string)
+        tokens_subordinate = tokenize_with_cache(input_string)
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(input_string)
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+        result_subordinate = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("parsed result: ", result_subordinate)
 
-            result_subordinate = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("a_times_c_plus_a_times_d parsed result: ",
-                    result_subordinate
-                    )
+        b_times_d = result_subordinate
+        if ctx.get_current_context().debugging_mode is True:
+            print("b_times_d: ", b_times_d)
 
-            a_times_c_plus_a_times_d = result_subordinate
+        if b_times_d == cfg.unimplemented_sym:
+            return cfg.unimplemented_sym
 
-            if a_times_c_plus_a_times_d == cfg.unimplemented_sym:
-                return cfg.unimplemented_sym
 
+        # ------------------------------------------------------------------
+        # Determine the sum of "a_times_c + a_times_d".
+        # ------------------------------------------------------------------
 
-            # ------------------------------------------------------------------
-            # Determine the sum of "a_times_c_plus_a_times_d + b_times_c".
-            # ------------------------------------------------------------------
+        input_string = "(" \
+            + str(a_times_c[0]) + " + " \
+            + str(a_times_c[1]) + " + " \
+            + str(a_times_d[0]) + " + " \
+            + str(a_times_d[1]) \
+            + ")"
+        if ctx.get_current_context().debugging_mode is True:
+            print("a_times_c + a_times_d input_string: ", input_string)
 
-            input_string = "(" \
-                + str(a_times_c_plus_a_times_d[0]) + " + " \
-                + str(a_times_c_plus_a_times_d[1]) + " + " \
-                + str(b_times_c[0]) + " + " \
-                + str(b_times_c[1]) \
-                + ")"
-            if cfg.debugging_mode is True:
-                print("input_string: ", input_string)
+        tokens_subordinate = tokenize_with_cache(input_string)
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(input_string)
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+        result_subordinate = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("a_times_c_plus_a_times_d parsed result: ",
+                result_subordinate
+                )
 
-            result_subordinate = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print("a_times_c_plus_a_times_d_plus_b_times_c parsed result: ",
-                    result_subordinate
-                    )
+        a_times_c_plus_a_times_d = result_subordinate
 
-            a_times_c_plus_a_times_d_plus_b_times_c = result_subordinate
+        if a_times_c_plus_a_times_d == cfg.unimplemented_sym:
+            return cfg.unimplemented_sym
 
-            if a_times_c_plus_a_times_d_plus_b_times_c == cfg.unimplemented_sym:
-                return cfg.unimplemented_sym
 
+        # ------------------------------------------------------------------
+        # Determine the sum of "a_times_c_plus_a_times_d + b_times_c".
+        # ------------------------------------------------------------------
 
-            # ------------------------------------------------------------------
-            # Determine the sum of 
-            # "a_times_c_plus_a_times_d_plus_b_times_c + b_times_d".
-            # ------------------------------------------------------------------
+        input_string = "(" \
+            + str(a_times_c_plus_a_times_d[0]) + " + " \
+            + str(a_times_c_plus_a_times_d[1]) + " + " \
+            + str(b_times_c[0]) + " + " \
+            + str(b_times_c[1]) \
+            + ")"
+        if ctx.get_current_context().debugging_mode is True:
+            print("input_string: ", input_string)
 
-            input_string = "(" \
-                + str(a_times_c_plus_a_times_d_plus_b_times_c[0]) + " + " \
-                + str(a_times_c_plus_a_times_d_plus_b_times_c[1]) + " + " \
-                + str(b_times_d[0]) + " + " \
-                + str(b_times_d[1]) \
-                + ")"
-            if cfg.debugging_mode is True:
-                print("input_string: ", input_string)
+        tokens_subordinate = tokenize_with_cache(input_string)
 
-            lexer_subordinate = LiniaroteLexer()
-            tokens_subordinate = lexer_subordinate.tokenize(input_string)
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-            # It's necessary to create a new parser.
-            parser_subordinate = LiniaroteParser()
+        result_subordinate = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print("a_times_c_plus_a_times_d_plus_b_times_c parsed result: ",
+                result_subordinate
+                )
 
-            result_subordinate = parser_subordinate.parse(tokens_subordinate)
-            if cfg.debugging_mode is True:
-                print(
-                    "a_times_c_plus_a_times_d_plus_b_times_c_plus_b_times_d parsed result: ",
-                    result_subordinate
-                    )
+        a_times_c_plus_a_times_d_plus_b_times_c = result_subordinate
 
-            a_times_c_plus_a_times_d_plus_b_times_c_plus_b_times_d = result_subordinate
+        if a_times_c_plus_a_times_d_plus_b_times_c == cfg.unimplemented_sym:
+            return cfg.unimplemented_sym
 
-            if a_times_c_plus_a_times_d_plus_b_times_c_plus_b_times_d == cfg.unimplemented_sym:
-                return cfg.unimplemented_sym
-            else:
-                return a_times_c_plus_a_times_d_plus_b_times_c_plus_b_times_d
 
+        # ------------------------------------------------------------------
+        # Determine the sum of 
+        # "a_times_c_plus_a_times_d_plus_b_times_c + b_times_d".
+        # ------------------------------------------------------------------
 
-        # If none of the steps above have been able to successfully
-        # handle the multiplication operation, return the Unimplemented 
-        # symbol.
-        else:
-            return cfg.unimplemented_sym
+        input_string = "(" \
+            + str(a_times_c_plus_a_times_d_plus_b_times_c[0]) + " + " \
+            + str(a_times_c_plus_a_times_d_plus_b_times_c[1]) + " + " \
+            + str(b_times_d[0]) + " + " \
+            + str(b_times_d[1]) \
+            + ")"
+        if ctx.get_current_context().debugging_mode is True:
+            print("input_string: ", input_string)
 
+        tokens_subordinate = tokenize_with_cache(input_string)
 
-    @_('expr DIVIDE expr')
-    def expr(self, p):
-        """
-        Specifies how the division operation is evaluated
-        within the context of transvalent mathematics.
-        """
+        # It's necessary to create a new parser.
+        parser_subordinate = LiniaroteParser()
 
-        if cfg.debugging_mode is True:
-            print("Beginning division of: ", str(p.expr0), "and", str(p.expr1))
-            print("   ... of types: ", 
-                str(type(p.expr0)), "and", str(type(p.expr1))
+        result_subordinate = parser_subordinate.parse(tokens_subordinate)
+        if ctx.get_current_context().debugging_mode is True:
+            print(
+                "a_times_c_plus_a_times_d_plus_b_times_c_plus_b_times_d parsed result: ",
+                result_subordinate
                 )
 
-        # Assign the argument expressions to variables, to simplify
-        # operations involving them.
-        u = p.expr0
-        v = p.expr1
-
-        # If both u *and* v are lone elements, then they can be processed
-        # directly as specified further below. Similarly, if both u *and* v 
-        # are already well-formed tuples, they can be processed as specified
-        # further below. However, if one of u or v is a lone element and the
-        # other is a tuple, the lone element should be converted to a tuple
-        # here, so that they can be processed below as two tuples.
-        #
-        # Note that technically, this only checks whether they are tuples;
-        # to be more rigorous and eliminate errors, it should check whether
-        # they are *well-formed* transvalent tuples.
-        if isinstance(u, tuple) and (not isinstance(v, tuple)):
-            v = convert_lone_element_to_tuple(v)
-        elif (not isinstance(u, tuple)) and isinstance(v, tuple):
-            u = convert_lone_element_to_tuple(u)
-
-        if cfg.debugging_mode is True:
-            print("Continuing with division of: ", str(u), "and", str(v))
-
-
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-        # ● Process the division of lone elements (e.g., a transvalent 
-        # ● symbol *or* float with another such variable), generating a
-        # ● well-formed transvalent tuple as output.
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-
-        # If either of the terms is the Unimplemented symbol, return
-        # a result indicating that the operation cannot be processed.
-        if (u == cfg.unimplemented_sym) | (v == cfg.unimplemented_sym):
+        a_times_c_plus_a_times_d_plus_b_times_c_plus_b_times_d = result_subordinate
+
+        if a_times_c_plus_a_times_d_plus_b_times_c_plus_b_times_d == cfg.unimplemented_sym:
             return cfg.unimplemented_sym
+        else:
+            return a_times_c_plus_a_times_d_plus_b_times_c_plus_b_times_d
 
 
-        # ------------------------------------------------------------------
-        # Process "positive float ÷ (something)".
-        # ------------------------------------------------------------------
-        if isinstance(u, float) and (u > 0):
+    # If none of the steps above have been able to successfully
+    # handle the multiplication operation, return the Unimplemented 
+    # symbol.
+    else:
+        return cfg.unimplemented_sym
 
-            # Process "positive float ÷ positive float".
-            # Process "positive float ÷ negative float".
-            if isinstance(v, float) and (v != 0):
-                return (u/v, cfg.null_sym)
 
-            # Process "positive float ÷ 0".
-            elif isinstance(v, float) and (v == 0):
-                return (0.0, cfg.tv_sym_pos)
+def divide_values(
+    u,
+    v,
+    ):
+    """
+    Specifies how the division operation is evaluated
+    within the context of transvalent mathematics.
+    """
 
-            # Process "positive float ÷ Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.null_sym)
+    if ctx.get_current_context().debugging_mode is True:
+        print("Beginning division of: ", str(u), "and", str(v))
+        print("   ... of types: ", 
+            str(type(u)), "and", str(type(v))
+            )
+
+    # If both u *and* v are lone elements, then they can be processed
+    # directly as specified further below. Similarly, if both u *and* v 
+    # are already well-formed tuples, they can be processed as specified
+    # further below. However, if one of u or v is a lone element and the
+    # other is a tuple, the lone element should be converted to a tuple
+    # here, so that they can be processed below as two tuples.
+    #
+    # Note that technically, this only checks whether they are tuples;
+    # to be more rigorous and eliminate errors, it should check whether
+    # they are *well-formed* transvalent tuples.
+    if isinstance(u, tuple) and (not isinstance(v, tuple)):
+        v = convert_lone_element_to_tuple(v)
+    elif (not isinstance(u, tuple)) and isinstance(v, tuple):
+        u = convert_lone_element_to_tuple(u)
+
+    if ctx.get_current_context().debugging_mode is True:
+        print("Continuing with division of: ", str(u), "and", str(v))
+
+
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ● Process the division of lone elements (e.g., a transvalent 
+    # ● symbol *or* float with another such variable), generating a
+    # ● well-formed transvalent tuple as output.
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+
+    # If either of the terms is the Unimplemented symbol, return
+    # a result indicating that the operation cannot be processed.
+    if (u == cfg.unimplemented_sym) | (v == cfg.unimplemented_sym):
+        return cfg.unimplemented_sym
 
-            # Process "positive float ÷ -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.null_sym)
 
-            # Process "positive float ÷ Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_m2_pos)
+    # ------------------------------------------------------------------
+    # Process "positive float ÷ (something)".
+    # ------------------------------------------------------------------
+    if isinstance(u, float) and (u > 0):
 
-            # Process "positive float ÷ -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_m2_neg)
+        # Process "positive float ÷ positive float".
+        # Process "positive float ÷ negative float".
+        if isinstance(v, float) and (v != 0):
+            return (u/v, cfg.null_sym)
 
+        # Process "positive float ÷ 0".
+        elif isinstance(v, float) and (v == 0):
+            return tuple_tv_sym_pos
 
-        # ------------------------------------------------------------------
-        # Process "negative float ÷ (something)".
-        # ------------------------------------------------------------------
-        elif isinstance(u, float) and (u < 0):
+        # Process "positive float ÷ Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_null_sym
 
-            # Process "negative float ÷ positive float".
-            # Process "negative float ÷ negative float".
-            if isinstance(v, float) and (v != 0):
-                return (u/v, cfg.null_sym)
+        # Process "positive float ÷ -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_null_sym
 
-            # Process "negative float ÷ 0".
-            elif isinstance(v, float) and (v == 0):
-                return (0.0, cfg.tv_sym_neg)
+        # Process "positive float ÷ Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_m2_pos
 
-            # Process "negative float ÷ Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.null_sym)
+        # Process "positive float ÷ -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_m2_neg
 
-            # Process "negative float ÷ -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.null_sym)
 
-            # Process "negative float ÷ Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_m2_neg)
+    # ------------------------------------------------------------------
+    # Process "negative float ÷ (something)".
+    # ------------------------------------------------------------------
+    elif isinstance(u, float) and (u < 0):
 
-            # Process "negative float ÷ -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_m2_pos)
+        # Process "negative float ÷ positive float".
+        # Process "negative float ÷ negative float".
+        if isinstance(v, float) and (v != 0):
+            return (u/v, cfg.null_sym)
 
+        # Process "negative float ÷ 0".
+        elif isinstance(v, float) and (v == 0):
+            return tuple_tv_sym_neg
 
-        # ------------------------------------------------------------------
-        # Process "0 ÷ (something)".
-        # ------------------------------------------------------------------
-        elif u == 0:
+        # Process "negative float ÷ Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_null_sym
 
-            # Process "0 ÷ positive float".
-            # Process "0 ÷ negative float".
-            if isinstance(v, float) and (v != 0):
-                return (0.0, cfg.null_sym)
+        # Process "negative float ÷ -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_null_sym
 
-            # Process "0 ÷ 0".
-            elif isinstance(v, float) and (v == 0):
-                return (cfg.real_num_sym, cfg.null_sym)
+        # Process "negative float ÷ Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_m2_neg
 
-            # Process "0 ÷ Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_pwr_m2_pos)
+        # Process "negative float ÷ -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_m2_pos
 
-            # Process "0 ÷ -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_pwr_m2_neg)
 
-            # Process "0 ÷ Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.tv_sym_pwr_m3_pos)
+    # ------------------------------------------------------------------
+    # Process "0 ÷ (something)".
+    # ------------------------------------------------------------------
+    elif u == 0:
 
-            # Process "0 ÷ -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.tv_sym_pwr_m3_neg)
+        # Process "0 ÷ positive float".
+        # Process "0 ÷ negative float".
+        if isinstance(v, float) and (v != 0):
+            return tuple_null_sym
 
+        # Process "0 ÷ 0".
+        elif isinstance(v, float) and (v == 0):
+            return tuple_real_num_sym
 
-        # ------------------------------------------------------------------
-        # Process "Ƿ ÷ (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.tv_sym_pos:
+        # Process "0 ÷ Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_pwr_m2_pos
 
-            # Process "Ƿ ÷ positive float".
-            if isinstance(v, float) and (v > 0):
-                return (0.0, cfg.tv_sym_pos)
+        # Process "0 ÷ -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_pwr_m2_neg
 
-            # Process "Ƿ ÷ negative float".
-            elif isinstance(v, float) and (v < 0):
-                return (0.0, cfg.tv_sym_neg)
+        # Process "0 ÷ Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_tv_sym_pwr_m3_pos
 
-            # Process "Ƿ ÷ 0".
-            elif v == 0:
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # Process "0 ÷ -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_tv_sym_pwr_m3_neg
 
-            # Process "Ƿ ÷ Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
 
-            # Process "Ƿ ÷ -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
+    # ------------------------------------------------------------------
+    # Process "Ƿ ÷ (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.tv_sym_pos:
 
-            # Process "Ƿ ÷ Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.null_sym)
+        # Process "Ƿ ÷ positive float".
+        if isinstance(v, float) and (v > 0):
+            return tuple_tv_sym_pos
 
-            # Process "Ƿ ÷ -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.null_sym)
+        # Process "Ƿ ÷ negative float".
+        elif isinstance(v, float) and (v < 0):
+            return tuple_tv_sym_neg
 
+        # Process "Ƿ ÷ 0".
+        elif v == 0:
+            return tuple_tv_sym_pwr_p2_pos
 
-        # ------------------------------------------------------------------
-        # Process "-Ƿ ÷ (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.tv_sym_neg:
+        # Process "Ƿ ÷ Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_real_num_sym_pos
 
-            # Process "-Ƿ ÷ positive float".
-            if isinstance(v, float) and (v > 0):
-                return (0.0, cfg.tv_sym_neg)
+        # Process "Ƿ ÷ -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_real_num_sym_neg
 
-            # Process "-Ƿ ÷ negative float".
-            elif isinstance(v, float) and (v < 0):
-                return (0.0, cfg.tv_sym_pos)
+        # Process "Ƿ ÷ Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_null_sym
 
-            # Process "-Ƿ ÷ 0".
-            elif v == 0:
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+        # Process "Ƿ ÷ -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_null_sym
 
-            # Process "-Ƿ ÷ Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
 
-            # Process "-Ƿ ÷ -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
+    # ------------------------------------------------------------------
+    # Process "-Ƿ ÷ (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.tv_sym_neg:
 
-            # Process "-Ƿ ÷ Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (0.0, cfg.null_sym)
+        # Process "-Ƿ ÷ positive float".
+        if isinstance(v, float) and (v > 0):
+            return tuple_tv_sym_neg
 
-            # Process "-Ƿ ÷ -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (0.0, cfg.null_sym)
+        # Process "-Ƿ ÷ negative float".
+        elif isinstance(v, float) and (v < 0):
+            return tuple_tv_sym_pos
 
+        # Process "-Ƿ ÷ 0".
+        elif v == 0:
+            return tuple_tv_sym_pwr_p2_neg
 
-        # ------------------------------------------------------------------
-        # Process "Ƿ² ÷ (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.tv_sym_pwr_p2_pos:
+        # Process "-Ƿ ÷ Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_real_num_sym_neg
 
-            # Process "Ƿ² ÷ positive float".
-            if isinstance(v, float) and (v > 0):
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # Process "-Ƿ ÷ -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_real_num_sym_pos
 
-            # Process "Ƿ² ÷ negative float".
-            elif isinstance(v, float) and (v < 0):
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+        # Process "-Ƿ ÷ Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_null_sym
 
-            # Process "Ƿ² ÷ 0".
-            elif v == 0:
-                return (0.0, cfg.tv_sym_pwr_p3_pos)
+        # Process "-Ƿ ÷ -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_null_sym
 
-            # Process "Ƿ² ÷ Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_pos)
 
-            # Process "Ƿ² ÷ -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_neg)
+    # ------------------------------------------------------------------
+    # Process "Ƿ² ÷ (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.tv_sym_pwr_p2_pos:
 
-            # Process "Ƿ² ÷ Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
+        # Process "Ƿ² ÷ positive float".
+        if isinstance(v, float) and (v > 0):
+            return tuple_tv_sym_pwr_p2_pos
 
-            # Process "Ƿ² ÷ -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
+        # Process "Ƿ² ÷ negative float".
+        elif isinstance(v, float) and (v < 0):
+            return tuple_tv_sym_pwr_p2_neg
 
+        # Process "Ƿ² ÷ 0".
+        elif v == 0:
+            return tuple_tv_sym_pwr_p3_pos
 
-        # ------------------------------------------------------------------
-        # Process "-Ƿ² ÷ (something)".
-        # ------------------------------------------------------------------
-        elif u == cfg.tv_sym_pwr_p2_neg:
+        # Process "Ƿ² ÷ Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_pos
 
-            # Process "-Ƿ² ÷ positive float".
-            if isinstance(v, float) and (v > 0):
-                return (0.0, cfg.tv_sym_pwr_p2_neg)
+        # Process "Ƿ² ÷ -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_neg
 
-            # Process "-Ƿ² ÷ negative float".
-            elif isinstance(v, float) and (v < 0):
-                return (0.0, cfg.tv_sym_pwr_p2_pos)
+        # Process "Ƿ² ÷ Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_real_num_sym_pos
 
-            # Process "-Ƿ² ÷ 0".
-            elif v == 0:
-                return (0.0, cfg.tv_sym_pwr_p3_neg)
+        # Process "Ƿ² ÷ -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_real_num_sym_neg
 
-            # Process "-Ƿ² ÷ Ƿ".
-            elif v == cfg.tv_sym_pos:
-                return (0.0, cfg.tv_sym_neg)
 
-            # Process "-Ƿ² ÷ -Ƿ".
-            elif v == cfg.tv_sym_neg:
-                return (0.0, cfg.tv_sym_pos)
+    # ------------------------------------------------------------------
+    # Process "-Ƿ² ÷ (something)".
+    # ------------------------------------------------------------------
+    elif u == cfg.tv_sym_pwr_p2_neg:
 
-            # Process "-Ƿ² ÷ Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_pos:
-                return (cfg.real_num_sym_neg, cfg.null_sym)
+        # Process "-Ƿ² ÷ positive float".
+        if isinstance(v, float) and (v > 0):
+            return tuple_tv_sym_pwr_p2_neg
 
-            # Process "-Ƿ² ÷ -Ƿ²".
-            elif v == cfg.tv_sym_pwr_p2_neg:
-                return (cfg.real_num_sym_pos, cfg.null_sym)
+        # Process "-Ƿ² ÷ negative float".
+        elif isinstance(v, float) and (v < 0):
+            return tuple_tv_sym_pwr_p2_pos
 
+        # Process "-Ƿ² ÷ 0".
+        elif v == 0:
+            return tuple_tv_sym_pwr_p3_neg
 
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
-        # ● Process the division of two well-formed tuples.
-        # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+        # Process "-Ƿ² ÷ Ƿ".
+        elif v == cfg.tv_sym_pos:
+            return tuple_tv_sym_neg
 
-        elif isinstance(u, tuple) and isinstance(v, tuple):
+        # Process "-Ƿ² ÷ -Ƿ".
+        elif v == cfg.tv_sym_neg:
+            return tuple_tv_sym_pos
 
-            # This divides one well-formed tuple by another; i.e., it 
-            # calculates the value of: (a, b) ÷ (c, d), where:
-            a = u[0]
-            b = u[1]
-            c = v[0]
-            d = v[1]
+        # Process "-Ƿ² ÷ Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_pos:
+            return tuple_real_num_sym_neg
 
-            # If any of the tuples' elements is the Unimplemented symbol, 
-            # return a result indicating that the operation cannot be 
-            # processed.
-            if (a == cfg.unimplemented_sym) \
-                    | (b == cfg.unimplemented_sym) \
-                    | (c == cfg.unimplemented_sym) \
-                    | (d == cfg.unimplemented_sym):
-                return cfg.unimplemented_sym
+        # Process "-Ƿ² ÷ -Ƿ²".
+        elif v == cfg.tv_sym_pwr_p2_neg:
+            return tuple_real_num_sym_pos
 
 
-            # NOTE! At the moment, some of the if statements below don't check
-            # the values of a or c. But I haven't yet confirmed that the 
-            # formulas will be true for ALL possible values of a and c.
-
-            if (b == cfg.tv_sym_pos) and (d == cfg.tv_sym_pos):
-                return (cfg.real_num_sym_pos, cfg.null_sym)
-
-            elif (b == cfg.tv_sym_pos) and (d == cfg.tv_sym_neg):
-                return (cfg.real_num_sym_neg, cfg.null_sym)
-
-            elif (b == cfg.tv_sym_neg) and (d == cfg.tv_sym_pos):
-                return (cfg.real_num_sym_neg, cfg.null_sym)
-
-            elif (b == cfg.tv_sym_neg) and (d == cfg.tv_sym_neg):
-                return (cfg.real_num_sym_pos, cfg.null_sym)
-
-            elif (b == cfg.tv_sym_pos) and (d == cfg.null_sym):
-                if isinstance(c, float) and (c > 0):
-                    return (0.0, cfg.tv_sym_pos)
-                elif isinstance(c, float) and (c < 0):
-                    return (0.0, cfg.tv_sym_neg)
-                elif c == 0:
-                    return cfg.unimplemented_sym
-
-            elif (b == cfg.tv_sym_neg) and (d == cfg.null_sym):
-                if isinstance(c, float) and (c > 0):
-                    return (0.0, cfg.tv_sym_neg)
-                elif isinstance(c, float) and (c < 0):
-                    return (0.0, cfg.tv_sym_pos)
-                elif c == 0:
-                    return cfg.unimplemented_sym
-
-            elif (b == cfg.null_sym) and (d == cfg.tv_sym_pos):
-                if a == 0:
-                    return cfg.unimplemented_sym
-                else:
-                    return (0.0, cfg.null_sym)
-
-            elif (b == cfg.null_sym) and (d == cfg.tv_sym_neg):
-                if a == 0:
-                    return cfg.unimplemented_sym
-                else:
-                    return (0.0, cfg.null_sym)
-
-            elif (b == cfg.null_sym) and (d == cfg.null_sym):
-
-                # Handle the subcase when:
-                #    a is a positive real number and
-                #    c is a positive real number.
-                if ( isinstance(a, float) and (a > 0) ) \
-                        and ( isinstance(c, float) and (c > 0) ):
-                    return (a/c, cfg.null_sym)
-
-                # Handle the subcase when:
-                #    a is a positive real number and
-                #    c is zero.
-                elif ( isinstance(a, float) and (a > 0) ) \
-                        and (c == 0):
-                    return cfg.unimplemented_sym
-
-                # Handle the subcase when:
-                #    a is a positive real number and
-                #    c is a negative real number.
-                elif ( isinstance(a, float) and (a > 0) ) \
-                        and ( isinstance(c, float) and (c < 0) ):
-                    return (a/c, cfg.null_sym)
-
-                # Handle the subcase when:
-                #    a is zero and
-                #    c is a positive real number.
-                if (a == 0)  \
-                        and ( isinstance(c, float) and (c > 0) ):
-                    return cfg.unimplemented_sym
-
-                # Handle the subcase when:
-                #    a is zero and
-                #    c is zero.
-                if (a == 0) and (c == 0):
-                    return cfg.unimplemented_sym
-
-                # Handle the subcase when:
-                #    a is zero and
-                #    c is a negative real number.
-                if (a == 0)  \
-                        and ( isinstance(c, float) and (c < 0) ):
-                    return cfg.unimplemented_sym
-
-                # Handle the subcase when:
-                #    a is a negative real number and
-                #    c is a positive real number.
-                elif ( isinstance(a, float) and (a < 0) ) \
-                        and ( isinstance(c, float) and (c > 0) ):
-                    return (a/c, cfg.null_sym)
-
-                # Handle the subcase when:
-                #    a is a negative real number and
-                #    c is zero.
-                elif ( isinstance(a, float) and (a < 0) ) \
-                        and (c == 0):
-                    return cfg.unimplemented_sym
-
-                # Handle the subcase when:
-                #    a is a negative real number and
-                #    c is a negative real number.
-                elif ( isinstance(a, float) and (a < 0) ) \
-                        and ( isinstance(c, float) and (c < 0) ):
-                    return (a/c, cfg.null_sym)
-
-
-        # If none of the steps above have been able to successfully
-        # handle the multiplication operation, return the Unimplemented 
-        # symbol.
-        else:
-            return cfg.unimplemented_sym
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
+    # ● Process the division of two well-formed tuples.
+    # ●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●●
 
+    elif isinstance(u, tuple) and isinstance(v, tuple):
 
-    @_('factor')
-    def term(self, p):
-        """
-        Defines the processing of a single factor.
-        """
-        return p.factor
+        # This divides one well-formed tuple by another; i.e., it 
+        # calculates the value of: (a, b) ÷ (c, d), where:
+        a = u[0]
+        b = u[1]
+        c = v[0]
+        d = v[1]
 
+        # If any of the tuples' elements is the Unimplemented symbol, 
+        # return a result indicating that the operation cannot be 
+        # processed.
+        if (a == cfg.unimplemented_sym) \
+                | (b == cfg.unimplemented_sym) \
+                | (c == cfg.unimplemented_sym) \
+                | (d == cfg.unimplemented_sym):
+            return cfg.unimplemented_sym
 
-    @_('LPAREN expr RPAREN')
-    def factor(self, p):
-        """
-        Defines the processing of an expression enclosed in parentheses.
-        """
-        return p.expr
 
+        # NOTE! At the moment, some of the if statements below don't check
+        # the values of a or c. But I haven't yet confirmed that the 
+        # formulas will be true for ALL possible values of a and c.
 
-    @_('NUM')
-    def factor(self, p):
-        """
-        Defines the processing of a recognized numerical token.
-        """
-        return float(p.NUM)
+        if (b == cfg.tv_sym_pos) and (d == cfg.tv_sym_pos):
+            return tuple_real_num_sym_pos
 
+        elif (b == cfg.tv_sym_pos) and (d == cfg.tv_sym_neg):
+            return tuple_real_num_sym_neg
 
-    # ------------------------------------------------------------------
-    # Define the recognition of transvalent symbols and other special
-    # symbols.
-    # ------------------------------------------------------------------
+        elif (b == cfg.tv_sym_neg) and (d == cfg.tv_sym_pos):
+            return tuple_real_num_sym_neg
 
-    @_('TRANSVALENT_SYMBOL_POSITIVE_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “Ƿ” string.
-        """
-        return cfg.tv_sym_pos
+        elif (b == cfg.tv_sym_neg) and (d == cfg.tv_sym_neg):
+            return tuple_real_num_sym_pos
 
+        elif (b == cfg.tv_sym_pos) and (d == cfg.null_sym):
+            if isinstance(c, float) and (c > 0):
+                return tuple_tv_sym_pos
+            elif isinstance(c, float) and (c < 0):
+                return tuple_tv_sym_neg
+            elif c == 0:
+                return cfg.unimplemented_sym
 
-    @_('TRANSVALENT_SYMBOL_POWER_PLUS_TWO_POSITIVE_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “Ƿ²” string.
-        """
-        return cfg.tv_sym_pwr_p2_pos
+        elif (b == cfg.tv_sym_neg) and (d == cfg.null_sym):
+            if isinstance(c, float) and (c > 0):
+                return tuple_tv_sym_neg
+            elif isinstance(c, float) and (c < 0):
+                return tuple_tv_sym_pos
+            elif c == 0:
+                return cfg.unimplemented_sym
 
+        elif (b == cfg.null_sym) and (d == cfg.tv_sym_pos):
+            if a == 0:
+                return cfg.unimplemented_sym
+            else:
+                return tuple_null_sym
 
-    @_('TRANSVALENT_SYMBOL_POWER_PLUS_THREE_POSITIVE_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “Ƿ³” string.
-        """
-        return cfg.tv_sym_pwr_p3_pos
+        elif (b == cfg.null_sym) and (d == cfg.tv_sym_neg):
+            if a == 0:
+                return cfg.unimplemented_sym
+            else:
+                return tuple_null_sym
+
+        elif (b == cfg.null_sym) and (d == cfg.null_sym):
+
+            # Handle the subcase when:
+            #    a is a positive real number and
+            #    c is a positive real number.
+            if ( isinstance(a, float) and (a > 0) ) \
+                    and ( isinstance(c, float) and (c > 0) ):
+                return (a/c, cfg.null_sym)
+
+            # Handle the subcase when:
+            #    a is a positive real number and
+            #    c is zero.
+            elif ( isinstance(a, float) and (a > 0) ) \
+                    and (c == 0):
+                return cfg.unimplemented_sym
 
+            # Handle the subcase when:
+            #    a is a positive real number and
+            #    c is a negative real number.
+            elif ( isinstance(a, float) and (a > 0) ) \
+                    and ( isinstance(c, float) and (c < 0) ):
+                return (a/c, cfg.null_sym)
+
+            # Handle the subcase when:
+            #    a is zero and
+            #    c is a positive real number.
+            if (a == 0)  \
+                    and ( isinstance(c, float) and (c > 0) ):
+                return cfg.unimplemented_sym
 
-    @_('TRANSVALENT_SYMBOL_POWER_PLUS_FOUR_POSITIVE_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “Ƿ⁴” string.
-        """
-        return cfg.tv_sym_pwr_p4_pos
+            # Handle the subcase when:
+            #    a is zero and
+            #    c is zero.
+            if (a == 0) and (c == 0):
+                return cfg.unimplemented_sym
 
+            # Handle the subcase when:
+            #    a is zero and
+            #    c is a negative real number.
+            if (a == 0)  \
+                    and ( isinstance(c, float) and (c < 0) ):
+                return cfg.unimplemented_sym
 
-    @_('TRANSVALENT_SYMBOL_POWER_MINUS_TWO_POSITIVE_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “Ƿ⁻²” string.
-        """
-        return cfg.tv_sym_pwr_m2_pos
+            # Handle the subcase when:
+            #    a is a negative real number and
+            #    c is a positive real number.
+            elif ( isinstance(a, float) and (a < 0) ) \
+                    and ( isinstance(c, float) and (c > 0) ):
+                return (a/c, cfg.null_sym)
+
+            # Handle the subcase when:
+            #    a is a negative real number and
+            #    c is zero.
+            elif ( isinstance(a, float) and (a < 0) ) \
+                    and (c == 0):
+                return cfg.unimplemented_sym
 
+            # Handle the subcase when:
+            #    a is a negative real number and
+            #    c is a negative real number.
+            elif ( isinstance(a, float) and (a < 0) ) \
+                    and ( isinstance(c, float) and (c < 0) ):
+                return (a/c, cfg.null_sym)
 
-    @_('TRANSVALENT_SYMBOL_POWER_MINUS_THREE_POSITIVE_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “Ƿ⁻³” string.
-        """
-        return cfg.tv_sym_pwr_m3_pos
 
+    # If none of the steps above have been able to successfully
+    # handle the multiplication operation, return the Unimplemented 
+    # symbol.
+    else:
+        return cfg.unimplemented_sym
 
-    @_('REAL_NUMBER_POSITIVE_SYMBOL_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “Æ” string.
-        """
-        return cfg.real_num_sym_pos
 
+def raise_real_to_power(
+    base,
+    exponent,
+    base_is_lone,
+    ):
+    """
+    Raises a real number to a real power. The result is a lone element
+    if the base is one (as though the result had been typed directly).
+    """
 
-    @_('REAL_NUMBER_SYMBOL_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “ℝ” string.
-        """
-        return cfg.real_num_sym
+    if base == 0:
+        if exponent > 0:
+            result = 0.0
+        elif exponent == 0:
+            result = 1.0
+        else:
+            # A negative power of zero is the reciprocal of zero.
+            return divide_values(1.0, 0.0)
+    elif base < 0 and not exponent.is_integer():
+        # The result wouldn't be a real number.
+        return cfg.unimplemented_sym
+    else:
+        try:
+            result = base ** exponent
+        except OverflowError:
+            return cfg.unimplemented_sym
 
+    if base_is_lone:
+        return result
+    return (result, cfg.null_sym)
 
-    @_('NULL_SYMBOL_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “∅” string.
-        """
-        return cfg.null_sym
 
+def power_values(
+    u,
+    v,
+    ):
+    """
+    Specifies how exponentiation (u ^ v) is evaluated within the context
+    of transvalent mathematics. The exponent must be a real number. Real
+    numbers are raised to powers directly. Other values are raised to a
+    positive integer power n by multiplying them together from left to
+    right (so that u ^ n always gives the same result as u × u × ... × u),
+    and to negative powers by dividing 1 by the corresponding positive
+    power. Other powers of non-real values are unimplemented.
+
+    As transvalent multiplication isn't associative, the power can't be
+    found by repeated squaring (which groups the factors differently);
+    instead, the products are calculated one at a time until one of them
+    recurs, after which the rest follow a cycle. The number of
+    multiplications is thus bounded by the number of distinct products,
+    rather than by n.
+    """
 
-    @_('UNIMPLEMENTED_SYMBOL_INPUT')
-    def factor(self, p):
-        """
-        Defines the processing of the “U” string.
-        """
+    if ctx.get_current_context().debugging_mode is True:
+        print("Beginning exponentiation of: ", str(u), "and", str(v))
+
+    if u == cfg.unimplemented_sym or v == cfg.unimplemented_sym:
         return cfg.unimplemented_sym
 
+    # A lone null symbol is equivalent to the real number zero, except as
+    # the base of a positive integer power (e.g., ∅ ^ 1 = ∅ × ... = ∅).
+    if v == cfg.null_sym:
+        v = 0.0
 
-    # ------------------------------------------------------------------
-    # Handle the input of user-defined constants.
-    # ------------------------------------------------------------------
+    # Determine the (real) exponent.
+    if isinstance(v, float):
+        exponent = v
+    elif isinstance(v, tuple) and isinstance(v[0], float) and v[1] == cfg.null_sym:
+        exponent = v[0]
+    else:
+        return cfg.unimplemented_sym
 
-    @_('ID')
-    def factor(self, p):
-        """
-        Checks whether inputted text is an established variable.
-        """
-        return self.get_value_of_constant(p.ID)
+    if u == cfg.null_sym and not (exponent > 0 and exponent.is_integer()):
+        u = 0.0
 
+    # Raise a real base to the power.
+    base_is_lone = not isinstance(u, tuple)
+    if isinstance(u, float):
+        return raise_real_to_power(u, exponent, True)
+    elif not base_is_lone and isinstance(u[0], float) and u[1] == cfg.null_sym:
+        return raise_real_to_power(u[0], exponent, False)
 
-    def get_value_of_constant(self, name):
-        """
-        Assigns the value to a new variable from via user input.
-        """
-        if name not in cfg.recognized_constants:
-            cfg.recognized_constants[name] = \
-                float(input(f"Please enter the desired value for {name}: "))
-        return cfg.recognized_constants[name]
+    # Only integer powers of other values are implemented.
+    if not exponent.is_integer():
+        return cfg.unimplemented_sym
+    if exponent < 0:
+        # The reciprocals of the symbols are defined for lone symbols, so
+        # a positive power of a lone symbol that is a canonical tuple
+        # (e.g., Ƿ ^ 2 = (0.0, Ƿ²)) is replaced by its symbol (Ƿ²) before
+        # the division. A division that isn't implemented yields U.
+        positive_power = power_values(u, -exponent)
+        if base_is_lone and positive_power is not tuple_null_sym:
+            positive_power = displayed_forms_by_identity.get(
+                id(intern_value(positive_power)), positive_power
+                )
+        result = divide_values(1.0, positive_power)
+        if result is None:
+            return cfg.unimplemented_sym
+        return result
+    power = int(exponent)
+    if power == 0:
+        return 1.0 if base_is_lone else (1.0, cfg.null_sym)
+
+    # Otherwise, multiply the base by itself from left to right, exactly
+    # as the parser evaluates "u × u × ... × u". Each product depends only
+    # on the previous one, so once a product recurs, the remaining ones
+    # repeat in a cycle, and the final product can be read off the cycle
+    # (which keeps large powers cheap).
+    result = u
+    products = [result]
+    positions = {result: 0}
+    for position in range(1, power):
+        result = multiply_values(result, u)
+        if result == cfg.unimplemented_sym:
+            return result
+        if result in positions:
+            cycle_start = positions[result]
+            cycle_length = position - cycle_start
+            return products[
+                cycle_start + (power - 1 - cycle_start) % cycle_length
+                ]
+        positions[result] = position
+        products.append(result)
+    return result
 
 
 # ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
@@ -2397,52 +2912,14 @@ def convert_lone_element_to_tuple(
     """
     Converts a lone element (e.g., a float or "Ƿ") into a well-formed
     transvalent tuple upon which mathematical operations can be
-    performed.
+    performed. (Symbols are converted into their canonical tuples.)
     """
 
     if isinstance(lone_element_u, float):
         return (lone_element_u, cfg.null_sym)
 
-    elif lone_element_u == cfg.tv_sym_pos:
-        return (0.0, cfg.tv_sym_pos)
-    elif lone_element_u == cfg.tv_sym_neg:
-        return (0.0, cfg.tv_sym_neg)
-
-    elif lone_element_u == cfg.tv_sym_pwr_p2_pos:
-        return (0.0, cfg.tv_sym_pwr_p2_pos)
-    elif lone_element_u == cfg.tv_sym_pwr_p2_neg:
-        return (0.0, cfg.tv_sym_pwr_p2_neg)
-
-    elif lone_element_u == cfg.tv_sym_pwr_p3_pos:
-        return (0.0, cfg.tv_sym_pwr_p3_pos)
-    elif lone_element_u == cfg.tv_sym_pwr_p3_neg:
-        return (0.0, cfg.tv_sym_pwr_p3_neg)
-
-    elif lone_element_u == cfg.tv_sym_pwr_p4_pos:
-        return (0.0, cfg.tv_sym_pwr_p4_pos)
-    elif lone_element_u == cfg.tv_sym_pwr_p4_neg:
-        return (0.0, cfg.tv_sym_pwr_p4_neg)
-
-    elif lone_element_u == cfg.tv_sym_pwr_m2_pos:
-        return (0.0, cfg.tv_sym_pwr_m2_pos)
-    elif lone_element_u == cfg.tv_sym_pwr_m2_neg:
-        return (0.0, cfg.tv_sym_pwr_m2_neg)
-
-    elif lone_element_u == cfg.tv_sym_pwr_m3_pos:
-        return (0.0, cfg.tv_sym_pwr_m3_pos)
-    elif lone_element_u == cfg.tv_sym_pwr_m3_neg:
-        return (0.0, cfg.tv_sym_pwr_m3_neg)
-
-    elif lone_element_u == cfg.real_num_sym_pos:
-        return (cfg.real_num_sym_pos, cfg.null_sym)
-    elif lone_element_u == cfg.real_num_sym_neg:
-        return (cfg.real_num_sym_neg, cfg.null_sym)
-
-    elif lone_element_u == cfg.real_num_sym:
-        return (cfg.real_num_sym, cfg.null_sym)
-
-    elif lone_element_u == cfg.null_sym:
-        return (0.0, cfg.null_sym)
+    elif lone_element_u in tuples_by_lone_element:
+        return tuples_by_lone_element[lone_element_u]
 
     elif lone_element_u == cfg.unimplemented_sym:
         return cfg.unimplemented_sym
@@ -2457,10 +2934,16 @@ def format_result_for_display(
     text strings (e.g., intro or help text) without alteration.
     """
 
-    if cfg.debugging_mode is True:
+    if ctx.get_current_context().debugging_mode is True:
         print("result_unformatted: ", result_unformatted)
         print("result_unformatted type: ", type(result_unformatted))
 
+    # The canonical symbolic tuples are recognized by their identities
+    # alone.
+    displayed_form = displayed_forms_by_identity.get(id(result_unformatted))
+    if displayed_form is not None:
+        return displayed_form
+
 
     # ------------------------------------------------------------------
     # Format various types of unformatted results.
@@ -2514,6 +2997,50 @@ def format_result_for_display(
     return result_formatted
 
 
+def decompose_result_for_output(
+    result_unformatted
+    ):
+    """
+    Splits a calculated result into a (real, symbol) pair for output in
+    a machine-readable form. The symbol is the Null symbol if the result
+    is simply the given real number; otherwise, it is the symbol that
+    would be displayed (e.g., "Ƿ²" or "Æ"), and the real value is 0.0
+    (for transvalent symbols) or NaN (for indeterminate values and for
+    results that couldn't be calculated). None (for an input that couldn't
+    be evaluated) is treated as "U"; the batch writers mark such inputs as
+    errors instead, without calling this function.
+    """
+
+    # If the result is a lone real number...
+    if isinstance(result_unformatted, float):
+        return (result_unformatted, cfg.null_sym)
+
+    # If the result is a well-formed tuple...
+    elif isinstance(result_unformatted, tuple):
+        real_element = result_unformatted[0]
+        tv_element = result_unformatted[1]
+        if isinstance(real_element, str):
+            if real_element in cfg.symbol_codes:
+                return (math.nan, real_element)
+        elif tv_element in cfg.symbol_codes:
+            return (float(real_element), tv_element)
+
+    # If the result is a lone symbol...
+    elif result_unformatted in cfg.symbol_codes:
+        if result_unformatted in (
+                cfg.real_num_sym_pos,
+                cfg.real_num_sym_neg,
+                cfg.real_num_sym,
+                cfg.unimplemented_sym,
+                ):
+            return (math.nan, result_unformatted)
+        return (0.0, result_unformatted)
+
+    # For any other (unanticipated) cases, such as a result that isn't
+    # a transvalent value at all:
+    return (math.nan, cfg.unimplemented_sym)
+
+
 # ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 # █ Define functions for displaying pre-prepared text blocks.
 # ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
@@ -2568,26 +3095,51 @@ if __name__ == '__main__':
         print_intro_text()
 
         # Create the main lexer.
-        lexer = LiniaroteLexer()
+        lexer = create_lexer()
 
         # Check for user input of "Ctrl+C".
         signal.signal(signal.SIGINT, handler)
 
+        # Create the session that holds any expressions saved by the
+        # user. (The module is imported here, as it imports this one.)
+        try:
+            from . import session as session_module
+        except:
+            import session as session_module
+        session = session_module.ExpressionSession()
+
+        # The run-time metrics (displayed by ":stats") are those of the
+        # parsers and token-stream cache defined in this module.
+        runtime_metrics = session_module.metrics.runtime_metrics
+        runtime_metrics.token_cache = token_stream_cache
+
         while True:
 
             # Display the command prompt that accepts user input.
             text = input("<LINIAROTE:>  ")
 
+            # Process session commands (e.g., ":save" or ":set").
+            if text.lstrip().startswith(":"):
+                print(session_module.process_session_command(session, text))
+                continue
+
             #try:
-            if cfg.debugging_mode is True:
+            if ctx.get_current_context().debugging_mode is True:
                 tokens_for_display = lexer.tokenize(text)
                 for token in tokens_for_display:
                     print('token type: ', token.type, "; token value: ", token.value)
 
             # Process the user's input.
+            parsers_before = LiniaroteParser.parsers_created
+            start_time = time.perf_counter()
             tokens = lexer.tokenize(text)
             parser = LiniaroteParser()
             result = parser.parse(tokens)
+            runtime_metrics.record_expression(
+                time.perf_counter() - start_time, result,
+                LiniaroteParser.parsers_created - parsers_before - 1,
+                parse_error=parser.errors_detected > 0,
+                )
 
             # Format the calculated output for display and display it
             # on a special "output" line.
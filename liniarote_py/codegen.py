@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module translates Liniarote expressions into the source code of
+Python functions, which are then compiled with compile() and cached.
+
+A generated function accepts the values of the constants used in the
+expression. When all of the values involved are ordinary real numbers,
+it performs the calculation with Python's own arithmetic; otherwise
+(e.g., if a transvalent value appears or a division by zero occurs), it
+calls the same operator functions as the CLI's parser.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import time
+import argparse
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import tree
+    from . import batch
+    from . import evaluation_context as ctx
+except:
+    import config as cfg
+    import cli
+    import tree
+    import batch
+    import evaluation_context as ctx
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the code generator.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The operator functions handle a real-valued operand in the same way as
+# Python's own arithmetic only when it is nonzero and finite and its
+# string form doesn't use exponential notation (as the string forms of
+# values are parsed again when tuples are combined). Only values within
+# these bounds are calculated with Python's arithmetic.
+ordinary_real_lower_bound = 0.0001
+ordinary_real_upper_bound = 1e16
+
+ordinary_real_check = "{lower!r} <= _abs({name}) < {upper!r}"
+
+# The names by which the generated code refers to the operator functions.
+operator_function_names = {
+    "+": "_add",
+    "-": "_subtract",
+    "*": "_multiply",
+    "/": "_divide",
+    "^": "_power",
+    }
+
+# The operators that can be calculated with Python's own arithmetic.
+# (Exponentiation isn't among them, as its results for real numbers
+# are lone elements rather than tuples.)
+inline_operators = {"+", "-", "*", "/"}
+
+generated_code_namespace = {
+    "_add": cli.add_values,
+    "_subtract": cli.subtract_values,
+    "_multiply": cli.multiply_values,
+    "_divide": cli.divide_values,
+    "_power": cli.power_values,
+    "_negate": cli.negate_value,
+    "_help": cli.print_help_text,
+    "_null_symbol": cfg.null_sym,
+    }
+
+
+def is_ordinary_real(value):
+    return type(value) is float \
+        and ordinary_real_lower_bound <= abs(value) < ordinary_real_upper_bound
+
+
+class FunctionSourceGenerator:
+    """
+    Generates the source code of a Python function that evaluates a
+    single expression tree.
+    """
+
+    def __init__(self, expression_tree):
+        self.expression_tree = expression_tree
+        self.constant_names = sorted(tree.find_constants_used(expression_tree))
+        self.parameter_names = {
+            name: f"c{index}" for index, name in enumerate(self.constant_names)
+            }
+        self.literals = {}
+        self.lines = []
+        self.temporary_count = 0
+
+
+    def new_temporary(self):
+        name = f"t{self.temporary_count}"
+        self.temporary_count += 1
+        return name
+
+
+    def get_literal_name(self, value):
+        """
+        Returns the name by which the generated code refers to a literal
+        value (other than an ordinary real number, which is written out).
+        """
+
+        if is_ordinary_real(value):
+            return repr(value)
+        key = (type(value), repr(value))
+        if key not in self.literals:
+            self.literals[key] = (f"_literal_{len(self.literals)}", value)
+        return self.literals[key][0]
+
+
+    def supports_inline_arithmetic(self, node):
+        """
+        Returns True if the given tree can be calculated with Python's own
+        arithmetic (assuming its constants have ordinary real values): all
+        of its operators must be inline operators, all of its literals must
+        be ordinary real numbers, and unary minus may
+        only be applied to a constant or a literal (as the operator
+        functions don't negate the tuples produced by other operations).
+        """
+
+        node_type = type(node)
+        if node_type is tree.BinaryOperation:
+            return node.operator in inline_operators \
+                and self.supports_inline_arithmetic(node.left) \
+                and self.supports_inline_arithmetic(node.right)
+        elif node_type is tree.Negation:
+            return type(node.operand) in (tree.Number, tree.Constant, tree.Negation) \
+                and self.supports_inline_arithmetic(node.operand)
+        elif node_type is tree.Number:
+            return is_ordinary_real(node.value)
+        elif node_type is tree.Constant:
+            return True
+        return False
+
+
+    def generate_inline_expression(self, node, intermediate_names):
+        """
+        Returns Python source for calculating the given node with Python's
+        own arithmetic, assigning the result of each operation within it
+        to a temporary variable (whose name is appended to
+        intermediate_names, so that its value can be checked).
+        """
+
+        node_type = type(node)
+        if node_type is tree.BinaryOperation:
+            left_source = self.generate_inline_operand(node.left, intermediate_names)
+            right_source = self.generate_inline_operand(node.right, intermediate_names)
+            return f"{left_source} {node.operator} {right_source}"
+        elif node_type is tree.Negation:
+            return "-" + self.generate_inline_operand(node.operand, intermediate_names)
+        elif node_type is tree.Number:
+            return repr(node.value)
+        return self.parameter_names[node.name]
+
+
+    def generate_inline_operand(self, node, intermediate_names):
+        if type(node) is not tree.BinaryOperation:
+            return self.generate_inline_expression(node, intermediate_names)
+        expression_source = self.generate_inline_expression(node, intermediate_names)
+        temporary_name = self.new_temporary()
+        self.lines.append(f"            {temporary_name} = {expression_source}")
+        intermediate_names.append(temporary_name)
+        return temporary_name
+
+
+    def generate_general_operand(self, node):
+        """
+        Appends the lines that evaluate the given node by means of the
+        operator functions and returns the source for the node's value.
+        """
+
+        node_type = type(node)
+        if node_type is tree.BinaryOperation:
+            left_source = self.generate_general_operand(node.left)
+            right_source = self.generate_general_operand(node.right)
+            temporary_name = self.new_temporary()
+            self.lines.append(
+                f"    {temporary_name} = "
+                + f"{operator_function_names[node.operator]}({left_source}, {right_source})"
+                )
+            return temporary_name
+        elif node_type is tree.Negation:
+            operand_source = self.generate_general_operand(node.operand)
+            temporary_name = self.new_temporary()
+            self.lines.append(f"    {temporary_name} = _negate({operand_source})")
+            return temporary_name
+        elif node_type is tree.Number:
+            return self.get_literal_name(node.value)
+        elif node_type is tree.Symbol:
+            return self.get_literal_name(node.symbol)
+        elif node_type is tree.Constant:
+            return self.parameter_names[node.name]
+        elif node_type is tree.HelpRequest:
+            temporary_name = self.new_temporary()
+            self.lines.append(f"    {temporary_name} = _help()")
+            return temporary_name
+        return self.get_literal_name(node)
+
+
+    def generate(self, function_name="evaluate_expression"):
+        """
+        Returns the source code of the function and a dictionary of the
+        literal values that it refers to by name.
+        """
+
+        node = self.expression_tree
+        parameters = [self.parameter_names[name] for name in self.constant_names]
+        # The built-in abs() is bound to a local name, which is faster to
+        # look up than a global one.
+        self.lines.append(
+            f"def {function_name}({''.join(p + ', ' for p in parameters)}_abs=abs):"
+            )
+
+        if self.supports_inline_arithmetic(node):
+            parameter_checks = [
+                f"type({parameter}) is float and "
+                + ordinary_real_check.format(
+                    lower=ordinary_real_lower_bound,
+                    upper=ordinary_real_upper_bound,
+                    name=parameter,
+                    )
+                for parameter in parameters
+                ] or ["True"]
+            self.lines.append("    if " + " and ".join(parameter_checks) + ":")
+            self.lines.append("        try:")
+
+            intermediate_names = []
+            result_source = self.generate_inline_operand(node, intermediate_names)
+            if type(node) is tree.BinaryOperation:
+                result_source = f"({result_source}, _null_symbol)"
+
+            if intermediate_names:
+                intermediate_checks = " and ".join(
+                    ordinary_real_check.format(
+                        lower=ordinary_real_lower_bound,
+                        upper=ordinary_real_upper_bound,
+                        name=name,
+                        )
+                    for name in intermediate_names
+                    )
+                self.lines.append(f"            if {intermediate_checks}:")
+                self.lines.append(f"                return {result_source}")
+            else:
+                self.lines.append(f"            return {result_source}")
+            self.lines.append("        except ZeroDivisionError:")
+            self.lines.append("            pass")
+
+        result_source = self.generate_general_operand(node)
+        self.lines.append(f"    return {result_source}")
+
+        literal_values = dict(self.literals.values())
+        return ("\n".join(self.lines) + "\n", literal_values)
+
+
+def generate_function(
+    expression_tree,
+    ):
+    """
+    Generates and compiles the Python function for an expression tree.
+    The function's source code and the names of the constants that it
+    accepts (in order) are stored as its attributes.
+    """
+
+    generator = FunctionSourceGenerator(expression_tree)
+    source, literal_values = generator.generate()
+
+    namespace = dict(generated_code_namespace)
+    namespace.update(literal_values)
+    exec(compile(source, "<liniarote expression>", "exec"), namespace)
+
+    generated_function = namespace["evaluate_expression"]
+    generated_function.source = source
+    generated_function.constant_names = tuple(generator.constant_names)
+    return generated_function
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the cache of generated functions.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# Generated functions are kept in two caches belonging to the current
+# evaluation context, keyed by the text of an expression and by its
+# expression tree (so that differently formatted versions of the same
+# expression share a function). Each cache holds at most
+# cfg.generated_function_cache_size functions; a dictionary keeps its
+# keys in the order of insertion, so a function that is used is moved to
+# the end, and the function at the start (the one used least recently) is
+# discarded when the cache is full.
+text_cache_name = "codegen.functions_by_text"
+tree_cache_name = "codegen.functions_by_tree"
+
+
+def get_cached_function(
+    cache,
+    key,
+    ):
+    """
+    Returns the generated function stored in a cache under the given key
+    (marking it as the most recently used), or None if there isn't one.
+    """
+
+    generated_function = cache.pop(key, None)
+    if generated_function is not None:
+        cache[key] = generated_function
+    return generated_function
+
+
+def store_function(
+    cache,
+    key,
+    generated_function,
+    ):
+    """
+    Stores a generated function in a cache, first discarding the function
+    used least recently if the cache is full.
+    """
+
+    while len(cache) >= cfg.generated_function_cache_size:
+        try:
+            del cache[next(iter(cache))]
+        except (KeyError, RuntimeError, StopIteration):
+            break
+    cache[key] = generated_function
+
+
+def get_function_for_tree(
+    expression_tree,
+    ):
+    functions_by_tree = ctx.get_current_context().get_cache(tree_cache_name)
+    generated_function = get_cached_function(functions_by_tree, expression_tree)
+    if generated_function is None:
+        generated_function = generate_function(expression_tree)
+        store_function(functions_by_tree, expression_tree, generated_function)
+    return generated_function
+
+
+def get_function_for_expression(
+    text,
+    ):
+    """
+    Returns the (cached) generated function for the text of an
+    expression, or None if no expression could be recognized.
+    """
+
+    functions_by_text = ctx.get_current_context().get_cache(text_cache_name)
+    generated_function = get_cached_function(functions_by_text, text)
+    if generated_function is None:
+        expression_tree = tree.parse_expression_to_tree(text)
+        if expression_tree is None:
+            return None
+        generated_function = get_function_for_tree(expression_tree)
+        store_function(functions_by_text, text, generated_function)
+    return generated_function
+
+
+def call_generated_function(
+    generated_function,
+    constants=None,
+    ):
+    """
+    Calls a generated function with the values of its constants (which
+    are looked up as at the CLI's command prompt).
+    """
+
+    return generated_function(*[
+        tree.get_value_of_constant(name, constants)
+        for name in generated_function.constant_names
+        ])
+
+
+def evaluate_expression(
+    text,
+    constants=None,
+    ):
+    """
+    Evaluates the text of an expression by means of its generated
+    function, returning the same (unformatted) result as the CLI's parser.
+    """
+    return call_generated_function(get_function_for_expression(text), constants)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def measure_call_time(
+    expression_tree,
+    constants,
+    repetitions,
+    ):
+    """
+    Returns the mean time (in seconds) of calling the generated function
+    for an expression tree and of evaluating the tree with evaluate_tree().
+    """
+
+    generated_function = get_function_for_tree(expression_tree)
+    arguments = [constants[name] for name in generated_function.constant_names]
+
+    start_time = time.perf_counter()
+    for repetition in range(repetitions):
+        generated_function(*arguments)
+    generated_time = (time.perf_counter() - start_time) / repetitions
+
+    start_time = time.perf_counter()
+    for repetition in range(repetitions):
+        tree.evaluate_tree(expression_tree, constants)
+    tree_time = (time.perf_counter() - start_time) / repetitions
+
+    return (generated_time, tree_time)
+
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(
+        description="Display (and time) the Python function generated "
+            + "for a Liniarote expression."
+        )
+    argument_parser.add_argument("expression")
+    argument_parser.add_argument(
+        "--constant", type=batch.parse_constant_assignment, action="append",
+        default=[],
+        )
+    argument_parser.add_argument(
+        "--repetitions", type=int, default=0,
+        help="time this many calls of the generated function",
+        )
+    arguments = argument_parser.parse_args()
+
+    for name, value in arguments.constant:
+        cfg.recognized_constants[name] = value
+
+    expression_tree = tree.parse_expression_to_tree(arguments.expression)
+    generated_function = get_function_for_tree(expression_tree)
+    print(generated_function.source)
+    result = call_generated_function(generated_function)
+    print("output =  " + cli.format_result_for_display(result))
+
+    if arguments.repetitions > 0:
+        generated_time, tree_time = measure_call_time(
+            expression_tree, cfg.recognized_constants, arguments.repetitions,
+            )
+        print(f"generated function: {generated_time * 1e9:.0f} ns per call")
+        print(f"tree evaluation:    {tree_time * 1e9:.0f} ns per call")
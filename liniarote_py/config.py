@@ -44,6 +44,30 @@ recognized_constants = {
    "e": math.e,
    }
 
+# The greatest number of texts (e.g., the strings lexed by the subordinate
+# parsers that operations on tuples create) whose tokens are kept in the
+# lexer's cache.
+token_cache_size = 65536
+
+# The greatest number of generated functions (see codegen.py) kept in
+# each of the caches of an evaluation context; when a cache is full, the
+# function used least recently is discarded.
+generated_function_cache_size = 4096
+
+# The lexer used to tokenize input: "sly" (the CLI's sly-based lexer) or
+# "scanner" (the hand-written scanner in scanner.py).
+lexer_backend = "sly"
+
+# The parser used to build expression trees: "sly" (the tree-building
+# parser in tree.py) or "pratt" (the precedence-climbing parser there).
+parser_backend = "sly"
+
+# The file to which the run-time metrics (see metrics.py) are written, in
+# the Prometheus text format, or None if they aren't to be written; and
+# the number of seconds that pass between writes.
+metrics_file_path = None
+metrics_write_interval = 15.0
+
 
 # ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 # █ Define transvalent symbols.
@@ -73,6 +97,39 @@ real_num_sym_neg = "-" + real_num_sym_pos
 real_num_sym = "ℝ"
 unimplemented_sym = "U"
 
+# These integer codes represent the symbols above when results are stored
+# in compact form (e.g., in .npy files). The code of a negative symbol is
+# the negation of the code of its positive counterpart; a code of 0 means
+# that a result is simply the real number stored alongside the code.
+symbol_codes = {
+    null_sym: 0,
+    tv_sym_pos: 1,
+    tv_sym_neg: -1,
+    tv_sym_pwr_p2_pos: 2,
+    tv_sym_pwr_p2_neg: -2,
+    tv_sym_pwr_p3_pos: 3,
+    tv_sym_pwr_p3_neg: -3,
+    tv_sym_pwr_p4_pos: 4,
+    tv_sym_pwr_p4_neg: -4,
+    tv_sym_pwr_m2_pos: 5,
+    tv_sym_pwr_m2_neg: -5,
+    tv_sym_pwr_m3_pos: 6,
+    tv_sym_pwr_m3_neg: -6,
+    real_num_sym_pos: 7,
+    real_num_sym_neg: -7,
+    real_num_sym: 8,
+    unimplemented_sym: 9,
+    }
+symbols_by_code = {code: symbol for symbol, code in symbol_codes.items()}
+
+# The code stored in place of a symbol code (e.g., in .npy output and in
+# binary records) for an input that couldn't be evaluated at all (e.g.,
+# because it couldn't be parsed), so that such a failure can't be
+# mistaken for the Unimplemented symbol; and the marker written in its
+# place in text formats.
+evaluation_error_code = 10
+evaluation_error_marker = "error"
+
 
 # ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
 # █ Define text for display by the CLI.
@@ -229,7 +286,11 @@ automatically converted into “Ƿ” during processing of the input. (Similarly
 “-w” will be converted into “-Ƿ”.) Built-in constants recognized by Liniarote
 include “e” and “pi”. The operators currently available for use are:
 
-    + - * / ( )
+    + - * / ^ ( )
+
+The exponentiation operator “^” is right-associative and binds more tightly
+than a unary minus sign (so that “-2^2” equals -4.0). Its exponent must be a
+real number.
 
 It’s possible to assign a value to a user-created alphabetical constant 
 (beyond “pi” and “e”) for use in multiple calculations. This can be done by 
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module allows expressions to be lexed and parsed without any error
+messages being displayed. Instead, each problem that is detected is
+recorded as a diagnostic (with its line, column, token, and category)
+and returned along with the result.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import re
+import collections
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import cli
+    from . import evaluation_context as ctx
+except:
+    import cli
+    import evaluation_context as ctx
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define diagnostics.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# A problem detected while lexing or parsing. The line and column are
+# counted from 1; they (and the token) are None if not applicable.
+Diagnostic = collections.namedtuple(
+    "Diagnostic", ["line", "column", "token", "category", "message"]
+    )
+
+# The categories of diagnostics, along with their messages.
+diagnostic_messages = {
+    "illegal_character":
+        "This character isn't recognized and has been skipped.",
+    "unexpected_token":
+        "A poorly formulated input statement has been detected at this token.",
+    "unexpected_end_of_input":
+        "The input statement ended before it was complete.",
+    "subordinate_input":
+        "A value generated during the calculation couldn't be interpreted.",
+    "evaluation_error":
+        "The calculation couldn't be completed.",
+    "unknown_constant":
+        "No value has been assigned to this constant.",
+    "invalid_encoding":
+        "This line isn't valid UTF-8 text and hasn't been evaluated.",
+    }
+
+# The categories that indicate that no trustworthy result was generated
+# for the input (unlike "subordinate_input", which only indicates that
+# a generated value was reinterpreted).
+input_categories = (
+    "illegal_character",
+    "unexpected_token",
+    "unexpected_end_of_input",
+    "evaluation_error",
+    "unknown_constant",
+    "invalid_encoding",
+    )
+
+
+def convert_to_diagnostic(
+    raw_diagnostic,
+    text,
+    line_number=1,
+    ):
+    """
+    Converts an (index, token, category) entry recorded by the lexer or
+    parser into a Diagnostic, using the text that was being parsed to
+    find the line and column.
+    """
+
+    index, token, category = raw_diagnostic
+    if index is None:
+        # The problem was detected at the end of the input.
+        index = len(text.rstrip())
+
+    line = line_number + text.count("\n", 0, index)
+    column = index - (text.rfind("\n", 0, index) + 1) + 1
+    return Diagnostic(line, column, token, category, diagnostic_messages[category])
+
+
+def has_input_errors(
+    diagnostics,
+    ):
+    """
+    Returns True if any of the given diagnostics indicate that no
+    trustworthy result was generated for the input.
+    """
+    return any(diagnostic.category in input_categories for diagnostic in diagnostics)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define parsing with diagnostics.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def parse_with_diagnostics(
+    text,
+    line_number=1,
+    lexer=None,
+    context=None,
+    ):
+    """
+    Lexes and parses the given text (beginning at the given line number)
+    without displaying any error messages. Returns the parser's result
+    and a list of Diagnostics. Problems detected by the subordinate
+    parsers that the operations use to interpret generated values are
+    included in the list with the category "subordinate_input"; if an
+    exception is raised while the operations are performed, the result
+    is None and the list includes an "evaluation_error" (or, if the value
+    of a constant was unknown, an "unknown_constant"). The text is
+    evaluated within the given context (by default, the current one).
+    """
+
+    if lexer is None:
+        lexer = cli.create_lexer()
+    if context is None:
+        context = ctx.get_current_context()
+
+    raw_diagnostics = []
+    lexer.diagnostics = raw_diagnostics
+
+    # The parsers created while performing the operations record their
+    # errors in a list belonging to a context derived for this parse
+    # alone (so that parses in other threads are unaffected).
+    parse_context = context.derive()
+    parse_context.subordinate_diagnostics = subordinate_diagnostics = []
+    parser = cli.LiniaroteParser(parse_context)
+    parser.diagnostics = raw_diagnostics
+
+    evaluation_error = None
+    try:
+        with ctx.use_context(parse_context):
+            result = parser.parse(cli.tokenize_with_cache(text, lexer))
+    except Exception as error:
+        result = None
+        evaluation_error = error
+    finally:
+        lexer.diagnostics = None
+
+    diagnostics = [
+        convert_to_diagnostic(raw_diagnostic, text, line_number)
+        for raw_diagnostic in raw_diagnostics
+        ]
+    if isinstance(evaluation_error, ctx.UnknownConstantError):
+        name = evaluation_error.constant_name
+        name_match = re.search(
+            r"(?<!\w)" + re.escape(name) + r"(?!\w)", text
+            )
+        diagnostics.append(convert_to_diagnostic(
+            (name_match.start() if name_match else None, name, "unknown_constant"),
+            text, line_number,
+            ))
+    elif evaluation_error is not None:
+        diagnostics.append(Diagnostic(
+            line_number, None, None, "evaluation_error",
+            diagnostic_messages["evaluation_error"]
+                + f" ({type(evaluation_error).__name__}: {evaluation_error})",
+            ))
+    for index, token, category in subordinate_diagnostics:
+        diagnostics.append(Diagnostic(
+            line_number, None, token, "subordinate_input",
+            diagnostic_messages["subordinate_input"],
+            ))
+    return (result, diagnostics)
+
+
+def format_diagnostic(
+    diagnostic,
+    ):
+    """
+    Returns a one-line description of a diagnostic (e.g., for display).
+    """
+
+    location = f"line {diagnostic.line}"
+    if diagnostic.column is not None:
+        location += f", column {diagnostic.column}"
+    token = "" if diagnostic.token is None else f" ({diagnostic.token!r})"
+    return f"{location}: {diagnostic.category}{token}: {diagnostic.message}"
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module defines evaluation contexts. A context holds everything that
+may change while expressions are being evaluated (the values of
+user-created constants, options such as debugging mode, and caches), so
+that separate sessions (e.g., in separate threads) don't affect one
+another.
+
+Every parser is bound to a context when it is created. The operations
+(and the subordinate parsers that they create) use the context that is
+"current" in the running thread, which is set by means of use_context().
+Unless another context has been made current, the default context is
+used; it keeps its constants in config.recognized_constants, as the CLI
+always has.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import contextlib
+import contextvars
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+except:
+    import config as cfg
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define evaluation contexts.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class UnknownConstantError(NameError):
+    """
+    Raised when the value of a constant to which no value has been
+    assigned is needed (and the user isn't to be asked for it).
+    """
+
+    def __init__(self, name):
+        super().__init__(f"No value has been assigned to the constant {name}")
+        self.constant_name = name
+
+
+class EvaluationContext:
+    """
+    The constants, options, and caches used when evaluating expressions
+    for a single session.
+    """
+
+    def __init__(
+        self,
+        constants=None,
+        debugging_mode=False,
+        prompt_for_constants=False,
+        ):
+        """
+        Creates a context whose constants are a copy of the given ones
+        (by default, the constants that the CLI recognizes at launch).
+        If prompt_for_constants is True, the user is asked for the value
+        of an unknown constant (as at the CLI's command prompt);
+        otherwise, an UnknownConstantError is raised.
+        """
+
+        if constants is None:
+            constants = cfg.recognized_constants
+        self.constants = dict(constants)
+        self.debugging_mode = debugging_mode
+        self.prompt_for_constants = prompt_for_constants
+        self.caches = {}
+
+        # When a list is assigned to this attribute, parse errors detected
+        # by the subordinate parsers that the operations create are
+        # recorded in it rather than displayed; see diagnostics.py.
+        self.subordinate_diagnostics = None
+
+
+    def get_value_of_constant(self, name):
+        """
+        Returns the value of a user-created constant.
+        """
+
+        constants = self.constants
+        if name not in constants:
+            if not self.prompt_for_constants:
+                raise UnknownConstantError(name)
+            constants[name] = \
+                float(input(f"Please enter the desired value for {name}: "))
+        return constants[name]
+
+
+    def get_cache(self, name):
+        """
+        Returns the cache (a dictionary) with the given name, creating it
+        if necessary.
+        """
+
+        cache = self.caches.get(name)
+        if cache is None:
+            cache = self.caches[name] = {}
+        return cache
+
+
+    def derive(self):
+        """
+        Returns a new context that shares this one's constants and caches
+        but has its own subordinate_diagnostics attribute.
+        """
+
+        derived_context = EvaluationContext.__new__(type(self))
+        derived_context.__dict__.update(self.__dict__)
+        derived_context.subordinate_diagnostics = None
+        return derived_context
+
+
+class DefaultEvaluationContext(EvaluationContext):
+    """
+    The context used when no other has been made current. Its constants
+    and debugging mode are those found in config.py, so that changes to
+    them made elsewhere remain visible.
+    """
+
+    def __init__(self):
+        self.prompt_for_constants = True
+        self.caches = {}
+        self.subordinate_diagnostics = None
+
+
+    @property
+    def constants(self):
+        return cfg.recognized_constants
+
+
+    @property
+    def debugging_mode(self):
+        return cfg.debugging_mode
+
+
+default_context = DefaultEvaluationContext()
+
+current_context = contextvars.ContextVar(
+    "liniarote_evaluation_context", default=default_context
+    )
+
+# Returns the context that is current in the running thread.
+get_current_context = current_context.get
+
+
+@contextlib.contextmanager
+def use_context(
+    context,
+    ):
+    """
+    Makes the given context current (in the running thread only) until
+    the end of the "with" block.
+    """
+
+    token = current_context.set(context)
+    try:
+        yield context
+    finally:
+        current_context.reset(token)
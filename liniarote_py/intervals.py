@@ -0,0 +1,748 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module provides an interval-valued mode of evaluation, in which
+the indeterminate values are represented by the intervals that they
+stand for: Æ by (0, ∞), -Æ by (-∞, 0), and ℝ by (-∞, ∞). Real numbers
+are represented by intervals containing a single number, and constants
+may be given intervals as their values.
+
+Where the CLI's operations yield the Unimplemented symbol for an
+indeterminate value combined with a nonzero real number (e.g.,
+3 - Æ), the interval mode yields bounds for the result (here, (-∞, 3)).
+Intervals are combined with the transvalent symbols by applying the
+CLI's own operations to representative real numbers of each sign that
+the interval contains; if the results for the different signs can't be
+represented by a single interval or symbol, the result is "U".
+
+An interval's bounds may be open or closed. The module also provides
+arrays of intervals (which require NumPy), for evaluating expressions
+for large numbers of intervals at once.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import math
+import argparse
+import collections
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import third-party modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import tree
+    from . import evaluation_context as ctx
+except:
+    import config as cfg
+    import cli
+    import tree
+    import evaluation_context as ctx
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define intervals.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# An interval of real numbers. Each bound is closed (i.e., belongs to the
+# interval) if the corresponding flag is True. Infinite bounds are always
+# open.
+Interval = collections.namedtuple(
+    "Interval", ["lower", "upper", "lower_closed", "upper_closed"]
+    )
+
+infinity = math.inf
+
+# The intervals represented by the indeterminate values.
+intervals_by_symbol = {
+    cfg.real_num_sym_pos: Interval(0.0, infinity, False, False),
+    cfg.real_num_sym_neg: Interval(-infinity, 0.0, False, False),
+    cfg.real_num_sym: Interval(-infinity, infinity, False, False),
+    }
+
+
+def create_point_interval(
+    number,
+    ):
+    return Interval(number, number, True, True)
+
+
+def parse_interval(
+    text,
+    ):
+    """
+    Converts text such as "2.5", "[1, 2]", "(0, 3]", or "[-inf, 5)" into
+    an Interval.
+    """
+
+    text = text.strip()
+    if text[:1] not in "[(":
+        return create_point_interval(float(text))
+    if text[-1:] not in "])" or "," not in text:
+        raise ValueError(f"invalid interval: {text!r}")
+    lower, upper = text[1:-1].split(",")
+    lower = float(lower)
+    upper = float(upper)
+    if lower > upper:
+        raise ValueError(f"invalid interval: {text!r}")
+    return Interval(
+        lower, upper,
+        text[0] == "[" and math.isfinite(lower), text[-1] == "]" and math.isfinite(upper),
+        )
+
+
+def format_interval(
+    interval,
+    ):
+    """
+    Returns the text of an interval for display (or the number itself, if
+    the interval contains a single number).
+    """
+
+    if interval.lower == interval.upper:
+        return str(interval.lower)
+
+    def format_bound(number):
+        if math.isinf(number):
+            return "-∞" if number < 0 else "∞"
+        return str(number)
+
+    return ("[" if interval.lower_closed else "(") + format_bound(interval.lower) \
+        + ", " + format_bound(interval.upper) + ("]" if interval.upper_closed else ")")
+
+
+def contains_zero(
+    interval,
+    ):
+    return (interval.lower < 0.0 < interval.upper) \
+        or (interval.lower == 0.0 and interval.lower_closed) \
+        or (interval.upper == 0.0 and interval.upper_closed)
+
+
+def negate_interval(
+    interval,
+    ):
+    # (Adding 0.0 turns a bound of -0.0 into 0.0.)
+    return Interval(
+        -interval.upper + 0.0, -interval.lower + 0.0,
+        interval.upper_closed, interval.lower_closed,
+        )
+
+
+def add_intervals(
+    u,
+    v,
+    ):
+    return Interval(
+        u.lower + v.lower, u.upper + v.upper,
+        u.lower_closed and v.lower_closed, u.upper_closed and v.upper_closed,
+        )
+
+
+def subtract_intervals(
+    u,
+    v,
+    ):
+    return add_intervals(u, negate_interval(v))
+
+
+def multiply_bounds(
+    x,
+    x_closed,
+    y,
+    y_closed,
+    ):
+    """
+    Returns the product of two bounds and whether it is attained. A closed
+    bound of zero yields zero (which is attained) whatever the other
+    bound may be, as the other interval contains some finite number.
+    """
+
+    if x == 0.0 and x_closed:
+        return (0.0, True)
+    if y == 0.0 and y_closed:
+        return (0.0, True)
+    if (x == 0.0 and math.isinf(y)) or (y == 0.0 and math.isinf(x)):
+        return (0.0, False)
+    return (x * y, x_closed and y_closed)
+
+
+def multiply_intervals(
+    u,
+    v,
+    ):
+    products = [
+        multiply_bounds(x, x_closed, y, y_closed)
+        for x, x_closed in ((u.lower, u.lower_closed), (u.upper, u.upper_closed))
+        for y, y_closed in ((v.lower, v.lower_closed), (v.upper, v.upper_closed))
+        ]
+    lower = min(product for product, closed in products) + 0.0
+    upper = max(product for product, closed in products) + 0.0
+    return Interval(
+        lower, upper,
+        any(closed for product, closed in products if product == lower),
+        any(closed for product, closed in products if product == upper),
+        )
+
+
+def divide_intervals(
+    u,
+    v,
+    ):
+    """
+    Divides one interval by another that doesn't contain zero.
+    """
+
+    def invert_bound(number):
+        return 0.0 if math.isinf(number) else (
+            math.copysign(infinity, number) if number == 0.0 else 1.0 / number
+            )
+
+    reciprocal = Interval(
+        invert_bound(v.upper), invert_bound(v.lower),
+        v.upper_closed and math.isfinite(v.upper) and v.upper != 0.0,
+        v.lower_closed and math.isfinite(v.lower) and v.lower != 0.0,
+        )
+    if v.upper == 0.0:
+        reciprocal = reciprocal._replace(lower=-infinity)
+    if v.lower == 0.0:
+        reciprocal = reciprocal._replace(upper=infinity)
+    return multiply_intervals(u, reciprocal)
+
+
+def raise_interval_to_power(
+    interval,
+    exponent,
+    ):
+    """
+    Raises an interval to an integer power (which mustn't be negative if
+    the interval contains zero). As x^n is monotonic for positive x and
+    for negative x, the bounds of the result are the powers of the
+    interval's bounds (or, for an even power of an interval containing
+    numbers of both signs, zero and the greater of those powers).
+    """
+
+    if exponent == 0:
+        return create_point_interval(1.0)
+    if exponent < 0:
+        return divide_intervals(
+            create_point_interval(1.0), raise_interval_to_power(interval, -exponent)
+            )
+
+    # (Adding 0.0 turns a bound of -0.0 into 0.0.)
+    lower = interval.lower ** exponent + 0.0
+    upper = interval.upper ** exponent + 0.0
+    if exponent % 2 or interval.lower >= 0.0:
+        return Interval(lower, upper, interval.lower_closed, interval.upper_closed)
+    if interval.upper <= 0.0:
+        return Interval(upper, lower, interval.upper_closed, interval.lower_closed)
+    greatest = max(lower, upper)
+    return Interval(
+        0.0, greatest, True,
+        (lower == greatest and interval.lower_closed)
+            or (upper == greatest and interval.upper_closed),
+        )
+
+
+def find_hull(
+    intervals,
+    ):
+    """
+    Returns the smallest interval that contains all of the given ones.
+    """
+
+    lower = min(interval.lower for interval in intervals)
+    upper = max(interval.upper for interval in intervals)
+    return Interval(
+        lower, upper,
+        any(interval.lower_closed for interval in intervals if interval.lower == lower),
+        any(interval.upper_closed for interval in intervals if interval.upper == upper),
+        )
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the operations in interval mode.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+interval_operations = {
+    "+": add_intervals,
+    "-": subtract_intervals,
+    "*": multiply_intervals,
+    "/": divide_intervals,
+    }
+
+# Representative real numbers of each sign, to which the CLI's operations
+# are applied to determine how an interval containing numbers of that
+# sign is combined with a value that isn't an interval. Two are used for
+# each nonzero sign, so that it can be confirmed that the result depends
+# only on the sign.
+sign_representatives = {
+    -1: (-2.5, -0.5),
+    0: (0.0,),
+    1: (0.5, 3.0),
+    }
+
+
+def convert_to_interval_value(
+    value,
+    ):
+    """
+    Converts a value generated by the CLI's operations into the form used
+    in interval mode: real numbers and indeterminate values (whether lone
+    or within tuples) become Intervals, and all other values are left
+    unchanged.
+    """
+
+    if type(value) is tuple and len(value) == 2 and value[1] == cfg.null_sym:
+        value = value[0]
+    if type(value) is float:
+        return create_point_interval(value)
+    if type(value) is str and value in intervals_by_symbol:
+        return intervals_by_symbol[value]
+    return value
+
+
+def split_interval_by_sign(
+    interval,
+    ):
+    """
+    Returns a dictionary of the parts of an interval that contain negative
+    numbers, zero, and positive numbers (by sign).
+    """
+
+    parts = {}
+    if interval.lower < 0.0:
+        if interval.upper < 0.0:
+            parts[-1] = interval
+        else:
+            parts[-1] = Interval(interval.lower, 0.0, interval.lower_closed, False)
+    if contains_zero(interval):
+        parts[0] = create_point_interval(0.0)
+    if interval.upper > 0.0:
+        if interval.lower > 0.0:
+            parts[1] = interval
+        else:
+            parts[1] = Interval(0.0, interval.upper, False, interval.upper_closed)
+    return parts
+
+
+def combine_interval_with_value(
+    operator,
+    interval,
+    other_value,
+    interval_is_left,
+    ):
+    """
+    Combines an interval with a value that isn't an interval (e.g., a
+    transvalent symbol), or divides an interval by zero. For each sign
+    of the numbers in the interval, the CLI's operation is applied to the
+    representative numbers of that sign. The result for that part of the
+    interval is then the common result for the representative numbers
+    (if any), or the part itself (or its negative) if the operation
+    yields each representative number (or its negative).
+    """
+
+    results_by_sign = {}
+    for sign, part in split_interval_by_sign(interval).items():
+        results = []
+        for number in sign_representatives[sign]:
+            operands = (number, other_value) if interval_is_left else (other_value, number)
+            results.append(convert_to_interval_value(
+                tree.binary_operations[operator](*operands)
+                ))
+
+        if all(result == results[0] for result in results[1:]):
+            results_by_sign[sign] = results[0]
+        elif all(
+                type(result) is Interval and result.lower == result.upper == number
+                for result, number in zip(results, sign_representatives[sign])
+                ):
+            results_by_sign[sign] = part
+        elif all(
+                type(result) is Interval and result.lower == result.upper == -number
+                for result, number in zip(results, sign_representatives[sign])
+                ):
+            results_by_sign[sign] = negate_interval(part)
+        else:
+            return cfg.unimplemented_sym
+
+    results = list(results_by_sign.values())
+    if all(type(result) is Interval for result in results):
+        return find_hull(results)
+    if all(result == results[0] for result in results[1:]):
+        return results[0]
+    return cfg.unimplemented_sym
+
+
+def apply_interval_operation(
+    operator,
+    u,
+    v,
+    ):
+    """
+    Applies one of the operators "+", "-", "*", "/", or "^" in interval
+    mode. (The exponent of "^" may be an interval only if it consists of a
+    single number; the base may be an interval containing more than one
+    number only if the exponent is an integer, which mustn't be negative
+    if the interval contains zero.)
+    """
+
+    u = convert_to_interval_value(u)
+    v = convert_to_interval_value(v)
+
+    if operator == "^":
+        if type(u) is Interval and u.lower != u.upper \
+                and type(v) is Interval and v.lower == v.upper \
+                and math.isfinite(v.lower) and v.lower.is_integer() \
+                and (v.lower >= 0.0 or not contains_zero(u)):
+            return raise_interval_to_power(u, int(v.lower))
+        operands = []
+        for operand in (u, v):
+            if type(operand) is Interval:
+                if operand.lower != operand.upper:
+                    return cfg.unimplemented_sym
+                operand = operand.lower
+            operands.append(operand)
+        return convert_to_interval_value(tree.binary_operations[operator](*operands))
+
+    if type(u) is Interval and type(v) is Interval:
+        if operator != "/" or not contains_zero(v):
+            return interval_operations[operator](u, v)
+        if v.lower == v.upper == 0.0:
+            return combine_interval_with_value(operator, u, 0.0, True)
+        # The divisor contains both zero and nonzero numbers, so the result
+        # would combine real numbers with transvalent values.
+        return cfg.unimplemented_sym
+
+    elif type(u) is Interval:
+        return combine_interval_with_value(operator, u, v, True)
+    elif type(v) is Interval:
+        return combine_interval_with_value(operator, v, u, False)
+    return convert_to_interval_value(tree.binary_operations[operator](u, v))
+
+
+def negate_interval_value(
+    u,
+    ):
+    u = convert_to_interval_value(u)
+    if type(u) is Interval:
+        return negate_interval(u)
+    return convert_to_interval_value(cli.negate_value(u))
+
+
+def evaluate_tree_with_intervals(
+    node,
+    constants=None,
+    ):
+    """
+    Evaluates an expression tree in interval mode. The values of the
+    constants may be real numbers or Intervals.
+    """
+
+    node_type = type(node)
+
+    if node_type is tree.BinaryOperation:
+        return apply_interval_operation(
+            node.operator,
+            evaluate_tree_with_intervals(node.left, constants),
+            evaluate_tree_with_intervals(node.right, constants),
+            )
+    elif node_type is tree.Negation:
+        return negate_interval_value(evaluate_tree_with_intervals(node.operand, constants))
+    elif node_type is tree.Constant and constants is not None \
+            and type(constants.get(node.name)) is Interval:
+        return constants[node.name]
+    elif node_type is tree.Constant and constants is None \
+            and type(ctx.get_current_context().constants.get(node.name)) is Interval:
+        return ctx.get_current_context().constants[node.name]
+    return convert_to_interval_value(tree.evaluate_tree(node, constants))
+
+
+def format_interval_value(
+    value,
+    ):
+    if type(value) is Interval:
+        return format_interval(value)
+    return cli.format_result_for_display(value)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define arrays of intervals.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class IntervalArray:
+    """
+    An array of intervals, stored as NumPy arrays of lower and upper
+    bounds and of flags indicating which bounds are closed. The entries
+    flagged as unresolved are those whose results aren't intervals (e.g.,
+    after division by an interval containing zero); their bounds are
+    meaningless, and they must be evaluated one at a time in interval
+    mode.
+    """
+
+    def __init__(self, lower, upper, lower_closed, upper_closed, unresolved=None):
+        if np is None:
+            raise ImportError("NumPy is required for arrays of intervals.")
+        self.lower = np.asarray(lower, dtype=np.float64)
+        self.upper = np.asarray(upper, dtype=np.float64)
+        self.lower_closed = np.asarray(lower_closed, dtype=bool)
+        self.upper_closed = np.asarray(upper_closed, dtype=bool)
+        if unresolved is None:
+            unresolved = np.zeros(self.lower.shape, dtype=bool)
+        self.unresolved = unresolved
+
+
+    @classmethod
+    def from_interval(cls, interval, size):
+        """
+        Returns an array in which every entry is the given interval.
+        """
+
+        require_numpy()
+        return cls(
+            np.full(size, interval.lower), np.full(size, interval.upper),
+            np.full(size, interval.lower_closed), np.full(size, interval.upper_closed),
+            )
+
+
+    def __len__(self):
+        return len(self.lower)
+
+
+    def __getitem__(self, index):
+        """
+        Returns the entry with the given index as an Interval (or None if
+        it is unresolved).
+        """
+
+        if self.unresolved[index]:
+            return None
+        return Interval(
+            float(self.lower[index]), float(self.upper[index]),
+            bool(self.lower_closed[index]), bool(self.upper_closed[index]),
+            )
+
+
+    def negate(self):
+        return IntervalArray(
+            -self.upper + 0.0, -self.lower + 0.0, self.upper_closed, self.lower_closed,
+            self.unresolved,
+            )
+
+
+    def add(self, other):
+        return IntervalArray(
+            self.lower + other.lower, self.upper + other.upper,
+            self.lower_closed & other.lower_closed, self.upper_closed & other.upper_closed,
+            self.unresolved | other.unresolved,
+            )
+
+
+    def subtract(self, other):
+        return self.add(other.negate())
+
+
+    def multiply(self, other):
+        products = []
+        closed_flags = []
+        for x, x_closed in ((self.lower, self.lower_closed), (self.upper, self.upper_closed)):
+            for y, y_closed in ((other.lower, other.lower_closed), (other.upper, other.upper_closed)):
+                # As in multiply_bounds().
+                zero_bound = (x == 0.0) | (y == 0.0)
+                with np.errstate(invalid="ignore"):
+                    product = np.where(zero_bound, 0.0, x * y)
+                products.append(product)
+                closed_flags.append(
+                    (x_closed & y_closed)
+                    | ((x == 0.0) & x_closed) | ((y == 0.0) & y_closed)
+                    )
+        products = np.stack(products)
+        closed_flags = np.stack(closed_flags)
+        lower = products.min(axis=0) + 0.0
+        upper = products.max(axis=0) + 0.0
+        return IntervalArray(
+            lower, upper,
+            (closed_flags & (products == lower)).any(axis=0),
+            (closed_flags & (products == upper)).any(axis=0),
+            self.unresolved | other.unresolved,
+            )
+
+
+    def divide(self, other):
+        """
+        Divides the intervals element by element; entries whose divisors
+        contain zero are flagged as unresolved.
+        """
+
+        divisor_contains_zero = ((other.lower < 0.0) & (other.upper > 0.0)) \
+            | ((other.lower == 0.0) & other.lower_closed) \
+            | ((other.upper == 0.0) & other.upper_closed)
+        with np.errstate(divide="ignore"):
+            reciprocal_lower = np.where(
+                np.isinf(other.upper), 0.0,
+                np.where(other.upper == 0.0, -infinity, 1.0 / other.upper),
+                )
+            reciprocal_upper = np.where(
+                np.isinf(other.lower), 0.0,
+                np.where(other.lower == 0.0, infinity, 1.0 / other.lower),
+                )
+        reciprocal = IntervalArray(
+            reciprocal_lower, reciprocal_upper,
+            other.upper_closed & np.isfinite(other.upper) & (other.upper != 0.0),
+            other.lower_closed & np.isfinite(other.lower) & (other.lower != 0.0),
+            other.unresolved | divisor_contains_zero,
+            )
+        return self.multiply(reciprocal)
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for arrays of intervals.")
+
+
+interval_array_operations = {
+    "+": IntervalArray.add,
+    "-": IntervalArray.subtract,
+    "*": IntervalArray.multiply,
+    "/": IntervalArray.divide,
+    }
+
+
+def evaluate_tree_with_interval_arrays(
+    node,
+    constants,
+    size,
+    ):
+    """
+    Evaluates an expression tree for arrays of intervals at once. The
+    values of the constants may be IntervalArrays (of the given size),
+    Intervals, or real numbers. Returns an IntervalArray and a dictionary
+    of the results (evaluated one at a time in interval mode) for the
+    entries whose results aren't intervals.
+    """
+
+    require_numpy()
+
+    def get_entry_constants(index):
+        return {
+            name: value[index] if type(value) is IntervalArray else value
+            for name, value in constants.items()
+            }
+
+    def create_unresolved_array():
+        unresolved_array = IntervalArray.from_interval(intervals_by_symbol[cfg.real_num_sym], size)
+        unresolved_array.unresolved = np.ones(size, dtype=bool)
+        return unresolved_array
+
+    def evaluate(node):
+        node_type = type(node)
+        if node_type is tree.BinaryOperation and node.operator in interval_array_operations:
+            return interval_array_operations[node.operator](
+                evaluate(node.left), evaluate(node.right)
+                )
+        elif node_type is tree.BinaryOperation:
+            # Powers are evaluated one entry at a time.
+            return create_unresolved_array()
+        elif node_type is tree.Negation:
+            return evaluate(node.operand).negate()
+        elif node_type is tree.Constant and type(constants.get(node.name)) is IntervalArray:
+            return constants[node.name]
+
+        value = convert_to_interval_value(
+            evaluate_tree_with_intervals(node, get_entry_constants(0))
+            )
+        if type(value) is Interval:
+            return IntervalArray.from_interval(value, size)
+        # A transvalent (or other special) value can't be represented in
+        # the arrays.
+        return create_unresolved_array()
+
+    interval_array = evaluate(node)
+
+    # Entries whose results have unresolved intermediate values (or whose
+    # intervals contain values from divisions by zero) are evaluated one
+    # at a time.
+    other_results = {}
+    for index in np.flatnonzero(interval_array.unresolved):
+        result = evaluate_tree_with_intervals(node, get_entry_constants(index))
+        if type(result) is Interval:
+            interval_array.lower[index] = result.lower
+            interval_array.upper[index] = result.upper
+            interval_array.lower_closed[index] = result.lower_closed
+            interval_array.upper_closed[index] = result.upper_closed
+            interval_array.unresolved[index] = False
+        else:
+            other_results[int(index)] = result
+    return (interval_array, other_results)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def parse_interval_assignment(
+    text,
+    ):
+    """
+    Converts text such as "m=[1,2]" or "m=5.7" into a (name, Interval)
+    pair (for use with argparse).
+    """
+
+    name, separator, value = text.partition("=")
+    if not separator or not name.strip():
+        raise argparse.ArgumentTypeError(f"expected NAME=INTERVAL, not {text!r}")
+    try:
+        return (name.strip(), parse_interval(value))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(
+        description="Evaluate a Liniarote expression in interval mode."
+        )
+    argument_parser.add_argument("expression")
+    argument_parser.add_argument(
+        "--constant", type=parse_interval_assignment, action="append", default=[],
+        metavar="NAME=INTERVAL", help='e.g., "m=[1, 2]", "k=(0, inf)", or "n=5.7"',
+        )
+    arguments = argument_parser.parse_args()
+
+    constants = dict(cfg.recognized_constants)
+    for name, interval in arguments.constant:
+        constants[name] = interval
+
+    result = evaluate_tree_with_intervals(
+        tree.parse_expression_to_tree(arguments.expression), constants
+        )
+    print("output =  " + format_interval_value(result))
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module provides a lazy evaluator for expression trees, which skips
+the evaluation of an operand whenever the result of an operation is
+already determined by its other operand.
+
+The operands that determine the result of an operation by themselves
+are found by means of the operation truth tables (see truth_tables.py).
+In addition, as the Unimplemented symbol ("U") is absorbed by none of
+the operations, evaluation of an expression stops as soon as any of its
+subexpressions yields it.
+
+The scope of the pruning is therefore narrow: with the current operator
+functions, every operand that determines a result by itself determines
+that the result is U (e.g., "U" itself, "Ƿ³" in an addition, or "Æ" as
+the left operand of a multiplication). No other result can be decided by
+one operand, as an operation with a U operand always yields U (and, for
+the operands that remain, the result varies with the other operand).
+Only operands made unnecessary by a U result are thus pruned.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import ast
+import argparse
+import contextlib
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import tree
+    from . import batch
+    from . import truth_tables
+except:
+    import config as cfg
+    import cli
+    import tree
+    import batch
+    import truth_tables
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Find the operands that determine an operation's result by themselves.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def find_decisive_operands(
+    operations=None,
+    operands=None,
+    ):
+    """
+    Returns two dictionaries (for left and right operands) that map each
+    operator to a dictionary of the operands that yield the same result
+    whatever the other operand may be, along with that result. Operands
+    that are real numbers are excluded, as each merely represents the
+    numbers that resemble it. (Any result would be recognized here, but
+    with the current operator functions each of the results found is U.)
+    """
+
+    if operations is None:
+        operations = truth_tables.cli_operations
+    if operands is None:
+        operands = truth_tables.operand_classes
+
+    tables = truth_tables.build_truth_tables(operations, operands)["tables"]
+    decisive_left_operands = {}
+    decisive_right_operands = {}
+
+    for operator, table in tables.items():
+        columns = list(zip(*table))
+        decisive_left_operands[operator] = {}
+        decisive_right_operands[operator] = {}
+
+        for index, operand in enumerate(operands):
+            if isinstance(operand, float):
+                continue
+            for decisive_operands, cells in (
+                    (decisive_left_operands, table[index]),
+                    (decisive_right_operands, columns[index]),
+                    ):
+                if len(set(cells)) == 1 and not cells[0].startswith("error"):
+                    decisive_operands[operator][operand] = \
+                        cli.intern_value(ast.literal_eval(cells[0]))
+
+    return (decisive_left_operands, decisive_right_operands)
+
+
+# The decisive operands are found the first time that they're needed (as
+# building the truth tables takes a moment).
+decisive_operands = None
+
+
+def get_decisive_operands():
+    global decisive_operands
+    if decisive_operands is None:
+        decisive_operands = find_decisive_operands()
+    return decisive_operands
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the lazy evaluator.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class UnimplementedResultReached(Exception):
+    """
+    Raised to stop evaluation once a subexpression has yielded the
+    Unimplemented symbol (which then becomes the result of the whole
+    expression).
+    """
+
+
+class LazyEvaluation:
+    """
+    The evaluation of a single expression tree, which keeps count of the
+    nodes evaluated and of the nodes pruned (i.e., skipped).
+    """
+
+    def __init__(self, constants=None):
+        self.constants = constants
+        self.decisive_left_operands, self.decisive_right_operands = \
+            get_decisive_operands()
+        self.nodes_evaluated = 0
+        self.nodes_pruned = 0
+
+
+    def evaluate(self, expression_tree):
+        """
+        Returns the result of the expression.
+        """
+
+        try:
+            return self.evaluate_node(expression_tree)
+        except UnimplementedResultReached:
+            self.nodes_pruned = count_nodes(expression_tree) - self.nodes_evaluated
+            return cfg.unimplemented_sym
+
+
+    def evaluate_node(self, node):
+        self.nodes_evaluated += 1
+        node_type = type(node)
+
+        if node_type is tree.BinaryOperation:
+            operator = node.operator
+
+            # A literal right operand may determine the result by itself.
+            if type(node.right) is tree.Symbol:
+                decisive_right = self.decisive_right_operands[operator]
+                if node.right.symbol in decisive_right:
+                    self.nodes_evaluated += 1
+                    self.nodes_pruned += count_nodes(node.left)
+                    return self.check_value(decisive_right[node.right.symbol])
+
+            left_value = self.evaluate_node(node.left)
+            decisive_left = self.decisive_left_operands[operator]
+            try:
+                if left_value in decisive_left:
+                    self.nodes_pruned += count_nodes(node.right)
+                    return self.check_value(decisive_left[left_value])
+            except TypeError:
+                # The value is unhashable (and so can't be decisive).
+                pass
+
+            right_value = self.evaluate_node(node.right)
+            return self.check_value(
+                tree.binary_operations[operator](left_value, right_value)
+                )
+
+        elif node_type is tree.Negation:
+            return self.check_value(
+                cli.negate_value(self.evaluate_node(node.operand))
+                )
+
+        return self.check_value(tree.evaluate_tree(node, self.constants))
+
+
+    def check_value(self, value):
+        if value == cfg.unimplemented_sym:
+            raise UnimplementedResultReached()
+        return value
+
+
+def count_nodes(
+    node,
+    ):
+    """
+    Returns the number of nodes in an expression tree.
+    """
+    return 1 + sum(count_nodes(child_node) for child_node in tree.get_child_nodes(node))
+
+
+def evaluate_tree_lazily(
+    expression_tree,
+    constants=None,
+    ):
+    """
+    Evaluates an expression tree lazily, returning the result and the
+    numbers of nodes evaluated and pruned.
+    """
+
+    evaluation = LazyEvaluation(constants)
+    result = evaluation.evaluate(expression_tree)
+    return (result, evaluation.nodes_evaluated, evaluation.nodes_pruned)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(
+        description="Evaluate Liniarote expressions lazily and report "
+            + "how many nodes were pruned."
+        )
+    argument_parser.add_argument(
+        "expression", nargs="?",
+        help="an expression to evaluate (if no corpus file is given)",
+        )
+    argument_parser.add_argument(
+        "--corpus",
+        help="a file of expressions (one per line) to evaluate instead",
+        )
+    argument_parser.add_argument(
+        "--constant", type=batch.parse_constant_assignment, action="append",
+        default=[],
+        )
+    arguments = argument_parser.parse_args()
+
+    for name, value in arguments.constant:
+        cfg.recognized_constants[name] = value
+
+    if arguments.corpus is None:
+        result, nodes_evaluated, nodes_pruned = evaluate_tree_lazily(
+            tree.parse_expression_to_tree(arguments.expression)
+            )
+        print("output =  " + cli.format_result_for_display(result))
+        print(f"nodes evaluated: {nodes_evaluated}")
+        print(f"nodes pruned:    {nodes_pruned}")
+
+    else:
+        expressions = 0
+        errors = 0
+        total_evaluated = 0
+        total_pruned = 0
+        for line_number, offset, next_offset, text in \
+                batch.iterate_mapped_lines(arguments.corpus):
+            if not text.strip():
+                continue
+            expressions += 1
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    result, nodes_evaluated, nodes_pruned = evaluate_tree_lazily(
+                        tree.parse_expression_to_tree(text)
+                        )
+            except Exception:
+                errors += 1
+                continue
+            total_evaluated += nodes_evaluated
+            total_pruned += nodes_pruned
+
+        total_nodes = max(total_evaluated + total_pruned, 1)
+        print(f"expressions:     {expressions} ({errors} errors)")
+        print(f"nodes evaluated: {total_evaluated}")
+        print(f"nodes pruned:    {total_pruned}"
+            + f" ({100.0 * total_pruned / total_nodes:.1f}%)")
@@ -0,0 +1,486 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module records run-time metrics for the expressions evaluated by
+the CLI and by batch mode: the number of expressions evaluated, their
+latencies, the numbers of results that couldn't be calculated ("U"),
+of parse errors, and of evaluation errors, the number of subordinate
+parses (i.e., those performed by the operations to interpret the values
+that they generate) for each expression, and the hits and misses of the
+token-stream cache.
+
+The metrics can be displayed at the command prompt with ":stats", and
+they can be written periodically to a file in the Prometheus text
+format (e.g., "liniarote.prom", in the directory read by a node
+exporter's textfile collector); see config.metrics_file_path. The file
+is written when an expression is recorded after the write interval has
+passed, whenever ":stats" is entered, and when the process exits; as
+nothing is written while no expressions are evaluated, the file's
+modification time shows when the CLI was last active. Latencies
+and subordinate parses are counted in histograms with fixed buckets, so
+that recording an expression takes only a few additions (the
+percentiles displayed are estimated from the buckets). As with the
+token-stream cache, the counts are approximate when expressions are
+evaluated by several threads.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import os
+import time
+import atexit
+import bisect
+import argparse
+import statistics
+import contextlib
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import diagnostics
+except:
+    import config as cfg
+    import cli
+    import diagnostics
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the histograms.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The upper bounds of the histograms' buckets (apart from the last
+# bucket, which has no upper bound).
+latency_bucket_bounds = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )
+subordinate_parse_bucket_bounds = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+class Histogram:
+    """
+    Counts observed values in buckets with fixed upper bounds (each value
+    being counted in the first bucket whose bound is at least as great),
+    as a Prometheus histogram does.
+    """
+
+    def __init__(self, bucket_bounds):
+        self.bucket_bounds = bucket_bounds
+        self.bucket_counts = [0] * (len(bucket_bounds) + 1)
+        self.sum = 0
+
+
+    def observe(self, value):
+        self.bucket_counts[bisect.bisect_left(self.bucket_bounds, value)] += 1
+        self.sum += value
+
+
+    @property
+    def count(self):
+        return sum(self.bucket_counts)
+
+
+    def estimate_percentile(self, percentile):
+        """
+        Estimates a percentile (from 0 to 100) of the observed values, by
+        interpolating within the bucket in which it falls. (A percentile
+        that falls in the last bucket is given as that bucket's lower
+        bound.) Returns None if no values have been observed.
+        """
+
+        count = self.count
+        if not count:
+            return None
+        rank = count * percentile / 100
+        cumulative_count = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            if bucket_count and cumulative_count + bucket_count >= rank:
+                if index == len(self.bucket_bounds):
+                    return self.bucket_bounds[-1]
+                lower_bound = self.bucket_bounds[index - 1] if index else 0
+                upper_bound = self.bucket_bounds[index]
+                return lower_bound + (upper_bound - lower_bound) \
+                    * (rank - cumulative_count) / bucket_count
+            cumulative_count += bucket_count
+        return self.bucket_bounds[-1]
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the recording of the metrics.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class RuntimeMetrics:
+    """
+    The metrics recorded for the expressions evaluated in this process,
+    along with the statistics of the given token-stream cache (by
+    default, the CLI's).
+    """
+
+    def __init__(self, token_cache=None):
+        if token_cache is None:
+            token_cache = cli.token_stream_cache
+        self.token_cache = token_cache
+        self.start_time = time.time()
+        self.expressions_evaluated = 0
+        self.unimplemented_results = 0
+        self.parse_errors = 0
+        self.evaluation_errors = 0
+        self.latencies = Histogram(latency_bucket_bounds)
+        self.subordinate_parses = Histogram(subordinate_parse_bucket_bounds)
+        self.last_write_time = time.perf_counter()
+
+
+    def record_expression(
+        self,
+        latency,
+        result,
+        subordinate_parses,
+        parse_error=False,
+        evaluation_error=False,
+        ):
+        """
+        Records the evaluation of an expression: its latency (in seconds),
+        its unformatted result, and the number of subordinate parses that
+        it required. If a metrics file has been configured and the write
+        interval has passed, the metrics are written to it.
+        """
+
+        self.expressions_evaluated += 1
+        if result == cfg.unimplemented_sym:
+            self.unimplemented_results += 1
+        if parse_error:
+            self.parse_errors += 1
+        if evaluation_error:
+            self.evaluation_errors += 1
+        self.latencies.observe(latency)
+        self.subordinate_parses.observe(subordinate_parses)
+
+        if cfg.metrics_file_path is not None \
+                and time.perf_counter() - self.last_write_time \
+                    >= cfg.metrics_write_interval:
+            self.write_configured_file()
+
+
+    def record_diagnosed_expression(
+        self,
+        latency,
+        result,
+        subordinate_parses,
+        line_diagnostics,
+        ):
+        """
+        Records the evaluation of an expression that was parsed with
+        diagnostics (see diagnostics.py), from which its parse errors and
+        evaluation errors are determined.
+        """
+
+        parse_error = evaluation_error = False
+        for diagnostic in line_diagnostics:
+            if diagnostic.category == "evaluation_error":
+                evaluation_error = True
+            elif diagnostic.category in diagnostics.input_categories:
+                parse_error = True
+        self.record_expression(
+            latency, result, subordinate_parses, parse_error, evaluation_error
+            )
+
+
+    def get_statistics(self):
+        """
+        Returns a dictionary of the metrics' current values.
+        """
+
+        expressions_evaluated = self.expressions_evaluated
+        return {
+            "expressions_evaluated": expressions_evaluated,
+            "unimplemented_results": self.unimplemented_results,
+            "unimplemented_share": self.unimplemented_results / expressions_evaluated
+                if expressions_evaluated else 0.0,
+            "parse_errors": self.parse_errors,
+            "evaluation_errors": self.evaluation_errors,
+            "latency_p50": self.latencies.estimate_percentile(50),
+            "latency_p90": self.latencies.estimate_percentile(90),
+            "latency_p99": self.latencies.estimate_percentile(99),
+            "mean_latency": self.latencies.sum / expressions_evaluated
+                if expressions_evaluated else None,
+            "subordinate_parses": self.subordinate_parses.sum,
+            "mean_subordinate_parses": self.subordinate_parses.sum / expressions_evaluated
+                if expressions_evaluated else 0.0,
+            "token_cache": self.token_cache.get_statistics(),
+            "uptime": time.time() - self.start_time,
+            }
+
+
+    def format_statistics(self):
+        """
+        Formats the metrics for display (e.g., by the ":stats" command).
+        """
+
+        statistics = self.get_statistics()
+        token_cache = statistics["token_cache"]
+
+        def format_latency(latency):
+            if latency is None:
+                return "-"
+            return f"{latency * 1000:.3f} ms"
+
+        return "\n".join((
+            f"expressions evaluated:  {statistics['expressions_evaluated']:,}"
+                + f"   ({statistics['expressions_evaluated'] / max(statistics['uptime'], 1e-9):.1f} per second)",
+            f"latency:                p50 {format_latency(statistics['latency_p50'])}"
+                + f"   p90 {format_latency(statistics['latency_p90'])}"
+                + f"   p99 {format_latency(statistics['latency_p99'])}"
+                + f"   mean {format_latency(statistics['mean_latency'])}",
+            f"unimplemented results:  {statistics['unimplemented_results']:,}"
+                + f"   ({statistics['unimplemented_share']:.1%})",
+            f"parse errors:           {statistics['parse_errors']:,}",
+            f"evaluation errors:      {statistics['evaluation_errors']:,}",
+            f"subordinate parses:     {statistics['subordinate_parses']:,}"
+                + f"   ({statistics['mean_subordinate_parses']:.2f} per expression)",
+            f"token cache:            {token_cache['hits']:,} hits,"
+                + f" {token_cache['assembled']:,} assembled,"
+                + f" {token_cache['misses']:,} misses"
+                + f"   ({token_cache['hit_rate']:.1%} hit rate)",
+            ))
+
+
+    def format_text_file(self):
+        """
+        Formats the metrics in the Prometheus text format.
+        """
+
+        token_cache = self.token_cache.get_statistics()
+        lines = []
+
+        def add_metric(name, metric_type, description, samples):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{name}{labels} {value}")
+
+        def add_histogram(name, description, histogram):
+            samples = []
+            cumulative_count = 0
+            for bound, bucket_count in zip(histogram.bucket_bounds, histogram.bucket_counts):
+                cumulative_count += bucket_count
+                samples.append((f'_bucket{{le="{bound}"}}', cumulative_count))
+            cumulative_count += histogram.bucket_counts[-1]
+            samples.append(('_bucket{le="+Inf"}', cumulative_count))
+            samples.append(("_sum", histogram.sum))
+            samples.append(("_count", cumulative_count))
+            add_metric(name, "histogram", description, samples)
+
+        add_metric(
+            "liniarote_expressions_evaluated_total", "counter",
+            "Expressions evaluated.", [("", self.expressions_evaluated)],
+            )
+        add_metric(
+            "liniarote_unimplemented_results_total", "counter",
+            "Expressions whose results couldn't be calculated (U).",
+            [("", self.unimplemented_results)],
+            )
+        add_metric(
+            "liniarote_parse_errors_total", "counter",
+            "Expressions whose input couldn't be parsed.", [("", self.parse_errors)],
+            )
+        add_metric(
+            "liniarote_evaluation_errors_total", "counter",
+            "Expressions whose evaluation raised an exception.",
+            [("", self.evaluation_errors)],
+            )
+        add_histogram(
+            "liniarote_expression_latency_seconds",
+            "Time taken to evaluate an expression.", self.latencies,
+            )
+        add_histogram(
+            "liniarote_subordinate_parses",
+            "Subordinate parses performed by the operations for an expression.",
+            self.subordinate_parses,
+            )
+        add_metric(
+            "liniarote_token_cache_lookups_total", "counter",
+            "Lookups in the token-stream cache, by outcome.",
+            [
+                ('{outcome="hit"}', token_cache["hits"]),
+                ('{outcome="assembled"}', token_cache["assembled"]),
+                ('{outcome="miss"}', token_cache["misses"]),
+                ],
+            )
+        add_metric(
+            "liniarote_token_cache_size", "gauge",
+            "Texts whose tokens are held in the token-stream cache.",
+            [("", token_cache["size"])],
+            )
+        add_metric(
+            "liniarote_start_time_seconds", "gauge",
+            "Time at which the process began recording metrics (Unix time).",
+            [("", self.start_time)],
+            )
+        return "\n".join(lines) + "\n"
+
+
+    def write_text_file(self, path):
+        """
+        Writes the metrics to a file in the Prometheus text format. (The
+        file is written under a temporary name and then renamed, so that
+        a partially written file is never read.) A file that can't be
+        written is skipped.
+        """
+
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as metrics_file:
+                metrics_file.write(self.format_text_file())
+            os.replace(temporary_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+
+
+    def write_configured_file(self):
+        """
+        Writes the metrics to the file given by cfg.metrics_file_path (if
+        one has been configured), restarting the write interval.
+        """
+
+        if cfg.metrics_file_path is not None:
+            self.last_write_time = time.perf_counter()
+            self.write_text_file(cfg.metrics_file_path)
+
+
+# The metrics recorded by this process. They are also written to the
+# metrics file (if one has been configured) when the process exits, so
+# that the file's final contents include the expressions evaluated since
+# the last periodic write.
+runtime_metrics = RuntimeMetrics()
+atexit.register(runtime_metrics.write_configured_file)
+
+
+def count_parsers_created():
+    """
+    Returns the number of parsers created so far (which is compared before
+    and after an expression is evaluated, to find the number of its
+    subordinate parses).
+    """
+    return cli.LiniaroteParser.parsers_created
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def compare_texts(
+    texts,
+    metrics,
+    ):
+    """
+    Evaluates each of the given texts twice, as batch mode does: once
+    recording the metrics and once without (the order alternating from
+    one text to the next). Returns the total times taken by the
+    evaluations without and with the metrics. (Interleaving the two
+    evaluations of each text keeps changes in the machine's load from
+    affecting one kind of evaluation more than the other, as they would
+    if the whole corpus were evaluated in turn with and without them.)
+    """
+
+    lexer = cli.create_lexer()
+    plain_time = recorded_time = 0.0
+    for line_number, text in enumerate(texts, 1):
+        for recorded in ((False, True) if line_number % 2 else (True, False)):
+            parsers_before = count_parsers_created()
+            start_time = time.perf_counter()
+            result, line_diagnostics = diagnostics.parse_with_diagnostics(
+                text, line_number, lexer
+                )
+            if recorded:
+                metrics.record_diagnosed_expression(
+                    time.perf_counter() - start_time, result,
+                    count_parsers_created() - parsers_before - 1, line_diagnostics,
+                    )
+                recorded_time += time.perf_counter() - start_time
+            else:
+                count_parsers_created()
+                plain_time += time.perf_counter() - start_time
+    return (plain_time, recorded_time)
+
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(
+        description="Evaluate a corpus of expressions with and without "
+            + "recording the run-time metrics, to measure their overhead."
+        )
+    argument_parser.add_argument("corpus_file")
+    argument_parser.add_argument("--repetitions", type=int, default=5)
+    argument_parser.add_argument(
+        "--metrics-file", default=None,
+        help="a file to which the metrics should be written afterward",
+        )
+    arguments = argument_parser.parse_args()
+
+    with open(arguments.corpus_file, encoding="utf-8") as corpus_file:
+        texts = [line.rstrip("\n") for line in corpus_file if line.strip()]
+
+    # The corpus is evaluated once beforehand, so that the token-stream
+    # cache is equally warm for both measurements. The overhead is then
+    # taken as the median of several repetitions.
+    metrics = RuntimeMetrics()
+    with contextlib.redirect_stdout(io.StringIO()):
+        compare_texts(texts, RuntimeMetrics())
+        timings = [
+            compare_texts(texts, metrics)
+            for repetition in range(arguments.repetitions)
+            ]
+    overheads = [
+        (recorded_time - plain_time) / plain_time
+        for plain_time, recorded_time in timings
+        ]
+
+    # The cost of recording alone is also measured directly (as the
+    # median of several batches), which is far more precise.
+    record_count = 100000
+    record_times = []
+    for batch_index in range(5):
+        recording_metrics = RuntimeMetrics()
+        start_time = time.perf_counter()
+        for index in range(record_count):
+            recording_metrics.record_diagnosed_expression(0.0005, 1.0, 3, [])
+        record_times.append((time.perf_counter() - start_time) / record_count)
+    record_time = statistics.median(record_times)
+
+    plain_time = statistics.median(plain_time for plain_time, _ in timings)
+    recorded_time = statistics.median(recorded_time for _, recorded_time in timings)
+    mean_latency = plain_time / max(len(texts), 1)
+    print(metrics.format_statistics())
+    print()
+    print(f"without metrics: {plain_time:9.4f} s   (median of {len(timings)} runs)")
+    print(f"with metrics:    {recorded_time:9.4f} s   (median of {len(timings)} runs)")
+    print(f"overhead:        {statistics.median(overheads):+.2%}   (median;"
+        + f" from {min(overheads):+.2%} to {max(overheads):+.2%})")
+    print(f"recording one expression: {record_time * 1e6:.2f} µs"
+        + f"   ({record_time / mean_latency:.2%} of the mean evaluation time)")
+
+    if arguments.metrics_file:
+        metrics.write_text_file(arguments.metrics_file)
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module converts calculated results into a canonical form, so that
+equal results can be recognized by comparing (or hashing) them directly.
+The same result may take several forms: e.g., "Ƿ" and "(0.0, Ƿ)", or
+3.0 and "(3.0, ∅)", or 0.0 and -0.0. Each of these is converted into a
+CanonicalValue, a (real, symbol) pair in which:
+
+    - a real number has the Null symbol (with -0.0 becoming 0.0, and
+      the lone "∅" being the number 0.0, as in the CLI's operations);
+    - a transvalent or indeterminate symbol (e.g., "Ƿ²" or "Æ") has the
+      real part 0.0, unless a nonzero real number accompanies it;
+    - a result that isn't a number at all (including NaN) is "U".
+
+Two CanonicalValues are equal (and have the same hash) exactly when the
+CLI displays the results from which they were converted in the same way
+(apart from the sign of a lone zero, and the lone "∅", which is displayed
+as such rather than as 0.0). They can therefore be stored in a
+set or used as the keys of a dictionary, so that large numbers of
+results can be deduplicated or grouped in a single pass.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import time
+import argparse
+import collections
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+except:
+    import config as cfg
+    import cli
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the canonical values.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# A result in canonical form. (As with any tuple, CanonicalValues are
+# compared and hashed by their elements; the canonical form ensures that
+# equal results have equal elements.)
+CanonicalValue = collections.namedtuple("CanonicalValue", ["real", "symbol"])
+
+# The canonical value of each symbol when it appears alone (or in its
+# canonical tuple).
+canonical_values_by_symbol = {
+    symbol: CanonicalValue(0.0, symbol) for symbol in cfg.symbol_codes
+    }
+
+# The canonical values of the CLI's canonical tuples, by the identities of
+# the tuples.
+canonical_values_by_identity = {
+    id(tuple_value): canonical_values_by_symbol[symbol]
+    for symbol, tuple_value in cli.tuples_by_lone_element.items()
+    }
+
+# The canonical value of anything that isn't a number.
+unimplemented_value = canonical_values_by_symbol[cfg.unimplemented_sym]
+
+
+def normalize_value(
+    value,
+    ):
+    """
+    Returns the CanonicalValue of a calculated result.
+    """
+
+    value_type = type(value)
+    if value_type is float:
+        if value != value:
+            return unimplemented_value
+        return CanonicalValue(value + 0.0, cfg.null_sym)
+    if value_type is str:
+        return canonical_values_by_symbol.get(value, unimplemented_value)
+    canonical_value = canonical_values_by_identity.get(id(value))
+    if canonical_value is not None:
+        return canonical_value
+    return normalize_decomposed_value(value)
+
+
+def normalize_decomposed_value(
+    value,
+    ):
+    """
+    Returns the CanonicalValue of a result that isn't a lone element or
+    one of the CLI's canonical tuples.
+    """
+
+    real_value, symbol = cli.decompose_result_for_output(value)
+    if real_value != real_value:
+        if symbol == cfg.null_sym:
+            return unimplemented_value
+        return canonical_values_by_symbol[symbol]
+    if real_value == 0.0:
+        return canonical_values_by_symbol[symbol]
+    return CanonicalValue(real_value, symbol)
+
+
+def normalize_values(
+    values,
+    ):
+    """
+    Returns a list of the CanonicalValues of the given results. Each
+    distinct result is normalized only once, as results that are equal
+    (e.g., 3.0 and another 3.0, or 0.0 and -0.0) have the same canonical
+    value.
+    """
+
+    canonical_values_by_result = dict(canonical_values_by_symbol)
+    get_canonical_value = canonical_values_by_result.get
+    canonical_values = []
+    append = canonical_values.append
+
+    for value in values:
+        canonical_value = get_canonical_value(value)
+        if canonical_value is None:
+            canonical_value = normalize_value(value)
+            canonical_values_by_result[value] = canonical_value
+        append(canonical_value)
+    return canonical_values
+
+
+def count_values(
+    values,
+    ):
+    """
+    Returns a Counter of the number of times that each distinct result
+    (as a CanonicalValue) occurs among the given results. (The results
+    are counted as they are, and only the distinct results are then
+    normalized.)
+    """
+
+    canonical_counts = collections.Counter()
+    for value, count in collections.Counter(values).items():
+        canonical_counts[normalize_value(value)] += count
+    return canonical_counts
+
+
+def group_indexes_by_value(
+    values,
+    ):
+    """
+    Returns a dictionary that maps each distinct result (as a
+    CanonicalValue) to a list of the indexes at which it occurs.
+    """
+
+    groups = collections.defaultdict(list)
+    for index, canonical_value in enumerate(normalize_values(values)):
+        groups[canonical_value].append(index)
+    return dict(groups)
+
+
+def format_canonical_value(
+    canonical_value,
+    ):
+    """
+    Formats a CanonicalValue as the CLI displays the equivalent result.
+    """
+
+    real_value, symbol = canonical_value
+    if symbol == cfg.null_sym:
+        return str(real_value)
+    if real_value == 0.0:
+        return cli.format_result_for_display(symbol)
+    return f"({real_value}, {symbol})"
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+if __name__ == '__main__':
+
+    try:
+        from . import workload
+    except:
+        import workload
+
+    argument_parser = argparse.ArgumentParser(
+        description="Count the distinct results among randomly generated "
+            + "ones, comparing canonical values with displayed forms."
+        )
+    argument_parser.add_argument("--count", type=int, default=1000000)
+    argument_parser.add_argument("--seed", type=int, default=None)
+    arguments = argument_parser.parse_args()
+
+    results = workload.generate_results(arguments.count, arguments.seed)
+
+    start_time = time.perf_counter()
+    displayed_counts = collections.Counter(
+        cli.format_result_for_display(result) for result in results
+        )
+    display_time = time.perf_counter() - start_time
+    # The lone "∅" is displayed as such, but it has the same canonical
+    # value as 0.0.
+    displayed_counts["0.0"] += displayed_counts.pop(cfg.null_sym, 0)
+
+    start_time = time.perf_counter()
+    canonical_counts = count_values(results)
+    canonical_time = time.perf_counter() - start_time
+
+    agree = sorted(displayed_counts.values()) == sorted(canonical_counts.values()) \
+        and all(
+            displayed_counts[format_canonical_value(value)] == count
+            for value, count in canonical_counts.items()
+            )
+    print(f"results counted: {len(results):,}   distinct: {len(canonical_counts):,}"
+        + f"   (counts agree: {agree})")
+    print(f"displayed forms:  {display_time:9.4f} s")
+    print(f"canonical values: {canonical_time:9.4f} s   "
+        + f"({display_time / max(canonical_time, 1e-9):.1f}×)")
+
+    start_time = time.perf_counter()
+    groups = group_indexes_by_value(results)
+    print(f"grouped by value: {time.perf_counter() - start_time:9.4f} s   "
+        + f"(groups: {len(groups):,})")
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module defines a total order over calculated results, so that
+results mixing real numbers with transvalent and other symbols can be
+ranked consistently. The order is:
+
+    -Ƿ⁴ < -Ƿ³ < -Ƿ² < -Ƿ < (real numbers) < Ƿ < Ƿ² < Ƿ³ < Ƿ⁴
+        < -Æ < Æ < ℝ < U
+
+Values that share a power of Ƿ (e.g., "2.5 + Ƿ" and "Ƿ") are ordered
+by their real parts. The infinitesimal symbols are placed immediately
+around the real number to which they're added: r - Ƿ⁻² < r - Ƿ⁻³ < r <
+r + Ƿ⁻³ < r + Ƿ⁻². The indeterminate values (which may stand for many
+different numbers) follow all of the determinate ones, and the
+Unimplemented symbol (like NaN in NumPy's sorting) comes last. Lone
+elements and their equivalent tuples (e.g., "Ƿ" and "(0.0, Ƿ)") are
+equal in the order.
+
+A value's place in the order is determined by its (real, symbol) form,
+as produced by cli.decompose_result_for_output(). For results stored as
+arrays of reals and symbol codes (as in the .npy files written by
+writers.py), the module provides sort keys that are computed for the
+whole arrays at once, so that they can be sorted by NumPy without
+calling a Python function for each result.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import math
+import time
+import argparse
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import third-party modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+except:
+    import config as cfg
+    import cli
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the order of the symbols.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The place of each symbol in the order, as a (band, offset) pair. Values
+# are ordered first by band, then by real part, and then by offset. The
+# band of the real numbers (along with the infinitesimals, which are
+# distinguished by their offsets) is 0; the bands of the powers of Ƿ
+# are their exponents (negated, for the negative powers).
+symbol_ranks = {
+    cfg.tv_sym_pwr_p4_neg: (-4, 0),
+    cfg.tv_sym_pwr_p3_neg: (-3, 0),
+    cfg.tv_sym_pwr_p2_neg: (-2, 0),
+    cfg.tv_sym_neg: (-1, 0),
+    cfg.tv_sym_pwr_m2_neg: (0, -2),
+    cfg.tv_sym_pwr_m3_neg: (0, -1),
+    cfg.null_sym: (0, 0),
+    cfg.tv_sym_pwr_m3_pos: (0, 1),
+    cfg.tv_sym_pwr_m2_pos: (0, 2),
+    cfg.tv_sym_pos: (1, 0),
+    cfg.tv_sym_pwr_p2_pos: (2, 0),
+    cfg.tv_sym_pwr_p3_pos: (3, 0),
+    cfg.tv_sym_pwr_p4_pos: (4, 0),
+    cfg.real_num_sym_neg: (5, 0),
+    cfg.real_num_sym_pos: (6, 0),
+    cfg.real_num_sym: (7, 0),
+    cfg.unimplemented_sym: (8, 0),
+    }
+
+# Inputs that couldn't be evaluated (stored with the code
+# config.evaluation_error_code) follow all of the results.
+symbol_ranks[cfg.evaluation_error_marker] = (9, 0)
+
+# The first band whose values have no real part that can be compared.
+first_indeterminate_band = symbol_ranks[cfg.real_num_sym_neg][0]
+
+# The band and offset of a value whose real part is NaN although its
+# symbol is that of a determinate value (which is ranked as "U").
+unimplemented_rank = symbol_ranks[cfg.unimplemented_sym]
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the sort keys for individual values.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def compute_sort_key_of_pair(
+    real_value,
+    symbol,
+    ):
+    """
+    Returns the sort key of a result in its (real, symbol) form: a
+    (band, real, offset) tuple of numbers.
+    """
+
+    band, offset = symbol_ranks[symbol]
+    if band >= first_indeterminate_band:
+        return (band, 0.0, offset)
+    if real_value != real_value:
+        return (unimplemented_rank[0], 0.0, unimplemented_rank[1])
+    return (band, real_value, offset)
+
+
+def compute_sort_key(
+    value,
+    ):
+    """
+    Returns the sort key of a calculated result (for use with sorted()
+    or list.sort()).
+    """
+    return compute_sort_key_of_pair(*cli.decompose_result_for_output(value))
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the sort keys for arrays of results.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for sorting arrays of results.")
+
+
+# The smallest symbol code (by which the codes are shifted so that they
+# can index the tables below).
+smallest_symbol_code = min(cfg.symbol_codes.values())
+
+# The symbols (or markers) by their codes, including that of an input
+# that couldn't be evaluated.
+ranked_symbols_by_code = dict(cfg.symbols_by_code)
+ranked_symbols_by_code[cfg.evaluation_error_code] = cfg.evaluation_error_marker
+
+
+def build_rank_tables():
+    """
+    Returns two arrays giving the band and the offset of each symbol
+    code (shifted by the smallest code).
+    """
+
+    require_numpy()
+    size = max(ranked_symbols_by_code) - smallest_symbol_code + 1
+    bands = np.zeros(size, dtype=np.int8)
+    offsets = np.zeros(size, dtype=np.int8)
+    for code, symbol in ranked_symbols_by_code.items():
+        bands[code - smallest_symbol_code], offsets[code - smallest_symbol_code] = \
+            symbol_ranks[symbol]
+    return (bands, offsets)
+
+
+# The tables are built the first time that they're needed.
+rank_tables = None
+
+
+def get_rank_tables():
+    global rank_tables
+    if rank_tables is None:
+        rank_tables = build_rank_tables()
+    return rank_tables
+
+
+def compute_sort_key_arrays(
+    reals,
+    codes,
+    ):
+    """
+    Returns the sort keys of an array of real values and the matching
+    array of symbol codes (as defined in config.symbol_codes), as three
+    arrays: the bands, the real parts, and the offsets.
+    """
+
+    bands_by_code, offsets_by_code = get_rank_tables()
+    indexes = np.asarray(codes, dtype=np.intp) - smallest_symbol_code
+    bands = bands_by_code[indexes]
+    offsets = offsets_by_code[indexes]
+    reals = np.asarray(reals, dtype=np.float64)
+
+    nan_reals = np.isnan(reals)
+    unimplemented = nan_reals & (bands < first_indeterminate_band)
+    bands[unimplemented] = unimplemented_rank[0]
+    offsets[unimplemented] = unimplemented_rank[1]
+    key_reals = np.where(nan_reals | (bands >= first_indeterminate_band), 0.0, reals)
+    return (bands, key_reals, offsets)
+
+
+def argsort_results(
+    reals,
+    codes,
+    ):
+    """
+    Returns the indexes that would sort the results stored in an array of
+    real values and the matching array of symbol codes. (The sort is
+    stable, so that equal results keep their original order.)
+    """
+
+    require_numpy()
+    bands, key_reals, offsets = compute_sort_key_arrays(reals, codes)
+    return np.lexsort((offsets, key_reals, bands))
+
+
+def load_results(
+    prefix,
+    ):
+    """
+    Loads (memory-mapped) the arrays of real values and symbol codes
+    written by writers.NpyResultWriter with the given prefix.
+    """
+
+    require_numpy()
+    return (
+        np.load(prefix + ".real.npy", mmap_mode="r"),
+        np.load(prefix + ".symbol.npy", mmap_mode="r"),
+        )
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def decompose_results(
+    results,
+    ):
+    """
+    Returns arrays of the real values and symbol codes of the given
+    results, in the form produced by cli.decompose_result_for_output().
+    """
+
+    require_numpy()
+    reals = np.empty(len(results))
+    codes = np.empty(len(results), dtype=np.int8)
+    for index, result in enumerate(results):
+        real_value, symbol = cli.decompose_result_for_output(result)
+        reals[index] = real_value
+        codes[index] = cfg.symbol_codes[symbol]
+    return (reals, codes)
+
+
+if __name__ == '__main__':
+
+    try:
+        from . import workload
+    except:
+        import workload
+
+    argument_parser = argparse.ArgumentParser(
+        description="Sort calculated results, comparing the sort keys for "
+            + "individual values with those computed for whole arrays."
+        )
+    argument_parser.add_argument(
+        "prefix", nargs="?",
+        help="the prefix of a pair of .npy files of results (if omitted, "
+            + "random results are generated)",
+        )
+    argument_parser.add_argument("--count", type=int, default=200000)
+    argument_parser.add_argument("--seed", type=int, default=None)
+    arguments = argument_parser.parse_args()
+
+    if arguments.prefix:
+        reals, codes = load_results(arguments.prefix)
+    else:
+        reals, codes = decompose_results(
+            workload.generate_results(arguments.count, arguments.seed)
+            )
+    symbols = [ranked_symbols_by_code[int(code)] for code in codes]
+    real_values = reals.tolist()
+
+    start_time = time.perf_counter()
+    expected_order = sorted(
+        range(len(symbols)),
+        key=lambda index: compute_sort_key_of_pair(real_values[index], symbols[index]),
+        )
+    key_function_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    order = argsort_results(reals, codes)
+    array_time = time.perf_counter() - start_time
+
+    print(f"results sorted: {len(symbols):,}"
+        + f"   (orders agree: {order.tolist() == expected_order})")
+    print(f"key function: {key_function_time:9.4f} s")
+    print(f"array keys:   {array_time:9.4f} s   "
+        + f"({key_function_time / max(array_time, 1e-9):.1f}×)")
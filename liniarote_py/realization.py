@@ -0,0 +1,784 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module simulates concrete realizations of the indeterminate values
+Æ ("any positive real number"), -Æ ("any negative real number"), and ℝ
+("any real number").
+
+An expression tree is evaluated for many samples at once. Wherever a
+subexpression yields an indeterminate value, that value is replaced by
+real numbers drawn from a configurable distribution (one for each
+sample), which are then carried through the rest of the expression in
+NumPy arrays. The results can be summarized by statistics and a
+histogram.
+
+Within the arrays, operations on ordinary real numbers are performed by
+NumPy. Operations involving other values are performed by the CLI's
+operator functions, once for each distinct combination of operands (or,
+where the result depends on the particular real number involved, once
+for each sample), so the results match those of evaluating the
+expression separately for each sample.
+
+NumPy is required by this module (but not by the rest of Liniarote).
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import time
+import argparse
+import contextlib
+import collections
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import third-party modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import tree
+    from . import batch
+    from . import codegen
+except:
+    import config as cfg
+    import cli
+    import tree
+    import batch
+    import codegen
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the distributions from which realizations are drawn.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# A distribution is given as the name of a method of NumPy's random
+# Generator (e.g., "normal") along with its parameters. Samples for Æ
+# are made positive by taking their absolute values, and samples for
+# -Æ are the negatives of samples for Æ.
+Distribution = collections.namedtuple("Distribution", ["method", "parameters"])
+
+default_positive_distribution = Distribution("exponential", (1.0,))
+default_real_distribution = Distribution("normal", (0.0, 1.0))
+
+
+def parse_distribution(
+    text,
+    ):
+    """
+    Converts text such as "normal:0,1" or "exponential:2.5" into a
+    Distribution.
+    """
+
+    method, _, parameters = text.partition(":")
+    if np is not None and not hasattr(np.random.Generator, method):
+        raise argparse.ArgumentTypeError(f"unknown distribution: {method!r}")
+    try:
+        parameters = tuple(float(parameter) for parameter in parameters.split(",") if parameter)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid parameters: {text!r}")
+    return Distribution(method, parameters)
+
+
+class RealizationSampler:
+    """
+    Draws realizations of the indeterminate values from the configured
+    distributions.
+    """
+
+    def __init__(
+        self,
+        seed=None,
+        positive_distribution=default_positive_distribution,
+        real_distribution=default_real_distribution,
+        ):
+        require_numpy()
+        self.rng = np.random.default_rng(seed)
+        self.positive_distribution = positive_distribution
+        self.real_distribution = real_distribution
+
+
+    def draw(self, symbol, count):
+        """
+        Returns an array of the given number of realizations of Æ, -Æ,
+        or ℝ.
+        """
+
+        if symbol == cfg.real_num_sym:
+            distribution = self.real_distribution
+        else:
+            distribution = self.positive_distribution
+        samples = getattr(self.rng, distribution.method)(
+            *distribution.parameters, size=count
+            ).astype(np.float64)
+
+        if symbol == cfg.real_num_sym_pos:
+            return np.abs(samples)
+        elif symbol == cfg.real_num_sym_neg:
+            return -np.abs(samples)
+        return samples
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required to simulate realizations.")
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the arrays of values that are carried through an expression.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The indeterminate values that are replaced by realizations, either as
+# lone elements or as the real elements of tuples.
+indeterminate_symbols = (cfg.real_num_sym_pos, cfg.real_num_sym_neg, cfg.real_num_sym)
+
+# The result recorded for a sample whose evaluation raised an exception.
+SampleError = collections.namedtuple("SampleError", ["error_type"])
+
+
+class SampleValues:
+    """
+    The values of a subexpression for every sample. For a sample whose
+    value is a real number, codes holds 0 and reals holds the number
+    (which is a lone float if lone is True and otherwise the real element
+    of a tuple whose transvalent element is ∅). For any other sample,
+    codes holds the (positive) code of its value in the evaluation's
+    table of values.
+    """
+
+    def __init__(self, reals, codes, lone):
+        self.reals = reals
+        self.codes = codes
+        self.lone = lone
+
+
+def is_real_result(
+    value,
+    ):
+    return type(value) is float or (
+        type(value) is tuple and len(value) == 2
+        and type(value[0]) is float and value[1] == cfg.null_sym
+        )
+
+
+def is_indeterminate(
+    value,
+    ):
+    if type(value) is tuple and len(value) == 2 and value[1] == cfg.null_sym:
+        value = value[0]
+    return type(value) is str and value in indeterminate_symbols
+
+
+def is_ordinary_real(
+    numbers,
+    ):
+    """
+    Returns a Boolean array that indicates which of the given numbers are
+    ordinary real numbers (see codegen.py).
+    """
+
+    magnitudes = np.abs(numbers)
+    return (codegen.ordinary_real_lower_bound <= magnitudes) \
+        & (magnitudes < codegen.ordinary_real_upper_bound)
+
+
+# The representative real numbers used to determine how an operation
+# combines the real numbers of each sign with some other value.
+sign_representatives = {
+    -1: (-2.5, -0.5),
+    1: (0.5, 3.0),
+    }
+
+# The largest number of distinct real numbers that aren't ordinary that
+# an operand may have for them to be combined with the other operand's
+# values once for each distinct number (rather than once per sample).
+maximum_exceptional_reals = 16
+
+
+def raise_real_to_power(
+    u,
+    v,
+    ):
+    """
+    Raises a real number to a real power as the CLI does, returning NaN
+    (so that the sample is left to the CLI) where the result isn't real.
+    """
+
+    try:
+        result = u ** v
+    except (ZeroDivisionError, OverflowError):
+        return float("nan")
+    return result if type(result) is float else float("nan")
+
+
+# The NumPy counterparts of the operations, for ordinary real numbers.
+# (Powers are computed by Python itself, one sample at a time, as NumPy's
+# results may differ from the CLI's in the last digit.)
+real_operations = {
+    "+": lambda u, v: u + v,
+    "-": lambda u, v: u - v,
+    "*": lambda u, v: u * v,
+    "/": lambda u, v: u / v,
+    "^": lambda u, v: np.frompyfunc(raise_real_to_power, 2, 1)(u, v).astype(float),
+    }
+
+
+class RealizationEvaluation:
+    """
+    The evaluation of an expression tree for a given number of samples.
+    """
+
+    def __init__(self, sample_count, sampler, constants=None):
+        require_numpy()
+        self.sample_count = sample_count
+        self.sampler = sampler
+        self.constants = constants
+
+        # The table of values that aren't real numbers (code 0 being
+        # reserved for real numbers).
+        self.values = [None]
+        self.codes_by_value = {}
+
+        # The realizations drawn for each node (by the id() of the node),
+        # so that the evaluation of any single sample can be repeated.
+        self.realizations_by_node = {}
+
+        self.mixed_operation_cache = {}
+
+
+    def get_code(self, value):
+        code = self.codes_by_value.get(value)
+        if code is None:
+            code = self.codes_by_value[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+    def get_operand(self, operand, index):
+        """
+        Returns an operand's value (as a lone element or tuple) for the
+        sample with the given index.
+        """
+
+        if type(operand) is not SampleValues:
+            return operand
+        code = operand.codes[index]
+        if code:
+            return self.values[code]
+        real = float(operand.reals[index])
+        return real if operand.lone[index] else (real, cfg.null_sym)
+
+
+    def store_result(self, result, reals, codes, lone, indexes):
+        if is_real_result(result):
+            reals[indexes] = result if type(result) is float else result[0]
+            codes[indexes] = 0
+            lone[indexes] = type(result) is float
+        else:
+            codes[indexes] = self.get_code(result)
+
+
+    def apply_scalar_operation(self, operator, u, v):
+        if type(u) is SampleError:
+            return u
+        if type(v) is SampleError:
+            return v
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                if operator == "negate":
+                    return cli.negate_value(u)
+                return tree.binary_operations[operator](u, v)
+        except Exception as error:
+            return SampleError(type(error).__name__)
+
+
+    def evaluate(self, node):
+        """
+        Returns the value of the subtree for every sample: either a single
+        value (if the value is the same for every sample) or SampleValues.
+        """
+
+        node_type = type(node)
+
+        if node_type is tree.BinaryOperation:
+            left_value = self.evaluate(node.left)
+            right_value = self.evaluate(node.right)
+            if type(left_value) is SampleValues or type(right_value) is SampleValues:
+                value = self.combine(node.operator, left_value, right_value)
+            else:
+                value = tree.binary_operations[node.operator](left_value, right_value)
+        elif node_type is tree.Negation:
+            operand_value = self.evaluate(node.operand)
+            if type(operand_value) is SampleValues:
+                value = self.negate(operand_value)
+            else:
+                value = cli.negate_value(operand_value)
+        else:
+            value = tree.evaluate_tree(node, self.constants)
+
+        return self.realize(node, value)
+
+
+    def realize(self, node, value):
+        """
+        Replaces the indeterminate values among the given values with
+        realizations.
+        """
+
+        if type(value) is not SampleValues:
+            if not is_indeterminate(value):
+                return value
+            value = SampleValues(
+                np.zeros(self.sample_count),
+                np.full(self.sample_count, self.get_code(value), dtype=np.int32),
+                np.zeros(self.sample_count, dtype=bool),
+                )
+
+        realizations = np.full(self.sample_count, np.nan)
+        for code in np.unique(value.codes):
+            if code == 0 or not is_indeterminate(self.values[code]):
+                continue
+            symbol = self.values[code]
+            lone = type(symbol) is str
+            if not lone:
+                symbol = symbol[0]
+            indexes = np.flatnonzero(value.codes == code)
+            realizations[indexes] = self.sampler.draw(symbol, len(indexes))
+            value.reals[indexes] = realizations[indexes]
+            value.codes[indexes] = 0
+            value.lone[indexes] = lone
+
+        if not np.isnan(realizations).all():
+            self.realizations_by_node[id(node)] = realizations
+        return value
+
+
+    def broadcast(self, value, as_operand=False):
+        """
+        Converts a single value into SampleValues. If the value is to be
+        an operand and is a real number that isn't ordinary (e.g., zero),
+        it is treated in the same manner as a value that isn't a real
+        number, so that it is combined with the other operand's values by
+        means of the CLI's operations rather than NumPy.
+        """
+
+        if type(value) is SampleValues:
+            return value
+        reals = np.zeros(self.sample_count)
+        codes = np.zeros(self.sample_count, dtype=np.int32)
+        lone = np.full(self.sample_count, type(value) is float)
+        if is_real_result(value) and not (
+                as_operand and not is_ordinary_real(
+                    value if type(value) is float else value[0]
+                    )
+                ):
+            reals[:] = value if type(value) is float else value[0]
+        else:
+            codes[:] = self.get_code(value)
+        return SampleValues(reals, codes, lone)
+
+
+    def code_exceptional_reals(self, operand):
+        """
+        Returns the operand's values with any real numbers that aren't
+        ordinary (e.g., zero) given codes as if they weren't real numbers,
+        provided that there are only a few distinct such numbers. They
+        are thus combined with the other operand's values by means of the
+        CLI's operations, once for each distinct combination (rather than
+        once for each sample).
+        """
+
+        exceptional = np.flatnonzero(
+            (operand.codes == 0) & ~is_ordinary_real(operand.reals)
+            )
+        if not len(exceptional):
+            return operand
+        distinct_values = set(zip(
+            operand.reals[exceptional].tolist(), operand.lone[exceptional].tolist()
+            ))
+        if len(distinct_values) > maximum_exceptional_reals:
+            return operand
+
+        codes = operand.codes.copy()
+        for real, lone_value in distinct_values:
+            value = real if lone_value else (real, cfg.null_sym)
+            indexes = exceptional[
+                (operand.reals[exceptional] == real)
+                & (operand.lone[exceptional] == lone_value)
+                ]
+            codes[indexes] = self.get_code(value)
+        return SampleValues(operand.reals, codes, operand.lone)
+
+
+    def negate(self, operand):
+        """
+        Negates the values of the operand for every sample.
+        """
+
+        reals = -operand.reals
+        codes = operand.codes.copy()
+        lone = operand.lone.copy()
+        unresolved = np.zeros(self.sample_count, dtype=bool)
+
+        # Negate real numbers that are the results of operations (rather
+        # than lone elements) in the same manner as the CLI does.
+        tuple_reals = (operand.codes == 0) & ~operand.lone
+        for sign in sign_representatives:
+            indexes = np.flatnonzero(
+                tuple_reals & (np.sign(operand.reals) == sign)
+                & is_ordinary_real(operand.reals)
+                )
+            if len(indexes):
+                self.combine_with_sign(
+                    "negate", 0, None, sign, False, operand.reals[indexes],
+                    indexes, reals, codes, lone, unresolved,
+                    )
+        unresolved[tuple_reals & ~is_ordinary_real(operand.reals)] = True
+
+        for code in np.unique(operand.codes[operand.codes != 0]):
+            result = self.apply_scalar_operation("negate", self.values[code], None)
+            self.store_result(
+                result, reals, codes, lone, np.flatnonzero(operand.codes == code)
+                )
+
+        for index in np.flatnonzero(unresolved):
+            result = self.apply_scalar_operation(
+                "negate", self.get_operand(operand, index), None
+                )
+            self.store_result(result, reals, codes, lone, index)
+        return SampleValues(reals, codes, lone)
+
+
+    def combine(self, operator, left_value, right_value):
+        """
+        Applies a binary operation to the values of its operands for every
+        sample.
+        """
+
+        left = self.code_exceptional_reals(self.broadcast(left_value, as_operand=True))
+        right = self.code_exceptional_reals(self.broadcast(right_value, as_operand=True))
+        reals = np.zeros(self.sample_count)
+        codes = np.zeros(self.sample_count, dtype=np.int32)
+        lone = np.zeros(self.sample_count, dtype=bool)
+        left_real = left.codes == 0
+        right_real = right.codes == 0
+        unresolved = np.zeros(self.sample_count, dtype=bool)
+
+        # Combine ordinary real numbers by means of NumPy.
+        both_real = np.flatnonzero(left_real & right_real)
+        if len(both_real):
+            u = left.reals[both_real]
+            v = right.reals[both_real]
+            with np.errstate(all="ignore"):
+                results = real_operations[operator](u, v)
+            ordinary = is_ordinary_real(u) & is_ordinary_real(v) & is_ordinary_real(results)
+            reals[both_real[ordinary]] = results[ordinary]
+            if operator == "^":
+                # (A power of a lone real number is itself a lone number.)
+                lone[both_real] = left.lone[both_real]
+            unresolved[both_real[~ordinary]] = True
+
+        # Combine other values once for each distinct pair.
+        neither_real = np.flatnonzero(~left_real & ~right_real)
+        if len(neither_real):
+            pair_keys = left.codes[neither_real].astype(np.int64) * len(self.values) \
+                + right.codes[neither_real]
+            unique_keys, inverse = np.unique(pair_keys, return_inverse=True)
+            for key_index, key in enumerate(unique_keys):
+                u = self.values[int(key) // len(self.values)]
+                v = self.values[int(key) % len(self.values)]
+                result = self.apply_scalar_operation(operator, u, v)
+                self.store_result(
+                    result, reals, codes, lone, neither_real[inverse == key_index]
+                    )
+
+        # Combine real numbers with other values once for each sign, where
+        # the result depends only on the sign of the real number.
+        for real_side, real_mask in ((0, left_real & ~right_real), (1, ~left_real & right_real)):
+            other = right if real_side == 0 else left
+            real = left if real_side == 0 else right
+            for code in np.unique(other.codes[real_mask]):
+                for sign in sign_representatives:
+                    for lone_value in (False, True):
+                        indexes = np.flatnonzero(
+                            real_mask & (other.codes == code)
+                            & (np.sign(real.reals) == sign) & (real.lone == lone_value)
+                            & is_ordinary_real(real.reals)
+                            )
+                        if len(indexes):
+                            self.combine_with_sign(
+                                operator, real_side, self.values[code], sign,
+                                lone_value, real.reals[indexes], indexes,
+                                reals, codes, lone, unresolved,
+                                )
+                unresolved[
+                    real_mask & (other.codes == code) & ~is_ordinary_real(real.reals)
+                    ] = True
+
+        # Combine any remaining values separately for each sample.
+        for index in np.flatnonzero(unresolved):
+            result = self.apply_scalar_operation(
+                operator, self.get_operand(left, index), self.get_operand(right, index)
+                )
+            self.store_result(result, reals, codes, lone, index)
+
+        return SampleValues(reals, codes, lone)
+
+
+    def combine_with_sign(
+        self, operator, real_side, other_value, sign, lone_value, numbers,
+        indexes, reals, codes, lone, unresolved,
+        ):
+        """
+        Combines real numbers of a given sign with another value. If the
+        result is the same for every such number (or is the number itself,
+        or its negative), it is stored for all of them at once; otherwise,
+        the samples are left to be combined separately.
+        """
+
+        cache_key = (operator, real_side, other_value, sign, lone_value)
+        behavior = self.mixed_operation_cache.get(cache_key)
+        if behavior is None:
+            results = []
+            factors = []
+            for number in sign_representatives[sign]:
+                operand = number if lone_value else (number, cfg.null_sym)
+                if real_side == 0:
+                    operands = (operand, other_value)
+                else:
+                    operands = (other_value, operand)
+                result = self.apply_scalar_operation(operator, *operands)
+                results.append(result)
+                if is_real_result(result):
+                    real = result if type(result) is float else result[0]
+                    factors.append(("factor", real / number, type(result) is float))
+
+            if all(result == results[0] for result in results[1:]):
+                behavior = results[0]
+            elif len(factors) == len(results) \
+                    and all(factor == factors[0] for factor in factors[1:]) \
+                    and factors[0][1] in (1.0, -1.0):
+                behavior = factors[0]
+            else:
+                behavior = "unresolved"
+            self.mixed_operation_cache[cache_key] = behavior
+
+        if behavior == "unresolved":
+            unresolved[indexes] = True
+        elif type(behavior) is tuple and behavior[0] == "factor":
+            reals[indexes] = behavior[1] * numbers
+            codes[indexes] = 0
+            lone[indexes] = behavior[2]
+        else:
+            self.store_result(behavior, reals, codes, lone, indexes)
+
+
+    def evaluate_sample(self, node, index):
+        """
+        Evaluates the tree with the CLI's operations for a single sample,
+        using the same realizations as were drawn for the whole evaluation
+        (for checking purposes).
+        """
+
+        node_type = type(node)
+        if node_type is tree.BinaryOperation:
+            value = self.apply_scalar_operation(
+                node.operator,
+                self.evaluate_sample(node.left, index),
+                self.evaluate_sample(node.right, index),
+                )
+        elif node_type is tree.Negation:
+            value = self.apply_scalar_operation(
+                "negate", self.evaluate_sample(node.operand, index), None
+                )
+        else:
+            value = tree.evaluate_tree(node, self.constants)
+
+        realizations = self.realizations_by_node.get(id(node))
+        if realizations is not None and is_indeterminate(value):
+            real = float(realizations[index])
+            return real if type(value) is str else (real, cfg.null_sym)
+        return value
+
+
+def realize_expression(
+    expression_tree,
+    sample_count,
+    sampler=None,
+    constants=None,
+    ):
+    """
+    Evaluates an expression tree for the given number of samples. Returns
+    the RealizationEvaluation and the final values (as SampleValues).
+    """
+
+    if sampler is None:
+        sampler = RealizationSampler()
+    evaluation = RealizationEvaluation(sample_count, sampler, constants)
+    values = evaluation.broadcast(evaluation.evaluate(expression_tree))
+    return (evaluation, values)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the summaries of results.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+summary_percentiles = (5, 25, 50, 75, 95)
+
+
+def summarize_realizations(
+    evaluation,
+    values,
+    bins=20,
+    ):
+    """
+    Returns a dictionary summarizing the final values: the number of
+    samples yielding each kind of result, statistics for the samples
+    whose results are real numbers, and a histogram of those numbers.
+    """
+
+    real_numbers = values.reals[values.codes == 0]
+    outcomes = {}
+    if len(real_numbers):
+        outcomes["real number"] = len(real_numbers)
+    for code in np.unique(values.codes[values.codes != 0]):
+        value = evaluation.values[code]
+        if type(value) is SampleError:
+            label = "error: " + value.error_type
+        elif value == cfg.unimplemented_sym:
+            label = cfg.unimplemented_sym
+        else:
+            label = cli.format_result_for_display(value)
+        outcomes[label] = int(np.count_nonzero(values.codes == code))
+
+    summary = {"samples": len(values.codes), "outcomes": outcomes}
+    finite_numbers = real_numbers[np.isfinite(real_numbers)]
+    if len(finite_numbers):
+        summary["mean"] = float(np.mean(finite_numbers))
+        summary["standard deviation"] = float(np.std(finite_numbers))
+        summary["minimum"] = float(np.min(finite_numbers))
+        summary["maximum"] = float(np.max(finite_numbers))
+        for percentile, value in zip(
+                summary_percentiles, np.percentile(finite_numbers, summary_percentiles)
+                ):
+            summary[f"percentile {percentile}"] = float(value)
+        counts, edges = np.histogram(finite_numbers, bins=bins)
+        summary["histogram"] = (counts.tolist(), edges.tolist())
+    return summary
+
+
+def format_summary(
+    summary,
+    histogram_width=50,
+    ):
+    """
+    Returns the lines of a summary in a form suitable for display.
+    """
+
+    lines = [f"samples:  {summary['samples']}"]
+    for label, count in summary["outcomes"].items():
+        lines.append(f"  {label}: {count} ({100.0 * count / summary['samples']:.1f}%)")
+    for key, value in summary.items():
+        if key not in ("samples", "outcomes", "histogram"):
+            lines.append(f"{key}: {value:.6g}")
+
+    if "histogram" in summary:
+        counts, edges = summary["histogram"]
+        largest_count = max(max(counts), 1)
+        for count, lower_edge, upper_edge in zip(counts, edges, edges[1:]):
+            bar = "█" * round(histogram_width * count / largest_count)
+            lines.append(f"{lower_edge:>12.4g} .. {upper_edge:<12.4g} {bar} {count}")
+    return lines
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def build_argument_parser():
+    argument_parser = argparse.ArgumentParser(
+        description="Simulate realizations of the indeterminate values in "
+            + "a Liniarote expression and summarize the results."
+        )
+    argument_parser.add_argument("expression")
+    argument_parser.add_argument("--samples", type=int, default=100000)
+    argument_parser.add_argument("--seed", type=int, default=None)
+    argument_parser.add_argument(
+        "--positive-distribution", type=parse_distribution,
+        default=default_positive_distribution, metavar="METHOD:PARAMETERS",
+        help="the distribution of realizations of Æ (and, negated, of -Æ)",
+        )
+    argument_parser.add_argument(
+        "--real-distribution", type=parse_distribution,
+        default=default_real_distribution, metavar="METHOD:PARAMETERS",
+        help="the distribution of realizations of ℝ",
+        )
+    argument_parser.add_argument("--bins", type=int, default=20)
+    argument_parser.add_argument(
+        "--constant", type=batch.parse_constant_assignment, action="append",
+        default=[],
+        )
+    argument_parser.add_argument(
+        "--check", type=int, default=0, metavar="COUNT",
+        help="also evaluate this many samples separately and compare",
+        )
+    return argument_parser
+
+
+def main(argv=None):
+    arguments = build_argument_parser().parse_args(argv)
+    for name, value in arguments.constant:
+        cfg.recognized_constants[name] = value
+
+    expression_tree = tree.parse_expression_to_tree(arguments.expression)
+    sampler = RealizationSampler(
+        arguments.seed, arguments.positive_distribution, arguments.real_distribution
+        )
+    start_time = time.perf_counter()
+    evaluation, values = realize_expression(expression_tree, arguments.samples, sampler)
+    elapsed_time = time.perf_counter() - start_time
+
+    summary = summarize_realizations(evaluation, values, arguments.bins)
+    for line in format_summary(summary):
+        print(line)
+    print(f"evaluated in {elapsed_time:.3f} s")
+
+    if arguments.check:
+        mismatches = 0
+        for index in range(min(arguments.check, arguments.samples)):
+            expected = evaluation.evaluate_sample(expression_tree, index)
+            if evaluation.get_operand(values, index) != expected:
+                mismatches += 1
+        print(f"samples checked separately: {min(arguments.check, arguments.samples)}"
+            + f" ({mismatches} mismatches)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,938 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module sums (or multiplies) long sequences of values by dividing
+them into chunks that are processed in parallel.
+
+Transvalent addition and multiplication aren't associative (e.g.,
+(Ƿ + Ƿ) + -Ƿ = 0, but Ƿ + (Ƿ + -Ƿ) = Ƿ), so a sequence can't simply be
+split into parts whose results are then combined. However, apart from a
+real number, the running result (or "state") of a fold can take only a
+finite number of values. For each chunk, a worker process therefore
+determines the state in which the chunk would leave the fold for every
+possible state in which the chunk could be entered. These "transition
+maps" are then applied one after another, which yields the result of a
+strict left fold (((a + b) + c) + ...).
+
+The transitions between states are found by applying the CLI's own
+operations to representative values, so they remain correct if the
+operations are changed. While the state is an ordinary real number, it
+is updated by means of Python's arithmetic, which gives the same results
+as the CLI's operations. A chunk's real numbers aren't combined with one
+another in advance: the real number with which a chunk is entered is
+carried through the chunk's leading real numbers one at a time (which
+takes only a few Python additions or multiplications for each), so that
+the result is exactly, bit for bit, that of a serial fold.
+
+The transitions depend only on the signs of the real numbers involved
+as long as these are "ordinary" (i.e., zero or within the bounds that
+the code generator uses for Python's arithmetic, whose string forms
+don't use exponential notation). If a chunk contains any other real
+number, or the fold would pass through one within it (e.g., 0.5 *
+0.0001), the chunk is instead folded one element at a time, with the
+CLI's operation used for every step that involves such a number.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import sys
+import time
+import random
+import argparse
+import operator
+import functools
+import contextlib
+import collections
+import concurrent.futures
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import codegen
+except:
+    import config as cfg
+    import cli
+    import codegen
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the operations that can be folded.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# For each operator: the CLI's operation, the corresponding operation on
+# ordinary real numbers, and that operation's identity element.
+FoldOperation = collections.namedtuple(
+    "FoldOperation", ["transvalent_operation", "real_operation", "identity"]
+    )
+
+def multiply_reals(
+    u,
+    v,
+    ):
+    """
+    Multiplies two ordinary real numbers as the CLI multiplies a running
+    result by a real number (which gives 0.0, rather than -0.0, when
+    either is zero).
+    """
+
+    product = u * v
+    return product if product else 0.0
+
+
+fold_operations = {
+    "+": FoldOperation(cli.add_values, operator.add, 0.0),
+    "*": FoldOperation(cli.multiply_values, multiply_reals, 1.0),
+    }
+
+# Representative real numbers for each sign (-1, 0, and 1). Two are used
+# for each nonzero sign, so that it can be confirmed that a transition
+# depends only on the sign of a number and not on its magnitude.
+sign_representatives = {
+    -1: (-2.5, -0.5),
+    0: (0.0,),
+    1: (0.5, 3.0),
+    }
+
+# The symbols that can appear (as lone elements) in a folded sequence.
+foldable_symbols = tuple(cfg.symbol_codes)
+
+# The largest number of states that the fold of a sequence is expected
+# to pass through; reaching it indicates that the operation isn't suited
+# to being folded in this manner.
+maximum_state_count = 1000
+
+
+def get_sign(
+    number,
+    ):
+    return (number > 0) - (number < 0)
+
+
+class ExtraordinaryRealError(ValueError):
+    """
+    Raised when a sequence contains (or its fold would pass through) a
+    real number whose transitions can't be determined from its sign.
+    """
+
+
+def is_ordinary_state(
+    number,
+    ):
+    """
+    Returns True if a real number (as an element or a state) behaves in
+    the CLI's operations as the representatives of its sign do.
+    """
+    return number == 0.0 or (
+        codegen.ordinary_real_lower_bound <= abs(number)
+        < codegen.ordinary_real_upper_bound
+        )
+
+
+def check_real_number(
+    number,
+    ):
+    if not is_ordinary_state(number):
+        raise ExtraordinaryRealError(
+            f"The real number {number!r} can't be folded in parallel."
+            )
+    return number
+
+
+def check_computed_state(
+    number,
+    ):
+    if not is_ordinary_state(number):
+        raise ExtraordinaryRealError(
+            f"The state {number!r} can't be folded in parallel."
+            )
+    return number
+
+
+def get_element_key(
+    element,
+    ):
+    """
+    Returns the key under which a lone element is found in the transition
+    tables: the sign of a real number, or the symbol itself.
+    """
+
+    if type(element) is float:
+        return get_sign(element)
+    if element in cfg.symbol_codes:
+        return element
+    raise ValueError(f"{element!r} isn't a real number or a Liniarote symbol")
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the states of a fold and the transitions between them.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# In the tables and maps below, a state that is an ordinary real number
+# (i.e., the tuple (x, ∅)) is represented by the float x, and any other
+# result of an operation (e.g., (0.0, 'Ƿ') or 'U') by the result itself.
+# A fold that raises an exception enters a FoldFailure state, which it
+# never leaves.
+
+class FoldFailure:
+    """
+    The state of a fold in which an operation has raised an exception.
+    """
+
+    def __init__(self, error):
+        self.error = error
+
+
+    def __eq__(self, other):
+        return type(other) is FoldFailure \
+            and type(self.error) is type(other.error) \
+            and str(self.error) == str(other.error)
+
+
+    def __hash__(self):
+        return hash((type(self.error), str(self.error)))
+
+
+# Transition targets that are computed from the real numbers involved
+# rather than stored in the tables: the real number being folded in, or
+# the real state combined with 0 (as when ∅ is added to a real number).
+ELEMENT_VALUE = "element value"
+REAL_STATE_WITH_ZERO = "real state with zero"
+
+
+def convert_result_to_state(
+    result,
+    ):
+    if type(result) is tuple and len(result) == 2 \
+            and type(result[0]) is float and result[1] == cfg.null_sym:
+        return result[0]
+    return result
+
+
+def convert_state_to_result(
+    state,
+    ):
+    """
+    Returns the value (in the form used by the CLI's operations) that a
+    fold has yielded, raising the exception that stopped it, if any.
+    """
+
+    if type(state) is float:
+        return (state, cfg.null_sym)
+    if type(state) is FoldFailure:
+        raise state.error
+    return state
+
+
+def apply_operation_quietly(
+    transvalent_operation,
+    u,
+    v,
+    ):
+    """
+    Applies an operation to two operands, returning the resulting state
+    (with any messages that are printed along the way suppressed).
+    """
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            return convert_result_to_state(transvalent_operation(u, v))
+        except Exception as error:
+            return FoldFailure(error)
+
+
+def find_common_target(
+    targets,
+    description,
+    ):
+    """
+    Returns the target on which all of the given targets agree, raising
+    a ValueError if there is none.
+    """
+
+    if all(target == targets[0] for target in targets[1:]):
+        return targets[0]
+    raise ValueError(
+        f"The result of {description} depends on more than the signs "
+        + "of the real numbers involved, so it can't be folded in parallel."
+        )
+
+
+class TransitionTables:
+    """
+    The transitions between the states of a fold for a given operator,
+    found by applying the CLI's operation to representative values.
+
+    symbolic_transitions maps (state, element key) to the next state for
+    every state that isn't an ordinary real number (or to ELEMENT_VALUE,
+    if the next state is the real number being folded in). For states
+    that are ordinary real numbers, real_transitions maps (sign of the
+    state, symbol) to the next state (or to REAL_STATE_WITH_ZERO); the
+    transition caused by a real number is computed directly.
+    """
+
+    def __init__(self, operator_symbol):
+        self.operator_symbol = operator_symbol
+        self.transvalent_operation, self.real_operation, self.identity = \
+            fold_operations[operator_symbol]
+        self.symbolic_transitions = {}
+        self.real_transitions = {}
+
+        # The states that a chunk can be entered in are those reached
+        # after applying the operation at least once.
+        elements = [
+            number for numbers in sign_representatives.values()
+            for number in numbers
+            ] + list(foldable_symbols)
+        pending_states = set()
+        for u in elements:
+            for v in elements:
+                pending_states.add(
+                    apply_operation_quietly(self.transvalent_operation, u, v)
+                    )
+
+        for sign in sign_representatives:
+            for symbol in foldable_symbols:
+                target = self.find_real_transition(sign, symbol)
+                self.real_transitions[(sign, symbol)] = target
+                pending_states.add(target)
+
+        self.states = set()
+        while pending_states:
+            state = pending_states.pop()
+            if type(state) is float or state in self.states \
+                    or type(state) is FoldFailure or state == ELEMENT_VALUE \
+                    or state == REAL_STATE_WITH_ZERO:
+                continue
+            self.states.add(state)
+            if len(self.states) > maximum_state_count:
+                raise ValueError(
+                    f"The operation {operator_symbol} has too many states "
+                    + "to be folded in parallel."
+                    )
+            for element_key in list(sign_representatives) + list(foldable_symbols):
+                target = self.find_symbolic_transition(state, element_key)
+                self.symbolic_transitions[(state, element_key)] = target
+                pending_states.add(target)
+
+        # The states that real numbers never change.
+        self.float_fixed_states = {
+            state for state in self.states
+            if all(
+                self.symbolic_transitions[(state, sign)] == state
+                for sign in sign_representatives
+                )
+            }
+
+
+    def apply(self, state, element):
+        if type(state) is float:
+            state = (state, cfg.null_sym)
+        return apply_operation_quietly(self.transvalent_operation, state, element)
+
+
+    def find_symbolic_transition(self, state, element_key):
+        if element_key not in sign_representatives:
+            return self.apply(state, element_key)
+
+        targets = []
+        for number in sign_representatives[element_key]:
+            target = self.apply(state, number)
+            if type(target) is float:
+                # The result is an ordinary real number, which must either
+                # be the same for every number of this sign or be the
+                # number itself.
+                target = ELEMENT_VALUE if target == number else target
+            targets.append(target)
+        return find_common_target(targets, f"{state!r} {self.operator_symbol} (a real number)")
+
+
+    def find_real_transition(self, sign, symbol):
+        targets = []
+        for number in sign_representatives[sign]:
+            target = self.apply(number, symbol)
+            if type(target) is float \
+                    and target == self.real_operation(number, 0.0):
+                target = REAL_STATE_WITH_ZERO
+            targets.append(target)
+        return find_common_target(targets, f"(a real number) {self.operator_symbol} {symbol}")
+
+
+# The tables are built the first time that they're needed for each
+# operator (as this requires some thousands of operations).
+transition_tables_by_operator = {}
+
+
+def get_transition_tables(
+    operator_symbol,
+    ):
+    tables = transition_tables_by_operator.get(operator_symbol)
+    if tables is None:
+        tables = transition_tables_by_operator[operator_symbol] = \
+            TransitionTables(operator_symbol)
+    return tables
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the processing of a single chunk.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The effect of a chunk on a fold. If the chunk is entered with a state
+# that is a real number, the chunk's first real_prefix_length elements
+# (real numbers, and symbols that act on a real number as 0 does) are
+# folded into it one at a time. If that is the whole chunk, the result is
+# the state in which the chunk is left; otherwise, ends_by_sign gives the
+# final state for each sign of that result. For every other state,
+# ends_by_state gives the final state.
+ChunkEffect = collections.namedtuple(
+    "ChunkEffect", ["real_prefix_length", "ends_by_sign", "ends_by_state"],
+    )
+
+
+def advance_state(
+    tables,
+    state,
+    element,
+    ):
+    """
+    Returns the state of a fold after a single element has been folded in.
+    """
+
+    if type(state) is float:
+        if type(element) is float:
+            return check_computed_state(tables.real_operation(state, element))
+        target = tables.real_transitions[(get_sign(state), element)]
+        if target == REAL_STATE_WITH_ZERO:
+            return check_computed_state(tables.real_operation(state, 0.0))
+        return target
+
+    if type(state) is FoldFailure:
+        return state
+    target = tables.symbolic_transitions[(state, get_element_key(element))]
+    if target == ELEMENT_VALUE:
+        return element
+    return target
+
+
+def advance_states(
+    tables,
+    states,
+    elements,
+    ):
+    """
+    Folds the given elements into each of the given states, returning a
+    dictionary of the final state for each. States that reach the same
+    state are followed together from then on.
+    """
+
+    # Each track is followed by one or more of the initial states. Only
+    # the "moving" tracks (those whose states may be changed by real
+    # numbers) need to be advanced when a real number is folded in; the
+    # tracks are merged and the moving ones found after each symbol.
+    tracks = list(states)
+    initial_states_by_track = [[state] for state in states]
+    moving_tracks = None
+
+    for element in elements:
+        if type(element) is float and moving_tracks is not None:
+            for index in moving_tracks:
+                tracks[index] = advance_state(tables, tracks[index], element)
+            continue
+
+        tracks = [advance_state(tables, state, element) for state in tracks]
+        merged_tracks = {}
+        for state, initial_states in zip(tracks, initial_states_by_track):
+            merged_tracks.setdefault(state, []).extend(initial_states)
+        tracks = list(merged_tracks)
+        initial_states_by_track = list(merged_tracks.values())
+        moving_tracks = [
+            index for index, state in enumerate(tracks)
+            if state not in tables.float_fixed_states
+            ]
+
+    return {
+        initial_state: state
+        for state, initial_states in zip(tracks, initial_states_by_track)
+        for initial_state in initial_states
+        }
+
+
+def find_chunk_effect(
+    operator_symbol,
+    chunk,
+    ):
+    """
+    Returns the ChunkEffect of a chunk of lone elements (real numbers and
+    symbols).
+    """
+
+    tables = get_transition_tables(operator_symbol)
+    for element in chunk:
+        if type(element) is float:
+            check_real_number(element)
+
+    # Find the elements that act on a state that is a real number in the
+    # same way whatever its sign.
+    real_prefix_length = len(chunk)
+    ends_by_sign = None
+    for index, element in enumerate(chunk):
+        if type(element) is float:
+            continue
+        targets = {
+            sign: tables.real_transitions[(sign, element)]
+            for sign in sign_representatives
+            }
+        if all(target == REAL_STATE_WITH_ZERO for target in targets.values()):
+            continue
+
+        for sign, target in targets.items():
+            if target == REAL_STATE_WITH_ZERO:
+                if sign != 0:
+                    raise ValueError(
+                        f"The effect of {element!r} on a real number can't "
+                        + "be determined in advance."
+                        )
+                target = tables.real_operation(0.0, 0.0)
+            targets[sign] = target
+        ends_by_sign = advance_states(tables, set(targets.values()), chunk[index + 1:])
+        ends_by_sign = {sign: ends_by_sign[target] for sign, target in targets.items()}
+        real_prefix_length = index
+        break
+
+    ends_by_state = advance_states(tables, tables.states, chunk)
+    return ChunkEffect(real_prefix_length, ends_by_sign, ends_by_state)
+
+
+def apply_chunk_effect(
+    tables,
+    state,
+    chunk,
+    chunk_effect,
+    ):
+    """
+    Returns the state in which a chunk leaves a fold that enters it with
+    the given state. Raises an ExtraordinaryRealError if the state can't
+    be determined from the chunk's effect.
+    """
+
+    if type(state) is FoldFailure:
+        return state
+    if type(state) is not float:
+        if state not in chunk_effect.ends_by_state:
+            # (A state reached by way of a real number that isn't ordinary.)
+            raise ExtraordinaryRealError(
+                f"The state {state!r} can't be folded in parallel."
+                )
+        return chunk_effect.ends_by_state[state]
+
+    # Continue the real state through the chunk's leading elements in
+    # order, exactly as a serial fold does.
+    check_real_number(state)
+    real_operation = tables.real_operation
+    for index in range(chunk_effect.real_prefix_length):
+        element = chunk[index]
+        state = real_operation(state, element if type(element) is float else 0.0)
+        if not is_ordinary_state(state):
+            raise ExtraordinaryRealError(
+                f"The state {state!r} can't be folded in parallel."
+                )
+    if chunk_effect.ends_by_sign is None:
+        return state
+    return chunk_effect.ends_by_sign[get_sign(state)]
+
+
+def find_chunk_effect_if_ordinary(
+    operator_symbol,
+    chunk,
+    ):
+    """
+    Returns the ChunkEffect of a chunk, or None if the chunk contains (or
+    its fold would pass through) a real number that isn't ordinary.
+    """
+
+    try:
+        return find_chunk_effect(operator_symbol, chunk)
+    except ExtraordinaryRealError:
+        return None
+
+
+def advance_state_serially(
+    tables,
+    state,
+    element,
+    ):
+    """
+    Returns the state of a fold after a single element has been folded
+    in, using the CLI's operation if a real number that isn't ordinary
+    (or a state reached by way of one) is involved.
+    """
+
+    if type(state) is FoldFailure:
+        return state
+    if (type(element) is not float or is_ordinary_state(element)) \
+            and (is_ordinary_state(state) if type(state) is float
+                else state in tables.states):
+        try:
+            return advance_state(tables, state, element)
+        except ExtraordinaryRealError:
+            pass
+    return tables.apply(state, element)
+
+
+def fold_stepwise(
+    tables,
+    state,
+    elements,
+    ):
+    """
+    Folds the given elements into a state one at a time, reaching exactly
+    the state that a serial fold would (but using the transition tables
+    wherever possible).
+    """
+
+    for element in elements:
+        state = advance_state_serially(tables, state, element)
+    return state
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the folding of whole sequences.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def fold_serially(
+    values,
+    operator_symbol="+",
+    ):
+    """
+    Returns the result of a strict left fold of the given values, using
+    the CLI's operation for every step.
+    """
+
+    transvalent_operation = fold_operations[operator_symbol].transvalent_operation
+    return functools.reduce(transvalent_operation, values)
+
+
+def fold_in_parallel(
+    values,
+    operator_symbol="+",
+    chunk_size=1 << 20,
+    max_workers=None,
+    ):
+    """
+    Returns the result of a strict left fold of the given values (a
+    sequence of real numbers and symbols) with "+" or "*", processing
+    chunks of the sequence in a pool of processes. If max_workers is 0,
+    the chunks are processed in the calling process instead.
+    """
+
+    if len(values) < 2:
+        return fold_serially(values, operator_symbol)
+    tables = get_transition_tables(operator_symbol)
+
+    # The first step of the fold (whose left operand may be a lone
+    # element rather than a result) is performed directly.
+    initial_state = apply_operation_quietly(
+        tables.transvalent_operation, values[0], values[1]
+        )
+    chunks = [
+        values[start:start + chunk_size]
+        for start in range(2, len(values), chunk_size)
+        ]
+
+    with contextlib.ExitStack() as exit_stack:
+        if max_workers == 0 or len(chunks) < 2:
+            chunk_effects = (
+                find_chunk_effect_if_ordinary(operator_symbol, chunk)
+                for chunk in chunks
+                )
+        else:
+            executor = exit_stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(max_workers)
+                )
+            chunk_effects = executor.map(
+                find_chunk_effect_if_ordinary,
+                [operator_symbol] * len(chunks), chunks,
+                )
+
+        # A chunk whose effect can't be used is folded in one element at a
+        # time. (The state in which each chunk is entered is always exactly
+        # that of a serial fold.)
+        state = initial_state
+        for chunk, chunk_effect in zip(chunks, chunk_effects):
+            if chunk_effect is not None:
+                try:
+                    state = apply_chunk_effect(tables, state, chunk, chunk_effect)
+                    continue
+                except ExtraordinaryRealError:
+                    pass
+            state = fold_stepwise(tables, state, chunk)
+
+    return convert_state_to_result(state)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define functions for reading and generating sequences.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def parse_value(
+    text,
+    ):
+    """
+    Converts the text of a single value (a real number, or a symbol as
+    displayed by the CLI or "w") into a lone element.
+    """
+
+    text = text.strip()
+    if text in ("w", "W"):
+        return cfg.tv_sym_pos
+    if text in cfg.symbol_codes:
+        return text
+    return float(text)
+
+
+def read_values(
+    path,
+    ):
+    with open(path, encoding="utf-8") as values_file:
+        return [parse_value(line) for line in values_file if line.strip()]
+
+
+def generate_values(
+    count,
+    seed=0,
+    symbol_share=0.001,
+    symbols=(cfg.tv_sym_pos, cfg.tv_sym_neg, cfg.null_sym),
+    ):
+    """
+    Generates a random sequence of real numbers interspersed with the
+    given symbols.
+    """
+
+    rng = random.Random(seed)
+    return [
+        rng.choice(symbols) if rng.random() < symbol_share
+        else round(rng.uniform(-100.0, 100.0), 2)
+        for _ in range(count)
+        ]
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the comparison of parallel and serial folds.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# Sequences that contain (or whose folds pass through) real numbers that
+# aren't ordinary, or whose real numbers give a different result if they
+# are combined in another order, for which the parallel fold must agree
+# with the serial one.
+check_sequences = [
+    ("+", [1e16, 1.0, 2.0]),
+    ("+", [3e16, -1.0, cfg.tv_sym_pos]),
+    ("+", [9e15, 9e15, 1.0, 2.0]),
+    ("+", [2.5, 1e-05, cfg.tv_sym_neg, 1.0]),
+    ("+", [1.0, 2.0, 0.1, 0.2, -0.3, -3.0, 4.0]),
+    ("+", [1e15, 0.3, 0.3, 0.3, -1e15, 0.1]),
+    ("+", [1.5, 2.5, cfg.null_sym, -4.0, 0.00005, 7.0]),
+    ("*", [1e-05, 1.0, 1.0]),
+    ("*", [0.5, 0.0001, 2.0, 3.0]),
+    ("*", [2.0, 3.0, 1e8, 1e8, cfg.tv_sym_pos]),
+    ("*", [4.0, 0.5, 0.01, 0.01, 0.5, 2.0]),
+    ("*", [1.1, 1.3, 1.7, 1.9, 2.3, 0.7]),
+    ("*", [2.0, cfg.null_sym, 3.0, 1e20]),
+    ]
+
+
+def describe_fold(
+    fold,
+    *arguments,
+    ):
+    """
+    Returns the repr() of the (unformatted) result of a fold, which
+    distinguishes real numbers that differ in any bit, or a description
+    of the error that the fold raised.
+    """
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            return repr(fold(*arguments))
+        except Exception as error:
+            return "error: " + type(error).__name__
+
+
+def generate_magnitude_sequences(
+    count,
+    length=12,
+    seed=0,
+    ):
+    """
+    Generates random sequences whose real numbers span a wide range of
+    magnitudes (and which therefore often aren't ordinary).
+    """
+
+    rng = random.Random(seed)
+    symbols = (cfg.tv_sym_pos, cfg.tv_sym_neg, cfg.null_sym)
+    return [
+        (
+            rng.choice(sorted(fold_operations)),
+            [
+                rng.choice(symbols) if rng.random() < 0.1
+                else rng.choice((-1.0, 1.0)) * 10.0 ** rng.randint(-6, 17)
+                for _ in range(length)
+                ],
+            )
+        for _ in range(count)
+        ]
+
+
+def generate_ordinary_sequences(
+    count,
+    length=300,
+    seed=0,
+    ):
+    """
+    Generates random sequences of ordinary real numbers (with a few
+    symbols), as generate_values() does, whose sums and products depend
+    on the order in which they're rounded.
+    """
+
+    return [
+        (operator_symbol, [
+            value if operator_symbol == "+" or type(value) is not float
+            else 1.0 + value / 1000.0
+            for value in generate_values(length, seed + index, 0.01)
+            ])
+        for index in range(count)
+        for operator_symbol in sorted(fold_operations)
+        ]
+
+
+def compare_folds(
+    random_count=200,
+    ):
+    """
+    Folds each of the check sequences (and some randomly generated ones)
+    serially and in parallel, with chunks of several sizes. Returns a
+    list of (operator, values, chunk_size, serial_result, parallel_result)
+    tuples for the cases in which the results aren't identical.
+    """
+
+    cases = [
+        (operator_symbol, values, chunk_size)
+        for operator_symbol, values in check_sequences
+            + generate_magnitude_sequences(random_count)
+        for chunk_size in (1, 2, 3)
+        ] + [
+        (operator_symbol, values, chunk_size)
+        for operator_symbol, values in generate_ordinary_sequences(5)
+        for chunk_size in (7, 64)
+        ]
+
+    mismatches = []
+    for operator_symbol, values, chunk_size in cases:
+        serial_result = describe_fold(fold_serially, values, operator_symbol)
+        parallel_result = describe_fold(
+            fold_in_parallel, values, operator_symbol, chunk_size, 0
+            )
+        if parallel_result != serial_result:
+            mismatches.append((
+                operator_symbol, values, chunk_size,
+                serial_result, parallel_result,
+                ))
+    return mismatches
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def build_argument_parser():
+    argument_parser = argparse.ArgumentParser(
+        description="Sum or multiply a long sequence of Liniarote values "
+            + "in parallel."
+        )
+    argument_parser.add_argument(
+        "values_file", nargs="?",
+        help="a file containing one value per line (if --random isn't used)",
+        )
+    argument_parser.add_argument("--operator", choices=sorted(fold_operations), default="+")
+    argument_parser.add_argument(
+        "--random", type=int, metavar="COUNT",
+        help="fold a randomly generated sequence of this length instead",
+        )
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--symbol-share", type=float, default=0.001)
+    argument_parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    argument_parser.add_argument("--workers", type=int, default=None)
+    argument_parser.add_argument(
+        "--check", action="store_true",
+        help="also perform a serial fold and check that the results are "
+            + "identical, and compare the two folds on a set of check "
+            + "sequences (including ones of extreme magnitudes)",
+        )
+    return argument_parser
+
+
+def main(argv=None):
+    arguments = build_argument_parser().parse_args(argv)
+    if arguments.random is not None:
+        values = generate_values(arguments.random, arguments.seed, arguments.symbol_share)
+    elif arguments.values_file is not None:
+        values = read_values(arguments.values_file)
+    else:
+        build_argument_parser().error("a values file or --random is required")
+
+    get_transition_tables(arguments.operator)
+    start_time = time.perf_counter()
+    result = fold_in_parallel(
+        values, arguments.operator, arguments.chunk_size, arguments.workers
+        )
+    elapsed_time = time.perf_counter() - start_time
+    print("output =  " + cli.format_result_for_display(result))
+    print(f"values folded:   {len(values)} in {elapsed_time:.3f} s")
+
+    if arguments.check:
+        exit_status = 0
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial_result = fold_serially(values, arguments.operator)
+        elapsed_time = time.perf_counter() - start_time
+        print("serial output =  " + cli.format_result_for_display(serial_result)
+            + f"   ({elapsed_time:.3f} s)")
+        if repr(result) != repr(serial_result):
+            print(f"    the results differ: {result!r} (serially: {serial_result!r})")
+            exit_status = 1
+
+        mismatches = compare_folds()
+        print(f"check sequences folded differently:   {len(mismatches)}")
+        for operator_symbol, values, chunk_size, serial_result, parallel_result \
+                in mismatches:
+            print(f"    {operator_symbol} {values} (chunks of {chunk_size}): "
+                f"{parallel_result} (serially: {serial_result})")
+        if mismatches:
+            exit_status = 1
+        return exit_status
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module provides a hand-written scanner that recognizes the same
+tokens as the CLI's sly-based lexer, as an alternative to it. It makes a
+single pass over the text, classifying each character with a table
+built in advance, and recognizes the transvalent and other symbols
+(including the "w" shorthand) directly from a table of keywords.
+
+The scanner is used instead of the sly-based lexer when
+config.lexer_backend is set to "scanner". Run this module with a corpus
+of expressions to check that both produce the same tokens and to
+compare their speed.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import time
+import argparse
+import contextlib
+import collections
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import third-party modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+from sly.lex import LexError
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+except:
+    import config as cfg
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the character and keyword tables.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# A token, which the parsers treat as they do the sly-based lexer's own
+# tokens.
+ScannedToken = collections.namedtuple(
+    "ScannedToken", ["type", "value", "lineno", "index", "end"]
+    )
+
+# The classes into which characters are sorted.
+IGNORED = 0
+OPERATOR = 1
+DIGIT = 2
+IDENTIFIER_START = 3
+
+# The characters that may begin an identifier (e.g., a constant's name or
+# a symbol such as "Ƿ²"), and those that may only continue one.
+identifier_start_characters = \
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_Ƿ⁻²³⁴Æℝ∅"
+digit_characters = "0123456789"
+
+# The token types of the characters that are tokens in themselves.
+operator_token_types = {
+    "+": "PLUS",
+    "-": "MINUS",
+    "*": "TIMES",
+    "/": "DIVIDE",
+    "^": "POWER",
+    "(": "LPAREN",
+    ")": "RPAREN",
+    }
+
+# The class of each character that can appear in a valid text. (Any other
+# character is illegal.)
+character_classes = {}
+for character in " \t\r\n":
+    character_classes[character] = IGNORED
+for character in operator_token_types:
+    character_classes[character] = OPERATOR
+for character in digit_characters:
+    character_classes[character] = DIGIT
+for character in identifier_start_characters:
+    character_classes[character] = IDENTIFIER_START
+
+# The characters that may continue an identifier.
+identifier_characters = frozenset(identifier_start_characters + digit_characters)
+digits = frozenset(digit_characters)
+
+# The token types of the identifiers that are keywords (i.e., symbols and
+# built-in constants), as in the sly-based lexer's remapping of "ID".
+keyword_token_types = {
+    "w": "TRANSVALENT_SYMBOL_POSITIVE_INPUT",
+    "W": "TRANSVALENT_SYMBOL_POSITIVE_INPUT",
+    cfg.tv_sym_pos: "TRANSVALENT_SYMBOL_POSITIVE_INPUT",
+    cfg.tv_sym_pwr_p2_pos: "TRANSVALENT_SYMBOL_POWER_PLUS_TWO_POSITIVE_INPUT",
+    cfg.tv_sym_pwr_p3_pos: "TRANSVALENT_SYMBOL_POWER_PLUS_THREE_POSITIVE_INPUT",
+    cfg.tv_sym_pwr_p4_pos: "TRANSVALENT_SYMBOL_POWER_PLUS_FOUR_POSITIVE_INPUT",
+    cfg.tv_sym_pwr_m2_pos: "TRANSVALENT_SYMBOL_POWER_MINUS_TWO_POSITIVE_INPUT",
+    cfg.tv_sym_pwr_m3_pos: "TRANSVALENT_SYMBOL_POWER_MINUS_THREE_POSITIVE_INPUT",
+    cfg.real_num_sym_pos: "REAL_NUMBER_POSITIVE_SYMBOL_INPUT",
+    cfg.real_num_sym: "REAL_NUMBER_SYMBOL_INPUT",
+    cfg.null_sym: "NULL_SYMBOL_INPUT",
+    cfg.unimplemented_sym: "UNIMPLEMENTED_SYMBOL_INPUT",
+    "help": "HELP",
+    "pi": "PI_CONSTANT",
+    "e": "E_CONSTANT",
+    }
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the scanner.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class Scanner:
+    """
+    A hand-written scanner that can be used in place of the CLI's
+    LiniaroteLexer.
+    """
+
+    # When a list is assigned to this attribute, illegal characters are
+    # recorded in it (and skipped) rather than raising an exception, as
+    # with LiniaroteLexer.
+    diagnostics = None
+
+
+    def __init__(self):
+        self.text = None
+        self.index = 0
+        self.lineno = 1
+
+
+    def tokenize(self, text, lineno=1, index=0):
+        """
+        Yields the ScannedTokens of a text.
+        """
+
+        self.text = text
+        get_class = character_classes.get
+        length = len(text)
+
+        while index < length:
+            character = text[index]
+            character_class = get_class(character)
+
+            if character_class == IGNORED:
+                index += 1
+
+            elif character_class == OPERATOR:
+                yield ScannedToken(
+                    operator_token_types[character], character, lineno, index, index + 1
+                    )
+                index += 1
+
+            elif character_class == DIGIT:
+                end = index + 1
+                while end < length and text[end] in digits:
+                    end += 1
+                if end < length and text[end] == ".":
+                    end += 1
+                    while end < length and text[end] in digits:
+                        end += 1
+                yield ScannedToken("NUM", text[index:end], lineno, index, end)
+                index = end
+
+            elif character_class == IDENTIFIER_START:
+                end = index + 1
+                while end < length and text[end] in identifier_characters:
+                    end += 1
+                value = text[index:end]
+                yield ScannedToken(
+                    keyword_token_types.get(value, "ID"), value, lineno, index, end
+                    )
+                index = end
+
+            else:
+                self.index = index
+                self.lineno = lineno
+                if self.diagnostics is None:
+                    raise LexError(
+                        f"Illegal character {character!r} at index {index}",
+                        text[index:], index,
+                        )
+                self.diagnostics.append((index, character, "illegal_character"))
+                index += 1
+
+        self.index = index
+        self.lineno = lineno
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the conformance check and benchmark.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def collect_tokens(
+    lexer,
+    text,
+    ):
+    """
+    Returns the tokens of a text as (type, value, lineno, index, end)
+    tuples, along with the illegal characters recorded.
+    """
+
+    lexer.diagnostics = []
+    try:
+        tokens = [
+            (token.type, token.value, token.lineno, token.index, token.end)
+            for token in lexer.tokenize(text)
+            ]
+        return (tokens, lexer.diagnostics)
+    finally:
+        lexer.diagnostics = None
+
+
+def find_nonconforming_texts(
+    texts,
+    sly_lexer,
+    ):
+    """
+    Yields each text for which the scanner and the sly-based lexer
+    produce different tokens (or record different illegal characters).
+    """
+
+    scanner = Scanner()
+    for text in texts:
+        if collect_tokens(scanner, text) != collect_tokens(sly_lexer, text):
+            yield text
+
+
+def measure_tokens_per_second(
+    lexer,
+    texts,
+    repetitions=1,
+    ):
+    """
+    Tokenizes the given texts with a lexer, returning the number of tokens
+    produced per second. (Texts are tokenized up to their first illegal
+    character.)
+    """
+
+    token_count = 0
+    start_time = time.perf_counter()
+    for repetition in range(repetitions):
+        for text in texts:
+            try:
+                for token in lexer.tokenize(text):
+                    token_count += 1
+            except LexError:
+                pass
+    return token_count / max(time.perf_counter() - start_time, 1e-9)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+if __name__ == '__main__':
+
+    # (The CLI is imported here, as it imports this module.)
+    try:
+        from . import cli
+    except:
+        import cli
+
+    argument_parser = argparse.ArgumentParser(
+        description="Compare the hand-written scanner with the sly-based lexer."
+        )
+    argument_parser.add_argument("corpus_file")
+    argument_parser.add_argument("--repetitions", type=int, default=5)
+    arguments = argument_parser.parse_args()
+
+    with open(arguments.corpus_file, encoding="utf-8") as corpus_file:
+        texts = [line.rstrip("\n") for line in corpus_file if line.strip()]
+
+    nonconforming_texts = list(find_nonconforming_texts(texts, cli.LiniaroteLexer()))
+    for text in nonconforming_texts[:10]:
+        print(f"tokens differ: {text}")
+    print(f"texts checked: {len(texts):,}   (differing: {len(nonconforming_texts):,})")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        sly_rate = measure_tokens_per_second(
+            cli.LiniaroteLexer(), texts, arguments.repetitions
+            )
+        scanner_rate = measure_tokens_per_second(
+            Scanner(), texts, arguments.repetitions
+            )
+    print(f"sly lexer:    {sly_rate:12,.0f} tokens/s")
+    print(f"scanner:      {scanner_rate:12,.0f} tokens/s   ({scanner_rate / sly_rate:.2f}×)")
@@ -0,0 +1,699 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module allows Liniarote scripts (i.e., files containing multiple
+statements, assignments to constants, and comments) to be compiled into
+bytecode, which is then executed by a small stack-based virtual machine.
+
+A script is lexed and parsed only once, when it is compiled. Each line
+may contain one or more statements separated by semicolons; text that
+follows a "#" is a comment. A statement is either an assignment (e.g.,
+"m = 5.7" or "r = (m + w) / 0") or an expression, whose result is
+displayed when the script is run.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import os
+import re
+import sys
+import pickle
+import hashlib
+import argparse
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import tree
+    from . import batch
+    from . import truth_tables
+    from . import evaluation_context as ctx
+except:
+    import config as cfg
+    import cli
+    import tree
+    import batch
+    import truth_tables
+    import evaluation_context as ctx
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the instruction set.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# Each instruction consists of an opcode followed by a single argument
+# (which is ignored by instructions that don't need one).
+OP_ADD = 0
+OP_SUBTRACT = 1
+OP_MULTIPLY = 2
+OP_DIVIDE = 3
+OP_POWER = 4
+OP_LOAD_LITERAL = 5
+OP_LOAD_NAME = 6
+OP_STORE_NAME = 7
+OP_NEGATE = 8
+OP_DISPLAY = 9
+OP_HELP = 10
+
+# The binary operators' opcodes are the lowest ones, so that the VM can
+# dispatch them all through a single lookup in this table.
+binary_operator_table = (
+    cli.add_values,
+    cli.subtract_values,
+    cli.multiply_values,
+    cli.divide_values,
+    cli.power_values,
+    )
+
+opcodes_by_operator = {
+    "+": OP_ADD,
+    "-": OP_SUBTRACT,
+    "*": OP_MULTIPLY,
+    "/": OP_DIVIDE,
+    "^": OP_POWER,
+    }
+
+opcode_names = (
+    "ADD",
+    "SUBTRACT",
+    "MULTIPLY",
+    "DIVIDE",
+    "POWER",
+    "LOAD_LITERAL",
+    "LOAD_NAME",
+    "STORE_NAME",
+    "NEGATE",
+    "DISPLAY",
+    "HELP",
+    )
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the compiler.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+assignment_pattern = re.compile(r"^\s*([A-Za-z_]\w*)\s*=(?!=)\s*(.*?)\s*$")
+
+# The names that the lexer always reads as symbols, constants, or
+# keywords (e.g., "w", "pi", or "help"), so that a value assigned to one
+# of them could never be read.
+reserved_names = frozenset(
+    name for token_type, name in cli.LiniaroteLexer._remap
+    if token_type == "ID"
+    )
+
+
+class CompiledScript:
+    """
+    The bytecode generated for a script, together with the tables of
+    literal values and constant names that its instructions refer to.
+    """
+
+    def __init__(self, code, literals, names, source_lines):
+        """
+        Stores the flat sequence of (opcode, argument) pairs, the literal
+        values, the names of constants, and the number of the source line
+        of each DISPLAY instruction.
+        """
+
+        self.code = code
+        self.literals = literals
+        self.names = names
+        self.source_lines = source_lines
+
+
+    def __setstate__(self, state):
+        """
+        Restores an unpickled script (e.g., one sent to a worker process),
+        replacing its symbolic literals with the CLI's canonical instances.
+        """
+        self.__dict__.update(state)
+        self.literals = tuple(cli.intern_value(value) for value in self.literals)
+
+
+class ScriptCompiler:
+    """
+    Translates the statements of a script into bytecode.
+    """
+
+    def __init__(self):
+        self.code = []
+        self.literals = []
+        self.literal_indices = {}
+        self.names = []
+        self.name_indices = {}
+        self.source_lines = []
+
+
+    def add_instruction(self, opcode, argument=0):
+        self.code.append(opcode)
+        self.code.append(argument)
+
+
+    def get_literal_index(self, value):
+        """
+        Returns the index of a literal value in the table of literals,
+        adding it to the table if necessary.
+        """
+
+        # The type is included in the key so that (e.g.) 0.0 and -0.0 or
+        # 1.0 and 1 aren't merged.
+        key = (type(value), repr(value))
+        if key not in self.literal_indices:
+            self.literal_indices[key] = len(self.literals)
+            self.literals.append(value)
+        return self.literal_indices[key]
+
+
+    def get_name_index(self, name):
+        """
+        Returns the index of a constant's name in the table of names,
+        adding it to the table if necessary.
+        """
+
+        if name not in self.name_indices:
+            self.name_indices[name] = len(self.names)
+            self.names.append(name)
+        return self.name_indices[name]
+
+
+    def compile_statement(self, text, line_number):
+        """
+        Compiles a single statement (an assignment or an expression).
+        """
+
+        match = assignment_pattern.match(text)
+        if match is not None:
+            target_name, expression_text = match.groups()
+            if target_name in reserved_names:
+                raise SyntaxError(
+                    f"Line {line_number}: a value can't be assigned to "
+                    + f"\"{target_name}\", which is a reserved symbol or name"
+                    )
+        else:
+            target_name, expression_text = None, text
+
+        expression_tree = tree.parse_expression_to_tree(expression_text)
+        if expression_tree is None:
+            raise SyntaxError(
+                f"Line {line_number}: no statement could be recognized in: "
+                + text.strip()
+                )
+        self.compile_node(fold_literal_subtrees(expression_tree))
+
+        if target_name is not None:
+            self.add_instruction(OP_STORE_NAME, self.get_name_index(target_name))
+        else:
+            self.add_instruction(OP_DISPLAY, len(self.source_lines))
+            self.source_lines.append(line_number)
+
+
+    def compile_node(self, node):
+        """
+        Generates the instructions that push the value of the given node
+        onto the VM's stack.
+        """
+
+        node_type = type(node)
+
+        if node_type is tree.BinaryOperation:
+            self.compile_node(node.left)
+            self.compile_node(node.right)
+            self.add_instruction(opcodes_by_operator[node.operator])
+        elif node_type is tree.Number:
+            self.add_instruction(OP_LOAD_LITERAL, self.get_literal_index(node.value))
+        elif node_type is tree.Symbol:
+            self.add_instruction(OP_LOAD_LITERAL, self.get_literal_index(node.symbol))
+        elif node_type is tree.Negation:
+            self.compile_node(node.operand)
+            self.add_instruction(OP_NEGATE)
+        elif node_type is tree.Constant:
+            self.add_instruction(OP_LOAD_NAME, self.get_name_index(node.name))
+        elif node_type is tree.HelpRequest:
+            self.add_instruction(OP_HELP)
+        else:
+            # The node is a value that was calculated in advance.
+            self.add_instruction(OP_LOAD_LITERAL, self.get_literal_index(node))
+
+
+    def finish(self):
+        return CompiledScript(
+            tuple(self.code),
+            tuple(self.literals),
+            tuple(self.names),
+            tuple(self.source_lines),
+            )
+
+
+def fold_literal_subtrees(
+    node,
+    ):
+    """
+    Replaces each subtree that involves no constants with its value, so
+    that the operations that it contains are performed only once, when
+    the script is compiled. (A subtree whose evaluation raises an
+    exception is left in place, so that the exception is raised when
+    the script is run.)
+    """
+
+    node_type = type(node)
+
+    if node_type is tree.BinaryOperation:
+        left = fold_literal_subtrees(node.left)
+        right = fold_literal_subtrees(node.right)
+        node = tree.BinaryOperation(node.operator, left, right)
+        if is_folded_value(left) and is_folded_value(right):
+            try:
+                return tree.binary_operations[node.operator](
+                    get_folded_value(left), get_folded_value(right)
+                    )
+            except Exception:
+                return node
+        return node
+    elif node_type is tree.Negation:
+        operand = fold_literal_subtrees(node.operand)
+        node = tree.Negation(operand)
+        if is_folded_value(operand):
+            try:
+                return cli.negate_value(get_folded_value(operand))
+            except Exception:
+                return node
+        return node
+    return node
+
+
+# The types of tree nodes that don't represent (known) values.
+unfoldable_node_types = (
+    tree.BinaryOperation,
+    tree.Negation,
+    tree.Constant,
+    tree.HelpRequest,
+    )
+
+
+def is_folded_value(node):
+    return not isinstance(node, unfoldable_node_types)
+
+
+def get_folded_value(node):
+    node_type = type(node)
+    if node_type is tree.Number:
+        return node.value
+    elif node_type is tree.Symbol:
+        return node.symbol
+    return node
+
+
+def split_script_into_statements(
+    script_text,
+    ):
+    """
+    Yields the (line_number, statement_text) of each statement in a
+    script, skipping comments and blank statements.
+    """
+
+    for line_number, line in enumerate(script_text.splitlines(), start=1):
+        line = line.partition("#")[0]
+        for statement_text in line.split(";"):
+            if statement_text.strip():
+                yield (line_number, statement_text)
+
+
+def compile_script(
+    script_text,
+    ):
+    """
+    Compiles the text of a script into a CompiledScript.
+    """
+
+    compiler = ScriptCompiler()
+    for line_number, statement_text in split_script_into_statements(script_text):
+        compiler.compile_statement(statement_text, line_number)
+    return compiler.finish()
+
+
+def disassemble(
+    compiled_script,
+    ):
+    """
+    Returns a human-readable listing of a compiled script's bytecode.
+    """
+
+    listing = []
+    code = compiled_script.code
+    for position in range(0, len(code), 2):
+        opcode, argument = code[position], code[position + 1]
+        if opcode == OP_LOAD_LITERAL:
+            description = repr(compiled_script.literals[argument])
+        elif opcode in (OP_LOAD_NAME, OP_STORE_NAME):
+            description = compiled_script.names[argument]
+        elif opcode == OP_DISPLAY:
+            description = f"line {compiled_script.source_lines[argument]}"
+        else:
+            description = ""
+        listing.append(
+            f"{position // 2:>6}  {opcode_names[opcode]:<14}{description}"
+            )
+    return "\n".join(listing)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the compiled-script cache files.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# A compiled script is saved (as a pickled tuple of its bytecode and
+# tables, so that the file doesn't depend on the name under which this
+# module was imported) in a ".lrc" file alongside its source file, so that later runs needn't lex and
+# parse the script again. The file begins with this marker, followed by
+# the cache key (a SHA-256 digest) of the script from which it was
+# compiled; it is used only if the key of the current script matches.
+# The version number must be increased whenever the layout of the file
+# or the behaviour of the virtual machine's instructions changes.
+compiled_file_format_version = 3
+compiled_file_marker = b"LRC" + bytes([compiled_file_format_version])
+compiled_file_extension = ".lrc"
+
+# The key depends on the format version, on the grammar, on the axioms,
+# and on the operator functions (as literal subtrees are folded when a
+# script is compiled). Their fingerprints are computed the first time
+# that they're needed.
+fingerprints = None
+
+
+def compute_grammar_fingerprint():
+    """
+    Returns a hash of the grammar: the tree parser's productions and
+    precedence rules, the lexer's token patterns and keywords, and the
+    instruction set.
+    """
+
+    fingerprint = hashlib.sha256()
+    for production in tree.LiniaroteTreeParser._grammar.Productions:
+        fingerprint.update(str(production).encode("utf-8") + b"\n")
+    fingerprint.update(repr(tree.LiniaroteTreeParser.precedence).encode("utf-8"))
+    fingerprint.update(cli.LiniaroteLexer._master_re.pattern.encode("utf-8"))
+    fingerprint.update(repr(sorted(cli.LiniaroteLexer._remap.items())).encode("utf-8"))
+    fingerprint.update(repr(opcode_names).encode("utf-8"))
+    return fingerprint.digest()
+
+
+def compute_axiom_fingerprint():
+    """
+    Returns a hash of the golden truth tables, which record the results
+    of the operations for every class of operand.
+    """
+
+    with open(truth_tables.golden_tables_path, "rb") as golden_file:
+        return hashlib.sha256(golden_file.read()).digest()
+
+
+def compute_operator_fingerprint():
+    """
+    Returns a hash of the source of the module that defines the operator
+    functions (cli.py), which calculate the folded literals. (A change in
+    an operator function needn't be reflected in the golden truth tables
+    until they are regenerated.)
+    """
+
+    with open(cli.__file__, "rb") as operator_file:
+        return hashlib.sha256(operator_file.read()).digest()
+
+
+def get_fingerprints():
+    global fingerprints
+    if fingerprints is None:
+        fingerprints = (
+            compiled_file_format_version.to_bytes(4, "big"),
+            compute_grammar_fingerprint(),
+            compute_axiom_fingerprint(),
+            compute_operator_fingerprint(),
+            )
+    return fingerprints
+
+
+def compute_cache_key(
+    script_text,
+    ):
+    """
+    Returns the cache key of a script: a digest of its source text, the
+    format version, and the grammar, axiom, and operator fingerprints.
+    """
+
+    key = hashlib.sha256()
+    for fingerprint in get_fingerprints():
+        key.update(fingerprint)
+    key.update(script_text.encode("utf-8"))
+    return key.digest()
+
+
+def get_compiled_file_path(
+    script_path,
+    ):
+    return os.path.splitext(script_path)[0] + compiled_file_extension
+
+
+def read_compiled_file(
+    compiled_path,
+    cache_key,
+    ):
+    """
+    Returns the CompiledScript saved in a .lrc file, or None if the file
+    doesn't exist, can't be read, or was compiled from a different script
+    (or with a different format version, grammar, axioms, or operator
+    functions).
+    """
+
+    try:
+        with open(compiled_path, "rb") as compiled_file:
+            header = compiled_file.read(len(compiled_file_marker) + len(cache_key))
+            if header != compiled_file_marker + cache_key:
+                return None
+            code, literals, names, source_lines = pickle.load(compiled_file)
+            return CompiledScript(
+                code,
+                tuple(cli.intern_value(value) for value in literals),
+                names,
+                source_lines,
+                )
+    except Exception:
+        # A cache file is never essential: whatever the reason that it
+        # can't be read (e.g., a corrupted or foreign file, whose
+        # unpickling may raise any exception), the script is simply
+        # compiled again.
+        return None
+
+
+def write_compiled_file(
+    compiled_path,
+    cache_key,
+    compiled_script,
+    ):
+    """
+    Saves a CompiledScript in a .lrc file. (The file is written under a
+    temporary name and then renamed, so that a concurrent reader never
+    sees a partly written file. A file that can't be written is simply
+    skipped.)
+    """
+
+    temporary_path = f"{compiled_path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as compiled_file:
+            compiled_file.write(compiled_file_marker + cache_key)
+            pickle.dump((
+                compiled_script.code,
+                compiled_script.literals,
+                compiled_script.names,
+                compiled_script.source_lines,
+                ), compiled_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, compiled_path)
+    except OSError:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+
+
+def load_compiled_script(
+    script_path,
+    use_cache=True,
+    ):
+    """
+    Returns the CompiledScript for a script file, loading it from the
+    script's .lrc file if that is up to date, and otherwise compiling the
+    script (and, if use_cache is True, saving the result in the .lrc
+    file).
+    """
+
+    with open(script_path, encoding="utf-8") as script_file:
+        script_text = script_file.read()
+    if not use_cache:
+        return compile_script(script_text)
+
+    compiled_path = get_compiled_file_path(script_path)
+    cache_key = compute_cache_key(script_text)
+    compiled_script = read_compiled_file(compiled_path, cache_key)
+    if compiled_script is None:
+        compiled_script = compile_script(script_text)
+        write_compiled_file(compiled_path, cache_key, compiled_script)
+    return compiled_script
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the virtual machine.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The marker held in the slot of a constant that has no value yet.
+unset_slot = object()
+
+
+def run_compiled_script(
+    compiled_script,
+    constants=None,
+    display_result=None,
+    ):
+    """
+    Executes a compiled script. Constants that are used before being
+    assigned a value in the script are looked up in the given dictionary
+    (by default, the constants of the current evaluation context), and
+    the user is asked for the value of any constant not found there
+    (unless the context doesn't permit this). The function
+    display_result(line_number, result) is called for each expression
+    statement. Returns a dictionary of the values of all constants named
+    in the script.
+    """
+
+    if constants is None:
+        context = ctx.get_current_context()
+        constants = context.constants
+        get_value_of_constant = context.get_value_of_constant
+    else:
+        def get_value_of_constant(name):
+            return tree.get_value_of_constant(name, constants)
+    if display_result is None:
+        display_result = print_result
+
+    code = compiled_script.code
+    literals = compiled_script.literals
+    names = compiled_script.names
+    source_lines = compiled_script.source_lines
+
+    # The value of each named constant is held in a slot.
+    unset = unset_slot
+    slots = [constants.get(name, unset) for name in names]
+
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    code_length = len(code)
+    position = 0
+
+    while position < code_length:
+        opcode = code[position]
+        argument = code[position + 1]
+        position += 2
+
+        if opcode <= OP_POWER:
+            right_value = pop()
+            stack[-1] = binary_operator_table[opcode](stack[-1], right_value)
+        elif opcode == OP_LOAD_LITERAL:
+            push(literals[argument])
+        elif opcode == OP_LOAD_NAME:
+            value = slots[argument]
+            if value is unset:
+                value = get_value_of_constant(names[argument])
+                slots[argument] = value
+            push(value)
+        elif opcode == OP_STORE_NAME:
+            slots[argument] = pop()
+        elif opcode == OP_NEGATE:
+            stack[-1] = cli.negate_value(stack[-1])
+        elif opcode == OP_DISPLAY:
+            display_result(source_lines[argument], pop())
+        elif opcode == OP_HELP:
+            push(cli.print_help_text())
+
+    final_values = {}
+    for index, name in enumerate(names):
+        if slots[index] is not unset:
+            final_values[name] = slots[index]
+    return final_values
+
+
+def print_result(
+    line_number,
+    result,
+    ):
+    """
+    Displays the result of an expression statement in the same manner
+    as the CLI's command prompt.
+    """
+    print(f"[line {line_number}]  output =  " + cli.format_result_for_display(result))
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+if __name__ == '__main__':
+
+    argument_parser = argparse.ArgumentParser(
+        description="Compile and run a Liniarote script."
+        )
+    argument_parser.add_argument("script_file")
+    argument_parser.add_argument(
+        "--constant", type=batch.parse_constant_assignment, action="append",
+        default=[],
+        help="assign a value to a constant before running (e.g., m=5.7)",
+        )
+    argument_parser.add_argument(
+        "--disassemble", action="store_true",
+        help="display the compiled bytecode instead of running the script",
+        )
+    argument_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="compile the script without reading or writing its .lrc file",
+        )
+    arguments = argument_parser.parse_args()
+
+    for name, value in arguments.constant:
+        cfg.recognized_constants[name] = value
+
+    try:
+        compiled_script = load_compiled_script(
+            arguments.script_file, not arguments.no_cache
+            )
+    except SyntaxError as error:
+        print(cfg.output_spacer + str(error), file=sys.stderr)
+        sys.exit(1)
+
+    if arguments.disassemble:
+        print(disassemble(compiled_script))
+    else:
+        try:
+            run_compiled_script(compiled_script)
+        except Exception as error:
+            print(cfg.output_spacer \
+                + f"A problem occurred while running the script: {error!r}",
+                file=sys.stderr)
+            sys.exit(1)
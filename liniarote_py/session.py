@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module allows expressions to be saved under a name during an
+interactive session. The session keeps track of which saved expressions
+depend on which constants; when a constant is redefined, only the
+expressions that use it (and, within them, only the subexpressions that
+use it) are recalculated.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import re
+import concurrent.futures
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import tree
+    from . import evaluation_context as ctx
+    from . import metrics
+except:
+    import config as cfg
+    import cli
+    import tree
+    import evaluation_context as ctx
+    import metrics
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define saved expressions.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class SavedExpression:
+    """
+    An expression saved under a name, together with the cached value of
+    each of its subexpressions.
+    """
+
+    def __init__(self, name, text, expression_tree):
+        """
+        Stores the expression and determines which constants are used by
+        each of its subexpressions.
+        """
+
+        self.name = name
+        self.text = text
+        self.expression_tree = expression_tree
+        self.result = None
+
+        # Both of these dictionaries are keyed by the id() of a node in
+        # the tree (which remains alive as long as the tree does).
+        self.constants_used_by_node = {}
+        self.cached_values = {}
+        self.record_constants_used(expression_tree)
+
+
+    def record_constants_used(self, node):
+        """
+        Records (and returns) the set of constants used by the given node
+        and each of its descendants.
+        """
+
+        if type(node) is tree.Constant:
+            constants_used = frozenset((node.name,))
+        else:
+            constants_used = frozenset()
+            for child_node in tree.get_child_nodes(node):
+                constants_used = constants_used \
+                    | self.record_constants_used(child_node)
+
+        self.constants_used_by_node[id(node)] = constants_used
+        return constants_used
+
+
+    @property
+    def constants_used(self):
+        return self.constants_used_by_node[id(self.expression_tree)]
+
+
+    def evaluate(self, constants=None, changed_constant=None):
+        """
+        Evaluates the expression, reusing the cached value of every
+        subexpression that doesn't use the changed constant. (If no
+        constant is given, every subexpression is evaluated.) Constants
+        are taken from the given dictionary or, by default, from the
+        current evaluation context. Returns a (result, nodes_recomputed,
+        subtrees_reused) tuple.
+        """
+
+        counts = [0, 0]
+        self.result = self.evaluate_node(
+            self.expression_tree, constants, changed_constant, counts
+            )
+        return (self.result, counts[0], counts[1])
+
+
+    def evaluate_node(self, node, constants, changed_constant, counts):
+        """
+        Evaluates a single node of the tree (see evaluate()).
+        """
+
+        node_id = id(node)
+        if (changed_constant is not None) \
+                and (node_id in self.cached_values) \
+                and (changed_constant not in self.constants_used_by_node[node_id]):
+            counts[1] += 1
+            return self.cached_values[node_id]
+
+        counts[0] += 1
+        node_type = type(node)
+
+        if node_type is tree.BinaryOperation:
+            left_value = self.evaluate_node(
+                node.left, constants, changed_constant, counts
+                )
+            right_value = self.evaluate_node(
+                node.right, constants, changed_constant, counts
+                )
+            value = tree.binary_operations[node.operator](
+                left_value, right_value
+                )
+        elif node_type is tree.Negation:
+            value = cli.negate_value(self.evaluate_node(
+                node.operand, constants, changed_constant, counts
+                ))
+        else:
+            value = tree.evaluate_tree(node, constants)
+
+        self.cached_values[node_id] = value
+        return value
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the session.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class ExpressionSession:
+    """
+    The saved expressions of an interactive session, along with a graph
+    recording which expressions depend on each constant.
+    """
+
+    def __init__(self, context=None):
+        """
+        Creates an empty session that evaluates its expressions within the
+        given evaluation context (by default, the current one).
+        """
+
+        if context is None:
+            context = ctx.get_current_context()
+        self.context = context
+        self.saved_expressions = {}
+        self.dependent_expressions = {}
+
+
+    def save_expression(self, name, text):
+        """
+        Parses, evaluates, and saves an expression under the given name
+        (replacing any expression previously saved under that name).
+        Returns the SavedExpression.
+        """
+
+        expression_tree = tree.parse_expression_to_tree(text)
+        if expression_tree is None:
+            raise ValueError(f"No expression could be recognized in: {text}")
+
+        self.remove_expression(name)
+        saved_expression = SavedExpression(name, text, expression_tree)
+        with ctx.use_context(self.context):
+            saved_expression.evaluate()
+
+        self.saved_expressions[name] = saved_expression
+        for constant_name in saved_expression.constants_used:
+            self.dependent_expressions.setdefault(constant_name, set()).add(name)
+        return saved_expression
+
+
+    def remove_expression(self, name):
+        """
+        Removes a saved expression (if there is one with the given name)
+        from the session and from the dependency graph.
+        """
+
+        saved_expression = self.saved_expressions.pop(name, None)
+        if saved_expression is None:
+            return
+        for constant_name in saved_expression.constants_used:
+            self.dependent_expressions.get(constant_name, set()).discard(name)
+
+
+    def set_constant(self, constant_name, value):
+        """
+        Assigns a new value to a constant and recalculates the saved
+        expressions that depend on it. Returns a list of (name, result,
+        nodes_recomputed, subtrees_reused) tuples for the recalculated
+        expressions and a list of the names of the expressions whose
+        results were reused unchanged.
+        """
+
+        self.context.constants[constant_name] = float(value)
+
+        affected_names = sorted(
+            self.dependent_expressions.get(constant_name, ())
+            )
+        recalculated = []
+        for name in affected_names:
+            with ctx.use_context(self.context):
+                result, nodes_recomputed, subtrees_reused = \
+                    self.saved_expressions[name].evaluate(None, constant_name)
+            recalculated.append(
+                (name, result, nodes_recomputed, subtrees_reused)
+                )
+
+        reused_names = sorted(
+            name for name in self.saved_expressions
+            if name not in affected_names
+            )
+        return (recalculated, reused_names)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the session commands available at the command prompt.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+assignment_pattern = re.compile(r"^\s*([A-Za-z_]\w*)\s*=\s*(.+?)\s*$")
+
+session_command_help = \
+""":save NAME = EXPRESSION   save (and evaluate) an expression under a name
+:set NAME = VALUE         assign a new value to a constant and recalculate
+                          the saved expressions that depend on it
+:show                     display the saved expressions and their results
+:stats                    display the run-time metrics (expressions evaluated,
+                          latencies, errors, and subordinate parses) and
+                          write them to the metrics file, if one is set"""
+
+
+def process_session_command(
+    session,
+    command_text,
+    ):
+    """
+    Carries out a session command entered at the command prompt (e.g.,
+    ":save r = (m + w) / 0" or ":set m = 5.7") and returns the text to be
+    displayed in response.
+    """
+
+    command, separator, argument_text = command_text.strip().partition(" ")
+
+    if command == ":save":
+        match = assignment_pattern.match(argument_text)
+        if match is None:
+            return "Usage: :save NAME = EXPRESSION"
+        try:
+            saved_expression = session.save_expression(*match.groups())
+        except ValueError as error:
+            return cfg.output_spacer + str(error)
+        return f"{saved_expression.name} = " \
+            + str(cli.format_result_for_display(saved_expression.result))
+
+    elif command == ":set":
+        match = assignment_pattern.match(argument_text)
+        if match is None:
+            return "Usage: :set NAME = VALUE"
+        try:
+            recalculated, reused_names = session.set_constant(*match.groups())
+        except ValueError:
+            return cfg.output_spacer \
+                + f"The value of a constant must be a real number: {match.group(2)}"
+
+        response_lines = []
+        for name, result, nodes_recomputed, subtrees_reused in recalculated:
+            response_lines.append(
+                f"recomputed: {name} = "
+                + str(cli.format_result_for_display(result))
+                + f"   ({nodes_recomputed} nodes recomputed,"
+                + f" {subtrees_reused} subexpressions reused)"
+                )
+        if reused_names:
+            response_lines.append("reused:     " + ", ".join(reused_names))
+        if not response_lines:
+            response_lines.append(f"{match.group(1)} = {float(match.group(2))}")
+        return "\n".join(response_lines)
+
+    elif command == ":show":
+        if not session.saved_expressions:
+            return "No expressions have been saved."
+        return "\n".join(
+            f"{name} = {saved_expression.text}   -> "
+            + str(cli.format_result_for_display(saved_expression.result))
+            for name, saved_expression in sorted(
+                session.saved_expressions.items()
+                )
+            )
+
+    elif command == ":stats":
+        metrics.runtime_metrics.write_configured_file()
+        return metrics.runtime_metrics.format_statistics()
+
+    return session_command_help
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the concurrent evaluation of separate sessions.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def evaluate_concurrently(
+    jobs,
+    max_workers=None,
+    ):
+    """
+    Evaluates each (context, text) pair in the given list using a pool of
+    threads, returning the unformatted results in the same order. As each
+    evaluation runs within its own context, evaluations in different
+    contexts don't affect one another (and no locks are needed).
+    """
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(cli.evaluate_text, text, context)
+            for context, text in jobs
+            ]
+        return [future.result() for future in futures]
@@ -0,0 +1,493 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module defines expression trees: an immutable representation of a
+parsed Liniarote expression that (unlike the results generated by the
+CLI's parser) can be stored and evaluated repeatedly, e.g., after the
+value of a constant has changed.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import math
+import collections
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import third-party modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+from sly import Parser
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import evaluation_context as ctx
+except:
+    import config as cfg
+    import cli
+    import evaluation_context as ctx
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the types of tree nodes.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# A real number (including the built-in constants "pi" and "e").
+Number = collections.namedtuple("Number", ["value"])
+
+# A transvalent or other special symbol (e.g., "Ƿ²" or "Æ").
+Symbol = collections.namedtuple("Symbol", ["symbol"])
+
+# A user-created constant (e.g., "m"), whose value is looked up
+# whenever the tree is evaluated.
+Constant = collections.namedtuple("Constant", ["name"])
+
+# The application of a unary minus sign.
+Negation = collections.namedtuple("Negation", ["operand"])
+
+# The application of one of the operators "+", "-", "*", "/", or "^".
+BinaryOperation = collections.namedtuple(
+    "BinaryOperation", ["operator", "left", "right"]
+    )
+
+# A request for the help text.
+HelpRequest = collections.namedtuple("HelpRequest", [])
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the tree-building parser.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class LiniaroteTreeParser(Parser):
+    """
+    A parser that accepts the same grammar as the CLI's parser but, rather
+    than evaluating expressions, builds an expression tree for them.
+    """
+
+    tokens = cli.LiniaroteLexer.tokens
+
+    # The order of operations matches that of the CLI's parser.
+    precedence = (
+        ('left', PLUS, MINUS),
+        ('left', TIMES, DIVIDE),
+        ('right', UMINUS),
+        ('right', POWER),
+        )
+
+
+    @_('HELP')
+    def expr(self, p):
+        return HelpRequest()
+
+
+    @_('PI_CONSTANT')
+    def expr(self, p):
+        return Number(math.pi)
+
+
+    @_('E_CONSTANT')
+    def expr(self, p):
+        return Number(math.e)
+
+
+    # As with the CLI's parser, parse errors are recorded in this list
+    # (when one is assigned) rather than displayed.
+    diagnostics = None
+
+
+    def error(self, p):
+        """
+        Displays an error message if poorly formulated input is detected,
+        in the same manner as the CLI's parser.
+        """
+
+        if self.diagnostics is not None:
+            if p is None:
+                self.diagnostics.append((None, None, "unexpected_end_of_input"))
+            else:
+                self.diagnostics.append((p.index, p.value, "unexpected_token"))
+            return
+
+        print(cfg.output_spacer \
+            + "A poorly formulated input statement has been detected.")
+        print(cfg.output_spacer \
+            + "A (possibly misguided) attempt will be made to interpret it.")
+
+
+    @_('MINUS expr %prec UMINUS')
+    def expr(self, p):
+        return Negation(p.expr)
+
+
+    @_('expr MINUS expr')
+    def expr(self, p):
+        return BinaryOperation("-", p.expr0, p.expr1)
+
+
+    @_('expr PLUS expr')
+    def expr(self, p):
+        return BinaryOperation("+", p.expr0, p.expr1)
+
+
+    @_('term')
+    def expr(self, p):
+        return p.term
+
+
+    @_('expr TIMES expr')
+    def expr(self, p):
+        return BinaryOperation("*", p.expr0, p.expr1)
+
+
+    @_('expr DIVIDE expr')
+    def expr(self, p):
+        return BinaryOperation("/", p.expr0, p.expr1)
+
+
+    @_('expr POWER expr')
+    def expr(self, p):
+        return BinaryOperation("^", p.expr0, p.expr1)
+
+
+    @_('factor')
+    def term(self, p):
+        return p.factor
+
+
+    @_('LPAREN expr RPAREN')
+    def factor(self, p):
+        return p.expr
+
+
+    @_('NUM')
+    def factor(self, p):
+        return Number(float(p.NUM))
+
+
+    @_('TRANSVALENT_SYMBOL_POSITIVE_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.tv_sym_pos)
+
+
+    @_('TRANSVALENT_SYMBOL_POWER_PLUS_TWO_POSITIVE_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.tv_sym_pwr_p2_pos)
+
+
+    @_('TRANSVALENT_SYMBOL_POWER_PLUS_THREE_POSITIVE_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.tv_sym_pwr_p3_pos)
+
+
+    @_('TRANSVALENT_SYMBOL_POWER_PLUS_FOUR_POSITIVE_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.tv_sym_pwr_p4_pos)
+
+
+    @_('TRANSVALENT_SYMBOL_POWER_MINUS_TWO_POSITIVE_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.tv_sym_pwr_m2_pos)
+
+
+    @_('TRANSVALENT_SYMBOL_POWER_MINUS_THREE_POSITIVE_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.tv_sym_pwr_m3_pos)
+
+
+    @_('REAL_NUMBER_POSITIVE_SYMBOL_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.real_num_sym_pos)
+
+
+    @_('REAL_NUMBER_SYMBOL_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.real_num_sym)
+
+
+    @_('NULL_SYMBOL_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.null_sym)
+
+
+    @_('UNIMPLEMENTED_SYMBOL_INPUT')
+    def factor(self, p):
+        return Symbol(cfg.unimplemented_sym)
+
+
+    @_('ID')
+    def factor(self, p):
+        return Constant(p.ID)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the precedence-climbing (Pratt) parser.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The binding powers of the binary operators, which follow the order of
+# operations of the CLI's parser. All of them are left-associative except
+# exponentiation, which is right-associative (and binds more tightly than
+# a unary minus sign).
+binary_binding_powers = {
+    "PLUS": 10,
+    "MINUS": 10,
+    "TIMES": 20,
+    "DIVIDE": 20,
+    "POWER": 40,
+    }
+unary_minus_binding_power = 30
+right_associative_operators = {"POWER"}
+
+binary_operators = {
+    "PLUS": "+",
+    "MINUS": "-",
+    "TIMES": "*",
+    "DIVIDE": "/",
+    "POWER": "^",
+    }
+
+# The nodes for the tokens that don't depend on the token's text. (As the
+# nodes are immutable, every tree shares these instances.)
+leaf_nodes = {
+    "TRANSVALENT_SYMBOL_POSITIVE_INPUT": Symbol(cfg.tv_sym_pos),
+    "TRANSVALENT_SYMBOL_POWER_PLUS_TWO_POSITIVE_INPUT": Symbol(cfg.tv_sym_pwr_p2_pos),
+    "TRANSVALENT_SYMBOL_POWER_PLUS_THREE_POSITIVE_INPUT": Symbol(cfg.tv_sym_pwr_p3_pos),
+    "TRANSVALENT_SYMBOL_POWER_PLUS_FOUR_POSITIVE_INPUT": Symbol(cfg.tv_sym_pwr_p4_pos),
+    "TRANSVALENT_SYMBOL_POWER_MINUS_TWO_POSITIVE_INPUT": Symbol(cfg.tv_sym_pwr_m2_pos),
+    "TRANSVALENT_SYMBOL_POWER_MINUS_THREE_POSITIVE_INPUT": Symbol(cfg.tv_sym_pwr_m3_pos),
+    "REAL_NUMBER_POSITIVE_SYMBOL_INPUT": Symbol(cfg.real_num_sym_pos),
+    "REAL_NUMBER_SYMBOL_INPUT": Symbol(cfg.real_num_sym),
+    "NULL_SYMBOL_INPUT": Symbol(cfg.null_sym),
+    "UNIMPLEMENTED_SYMBOL_INPUT": Symbol(cfg.unimplemented_sym),
+    "PI_CONSTANT": Number(math.pi),
+    "E_CONSTANT": Number(math.e),
+    "HELP": HelpRequest(),
+    }
+
+
+class PrattParseFailure(Exception):
+    """
+    Raised when the precedence-climbing parser finds input that isn't a
+    well-formed expression.
+    """
+
+
+def parse_tokens_with_precedence(
+    tokens,
+    ):
+    """
+    Builds the expression tree for a sequence of tokens by precedence
+    climbing, without side effects. Raises PrattParseFailure if the
+    tokens don't form a well-formed expression.
+    """
+
+    tokens = tuple(tokens)
+    token_count = len(tokens)
+    position = 0
+
+    def parse_expression(minimum_binding_power):
+        nonlocal position
+
+        if position >= token_count:
+            raise PrattParseFailure()
+        token = tokens[position]
+        token_type = token.type
+        position += 1
+
+        if token_type == "NUM":
+            left = Number(float(token.value))
+        elif token_type == "ID":
+            left = Constant(token.value)
+        elif token_type == "MINUS":
+            left = Negation(parse_expression(unary_minus_binding_power))
+        elif token_type == "LPAREN":
+            left = parse_expression(0)
+            if position >= token_count or tokens[position].type != "RPAREN":
+                raise PrattParseFailure()
+            position += 1
+        else:
+            left = leaf_nodes.get(token_type)
+            if left is None:
+                raise PrattParseFailure()
+
+        while position < token_count:
+            token_type = tokens[position].type
+            binding_power = binary_binding_powers.get(token_type)
+            if binding_power is None or binding_power <= minimum_binding_power:
+                break
+            position += 1
+            if token_type in right_associative_operators:
+                right = parse_expression(binding_power - 1)
+            else:
+                right = parse_expression(binding_power)
+            left = BinaryOperation(binary_operators[token_type], left, right)
+        return left
+
+    expression_tree = parse_expression(0)
+    if position != token_count:
+        raise PrattParseFailure()
+    return expression_tree
+
+
+def parse_expression_to_tree(
+    text,
+    ):
+    """
+    Lexes and parses the given text, returning its expression tree (or
+    None if no expression could be recognized). If config.parser_backend
+    is "pratt", the precedence-climbing parser is used; input that it
+    can't parse is passed to the sly-based parser, so that poorly
+    formulated input is handled exactly as before.
+    """
+
+    if cfg.parser_backend == "pratt":
+        try:
+            return parse_tokens_with_precedence(
+                cli.token_stream_cache.get_tokens(text)
+                )
+        except (PrattParseFailure, cli.LexError):
+            pass
+    tokens = cli.tokenize_with_cache(text)
+    return LiniaroteTreeParser().parse(tokens)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define functions for evaluating and analyzing trees.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The functions that perform the operations represented by
+# BinaryOperation nodes.
+binary_operations = {
+    "+": cli.add_values,
+    "-": cli.subtract_values,
+    "*": cli.multiply_values,
+    "/": cli.divide_values,
+    "^": cli.power_values,
+    }
+
+
+def get_value_of_constant(
+    name,
+    constants=None,
+    ):
+    """
+    Returns the value of a user-created constant from the given
+    dictionary (by default, from the current evaluation context). As at
+    the CLI's command prompt, the user is asked for the value of a
+    constant that hasn't yet been assigned one.
+    """
+
+    if constants is None:
+        return ctx.get_current_context().get_value_of_constant(name)
+    if name not in constants:
+        constants[name] = \
+            float(input(f"Please enter the desired value for {name}: "))
+    return constants[name]
+
+
+def evaluate_tree(
+    node,
+    constants=None,
+    ):
+    """
+    Evaluates an expression tree, returning the same (unformatted)
+    result that the CLI's parser would generate for the expression.
+    """
+
+    node_type = type(node)
+
+    if node_type is BinaryOperation:
+        left_value = evaluate_tree(node.left, constants)
+        right_value = evaluate_tree(node.right, constants)
+        return binary_operations[node.operator](left_value, right_value)
+    elif node_type is Number:
+        return node.value
+    elif node_type is Symbol:
+        return node.symbol
+    elif node_type is Negation:
+        return cli.negate_value(evaluate_tree(node.operand, constants))
+    elif node_type is Constant:
+        return get_value_of_constant(node.name, constants)
+    elif node_type is HelpRequest:
+        return cli.print_help_text()
+    return node
+
+
+def get_child_nodes(
+    node,
+    ):
+    """
+    Returns the nodes that are the immediate children of the given node.
+    """
+
+    node_type = type(node)
+    if node_type is BinaryOperation:
+        return (node.left, node.right)
+    elif node_type is Negation:
+        return (node.operand,)
+    return ()
+
+
+def find_constants_used(
+    node,
+    ):
+    """
+    Returns the (frozen) set of the names of the user-created constants
+    that appear in the given tree.
+    """
+
+    if type(node) is Constant:
+        return frozenset((node.name,))
+
+    constants_used = frozenset()
+    for child_node in get_child_nodes(node):
+        constants_used = constants_used | find_constants_used(child_node)
+    return constants_used
+
+
+def format_tree(
+    node,
+    ):
+    """
+    Converts an expression tree back into text that the lexer and parser
+    accept (with every operation enclosed in parentheses, so that the
+    structure of the tree is preserved exactly).
+    """
+
+    node_type = type(node)
+
+    if node_type is BinaryOperation:
+        return "(" + format_tree(node.left) + " " + node.operator + " " \
+            + format_tree(node.right) + ")"
+    elif node_type is Number:
+        return repr(node.value)
+    elif node_type is Symbol:
+        return node.symbol
+    elif node_type is Negation:
+        return "-" + format_tree(node.operand)
+    elif node_type is Constant:
+        return node.name
+    elif node_type is HelpRequest:
+        return "help"
+    return str(node)
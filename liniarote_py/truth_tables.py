@@ -0,0 +1,791 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module generates complete operation tables (Cayley tables) for the
+four arithmetic operations, by applying each operation to every pair of
+representative operands: reals of each sign, each transvalent symbol,
+the indeterminate and special symbols, and well-formed tuples. The
+tables are cached, compared against a golden copy that is distributed
+with the package, and checked against the axioms listed in the help
+text. Cells in which an operation raises an error or returns no result
+are never accepted as expected results: the golden copy lists them
+explicitly as known failures, which are reported on every run. The
+throughput of each table cell can also be measured, so that any faster
+implementation of the operations can be validated against (and
+benchmarked on) the same tables.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+import contextlib
+import collections
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+except:
+    import config as cfg
+    import cli
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the operands and operations to be tabulated.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The representative operands (one for each class of operand that the
+# operations distinguish between). The odd integers are included as
+# exponents, for which powers are computed by repeated multiplication.
+operand_classes = [
+    2.5,
+    -1.5,
+    0.0,
+    3.0,
+    5.0,
+    cfg.tv_sym_pos,
+    cfg.tv_sym_neg,
+    cfg.tv_sym_pwr_p2_pos,
+    cfg.tv_sym_pwr_p2_neg,
+    cfg.tv_sym_pwr_p3_pos,
+    cfg.tv_sym_pwr_p3_neg,
+    cfg.tv_sym_pwr_p4_pos,
+    cfg.tv_sym_pwr_p4_neg,
+    cfg.tv_sym_pwr_m2_pos,
+    cfg.tv_sym_pwr_m2_neg,
+    cfg.tv_sym_pwr_m3_pos,
+    cfg.tv_sym_pwr_m3_neg,
+    cfg.real_num_sym_pos,
+    cfg.real_num_sym_neg,
+    cfg.real_num_sym,
+    cfg.null_sym,
+    cfg.unimplemented_sym,
+    (2.5, cfg.null_sym),
+    (-1.5, cfg.null_sym),
+    cli.tuple_null_sym,
+    cli.tuple_tv_sym_pos,
+    cli.tuple_tv_sym_neg,
+    cli.tuple_tv_sym_pwr_p2_pos,
+    cli.tuple_tv_sym_pwr_p2_neg,
+    cli.tuple_real_num_sym_pos,
+    cli.tuple_real_num_sym_neg,
+    cli.tuple_real_num_sym,
+    (2.5, cfg.tv_sym_pos),
+    (-1.5, cfg.tv_sym_neg),
+    ]
+
+# The operations that are tabulated by default (i.e., those implemented
+# by the CLI).
+cli_operations = {
+    "+": cli.add_values,
+    "-": cli.subtract_values,
+    "*": cli.multiply_values,
+    "/": cli.divide_values,
+    "^": cli.power_values,
+    }
+
+# The location of the golden copy of the tables.
+golden_tables_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "truth_tables_golden.json"
+    )
+
+# The default location of the cached tables.
+default_cache_path = "truth_tables.json"
+
+
+def label_operand(
+    operand,
+    ):
+    """
+    Returns the label used for an operand in the tables.
+    """
+    if isinstance(operand, tuple):
+        return "(" + str(operand[0]) + ", " + str(operand[1]) + ")"
+    return str(operand)
+
+
+def compute_implementation_fingerprint():
+    """
+    Returns a hash of the source code of the modules that implement the
+    operations, which is used to determine whether cached tables are
+    still valid.
+    """
+
+    fingerprint = hashlib.sha256()
+    for module in (cli, cfg):
+        with open(module.__file__, "rb") as source_file:
+            fingerprint.update(source_file.read())
+    return fingerprint.hexdigest()
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define functions for generating and comparing the tables.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def apply_operation_quietly(
+    operation,
+    u,
+    v,
+    ):
+    """
+    Applies an operation to two operands, returning the repr() of the
+    result (or a description of the error raised). Any messages that
+    are printed along the way (e.g., by subordinate parsers) are
+    suppressed.
+    """
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            return repr(operation(u, v))
+        except Exception as error:
+            return "error: " + type(error).__name__
+
+
+def build_truth_tables(
+    operations=None,
+    operands=None,
+    ):
+    """
+    Applies each operation to every ordered pair of operands. Returns a
+    dictionary containing the operand labels and, for each operation,
+    a table whose rows correspond to the left operand and whose columns
+    correspond to the right operand.
+    """
+
+    if operations is None:
+        operations = cli_operations
+    if operands is None:
+        operands = operand_classes
+
+    tables = {}
+    for operator, operation in operations.items():
+        tables[operator] = [
+            [apply_operation_quietly(operation, u, v) for v in operands]
+            for u in operands
+            ]
+
+    return {
+        "operands": [label_operand(operand) for operand in operands],
+        "tables": tables,
+        }
+
+
+def load_or_build_truth_tables(
+    cache_path=default_cache_path,
+    refresh=False,
+    ):
+    """
+    Loads the tables for the CLI's operations from the given cache file,
+    if it was generated from the current implementation; otherwise,
+    generates the tables and saves them to the cache file.
+    """
+
+    fingerprint = compute_implementation_fingerprint()
+
+    if (not refresh) and os.path.exists(cache_path):
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cached_tables = json.load(cache_file)
+        if cached_tables.get("fingerprint") == fingerprint:
+            return cached_tables
+
+    truth_tables = build_truth_tables()
+    truth_tables["fingerprint"] = fingerprint
+    save_truth_tables(truth_tables, cache_path)
+    return truth_tables
+
+
+def save_truth_tables(
+    truth_tables,
+    output_path,
+    ):
+    """
+    Saves the tables as a JSON file.
+    """
+    with open(output_path, "w", encoding="utf-8") as output_file:
+        json.dump(truth_tables, output_file, ensure_ascii=False, indent=1)
+        output_file.write("\n")
+
+
+def load_golden_truth_tables(
+    golden_path=golden_tables_path,
+    ):
+    """
+    Loads the golden copy of the tables.
+    """
+    with open(golden_path, encoding="utf-8") as golden_file:
+        return json.load(golden_file)
+
+
+def is_failed_cell(
+    cell,
+    ):
+    """
+    Returns True if a table cell records an error or a missing result
+    (i.e., an operation that raised an exception or returned None),
+    neither of which is ever accepted as an expected result.
+    """
+    return cell is not None and (cell.startswith("error: ") or cell == "None")
+
+
+def find_failed_cells(
+    truth_tables,
+    ):
+    """
+    Returns a list of [operator, left_label, right_label, cell] entries,
+    one for each failed cell in the tables.
+    """
+    return [
+        [operator, left_label, right_label, table[row][column]]
+        for operator, table in truth_tables["tables"].items()
+        for row, left_label in enumerate(truth_tables["operands"])
+        for column, right_label in enumerate(truth_tables["operands"])
+        if is_failed_cell(table[row][column])
+        ]
+
+
+def prepare_golden_truth_tables(
+    truth_tables,
+    ):
+    """
+    Returns a golden copy of the tables in which the failed cells have no
+    expected result (null) and are instead listed explicitly as known
+    failures.
+    """
+    return {
+        "operands": truth_tables["operands"],
+        "tables": {
+            operator: [
+                [None if is_failed_cell(cell) else cell for cell in row]
+                for row in table
+                ]
+            for operator, table in truth_tables["tables"].items()
+            },
+        "known_failures": find_failed_cells(truth_tables),
+        }
+
+
+def compare_truth_tables(
+    truth_tables,
+    reference_tables,
+    ):
+    """
+    Returns a list of (operator, left_label, right_label, actual, expected)
+    tuples, one for each cell in which the two sets of tables differ.
+    A failed cell counts as a difference unless it's listed (with the
+    same error) among the reference's known failures.
+    """
+
+    differences = []
+    reference_index = {
+        label: position
+        for position, label in enumerate(reference_tables["operands"])
+        }
+    known_failures = {
+        tuple(known_failure)
+        for known_failure in reference_tables.get("known_failures", [])
+        }
+
+    for operator, table in truth_tables["tables"].items():
+        reference_table = reference_tables["tables"].get(operator)
+        for row, left_label in enumerate(truth_tables["operands"]):
+            for column, right_label in enumerate(truth_tables["operands"]):
+                actual = table[row][column]
+                if (operator, left_label, right_label, actual) \
+                        in known_failures:
+                    continue
+                if (reference_table is None) \
+                        or (left_label not in reference_index) \
+                        or (right_label not in reference_index):
+                    expected = None
+                else:
+                    expected = reference_table[
+                        reference_index[left_label]
+                        ][
+                        reference_index[right_label]
+                        ]
+                if actual != expected or is_failed_cell(actual):
+                    differences.append(
+                        (operator, left_label, right_label, actual, expected)
+                        )
+
+    return differences
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the conformance checks.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The real numbers that are substituted for "n" when checking an axiom,
+# depending on how the axiom qualifies n.
+axiom_sample_reals = {
+    "any real number": [2.5, -1.5, 0.0],
+    "any positive real number": [2.5],
+    "any negative real number": [-1.5],
+    "any non-zero real number": [2.5, -1.5],
+    }
+
+axiom_pattern = re.compile(
+    r"^\s*(?P<left>\S+) (?P<operator>[-+×÷]) (?P<right>\S+) = (?P<result>\S+)"
+    r"(, where n is (?P<qualifier>.*))?$"
+    )
+
+
+def extract_axioms_from_help_text():
+    """
+    Extracts the axioms of addition, subtraction, multiplication, and
+    division from the help text. Returns a list of (axiom_text,
+    expression, expected_result) tuples, with a separate entry for
+    each real number substituted for "n".
+    """
+
+    axiom_section = cfg.help_text.split(
+        ">>>>> SELECTED AXIOMS OF TRANSVALENT MATHEMATICS <<<<<"
+        )[1].split(">>>>>")[0]
+
+    axioms = []
+    for line in axiom_section.splitlines():
+        match = axiom_pattern.match(line)
+        if match is None:
+            continue
+
+        operator = {"×": "*", "÷": "/"}.get(
+            match.group("operator"), match.group("operator")
+            )
+        qualifier = match.group("qualifier")
+        sample_reals = axiom_sample_reals[qualifier] if qualifier else [None]
+
+        for sample_real in sample_reals:
+            left = match.group("left")
+            right = match.group("right")
+            if sample_real is not None:
+                left = str(sample_real) if left == "n" else left
+                right = str(sample_real) if right == "n" else right
+            axioms.append((
+                line.strip(),
+                "(" + left + ") " + operator + " (" + right + ")",
+                match.group("result"),
+                ))
+
+    return axioms
+
+
+def evaluate_expression_quietly(
+    expression,
+    ):
+    """
+    Evaluates an expression using the CLI's lexer and parser, returning
+    the result as it would be displayed.
+    """
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        tokens = cli.create_lexer().tokenize(expression)
+        result = cli.LiniaroteParser().parse(tokens)
+    return cli.format_result_for_display(result)
+
+
+def results_match(
+    displayed_result,
+    expected_result,
+    ):
+    """
+    Checks whether a displayed result matches the result given in an
+    axiom (treating, e.g., "0" and "0.0" as equal).
+    """
+
+    if displayed_result == expected_result:
+        return True
+    try:
+        return float(displayed_result) == float(expected_result)
+    except (TypeError, ValueError):
+        return False
+
+
+def check_axioms():
+    """
+    Evaluates every axiom listed in the help text. Returns a list of
+    (axiom_text, expression, displayed_result, expected_result) tuples
+    for the axioms that aren't satisfied.
+    """
+
+    failures = []
+    for axiom_text, expression, expected_result in \
+            extract_axioms_from_help_text():
+        displayed_result = evaluate_expression_quietly(expression)
+        if not results_match(displayed_result, expected_result):
+            failures.append(
+                (axiom_text, expression, displayed_result, expected_result)
+                )
+    return failures
+
+
+def check_tuple_consistency(
+    operations=None,
+    ):
+    """
+    Checks that each operation gives the same (displayed) result when a
+    lone element is replaced by its equivalent well-formed tuple (e.g.,
+    "Ƿ" by "(0.0, Ƿ)"). Returns a list of (operator, left_label,
+    right_label, lone_result, tuple_result) tuples for the cases in which
+    the results differ.
+    """
+
+    if operations is None:
+        operations = cli_operations
+
+    lone_elements = [
+        operand for operand in operand_classes
+        if not isinstance(operand, tuple)
+        and operand != cfg.unimplemented_sym
+        ]
+
+    inconsistencies = []
+    for operator, operation in operations.items():
+        for u in lone_elements:
+            for v in lone_elements:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    try:
+                        lone_result = cli.format_result_for_display(
+                            operation(u, v)
+                            )
+                        tuple_result = cli.format_result_for_display(
+                            operation(
+                                cli.convert_lone_element_to_tuple(u),
+                                cli.convert_lone_element_to_tuple(v),
+                                )
+                            )
+                    except Exception as error:
+                        lone_result = tuple_result = \
+                            "error: " + type(error).__name__
+                if lone_result != tuple_result:
+                    inconsistencies.append((
+                        operator,
+                        label_operand(u),
+                        label_operand(v),
+                        lone_result,
+                        tuple_result,
+                        ))
+    return inconsistencies
+
+
+def check_power_consistency(
+    highest_power=5,
+    ):
+    """
+    Checks that raising each non-real operand (lone element or tuple) to
+    a positive integer power n gives the same result as multiplying it
+    by itself from left to right (i.e., that x ^ n = x × ... × x). Returns
+    a list of (label, n, power_result, product_result) tuples for the
+    cases in which the results differ.
+    """
+
+    bases = [
+        operand for operand in operand_classes
+        if not isinstance(operand, float)
+        and not (isinstance(operand, tuple) and operand[1] == cfg.null_sym
+            and operand[0] != 0.0)
+        ]
+
+    mismatches = []
+    for u in bases:
+        for power in range(1, highest_power + 1):
+            power_result = apply_operation_quietly(
+                cli.power_values, u, float(power)
+                )
+            product = u
+            product_result = repr(product)
+            for _ in range(power - 1):
+                product_result = apply_operation_quietly(
+                    cli.multiply_values, product, u
+                    )
+                if product_result.startswith("error: "):
+                    break
+                product = cli.multiply_values(product, u)
+            if power_result != product_result:
+                mismatches.append(
+                    (label_operand(u), power, power_result, product_result)
+                    )
+    return mismatches
+
+
+# Expressions that raise lone symbols to negative powers, with the
+# results that they should display (as when 1 is divided by the symbol
+# for the corresponding positive power).
+negative_power_expectations = [
+    ("w^-1", "0.0"),
+    ("w^-2", "Ƿ⁻²"),
+    ("W^-2", "Ƿ⁻²"),
+    ]
+
+
+def check_negative_powers():
+    """
+    Evaluates each expression in negative_power_expectations. Returns a
+    list of (expression, displayed_result, expected_result) tuples for
+    the expressions that don't give the expected result.
+    """
+
+    failures = []
+    for expression, expected_result in negative_power_expectations:
+        try:
+            displayed_result = evaluate_expression_quietly(expression)
+        except Exception as error:
+            displayed_result = "error: " + type(error).__name__
+        if displayed_result != expected_result:
+            failures.append((expression, displayed_result, expected_result))
+    return failures
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the throughput measurements.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def measure_cell_throughput(
+    operation,
+    u,
+    v,
+    target_seconds=0.002,
+    maximum_repetitions=10000,
+    ):
+    """
+    Returns the number of times per second that the given operation can
+    be applied to the given operands.
+    """
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        repetitions = 1
+        while True:
+            start_time = time.perf_counter()
+            for repetition in range(repetitions):
+                try:
+                    operation(u, v)
+                except Exception:
+                    pass
+            elapsed_time = time.perf_counter() - start_time
+            if (elapsed_time >= target_seconds) \
+                    or (repetitions >= maximum_repetitions):
+                break
+            repetitions = min(repetitions * 4, maximum_repetitions)
+
+    return repetitions / max(elapsed_time, 1e-9)
+
+
+def measure_throughput(
+    operations=None,
+    operands=None,
+    target_seconds=0.002,
+    ):
+    """
+    Measures the throughput of every cell of every table. Returns a
+    dictionary mapping each operator to a table of operations per second
+    (laid out in the same way as the truth tables).
+    """
+
+    if operations is None:
+        operations = cli_operations
+    if operands is None:
+        operands = operand_classes
+
+    return {
+        operator: [
+            [
+                measure_cell_throughput(operation, u, v, target_seconds)
+                for v in operands
+                ]
+            for u in operands
+            ]
+        for operator, operation in operations.items()
+        }
+
+
+def summarize_throughput(
+    throughput_tables,
+    operands=None,
+    number_of_cells=10,
+    ):
+    """
+    Returns lines of text summarizing the throughput of each operation
+    and listing the slowest table cells.
+    """
+
+    if operands is None:
+        operands = operand_classes
+    labels = [label_operand(operand) for operand in operands]
+
+    summary_lines = []
+    all_cells = []
+    for operator, table in throughput_tables.items():
+        rates = [rate for row in table for rate in row]
+        summary_lines.append(
+            f"{operator}  mean: {sum(rates) / len(rates):14,.0f} ops/s"
+            f"   min: {min(rates):14,.0f} ops/s"
+            f"   max: {max(rates):14,.0f} ops/s"
+            )
+        for row, left_label in enumerate(labels):
+            for column, right_label in enumerate(labels):
+                all_cells.append(
+                    (table[row][column], left_label, operator, right_label)
+                    )
+
+    summary_lines.append("Slowest cells:")
+    for rate, left_label, operator, right_label in \
+            sorted(all_cells)[:number_of_cells]:
+        summary_lines.append(
+            f"    {left_label} {operator} {right_label}: {rate:,.0f} ops/s"
+            )
+    return summary_lines
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def build_argument_parser():
+    """
+    Defines the command-line options accepted by this module.
+    """
+
+    argument_parser = argparse.ArgumentParser(
+        description="Generate the operation tables for transvalent "
+            "arithmetic and check them for conformance."
+        )
+    argument_parser.add_argument(
+        "--cache", default=default_cache_path,
+        help="the file in which the generated tables are cached",
+        )
+    argument_parser.add_argument(
+        "--golden", default=golden_tables_path,
+        help="the golden copy against which the tables are compared",
+        )
+    argument_parser.add_argument(
+        "--refresh", action="store_true",
+        help="regenerate the tables even if the cache is up to date",
+        )
+    argument_parser.add_argument(
+        "--update-golden", action="store_true",
+        help="replace the golden copy with the newly generated tables",
+        )
+    argument_parser.add_argument(
+        "--throughput", action="store_true",
+        help="measure and report the throughput of each table cell",
+        )
+    argument_parser.add_argument(
+        "--show-known-failures", action="store_true",
+        help="list each of the known failures recorded in the golden copy",
+        )
+    argument_parser.add_argument(
+        "--show-inconsistencies", action="store_true",
+        help="list the operations whose results differ between lone "
+            "elements and the equivalent tuples",
+        )
+    return argument_parser
+
+
+def main(argv=None):
+    """
+    Generates (or loads) the tables, compares them with the golden copy,
+    and checks the axioms and powers. Returns a nonzero status if any
+    difference, failed axiom, or inconsistent power is found.
+    """
+
+    arguments = build_argument_parser().parse_args(argv)
+    truth_tables = load_or_build_truth_tables(arguments.cache, arguments.refresh)
+    exit_status = 0
+
+    if arguments.update_golden:
+        golden_tables = prepare_golden_truth_tables(truth_tables)
+        save_truth_tables(golden_tables, arguments.golden)
+        print(f"Golden tables updated: {arguments.golden}")
+    else:
+        golden_tables = load_golden_truth_tables(arguments.golden)
+        differences = compare_truth_tables(truth_tables, golden_tables)
+        print(f"Cells differing from the golden tables: {len(differences)}")
+        for operator, left_label, right_label, actual, expected in differences:
+            print(f"    {left_label} {operator} {right_label}: "
+                f"{actual} (golden: {expected})")
+        if differences:
+            exit_status = 1
+
+    # Report the known failures (which the golden copy lists explicitly,
+    # rather than accepting them as expected results) on every run.
+    known_failures = golden_tables.get("known_failures", [])
+    print(f"Known failures (errors or missing results): "
+        f"{len(known_failures)}")
+    failure_counts = collections.Counter(
+        (operator, cell) for operator, _, _, cell in known_failures
+        )
+    for (operator, cell), count in sorted(failure_counts.items()):
+        print(f"    {operator}: {count} cells giving {cell}")
+    if arguments.show_known_failures:
+        for operator, left_label, right_label, cell in known_failures:
+            print(f"    {left_label} {operator} {right_label}: {cell}")
+
+    axiom_failures = check_axioms()
+    print(f"Axioms not satisfied: {len(axiom_failures)}")
+    for axiom_text, expression, displayed_result, expected_result \
+            in axiom_failures:
+        print(f"    {axiom_text}  [{expression} gave {displayed_result}]")
+    if axiom_failures:
+        exit_status = 1
+
+    inconsistencies = check_tuple_consistency()
+    print(f"Results differing between lone elements and tuples: "
+        f"{len(inconsistencies)}")
+    if arguments.show_inconsistencies:
+        for operator, left_label, right_label, lone_result, tuple_result \
+                in inconsistencies:
+            print(f"    {left_label} {operator} {right_label}: "
+                f"{lone_result} (as tuples: {tuple_result})")
+
+    power_mismatches = check_power_consistency()
+    print(f"Powers differing from repeated multiplication: "
+        f"{len(power_mismatches)}")
+    for label, power, power_result, product_result in power_mismatches:
+        print(f"    {label} ^ {power}: {power_result} "
+            f"(by multiplication: {product_result})")
+    if power_mismatches:
+        exit_status = 1
+
+    negative_power_failures = check_negative_powers()
+    print(f"Negative powers giving unexpected results: "
+        f"{len(negative_power_failures)}")
+    for expression, displayed_result, expected_result in negative_power_failures:
+        print(f"    {expression}: {displayed_result} (expected {expected_result})")
+    if negative_power_failures:
+        exit_status = 1
+
+    if arguments.throughput:
+        for summary_line in summarize_throughput(measure_throughput()):
+            print(summary_line)
+
+    return exit_status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module defines a fixed-width binary encoding of calculated
+results, so that results can be passed between processes or stored
+without being formatted as text and parsed again. Each result occupies
+a record of 10 bytes:
+
+    - the real part, as a little-endian 8-byte float (NaN for the
+      indeterminate values and the Unimplemented symbol);
+    - the symbol code (a signed byte, as defined in config.symbol_codes,
+      whose sign is that of the symbol; 0 for a real number);
+    - a byte of flags: FLAG_LONE (the result is a lone element rather
+      than a tuple), FLAG_INDETERMINATE (Æ, -Æ, or ℝ),
+      FLAG_UNIMPLEMENTED ("U"), FLAG_NULL_SYMBOL (the result is the
+      lone "∅" itself), and FLAG_EVALUATION_ERROR (there is no result, as
+      the input couldn't be evaluated; the code is then
+      config.evaluation_error_code).
+
+Unpacking a record yields the same form of result that was packed,
+except that the CLI's canonical tuples are used where possible (e.g.,
+for any tuple representing Æ) and that anything other than a result or
+None (which stands for input that couldn't be evaluated) is unpacked as
+"U". The functions for
+packing and unpacking work directly on bytearrays, memoryviews, and
+other buffers (e.g., memory-mapped files) without copying them; where
+NumPy is available, a buffer of records can also be viewed as a
+structured array.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import math
+import time
+import struct
+import argparse
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import third-party modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+except:
+    import config as cfg
+    import cli
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the record layout.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The layout of a record: real part, symbol code, and flags.
+record_struct = struct.Struct("<dbB")
+record_size = record_struct.size
+
+FLAG_LONE = 0x01
+FLAG_INDETERMINATE = 0x02
+FLAG_UNIMPLEMENTED = 0x04
+FLAG_NULL_SYMBOL = 0x08
+FLAG_EVALUATION_ERROR = 0x10
+
+# The equivalent NumPy type, for viewing a buffer of records as an array.
+if np is not None:
+    record_dtype = np.dtype([("real", "<f8"), ("code", "i1"), ("flags", "u1")])
+else:
+    record_dtype = None
+
+indeterminate_symbols = (cfg.real_num_sym_pos, cfg.real_num_sym_neg, cfg.real_num_sym)
+
+
+def get_symbol_fields(
+    symbol,
+    lone,
+    ):
+    """
+    Returns the (real, code, flags) fields of a record for a symbol (or
+    for its canonical tuple, if lone is False).
+    """
+
+    flags = FLAG_LONE if lone else 0
+    if symbol == cfg.unimplemented_sym:
+        return (math.nan, cfg.symbol_codes[symbol], flags | FLAG_UNIMPLEMENTED)
+    if symbol in indeterminate_symbols:
+        return (math.nan, cfg.symbol_codes[symbol], flags | FLAG_INDETERMINATE)
+    if symbol == cfg.null_sym and lone:
+        return (0.0, 0, flags | FLAG_NULL_SYMBOL)
+    return (0.0, cfg.symbol_codes[symbol], flags)
+
+
+# The fields of the lone symbols, and of the CLI's canonical tuples (by
+# their identities), which are prepared in advance.
+fields_by_lone_element = {
+    symbol: get_symbol_fields(symbol, True) for symbol in cfg.symbol_codes
+    }
+fields_by_identity = {
+    id(tuple_value): get_symbol_fields(symbol, False)
+    for symbol, tuple_value in cli.tuples_by_lone_element.items()
+    }
+unimplemented_fields = fields_by_lone_element[cfg.unimplemented_sym]
+evaluation_error_fields = \
+    (math.nan, cfg.evaluation_error_code, FLAG_EVALUATION_ERROR)
+
+# The results of the records whose results don't depend on their real
+# parts, by (code, flags).
+results_by_code_and_flags = {}
+for symbol in cfg.symbol_codes:
+    real_value, code, flags = fields_by_lone_element[symbol]
+    results_by_code_and_flags[(code, flags)] = symbol
+for symbol in indeterminate_symbols:
+    real_value, code, flags = get_symbol_fields(symbol, False)
+    results_by_code_and_flags[(code, flags)] = cli.tuples_by_lone_element[symbol]
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the encoding and decoding of results.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def encode_result(
+    result,
+    ):
+    """
+    Returns the (real, code, flags) fields of the record for a result.
+    """
+
+    result_type = type(result)
+    if result_type is float:
+        return (result, 0, FLAG_LONE)
+    if result is None:
+        return evaluation_error_fields
+    if result_type is str:
+        return fields_by_lone_element.get(result, unimplemented_fields)
+    fields = fields_by_identity.get(id(result))
+    if fields is not None:
+        return fields
+
+    if result_type is tuple and len(result) == 2:
+        real_value, symbol = cli.decompose_result_for_output(result)
+        if symbol == cfg.unimplemented_sym:
+            return unimplemented_fields
+        if symbol in indeterminate_symbols:
+            return get_symbol_fields(symbol, False)
+        return (real_value, cfg.symbol_codes[symbol], 0)
+    return unimplemented_fields
+
+
+def decode_result(
+    real_value,
+    code,
+    flags,
+    ):
+    """
+    Returns the result represented by the fields of a record (None, for
+    an input that couldn't be evaluated).
+    """
+
+    if flags & FLAG_EVALUATION_ERROR:
+        return None
+    result = results_by_code_and_flags.get((code, flags))
+    if result is not None:
+        return result
+    if code == 0:
+        if flags & FLAG_LONE:
+            return real_value
+        if real_value == 0.0 and math.copysign(1.0, real_value) == 1.0:
+            return cli.tuple_null_sym
+        return (real_value, cfg.null_sym)
+
+    symbol = cfg.symbols_by_code[code]
+    if flags & FLAG_LONE:
+        return symbol
+    if real_value == 0.0:
+        return cli.tuples_by_lone_element[symbol]
+    return (real_value, symbol)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the packing and unpacking of buffers.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def pack_result(
+    result,
+    ):
+    """
+    Returns the record for a single result, as bytes.
+    """
+    return record_struct.pack(*encode_result(result))
+
+
+def pack_result_into(
+    buffer,
+    offset,
+    result,
+    ):
+    """
+    Writes the record for a result into a writable buffer (e.g., a
+    bytearray or memoryview) at the given byte offset.
+    """
+    record_struct.pack_into(buffer, offset, *encode_result(result))
+
+
+def unpack_result(
+    buffer,
+    offset=0,
+    ):
+    """
+    Returns the result whose record begins at the given byte offset of a
+    buffer.
+    """
+    return decode_result(*record_struct.unpack_from(buffer, offset))
+
+
+def pack_results(
+    results,
+    buffer=None,
+    offset=0,
+    ):
+    """
+    Writes the records for a sequence of results into a writable buffer,
+    beginning at the given byte offset, and returns the buffer. (If no
+    buffer is given, a bytearray of the required size is created.)
+    """
+
+    if buffer is None:
+        buffer = bytearray(record_size * len(results) + offset)
+    pack_into = record_struct.pack_into
+    lone_flags = FLAG_LONE
+    null_sym = cfg.null_sym
+    by_lone_element = fields_by_lone_element
+    by_identity = fields_by_identity
+
+    for result in results:
+        result_type = type(result)
+        if result_type is float:
+            pack_into(buffer, offset, result, 0, lone_flags)
+        elif result_type is str and result in by_lone_element:
+            pack_into(buffer, offset, *by_lone_element[result])
+        elif result_type is tuple and type(result[0]) is float and result[1] == null_sym \
+                and len(result) == 2:
+            pack_into(buffer, offset, result[0], 0, 0)
+        else:
+            fields = by_identity.get(id(result))
+            if fields is None:
+                fields = encode_result(result)
+            pack_into(buffer, offset, *fields)
+        offset += record_size
+    return buffer
+
+
+def unpack_results(
+    buffer,
+    offset=0,
+    count=None,
+    ):
+    """
+    Returns a list of the results whose records begin at the given byte
+    offset of a buffer (all of the remaining records, unless a count is
+    given). The buffer isn't copied.
+    """
+
+    view = memoryview(buffer).cast("B")
+    if count is None:
+        count = (len(view) - offset) // record_size
+    view = view[offset:offset + count * record_size]
+
+    by_code_and_flags = results_by_code_and_flags
+    results = []
+    append = results.append
+    lone_flags = FLAG_LONE
+    for real_value, code, flags in record_struct.iter_unpack(view):
+        if code == 0 and flags == lone_flags:
+            append(real_value)
+        else:
+            result = by_code_and_flags.get((code, flags))
+            if result is None:
+                result = decode_result(real_value, code, flags)
+            append(result)
+    return results
+
+
+def view_records(
+    buffer,
+    offset=0,
+    count=-1,
+    ):
+    """
+    Returns a NumPy structured array (with the fields "real", "code",
+    and "flags") that shares the memory of a buffer of records.
+    """
+
+    if np is None:
+        raise ImportError("NumPy is required for viewing records as arrays.")
+    return np.frombuffer(buffer, dtype=record_dtype, count=count, offset=offset)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+if __name__ == '__main__':
+
+    try:
+        from . import workload
+    except:
+        import workload
+
+    argument_parser = argparse.ArgumentParser(
+        description="Compare packing results into binary records with "
+            + "formatting them for display."
+        )
+    argument_parser.add_argument("--count", type=int, default=1000000)
+    argument_parser.add_argument("--seed", type=int, default=None)
+    arguments = argument_parser.parse_args()
+
+    results = workload.generate_results(arguments.count, arguments.seed)
+
+    start_time = time.perf_counter()
+    displayed_forms = [cli.format_result_for_display(result) for result in results]
+    display_time = time.perf_counter() - start_time
+    display_size = sum(len(form.encode("utf-8")) + 1 for form in displayed_forms)
+
+    start_time = time.perf_counter()
+    buffer = pack_results(results)
+    pack_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    unpacked_results = unpack_results(memoryview(buffer))
+    unpack_time = time.perf_counter() - start_time
+
+    print(f"results: {len(results):,}   (round trip exact: "
+        + f"{repr(unpacked_results) == repr(results)})")
+    print(f"display strings: {display_time:8.4f} s   {display_size:>12,} bytes")
+    print(f"packed records:  {pack_time:8.4f} s   {len(buffer):>12,} bytes")
+    print(f"unpacked:        {unpack_time:8.4f} s")
@@ -0,0 +1,781 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module generates reproducible corpora of random Liniarote
+expressions (for load testing and benchmarking), runs such corpora
+through an evaluator while measuring throughput and latency, and
+compares the results produced by two different evaluation paths. It
+also measures the memory needed to hold large numbers of results and
+compares the latency of the tree parsers.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import io
+import sys
+import time
+import array
+import random
+import argparse
+import itertools
+import contextlib
+import tracemalloc
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import batch
+    from . import tree
+    from . import script
+    from . import codegen
+    from . import lazy
+except:
+    import config as cfg
+    import cli
+    import batch
+    import tree
+    import script
+    import codegen
+    import lazy
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the expression generator.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The transvalent and other special symbols that can appear as operands
+# in generated expressions (using the forms recognized by the lexer).
+transvalent_leaf_symbols = [
+    "w",
+    cfg.tv_sym_pos,
+    cfg.tv_sym_pwr_p2_pos,
+    cfg.tv_sym_pwr_p3_pos,
+    cfg.tv_sym_pwr_p4_pos,
+    cfg.tv_sym_pwr_m2_pos,
+    cfg.tv_sym_pwr_m3_pos,
+    cfg.real_num_sym_pos,
+    cfg.real_num_sym,
+    cfg.null_sym,
+    ]
+
+
+class WorkloadSettings:
+    """
+    The settings that determine the shape of generated expressions.
+    """
+
+    def __init__(
+        self,
+        maximum_depth=4,
+        operator_weights=None,
+        transvalent_share=0.25,
+        constant_share=0.1,
+        unary_minus_share=0.1,
+        parentheses_share=0.7,
+        constants=("pi", "e"),
+        ):
+        """
+        Stores the settings. The operator weights give the relative
+        frequency of each of the operators "+", "-", "*", "/", and "^"; the
+        shares give the probability that a leaf will be a transvalent
+        symbol or a constant, that an operand will be negated, and that
+        a nested operation will be enclosed in parentheses.
+        """
+
+        if operator_weights is None:
+            operator_weights = {"+": 1.0, "-": 1.0, "*": 1.0, "/": 1.0}
+
+        self.maximum_depth = maximum_depth
+        self.operators = list(operator_weights)
+        self.operator_weights = list(operator_weights.values())
+        self.transvalent_share = transvalent_share
+        self.constant_share = constant_share
+        self.unary_minus_share = unary_minus_share
+        self.parentheses_share = parentheses_share
+        self.constants = list(constants)
+
+
+def generate_leaf(
+    rng,
+    settings,
+    ):
+    """
+    Generates a single operand: a real number, a transvalent (or other
+    special) symbol, or a constant.
+    """
+
+    draw = rng.random()
+    if draw < settings.transvalent_share:
+        leaf = rng.choice(transvalent_leaf_symbols)
+    elif settings.constants \
+            and draw < settings.transvalent_share + settings.constant_share:
+        leaf = rng.choice(settings.constants)
+    elif rng.random() < 0.1:
+        leaf = "0"
+    else:
+        leaf = str(round(rng.uniform(0.0, 100.0), rng.randint(0, 2)))
+
+    if rng.random() < settings.unary_minus_share:
+        leaf = "-" + leaf
+    return leaf
+
+
+def generate_expression(
+    rng,
+    settings,
+    depth=None,
+    ):
+    """
+    Generates the text of a random expression whose operator tree is no
+    deeper than the given depth.
+    """
+
+    if depth is None:
+        depth = settings.maximum_depth
+
+    # Stop at a leaf once the maximum depth has been reached (and, with
+    # some probability, before then, so that trees vary in shape).
+    if depth <= 0 or (depth < settings.maximum_depth and rng.random() < 0.3):
+        return generate_leaf(rng, settings)
+
+    operator = rng.choices(settings.operators, settings.operator_weights)[0]
+
+    # An exponent must be a real number, so a power's exponent is a small
+    # integer (which may be negative), and its base is enclosed in
+    # parentheses if it is itself an operation (as "^" binds tightly).
+    if operator == "^":
+        base = generate_expression(rng, settings, depth - 1)
+        if " " in base:
+            base = "(" + base + ")"
+        return base + " ^ " + str(rng.randint(-3, 5))
+
+    operands = []
+    for position in range(2):
+        operand = generate_expression(rng, settings, depth - 1)
+        if (" " in operand) and rng.random() < settings.parentheses_share:
+            operand = "(" + operand + ")"
+        operands.append(operand)
+
+    return operands[0] + " " + operator + " " + operands[1]
+
+
+def write_corpus(
+    output_path,
+    number_of_lines,
+    settings=None,
+    seed=0,
+    block_size=65536,
+    ):
+    """
+    Writes a corpus of random expressions (one per line) to the given
+    file. The same seed and settings always produce the same corpus.
+    """
+
+    if settings is None:
+        settings = WorkloadSettings()
+    rng = random.Random(seed)
+
+    with open(output_path, "w", encoding="utf-8", newline="\n") as output_file:
+        pending_lines = []
+        for line_number in range(number_of_lines):
+            pending_lines.append(generate_expression(rng, settings) + "\n")
+            if len(pending_lines) >= block_size:
+                output_file.write("".join(pending_lines))
+                pending_lines = []
+        output_file.write("".join(pending_lines))
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the result generator.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def generate_results(
+    count,
+    seed=None,
+    ):
+    """
+    Returns a list of randomly chosen results in the various forms that
+    the CLI's operations produce: lone real numbers and (real, "∅")
+    tuples, lone symbols, and tuples representing symbols (both the CLI's
+    canonical tuples and equal tuples that aren't canonical). Half of the
+    real numbers are integers, so that equal results recur.
+    """
+
+    generator = random.Random(seed)
+    forms = list(cfg.symbol_codes) \
+        + list(cli.tuples_by_lone_element.values()) \
+        + [tuple(list(value)) for value in cli.tuples_by_lone_element.values()]
+    results = []
+    for index in range(count):
+        if generator.random() < 0.5:
+            if generator.random() < 0.5:
+                real_value = float(generator.randrange(-50, 50))
+            else:
+                real_value = generator.gauss(0.0, 100.0)
+            results.append(generator.choice((real_value, (real_value, cfg.null_sym))))
+        else:
+            results.append(generator.choice(forms))
+    return results
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the evaluation paths.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def create_parser_evaluator():
+    """
+    Returns a function that evaluates an expression in the same way as
+    the CLI's command prompt (i.e., with a shared lexer and a new parser
+    for each expression).
+    """
+
+    lexer = cli.create_lexer()
+
+    def evaluate(text):
+        return cli.LiniaroteParser().parse(lexer.tokenize(text))
+
+    return evaluate
+
+
+def create_tree_evaluator():
+    """
+    Returns a function that evaluates an expression by building and then
+    evaluating its expression tree.
+    """
+
+    def evaluate(text):
+        return tree.evaluate_tree(tree.parse_expression_to_tree(text))
+
+    return evaluate
+
+
+def create_vm_evaluator():
+    """
+    Returns a function that evaluates an expression by compiling it as a
+    one-statement script and running the script's bytecode.
+    """
+
+    def evaluate(text):
+        results = []
+        script.run_compiled_script(
+            script.compile_script(text),
+            display_result=lambda line_number, result: results.append(result),
+            )
+        return results[0]
+
+    return evaluate
+
+
+def create_codegen_evaluator():
+    """
+    Returns a function that evaluates an expression by calling the Python
+    function generated for it (which is cached).
+    """
+    return codegen.evaluate_expression
+
+
+def create_lazy_evaluator():
+    """
+    Returns a function that evaluates an expression's tree lazily (i.e.,
+    skipping operands that can't affect the result).
+    """
+
+    def evaluate(text):
+        return lazy.evaluate_tree_lazily(tree.parse_expression_to_tree(text))[0]
+
+    return evaluate
+
+
+# Each entry maps the name of an evaluation path to a function that
+# creates an evaluator (i.e., a function that accepts the text of an
+# expression and returns its unformatted result).
+evaluator_factories = {
+    "parser": create_parser_evaluator,
+    "tree": create_tree_evaluator,
+    "vm": create_vm_evaluator,
+    "codegen": create_codegen_evaluator,
+    "lazy": create_lazy_evaluator,
+    }
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the load-test driver and differential tester.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def iterate_corpus(
+    corpus_path,
+    limit=None,
+    ):
+    """
+    Yields (line_number, text) for each non-blank line of a corpus.
+    """
+
+    lines_yielded = 0
+    for line_number, offset, next_offset, text in \
+            batch.iterate_mapped_lines(corpus_path):
+        if limit is not None and lines_yielded >= limit:
+            return
+        if text.strip():
+            lines_yielded += 1
+            yield (line_number, text)
+
+
+def calculate_percentile(
+    sorted_values,
+    percentile,
+    ):
+    """
+    Returns the given percentile (from 0 to 100) of a sorted sequence,
+    using the nearest-rank method.
+    """
+
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-percentile * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_corpus(
+    corpus_path,
+    evaluator_name="parser",
+    limit=None,
+    ):
+    """
+    Evaluates every expression in a corpus, timing each one. Returns a
+    dictionary giving the number of expressions, the total time, the
+    throughput, the latency percentiles (in seconds), and the statistics
+    of the token-stream cache.
+    """
+
+    evaluate = evaluator_factories[evaluator_name]()
+    latencies = array.array("d")
+    errors = 0
+    clock = time.perf_counter
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_start_time = clock()
+        for line_number, text in iterate_corpus(corpus_path, limit):
+            start_time = clock()
+            try:
+                evaluate(text)
+            except Exception:
+                errors += 1
+            latencies.append(clock() - start_time)
+        total_time = clock() - run_start_time
+
+    sorted_latencies = sorted(latencies)
+    return {
+        "expressions": len(latencies),
+        "errors": errors,
+        "total_seconds": total_time,
+        "expressions_per_second": len(latencies) / max(total_time, 1e-9),
+        "p50": calculate_percentile(sorted_latencies, 50),
+        "p90": calculate_percentile(sorted_latencies, 90),
+        "p99": calculate_percentile(sorted_latencies, 99),
+        "p999": calculate_percentile(sorted_latencies, 99.9),
+        "max": sorted_latencies[-1] if sorted_latencies else 0.0,
+        "token_cache": cli.token_stream_cache.get_statistics(),
+        }
+
+
+def evaluate_for_comparison(
+    evaluate,
+    text,
+    ):
+    """
+    Evaluates an expression and returns its result as it would be
+    displayed (or a description of the error raised).
+    """
+    try:
+        return str(cli.format_result_for_display(evaluate(text)))
+    except Exception as error:
+        return "error: " + type(error).__name__
+
+
+def compare_evaluators(
+    corpus_path,
+    first_evaluator_name,
+    second_evaluator_name,
+    limit=None,
+    ):
+    """
+    Evaluates every expression in a corpus using two evaluation paths.
+    Yields a (line_number, text, first_result, second_result) tuple for
+    each expression whose displayed results differ.
+    """
+
+    evaluate_first = evaluator_factories[first_evaluator_name]()
+    evaluate_second = evaluator_factories[second_evaluator_name]()
+
+    for line_number, text in iterate_corpus(corpus_path, limit):
+        with contextlib.redirect_stdout(io.StringIO()):
+            first_result = evaluate_for_comparison(evaluate_first, text)
+            second_result = evaluate_for_comparison(evaluate_second, text)
+        if first_result != second_result:
+            yield (line_number, text, first_result, second_result)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the memory benchmark.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def find_symbolic_results():
+    """
+    Returns the (tuple) results of the operations that combine two of the
+    transvalent and other special symbols.
+    """
+
+    symbolic_results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for left, right in itertools.product(transvalent_leaf_symbols, repeat=2):
+            for operator in ("+", "-", "*", "/"):
+                try:
+                    result = cli.evaluate_text(f"{left} {operator} {right}")
+                except Exception:
+                    continue
+                if isinstance(result, tuple):
+                    symbolic_results.append(result)
+    return symbolic_results
+
+
+def measure_result_memory(
+    result_count,
+    copy_results=False,
+    ):
+    """
+    Stores the given number of results of symbolic operations in a list
+    and returns the number of bytes allocated and the time taken. If
+    copy_results is True, each result is stored as a new tuple (as the
+    operations created before their results were interned); otherwise,
+    the results returned by the operations (i.e., the canonical tuples)
+    are stored.
+    """
+
+    symbolic_results = find_symbolic_results()
+    result_cycle = itertools.islice(itertools.cycle(symbolic_results), result_count)
+
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        if copy_results:
+            stored_results = [(result[0], result[1]) for result in result_cycle]
+        else:
+            stored_results = [result for result in result_cycle]
+        elapsed_time = time.perf_counter() - start_time
+        allocated_bytes = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del stored_results
+    return (allocated_bytes, elapsed_time)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the parser benchmark.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def parse_with_sly_tree_parser(tokens):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return tree.LiniaroteTreeParser().parse(iter(tokens))
+
+
+def parse_with_pratt_parser(tokens):
+    try:
+        return tree.parse_tokens_with_precedence(tokens)
+    except tree.PrattParseFailure:
+        return None
+
+
+tree_parsers = {
+    "sly": parse_with_sly_tree_parser,
+    "pratt": parse_with_pratt_parser,
+    }
+
+
+def measure_tree_parsers(
+    corpus_path,
+    limit=None,
+    allocation_sample_size=2000,
+    ):
+    """
+    Builds the expression tree for every (lexable) expression in a corpus
+    with each tree parser (a new sly-based parser being constructed for
+    each expression, as parse_expression_to_tree() does). Returns a
+    dictionary giving, for each parser, the median and 99th-percentile
+    parse latency, the mean peak memory allocated while parsing an
+    expression (for a sample of the expressions), and the number of
+    expressions whose trees differ from those of the sly-based parser.
+    """
+
+    token_streams = []
+    for line_number, text in iterate_corpus(corpus_path, limit):
+        try:
+            token_streams.append(cli.token_stream_cache.get_tokens(text))
+        except cli.LexError:
+            pass
+
+    clock = time.perf_counter
+    reference_trees = [parse_with_sly_tree_parser(tokens) for tokens in token_streams]
+    report = {}
+
+    for parser_name, parse in tree_parsers.items():
+        latencies = []
+        differing_trees = 0
+        for tokens, reference_tree in zip(token_streams, reference_trees):
+            start_time = clock()
+            expression_tree = parse(tokens)
+            latencies.append(clock() - start_time)
+            # (The Pratt parser leaves poorly formulated input to the sly
+            # parser, so only its trees are compared.)
+            if expression_tree is not None and expression_tree != reference_tree:
+                differing_trees += 1
+
+        peak_allocations = []
+        tracemalloc.start()
+        try:
+            for tokens in token_streams[:allocation_sample_size]:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                parse(tokens)
+                peak_allocations.append(tracemalloc.get_traced_memory()[1] - baseline)
+        finally:
+            tracemalloc.stop()
+
+        latencies.sort()
+        report[parser_name] = {
+            "p50": calculate_percentile(latencies, 50),
+            "p99": calculate_percentile(latencies, 99),
+            "peak_bytes": sum(peak_allocations) / max(len(peak_allocations), 1),
+            "differing_trees": differing_trees,
+            }
+    return report
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the overall logic for executing the module.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+def parse_operator_weights(
+    weights_text,
+    ):
+    """
+    Converts text of the form "+:2,-:1,*:1,/:0.5" into a dictionary of
+    operator weights.
+    """
+
+    operator_weights = {}
+    for item in weights_text.split(","):
+        operator, separator, weight = item.strip().partition(":")
+        if operator not in ("+", "-", "*", "/", "^") or not separator:
+            raise argparse.ArgumentTypeError(
+                f"Operator weights must be given in the form +:1,-:1: {item}"
+                )
+        operator_weights[operator] = float(weight)
+    return operator_weights
+
+
+def build_argument_parser():
+    """
+    Defines the command-line options accepted by this module.
+    """
+
+    argument_parser = argparse.ArgumentParser(
+        description="Generate and run workloads of Liniarote expressions."
+        )
+    subparsers = argument_parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="write a corpus of random expressions",
+        )
+    generate_parser.add_argument(
+        "output_file",
+        help="the file to which the expressions should be written",
+        )
+    generate_parser.add_argument(
+        "--lines", type=int, default=100000,
+        help="the number of expressions to be generated",
+        )
+    generate_parser.add_argument(
+        "--seed", type=int, default=0,
+        help="the seed of the random-number generator (the same seed "
+            "always gives the same corpus)",
+        )
+    generate_parser.add_argument(
+        "--max-depth", type=int, default=4,
+        help="the greatest depth of nested operations in an expression",
+        )
+    generate_parser.add_argument(
+        "--operators", type=parse_operator_weights,
+        default={"+": 1.0, "-": 1.0, "*": 1.0, "/": 1.0},
+        help="the relative frequency of each operator (e.g., +:2,-:1,*:1,/:1,^:0.5)",
+        )
+    generate_parser.add_argument(
+        "--transvalent-share", type=float, default=0.25,
+        help="the probability that an operand will be a transvalent symbol",
+        )
+    generate_parser.add_argument(
+        "--constant-share", type=float, default=0.1,
+        help="the probability that an operand will be a constant",
+        )
+    generate_parser.add_argument(
+        "--unary-minus-share", type=float, default=0.1,
+        help="the probability that an operand will be negated",
+        )
+    generate_parser.add_argument(
+        "--constants", default="pi,e",
+        help="a comma-separated list of the constants that may be used",
+        )
+
+    for command, help_text in (
+            ("run", "evaluate a corpus and report throughput and latency"),
+            ("diff", "report expressions on which two evaluators disagree"),
+            ):
+        command_parser = subparsers.add_parser(command, help=help_text)
+        command_parser.add_argument(
+            "corpus_file",
+            help="the file of expressions (one per line) to be evaluated",
+            )
+        command_parser.add_argument(
+            "--limit", type=int, default=None,
+            help="the greatest number of expressions to be evaluated",
+            )
+        command_parser.add_argument(
+            "--constant", type=batch.parse_constant_assignment,
+            action="append", default=[], metavar="NAME=VALUE",
+            help="assign a value to a user-created constant",
+            )
+        if command == "run":
+            command_parser.add_argument(
+                "--evaluator", choices=sorted(evaluator_factories),
+                default="parser",
+                help="the evaluator with which the expressions should be "
+                    "evaluated",
+                )
+        else:
+            command_parser.add_argument(
+                "--evaluators", nargs=2, choices=sorted(evaluator_factories),
+                default=["parser", "parser"],
+                help="the two evaluators whose results should be compared",
+                )
+
+    parse_parser = subparsers.add_parser(
+        "parse", help="compare the latency of the tree parsers",
+        )
+    parse_parser.add_argument(
+        "corpus_file",
+        help="the file of expressions (one per line) to be parsed",
+        )
+    parse_parser.add_argument(
+        "--limit", type=int, default=None,
+        help="the greatest number of expressions to be parsed",
+        )
+
+    memory_parser = subparsers.add_parser(
+        "memory", help="measure the memory needed to store symbolic results",
+        )
+    memory_parser.add_argument(
+        "--results", type=int, default=10000000,
+        help="the number of results to be stored",
+        )
+
+    return argument_parser
+
+
+def main(argv=None):
+    """
+    Runs the requested command.
+    """
+
+    arguments = build_argument_parser().parse_args(argv)
+
+    if arguments.command == "generate":
+        settings = WorkloadSettings(
+            maximum_depth=arguments.max_depth,
+            operator_weights=arguments.operators,
+            transvalent_share=arguments.transvalent_share,
+            constant_share=arguments.constant_share,
+            unary_minus_share=arguments.unary_minus_share,
+            constants=[
+                name.strip() for name in arguments.constants.split(",")
+                if name.strip()
+                ],
+            )
+        write_corpus(
+            arguments.output_file, arguments.lines, settings, arguments.seed
+            )
+        return 0
+
+    if arguments.command == "parse":
+        report = measure_tree_parsers(arguments.corpus_file, arguments.limit)
+        for parser_name, parser_report in report.items():
+            print(f"{parser_name + ':':7}"
+                f" p50 {parser_report['p50'] * 1e6:8,.1f} µs,"
+                f" p99 {parser_report['p99'] * 1e6:8,.1f} µs,"
+                f" {parser_report['peak_bytes']:10,.0f} bytes allocated"
+                f"   (trees differing: {parser_report['differing_trees']})")
+        return 0
+
+    if arguments.command == "memory":
+        for label, copy_results in (("copied", True), ("interned", False)):
+            allocated_bytes, elapsed_time = measure_result_memory(
+                arguments.results, copy_results
+                )
+            print(f"{label + ':':10} {allocated_bytes / 2**20:10,.1f} MiB"
+                f"   ({allocated_bytes / arguments.results:.1f} bytes/result,"
+                f" {elapsed_time:.2f} s)")
+        return 0
+
+    for name, value in arguments.constant:
+        cfg.recognized_constants[name] = value
+
+    if arguments.command == "run":
+        report = run_corpus(
+            arguments.corpus_file, arguments.evaluator, arguments.limit
+            )
+        print(f"expressions:  {report['expressions']:,}"
+            f"   (errors: {report['errors']:,})")
+        print(f"throughput:   {report['expressions_per_second']:,.0f}"
+            " expressions/s")
+        for key in ("p50", "p90", "p99", "p999", "max"):
+            print(f"latency {key + ':':5} {report[key] * 1e6:12,.1f} µs")
+        token_cache = report["token_cache"]
+        print(f"token cache:  {token_cache['hit_rate']:.1%} hits"
+            f"   ({token_cache['hits']:,} hits, {token_cache['assembled']:,}"
+            f" assembled, {token_cache['misses']:,} misses)")
+        return 0
+
+    disagreements = 0
+    for line_number, text, first_result, second_result in compare_evaluators(
+            arguments.corpus_file, *arguments.evaluators, arguments.limit
+            ):
+        disagreements += 1
+        print(f"{line_number}: {text}")
+        print(f"    {arguments.evaluators[0]}: {first_result}")
+        print(f"    {arguments.evaluators[1]}: {second_result}")
+    print(f"disagreements: {disagreements}")
+    return 1 if disagreements else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+This module provides writers that save calculated results in
+machine-readable formats (JSON lines, CSV, a pair of .npy files, or
+fixed-width binary records), so that large numbers of results can be
+loaded by other programs without parsing the text displayed by the CLI.
+"""
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import standard modules.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+import sys
+import json
+import math
+import array
+import struct
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Import other modules from the Liniarote package.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+try:
+    from . import config as cfg
+    from . import cli
+    from . import wire_format
+except:
+    import config as cfg
+    import cli
+    import wire_format
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define general-purpose variables and constants.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# The number of results that are accumulated in memory before being
+# written to disk as a single block.
+default_block_size = 65536
+
+# The text that follows the real value in each JSON line and each CSV
+# row is prepared in advance for every symbol, so that no per-character
+# formatting is needed when results are written.
+json_line_endings = {
+    symbol: ',"symbol":' + json.dumps(symbol, ensure_ascii=False) + "}\n"
+    for symbol in cfg.symbol_codes
+    }
+csv_row_endings = {
+    symbol: "," + symbol + "\n"
+    for symbol in cfg.symbol_codes
+    }
+
+# The text that follows the line number for an input that couldn't be
+# evaluated (whose result is None), which is marked as an error rather
+# than being written as "U".
+json_error_line_ending = \
+    ',"real":null,"symbol":null,"' + cfg.evaluation_error_marker + '":true}\n'
+csv_error_row_ending = ",," + cfg.evaluation_error_marker + "\n"
+
+
+def format_real_for_json(
+    real_value,
+    ):
+    """
+    Formats a real value as a JSON number (or as null, for values such
+    as NaN that JSON cannot represent).
+    """
+    if math.isfinite(real_value):
+        return repr(real_value)
+    return "null"
+
+
+def format_real_for_csv(
+    real_value,
+    ):
+    """
+    Formats a real value for a CSV field (leaving the field empty for
+    NaN, which is used for indeterminate and uncalculated results).
+    """
+    if real_value != real_value:
+        return ""
+    return repr(real_value)
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the text-based writers.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class BufferedTextResultWriter:
+    """
+    The base class for writers that save results as lines of text. Lines
+    are collected in memory and written in large blocks.
+    """
+
+    def __init__(
+        self,
+        output_path=None,
+        block_size=default_block_size,
+        ):
+        """
+        Opens the given output file (or uses standard output if no path
+        is given).
+        """
+
+        if output_path is None:
+            self.output_file = sys.stdout
+            self.owns_output_file = False
+        else:
+            self.output_file = open(
+                output_path, "w", encoding="utf-8", newline=""
+                )
+            self.owns_output_file = True
+
+        self.block_size = block_size
+        self.pending_lines = []
+        self.results_written = 0
+
+        header = self.format_header()
+        if header:
+            self.pending_lines.append(header)
+
+
+    def format_header(self):
+        """
+        Returns any text that should precede the first result.
+        """
+        return ""
+
+
+    def format_line(self, line_number, real_value, symbol):
+        """
+        Returns the text of the line that represents a single result.
+        """
+        raise NotImplementedError
+
+
+    def format_error_line(self, line_number):
+        """
+        Returns the text of the line that represents an input that
+        couldn't be evaluated.
+        """
+        raise NotImplementedError
+
+
+    def write(self, line_number, result_unformatted):
+        """
+        Adds the given (unformatted) result to the current block. (A
+        result of None, for an input that couldn't be evaluated, is
+        marked as an error.)
+        """
+
+        if result_unformatted is None:
+            self.pending_lines.append(self.format_error_line(line_number))
+        else:
+            real_value, symbol = cli.decompose_result_for_output(
+                result_unformatted
+                )
+            self.pending_lines.append(
+                self.format_line(line_number, real_value, symbol)
+                )
+        self.results_written += 1
+
+        if len(self.pending_lines) >= self.block_size:
+            self.flush()
+
+
+    def flush(self):
+        """
+        Writes the current block of results.
+        """
+        if self.pending_lines:
+            self.output_file.write("".join(self.pending_lines))
+            self.pending_lines = []
+
+
+    def close(self):
+        """
+        Writes any remaining results and closes the output file.
+        """
+        self.flush()
+        if self.owns_output_file:
+            self.output_file.close()
+        else:
+            self.output_file.flush()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JsonLinesResultWriter(BufferedTextResultWriter):
+    """
+    Writes each result as a JSON object on its own line, e.g.:
+    {"line":3,"real":0.0,"symbol":"Ƿ²"}
+    An input that couldn't be evaluated is written with an "error" field:
+    {"line":4,"real":null,"symbol":null,"error":true}
+    """
+
+    def format_line(self, line_number, real_value, symbol):
+        return '{"line":' + str(line_number) \
+            + ',"real":' + format_real_for_json(real_value) \
+            + json_line_endings[symbol]
+
+
+    def format_error_line(self, line_number):
+        return '{"line":' + str(line_number) + json_error_line_ending
+
+
+class CsvResultWriter(BufferedTextResultWriter):
+    """
+    Writes each result as a row of a CSV file with the columns
+    "line", "real", and "symbol". For an input that couldn't be evaluated,
+    the real value is left empty and the symbol is "error".
+    """
+
+    def format_header(self):
+        return "line,real,symbol\n"
+
+
+    def format_line(self, line_number, real_value, symbol):
+        return str(line_number) + "," + format_real_for_csv(real_value) \
+            + csv_row_endings[symbol]
+
+
+    def format_error_line(self, line_number):
+        return str(line_number) + csv_error_row_ending
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the .npy writer.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+# Each .npy file begins with a header of this fixed size, which leaves
+# room for the array's final length to be filled in when it is closed.
+npy_header_size = 128
+
+
+def build_npy_header(
+    dtype_description,
+    length,
+    ):
+    """
+    Builds a version 1.0 .npy header (padded to npy_header_size bytes)
+    for a one-dimensional array of the given type and length.
+    """
+
+    header_dict = "{'descr': '" + dtype_description \
+        + "', 'fortran_order': False, 'shape': (" + str(length) + ",), }"
+    prefix = b"\x93NUMPY\x01\x00"
+    header_length = npy_header_size - len(prefix) - 2
+    header_text = header_dict.ljust(header_length - 1) + "\n"
+    return prefix + struct.pack("<H", header_length) \
+        + header_text.encode("latin1")
+
+
+class NpyResultWriter:
+    """
+    Writes results to a pair of .npy files: "<prefix>.real.npy" (float64
+    real values) and "<prefix>.symbol.npy" (int8 symbol codes, as
+    defined in config.symbol_codes, or config.evaluation_error_code for
+    an input that couldn't be evaluated). These can be loaded with numpy.load()
+    (optionally with mmap_mode="r"), though NumPy isn't needed to write
+    them.
+    """
+
+    def __init__(
+        self,
+        output_prefix,
+        block_size=default_block_size,
+        ):
+        """
+        Creates the two output files, reserving space for their headers.
+        """
+
+        byte_order = "<" if sys.byteorder == "little" else ">"
+        self.real_description = byte_order + "f8"
+        self.symbol_description = "|i1"
+
+        self.real_path = output_prefix + ".real.npy"
+        self.symbol_path = output_prefix + ".symbol.npy"
+        self.real_file = open(self.real_path, "wb")
+        self.symbol_file = open(self.symbol_path, "wb")
+        self.real_file.write(build_npy_header(self.real_description, 0))
+        self.symbol_file.write(build_npy_header(self.symbol_description, 0))
+
+        self.block_size = block_size
+        self.pending_reals = array.array("d")
+        self.pending_codes = array.array("b")
+        self.results_written = 0
+
+
+    def write(self, line_number, result_unformatted):
+        """
+        Adds the given (unformatted) result to the current block. (The
+        line number isn't stored; results are saved in the order in which
+        they are written.)
+        """
+
+        if result_unformatted is None:
+            self.pending_reals.append(math.nan)
+            self.pending_codes.append(cfg.evaluation_error_code)
+        else:
+            real_value, symbol = cli.decompose_result_for_output(
+                result_unformatted
+                )
+            self.pending_reals.append(real_value)
+            self.pending_codes.append(cfg.symbol_codes[symbol])
+        self.results_written += 1
+
+        if len(self.pending_reals) >= self.block_size:
+            self.flush()
+
+
+    def flush(self):
+        """
+        Writes the current block of results.
+        """
+        if self.pending_reals:
+            self.pending_reals.tofile(self.real_file)
+            self.pending_codes.tofile(self.symbol_file)
+            self.pending_reals = array.array("d")
+            self.pending_codes = array.array("b")
+
+
+    def close(self):
+        """
+        Writes any remaining results, records the final array lengths in
+        the files' headers, and closes the files.
+        """
+
+        self.flush()
+        for output_file, description in (
+                (self.real_file, self.real_description),
+                (self.symbol_file, self.symbol_description),
+                ):
+            output_file.seek(0)
+            output_file.write(
+                build_npy_header(description, self.results_written)
+                )
+            output_file.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define the binary writer.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+class BinaryResultWriter:
+    """
+    Writes results as fixed-width binary records (see wire_format.py),
+    which can be read back with wire_format.unpack_results() (e.g., from
+    a memory-mapped file).
+    """
+
+    def __init__(
+        self,
+        output_path=None,
+        block_size=default_block_size,
+        ):
+        """
+        Opens the given output file (or uses standard output if no path
+        is given).
+        """
+
+        if output_path is None:
+            self.output_file = sys.stdout.buffer
+            self.owns_output_file = False
+        else:
+            self.output_file = open(output_path, "wb")
+            self.owns_output_file = True
+
+        self.block_size = block_size
+        self.pending_results = []
+        self.results_written = 0
+
+
+    def write(self, line_number, result_unformatted):
+        """
+        Adds the given (unformatted) result to the current block. (The
+        line number isn't stored; results are saved in the order in which
+        they are written.)
+        """
+
+        self.pending_results.append(result_unformatted)
+        self.results_written += 1
+
+        if len(self.pending_results) >= self.block_size:
+            self.flush()
+
+
+    def flush(self):
+        """
+        Packs the current block of results and writes it.
+        """
+        if self.pending_results:
+            self.output_file.write(wire_format.pack_results(self.pending_results))
+            self.pending_results = []
+
+
+    def close(self):
+        """
+        Writes any remaining results and closes the output file.
+        """
+        self.flush()
+        if self.owns_output_file:
+            self.output_file.close()
+        else:
+            self.output_file.flush()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+# █ Define a function for selecting a writer.
+# ■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■■
+
+result_writers_by_format = {
+    "jsonl": JsonLinesResultWriter,
+    "csv": CsvResultWriter,
+    "npy": NpyResultWriter,
+    "bin": BinaryResultWriter,
+    }
+
+
+def open_result_writer(
+    output_format,
+    output_path=None,
+    block_size=default_block_size,
+    ):
+    """
+    Returns a writer for the given format ("jsonl", "csv", "npy", or
+    "bin").
+    For the "npy" format, output_path is the prefix of the two files
+    to be created.
+    """
+
+    if output_format == "npy" and output_path is None:
+        raise ValueError("An output path prefix is required for .npy output.")
+    return result_writers_by_format[output_format](output_path, block_size)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Shared setup for the tests, which import the modules as parts of the
+liniarote_py package.
+"""
+
+
+import os
+import sys
+
+import pytest
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liniarote_py import workload
+
+
+@pytest.fixture(scope="session")
+def corpus_path(tmp_path_factory):
+    """
+    A file of randomly generated expressions (the same in every run).
+    """
+
+    path = tmp_path_factory.mktemp("corpus") / "corpus.txt"
+    workload.write_corpus(str(path), 400, seed=0)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def power_corpus_path(tmp_path_factory):
+    """
+    A file of randomly generated expressions that include powers.
+    """
+
+    path = tmp_path_factory.mktemp("corpus") / "power_corpus.txt"
+    settings = workload.WorkloadSettings(
+        operator_weights=workload.parse_operator_weights("+:1,-:1,*:1,/:1,^:0.5")
+        )
+    workload.write_corpus(str(path), 400, settings, seed=0)
+    return str(path)
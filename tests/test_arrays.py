@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of arrays of transvalent values, whose operations must give the
+same results as the CLI's.
+"""
+
+
+import pytest
+
+from liniarote_py import arrays
+from liniarote_py import cli
+from liniarote_py import config as cfg
+
+
+@pytest.fixture(scope="module")
+def operands():
+    left_values = arrays.generate_values(5000, 0.7, seed=0)
+    right_values = arrays.generate_values(5000, 0.7, seed=1)
+    return (
+        arrays.TransvalentArray.from_values(left_values),
+        arrays.TransvalentArray.from_values(right_values),
+        )
+
+
+@pytest.mark.parametrize("operator, function", [
+    ("+", arrays.add),
+    ("-", arrays.subtract),
+    ("*", arrays.multiply),
+    ("/", arrays.divide),
+    ])
+def test_operations_agree_with_cli(operands, operator, function):
+    left, right = operands
+    result = function(left, right)
+    for index, (u, v) in enumerate(zip(left.to_values(), right.to_values())):
+        expected = arrays.apply_operation_quietly(operator, u, v)
+        actual = (result.reals[index].item(), result.codes[index].item())
+        assert arrays.results_agree(expected, actual), (u, operator, v, actual)
+
+
+def test_powers_agree_with_cli(operands):
+    left, _ = operands
+    for exponent in (-2.0, 2.0, 3.0):
+        result = left ** exponent
+        for index, u in enumerate(left.to_values()):
+            expected = arrays.apply_operation_quietly("^", u, exponent)
+            actual = (result.reals[index].item(), result.codes[index].item())
+            assert arrays.results_agree(expected, actual), (u, exponent, actual)
+
+
+def test_values_round_trip_through_files(tmp_path):
+    values = [1.5, cli.tuples_by_lone_element[cfg.tv_sym_pos], cfg.unimplemented_sym, None]
+    array = arrays.TransvalentArray.from_values(values)
+    array.save(str(tmp_path / "values"))
+    loaded_array = arrays.TransvalentArray.load(str(tmp_path / "values"))
+    assert loaded_array.to_values() == [
+        (1.5, cfg.null_sym), (0.0, cfg.tv_sym_pos), cfg.unimplemented_sym, None,
+        ]
+    assert loaded_array.nbytes == 9 * len(values)
+
+
+def test_failed_evaluation_stays_distinct_from_unimplemented():
+    array = arrays.TransvalentArray.from_values([None, cfg.unimplemented_sym])
+    assert array.codes.tolist() == [cfg.evaluation_error_code, cfg.symbol_codes["U"]]
+    assert repr(array) == "TransvalentArray([error, U], shape=(2,))"
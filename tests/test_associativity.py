@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of the regrouping of real-valued chains, which must never change
+an expression's result.
+"""
+
+
+from liniarote_py import associativity
+from liniarote_py import batch
+from liniarote_py import tree
+
+
+def test_regrouping_doesnt_change_results(corpus_path):
+    chains_found = 0
+    for line_number, offset, next_offset, text in batch.iterate_mapped_lines(corpus_path):
+        expression_tree = tree.parse_expression_to_tree(text)
+        if expression_tree is None:
+            continue
+        chains_by_root = associativity.find_reassociable_chains(expression_tree)
+        if chains_by_root:
+            chains_found += 1
+            in_order_result, reassociated_result = \
+                associativity.compare_reassociated_result(expression_tree, chains_by_root)
+            assert reassociated_result == in_order_result, (line_number, text)
+    assert chains_found > 0
+
+
+def test_only_exactly_calculated_chains_are_regrouped():
+    constants = {"m": 5.75, "k": 3.0}
+    exact_tree = tree.parse_expression_to_tree("3 + 4.5 + 5 + m")
+    assert associativity.find_reassociable_chains(exact_tree, constants)
+
+    # (3.1 and 4.2 have no exact binary representation.)
+    inexact_tree = tree.parse_expression_to_tree("3.1 + 4.2 + 5.0 + m")
+    assert not associativity.find_reassociable_chains(inexact_tree, {"m": 5.7})
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of batch mode and its output formats.
+"""
+
+
+import io
+import json
+import contextlib
+
+from liniarote_py import batch
+from liniarote_py import config as cfg
+
+
+def run_batch_mode(tmp_path, input_bytes, *options):
+    input_path = tmp_path / "expressions.txt"
+    input_path.write_bytes(input_bytes)
+    with contextlib.redirect_stderr(io.StringIO()):
+        batch.main([str(input_path), *options])
+
+
+def test_check_batch_mode():
+    assert batch.check_batch_mode() == []
+
+
+def test_failed_evaluations_are_marked_in_json(tmp_path):
+    output_path = tmp_path / "results.jsonl"
+    run_batch_mode(
+        tmp_path, b"1+2\n3 +* \nw\n", "--format", "jsonl", "--output", str(output_path)
+        )
+    lines = [json.loads(line) for line in output_path.read_text("utf-8").splitlines()]
+    assert lines == [
+        {"line": 1, "real": 3.0, "symbol": cfg.null_sym},
+        {"line": 2, "real": None, "symbol": None, "error": True},
+        {"line": 3, "real": 0.0, "symbol": cfg.tv_sym_pos},
+        ]
+
+
+def test_failed_evaluations_are_marked_in_csv(tmp_path):
+    output_path = tmp_path / "results.csv"
+    run_batch_mode(
+        tmp_path, b"1+2\n3 +* \nU\n", "--format", "csv", "--output", str(output_path)
+        )
+    assert output_path.read_text("utf-8").splitlines() == [
+        "line,real,symbol",
+        "1,3.0," + cfg.null_sym,
+        "2,," + cfg.evaluation_error_marker,
+        "3,," + cfg.unimplemented_sym,
+        ]
+
+
+def test_invalid_utf8_doesnt_end_the_run(tmp_path):
+    reject_path = tmp_path / "rejected.jsonl"
+    output_path = tmp_path / "results.jsonl"
+    run_batch_mode(
+        tmp_path, b"1+1\n\xfe\xff2\r\n3*3\n", "--format", "jsonl",
+        "--output", str(output_path), "--reject-file", str(reject_path),
+        )
+    written_lines = [
+        json.loads(line)["line"] for line in output_path.read_text("utf-8").splitlines()
+        ]
+    rejected_lines = [
+        json.loads(line) for line in reject_path.read_text("utf-8").splitlines()
+        ]
+    assert written_lines == [1, 3]
+    assert [line["line"] for line in rejected_lines] == [2]
+    assert rejected_lines[0]["diagnostics"][0]["category"] == "invalid_encoding"
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of interval mode.
+"""
+
+
+import pytest
+
+from liniarote_py import intervals
+from liniarote_py import tree
+from liniarote_py import config as cfg
+
+
+def evaluate_with_intervals(text, **constants):
+    return intervals.evaluate_tree_with_intervals(
+        tree.parse_expression_to_tree(text),
+        {name: intervals.parse_interval(value) for name, value in constants.items()},
+        )
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("5 - Æ", "(-∞, 5.0)"),
+    ("Æ^2", "(0.0, ∞)"),
+    ("(-Æ)^3", "(-∞, 0.0)"),
+    ("ℝ^2", "[0.0, ∞)"),
+    ("m^2", "[0.0, 9.0]"),
+    ("m^3", "[-27.0, 8.0)"),
+    ("Æ^-2", "(0.0, ∞)"),
+    ("Æ^0", "1.0"),
+    ])
+def test_interval_results(text, expected):
+    result = evaluate_with_intervals(text, m="[-3, 2)")
+    assert intervals.format_interval_value(result) == expected
+
+
+@pytest.mark.parametrize("text", ["m^-1", "ℝ^-2", "Æ^0.5", "2^Æ"])
+def test_unimplemented_powers_of_intervals(text):
+    assert evaluate_with_intervals(text, m="[-3, 2)") == cfg.unimplemented_sym
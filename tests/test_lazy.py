@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of lazy evaluation, which must give the same results as the
+parser except where it skips a subexpression that raises an error.
+"""
+
+
+from liniarote_py import cli
+from liniarote_py import lazy
+from liniarote_py import tree
+from liniarote_py import config as cfg
+from liniarote_py import workload
+
+
+def test_lazy_evaluation_agrees_with_parser(corpus_path, power_corpus_path):
+    for path in (corpus_path, power_corpus_path):
+        for line_number, text, parser_result, lazy_result in \
+                workload.compare_evaluators(path, "parser", "lazy"):
+            assert parser_result.startswith("error: "), (line_number, text)
+            assert lazy_result == cli.format_result_for_display(cfg.unimplemented_sym)
+
+
+def test_operands_after_unimplemented_result_are_pruned():
+    result, nodes_evaluated, nodes_pruned = lazy.evaluate_tree_lazily(
+        tree.parse_expression_to_tree("(U + 1) * (2 + 3 * 4)")
+        )
+    assert result == cfg.unimplemented_sym
+    assert nodes_pruned > 0
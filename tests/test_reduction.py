@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of folding sequences of values in parallel.
+"""
+
+
+import pytest
+
+from liniarote_py import reduction
+
+
+def test_check_sequences_fold_identically():
+    assert reduction.compare_folds() == []
+
+
+@pytest.mark.parametrize("operator_symbol", ["+", "*"])
+def test_parallel_fold_is_identical_to_serial_fold(operator_symbol):
+    values = reduction.generate_values(20000, seed=1, symbol_share=0.001)
+    if operator_symbol == "*":
+        # (Keeps the running product within the range of ordinary reals.)
+        values = [
+            1.0 + value / 1000.0 if type(value) is float else value
+            for value in values
+            ]
+    serial_result = reduction.fold_serially(values, operator_symbol)
+    parallel_result = reduction.fold_in_parallel(values, operator_symbol, 997, 2)
+    assert repr(parallel_result) == repr(serial_result)
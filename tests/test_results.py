@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of the representations of results: binary records, canonical
+values, and the sort order.
+"""
+
+
+import collections
+
+from liniarote_py import cli
+from liniarote_py import config as cfg
+from liniarote_py import normalization
+from liniarote_py import ordering
+from liniarote_py import wire_format
+from liniarote_py import workload
+
+
+def test_binary_records_round_trip():
+    results = workload.generate_results(20000, seed=0) + [None]
+    unpacked_results = wire_format.unpack_results(
+        memoryview(wire_format.pack_results(results))
+        )
+    assert repr(unpacked_results) == repr(results)
+    assert unpacked_results[-1] is None
+
+
+def test_canonical_values_match_displayed_forms():
+    results = workload.generate_results(20000, seed=0)
+    displayed_counts = collections.Counter(
+        cli.format_result_for_display(result) for result in results
+        )
+    # The lone "∅" is displayed as such, but it has the same canonical
+    # value as 0.0.
+    displayed_counts["0.0"] += displayed_counts.pop(cfg.null_sym, 0)
+    canonical_counts = normalization.count_values(results)
+    assert {
+        normalization.format_canonical_value(value): count
+        for value, count in canonical_counts.items()
+        } == displayed_counts
+
+
+def test_array_sort_matches_sort_keys():
+    results = workload.generate_results(20000, seed=0) + [None]
+    reals, codes = ordering.decompose_results(results[:-1])
+    reals = list(reals) + [float("nan")]
+    codes = list(codes) + [cfg.evaluation_error_code]
+    symbols = [ordering.ranked_symbols_by_code[int(code)] for code in codes]
+    expected_order = sorted(
+        range(len(symbols)),
+        key=lambda index: ordering.compute_sort_key_of_pair(reals[index], symbols[index]),
+        )
+    order = ordering.argsort_results(
+        ordering.np.array(reals), ordering.np.array(codes, dtype=ordering.np.int8)
+        )
+    assert order.tolist() == expected_order
+    assert expected_order[-1] == len(results) - 1
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of compiling and running scripts, and of their compiled files.
+"""
+
+
+import pytest
+
+from liniarote_py import cli
+from liniarote_py import script
+
+
+def run_script_text(script_text):
+    results = []
+    script.run_compiled_script(
+        script.compile_script(script_text), {},
+        lambda line_number, result: results.append(cli.format_result_for_display(result)),
+        )
+    return results
+
+
+def test_script_is_run():
+    assert run_script_text("m = 5.5 # a constant\nm * 2; m / 0; w * w") \
+        == ["11.0", "Ƿ", "Ƿ²"]
+
+
+@pytest.mark.parametrize("name", ["w", "W", "pi", "e", "U", "help"])
+def test_reserved_names_cant_be_assigned(name):
+    with pytest.raises(SyntaxError, match=f'"{name}"'):
+        script.compile_script(f"m = 1\n{name} = 3")
+
+
+def test_compiled_file_is_reused(tmp_path):
+    script_path = tmp_path / "derivation.lrt"
+    script_path.write_text("m = 5.5\nm * 2\n", encoding="utf-8")
+    script.load_compiled_script(str(script_path))
+    compiled_path = tmp_path / "derivation.lrc"
+    assert compiled_path.exists()
+
+    cache_key = script.compute_cache_key(script_path.read_text(encoding="utf-8"))
+    assert script.read_compiled_file(str(compiled_path), cache_key) is not None
+
+
+@pytest.mark.parametrize("contents", [
+    b"",
+    b"not a compiled script",
+    None,
+    ])
+def test_unreadable_compiled_file_is_replaced(tmp_path, contents):
+    script_path = tmp_path / "derivation.lrt"
+    script_text = "m = 5.5\nm * 2\n"
+    script_path.write_text(script_text, encoding="utf-8")
+    compiled_path = tmp_path / "derivation.lrc"
+    cache_key = script.compute_cache_key(script_text)
+    if contents is None:
+        # A file with the right header but a corrupted body.
+        contents = script.compiled_file_marker + cache_key + b"\x80\x04corrupted"
+    compiled_path.write_bytes(contents)
+
+    assert script.read_compiled_file(str(compiled_path), cache_key) is None
+    compiled_script = script.load_compiled_script(str(script_path))
+    assert script.read_compiled_file(str(compiled_path), cache_key) is not None
+    assert compiled_script.source_lines
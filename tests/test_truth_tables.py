@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of the operations' truth tables, axioms, and powers.
+"""
+
+
+from liniarote_py import truth_tables
+
+
+def test_tables_match_golden_copy():
+    tables = truth_tables.build_truth_tables()
+    golden_tables = truth_tables.load_golden_truth_tables()
+    assert truth_tables.compare_truth_tables(tables, golden_tables) == []
+
+
+def test_axioms_are_satisfied():
+    assert truth_tables.check_axioms() == []
+
+
+def test_powers_match_repeated_multiplication():
+    assert truth_tables.check_power_consistency() == []
+
+
+def test_negative_powers():
+    assert truth_tables.check_negative_powers() == []
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# ╔════════════════════════════════════════════════════════════════════╗
+# ║   LINIAROTE: The programming language for performing operations    ║
+# ║   in transvalent mathematics                                       ║
+# ║                                                                    ║
+# ║   Developed by Matthew E. Gladden                                  ║
+# ║   Software and documentation ©2022-2023 Cognitive Firewall LLC     ║
+# ║                                                                    ║
+# ║   This software is made available for use under                    ║
+# ║   GNU General Public License Version 3                             ║
+# ║   (please see https://www.gnu.org/licenses/gpl-3.0.html).          ║
+# ╚════════════════════════════════════════════════════════════════════╝
+
+
+"""
+Tests of the evaluation paths, which must all give the same results, and
+of the other front ends of the CLI's operations.
+"""
+
+
+import pytest
+
+from liniarote_py import cli
+from liniarote_py import realization
+from liniarote_py import scanner
+from liniarote_py import tree
+from liniarote_py import workload
+
+
+@pytest.mark.parametrize("evaluator_name", ["tree", "vm", "codegen"])
+def test_evaluators_agree_with_parser(corpus_path, power_corpus_path, evaluator_name):
+    for path in (corpus_path, power_corpus_path):
+        assert list(workload.compare_evaluators(path, "parser", evaluator_name)) == []
+
+
+def test_generated_expressions_include_powers(power_corpus_path):
+    with open(power_corpus_path, encoding="utf-8") as corpus_file:
+        assert any("^" in line for line in corpus_file)
+
+
+def test_scanner_agrees_with_lexer(corpus_path, power_corpus_path):
+    texts = []
+    for path in (corpus_path, power_corpus_path):
+        with open(path, encoding="utf-8") as corpus_file:
+            texts.extend(line.rstrip("\n") for line in corpus_file)
+    assert list(scanner.find_nonconforming_texts(texts, cli.create_lexer())) == []
+
+
+@pytest.mark.parametrize("text", ["(w * 0) * -2 + m", "0 / 0 + Æ * 3", "m - ℝ / 2"])
+def test_realizations_agree_with_cli(text):
+    expression_tree = tree.parse_expression_to_tree(text)
+    evaluation, values = realization.realize_expression(
+        expression_tree, 200, realization.RealizationSampler(seed=0), {"m": 5.7}
+        )
+    for index in range(200):
+        assert evaluation.get_operand(values, index) \
+            == evaluation.evaluate_sample(expression_tree, index)